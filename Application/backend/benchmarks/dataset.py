@@ -0,0 +1,350 @@
+"""
+Synthetic OR-day dataset generator.
+
+Produces a hospital-scale dataset in the seed schema of `core/data/*.json`:
+a medication catalog grown from `medication_data_template.json`, inventory
+batches with spread-out expiration dates, carts per room per day with their
+cart items, and the schedule of the following day for the replay driver
+(`benchmarks/replay.py`). The same `--seed` always produces the same files.
+
+Run from the project root, e.g.:
+
+    python -m Application.backend.benchmarks.dataset --output-dir or_day \\
+        --rooms 12 --days 30 --carts-per-room 5 --medications 500
+
+Add `--database-url` to load the generated dataset into a database; its
+tables are dropped and recreated.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+from datetime import date, datetime, time, timedelta
+
+from Application.backend.benchmarks.seed import (
+    ANAESTHESIA_TYPES,
+    DATA_DIR,
+    LOCATIONS,
+    insert_rows,
+    load_medications,
+    reset_schema,
+)
+
+CHECKLIST_DIR = os.path.join(DATA_DIR, "medication_lists")
+
+# Operation type and the medication list used to prepare its cart
+OPERATION_CHECKLISTS = {
+    "Appendectomy": "apendectomy",
+    "Knee Meniscectomy": "knee-meniscectomy",
+    "Dekompression": "default",
+    "Cholecystectomy": "default",
+    "Hip Replacement": "default",
+    "Port-Einlage": "default",
+}
+
+DOSAGE_VARIANTS = ["1 mg/mL", "2 mg/mL", "5 mg/mL", "10 mg/mL", "20 mg/mL", "50 mg/mL", "100 mg", "500 mg"]
+PRODUCERS = [
+    "Fresenius Kabi Deutschland GmbH", "B. Braun Melsungen AG", "Hexal AG", "Ratiopharm GmbH",
+    "Sintetica Pharma GmbH", "Labatec GmbH & Co. KG", "Zentiva Pharma GmbH", "STADA Arzneimittel AG",
+]
+
+FIRST_OPERATION = time(7, 30)
+OPERATION_MINUTES = (45, 150)
+TURNOVER_MINUTES = 30
+CANCELLATION_RATE = 0.05
+
+DATASET_FILES = ("medications", "inventory", "carts", "cart_items", "schedule")
+
+
+def load_checklists() -> dict[str, list[dict]]:
+    """Return the medication lists used by `OPERATION_CHECKLISTS`, keyed by name."""
+    checklists = {}
+    for name in set(OPERATION_CHECKLISTS.values()):
+        with open(os.path.join(CHECKLIST_DIR, f"{name}.json"), "r", encoding="utf-8") as f:
+            checklists[name] = json.load(f)
+    return checklists
+
+
+def generate_medications(count: int, rng: random.Random) -> list[dict]:
+    """
+    Grow the template catalog to `count` medications (never below the template).
+
+    The template entries are kept as they are, so the medication lists still
+    resolve; further entries are dosage/producer variants of them.
+    """
+    template = load_medications()
+    medications = list(template)
+    counters: dict[str, int] = {}
+    for entry in template:
+        prefix, number = entry["medicationId"].rsplit("-", 1)
+        counters[prefix] = max(counters.get(prefix, 0), int(number))
+
+    for i in range(max(count - len(template), 0)):
+        base = template[i % len(template)]
+        prefix = base["medicationId"].rsplit("-", 1)[0]
+        counters[prefix] += 1
+        dosage = rng.choice(DOSAGE_VARIANTS)
+        medications.append({
+            **base,
+            "medicationId": f"{prefix}-{counters[prefix]:03d}",
+            "name": f"{base['name']} {dosage} #{counters[prefix]}",
+            "producer": rng.choice(PRODUCERS),
+            "dosage": dosage,
+        })
+    return medications
+
+
+def expiration_date(today: date, rng: random.Random) -> date:
+    """Draw an expiration date: a few expired, some due soon, most far out."""
+    roll = rng.random()
+    if roll < 0.05:
+        return today - timedelta(days=rng.randint(1, 60))
+    if roll < 0.20:
+        return today + timedelta(days=rng.randint(0, 30))
+    return today + timedelta(days=rng.randint(31, 3 * 365))
+
+
+def generate_inventory(medications: list[dict], batches_per_medication: int, today: date, rng: random.Random) -> list[dict]:
+    """Generate inventory batches for every medication."""
+    inventory = []
+    for medication in medications:
+        location = rng.choice(LOCATIONS)
+        min_stock = float(rng.randint(5, 50))
+        for _ in range(batches_per_medication):
+            inventory.append({
+                "medicationId": medication["medicationId"],
+                "batchNumber": f"B{len(inventory):07d}",
+                "amount": float(rng.randint(100, 2000)),
+                "unit": medication["baseUnit"],
+                "location": location,
+                "expirationDate": expiration_date(today, rng).isoformat(),
+                "min_stock": min_stock,
+            })
+    return inventory
+
+
+def cart_medications(checklist: list[dict], by_name: dict[str, dict], medications: list[dict], rng: random.Random) -> list[dict]:
+    """
+    Pick the medications of one cart: the checklist entries found in the
+    catalog plus a few extras requested by the anaesthetist.
+    """
+    items = []
+    for entry in checklist:
+        medication = by_name.get(entry["name"].lower())
+        if medication:
+            items.append({
+                "medication_id": medication["medicationId"],
+                "amount": float(entry["amount"]),
+                "time_sensitive": (medication.get("chemicalStabilityHours") or 0) > 0,
+            })
+    for medication in rng.sample(medications, min(rng.randint(0, 3), len(medications))):
+        items.append({
+            "medication_id": medication["medicationId"],
+            "amount": float(rng.randint(1, 5)),
+            "time_sensitive": (medication.get("chemicalStabilityHours") or 0) > 0,
+        })
+    return items
+
+
+def generate_day(day: date, rooms: int, carts_per_room: int, serial: int, rng: random.Random) -> list[dict]:
+    """
+    Generate the operations of one day, back to back in every room.
+
+    Each operation has a `start` and `end` time; `serial` numbers the patients.
+    """
+    operations = []
+    for room in range(1, rooms + 1):
+        start = datetime.combine(day, FIRST_OPERATION)
+        for _ in range(carts_per_room):
+            duration = timedelta(minutes=rng.randint(*OPERATION_MINUTES))
+            operation = rng.choice(list(OPERATION_CHECKLISTS))
+            operations.append({
+                "patientId": f"patient-{serial:07d}",
+                "operation": operation,
+                "operationDate": day.isoformat(),
+                "anaesthesiaType": rng.choice(ANAESTHESIA_TYPES),
+                "roomNumber": f"OR-{room:02d}",
+                "start": start.isoformat(),
+                "end": (start + duration).isoformat(),
+            })
+            serial += 1
+            start += duration + timedelta(minutes=TURNOVER_MINUTES)
+    return operations
+
+
+def generate_dataset(
+    rooms: int = 12,
+    days: int = 30,
+    carts_per_room: int = 5,
+    medications: int = 500,
+    batches_per_medication: int = 4,
+    today: date | None = None,
+    seed: int = 42,
+) -> dict[str, list[dict]]:
+    """
+    Generate a complete dataset.
+
+    Args:
+        rooms: Number of operating rooms.
+        days: Days of history ending with `today`; carts of past days are closed.
+        carts_per_room: Operations, and so carts, per room and day.
+        medications: Size of the medication catalog.
+        batches_per_medication: Inventory batches per medication.
+        today: Reference date, defaults to the current date.
+        seed: Random seed, the same seed gives the same data.
+
+    Returns:
+        dict with `medications`, `inventory`, `carts` and `cart_items` in the
+        seed schema (cart items reference carts and batches by their 1-based
+        position) and the `schedule` of the day after `today`.
+    """
+    rng = random.Random(seed)
+    today = today or date.today()
+    checklists = load_checklists()
+
+    catalog = generate_medications(medications, rng)
+    by_name = {medication["name"].lower(): medication for medication in catalog}
+    inventory = generate_inventory(catalog, batches_per_medication, today, rng)
+
+    batches: dict[str, list[int]] = {}
+    for position, batch in enumerate(inventory, start=1):
+        batches.setdefault(batch["medicationId"], []).append(position)
+
+    carts, cart_items, serial = [], [], 0
+    for offset in range(days - 1, -1, -1):
+        day = today - timedelta(days=offset)
+        for operation in generate_day(day, rooms, carts_per_room, serial, rng):
+            serial += 1
+            carts.append({
+                "status": "Prepared" if day == today else "Closed",
+                **{key: operation[key] for key in ("patientId", "operation", "operationDate", "anaesthesiaType", "roomNumber")},
+            })
+            checklist = checklists[OPERATION_CHECKLISTS[operation["operation"]]]
+            for item in cart_medications(checklist, by_name, catalog, rng):
+                position = rng.choice(batches[item["medication_id"]])
+                cart_items.append({"cart_id": len(carts), "inventory_id": position, **item})
+
+    schedule = []
+    for operation in generate_day(today + timedelta(days=1), rooms, carts_per_room, serial, rng):
+        checklist = checklists[OPERATION_CHECKLISTS[operation["operation"]]]
+        schedule.append({
+            **operation,
+            "checklist": checklist,
+            "items": cart_medications(checklist, by_name, catalog, rng),
+            "cancelled": rng.random() < CANCELLATION_RATE,
+        })
+
+    return {
+        "medications": catalog,
+        "inventory": inventory,
+        "carts": carts,
+        "cart_items": cart_items,
+        "schedule": schedule,
+    }
+
+
+def write_dataset(dataset: dict[str, list[dict]], output_dir: str) -> None:
+    """Write each part of the dataset to `<output_dir>/<part>.json`."""
+    os.makedirs(output_dir, exist_ok=True)
+    for name in DATASET_FILES:
+        with open(os.path.join(output_dir, f"{name}.json"), "w", encoding="utf-8") as f:
+            json.dump(dataset[name], f, indent=2)
+
+
+def read_dataset(directory: str) -> dict[str, list[dict]]:
+    """Read a dataset written by `write_dataset`."""
+    dataset = {}
+    for name in DATASET_FILES:
+        with open(os.path.join(directory, f"{name}.json"), "r", encoding="utf-8") as f:
+            dataset[name] = json.load(f)
+    return dataset
+
+
+async def load_dataset(engine, dataset: dict[str, list[dict]]) -> dict:
+    """
+    Recreate the schema and bulk-load a generated dataset.
+
+    Args:
+        engine: Engine of the target database (its tables are dropped).
+        dataset: Dataset from `generate_dataset` or `read_dataset`.
+
+    Returns:
+        dict with the number of rows per table.
+    """
+    from sqlalchemy import select
+
+    from Application.backend.models.cart import Cart
+    from Application.backend.models.cart_item import CartItem
+    from Application.backend.models.inventory import Inventory
+    from Application.backend.models.medication import Medication
+
+    def dates(rows: list[dict], *fields: str) -> list[dict]:
+        return [{**row, **{field: date.fromisoformat(row[field]) for field in fields}} for row in rows]
+
+    await reset_schema(engine)
+    async with engine.begin() as conn:
+        await insert_rows(conn, Medication, dataset["medications"])
+        await insert_rows(conn, Inventory, dates(dataset["inventory"], "expirationDate"))
+        await insert_rows(conn, Cart, dates(dataset["carts"], "operationDate"))
+
+        # Resolve the positional references of the seed schema to real ids
+        inventory = (await conn.execute(
+            select(Inventory.id, Inventory.unit, Inventory.expirationDate).order_by(Inventory.id)
+        )).all()
+        cart_ids = (await conn.execute(select(Cart.id).order_by(Cart.id))).scalars().all()
+        items = []
+        for item in dataset["cart_items"]:
+            batch = inventory[item["inventory_id"] - 1]
+            items.append({
+                **item,
+                "cart_id": cart_ids[item["cart_id"] - 1],
+                "inventory_id": batch.id,
+                "unit": batch.unit,
+                "expiration_date": batch.expirationDate,
+            })
+        await insert_rows(conn, CartItem, items)
+
+    return {name: len(dataset[name]) for name in DATASET_FILES}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output-dir", default="or_day")
+    parser.add_argument("--rooms", type=int, default=12)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--carts-per-room", type=int, default=5)
+    parser.add_argument("--medications", type=int, default=500)
+    parser.add_argument("--batches-per-medication", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database-url", help="Also load the dataset into this database (tables are dropped)")
+    args = parser.parse_args()
+
+    dataset = generate_dataset(
+        rooms=args.rooms,
+        days=args.days,
+        carts_per_room=args.carts_per_room,
+        medications=args.medications,
+        batches_per_medication=args.batches_per_medication,
+        seed=args.seed,
+    )
+    write_dataset(dataset, args.output_dir)
+    counts = {name: len(dataset[name]) for name in DATASET_FILES}
+
+    if args.database_url:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        async def load() -> None:
+            engine = create_async_engine(args.database_url)
+            try:
+                await load_dataset(engine, dataset)
+            finally:
+                await engine.dispose()
+
+        asyncio.run(load())
+
+    print(json.dumps({"output_dir": args.output_dir, "rows": counts}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
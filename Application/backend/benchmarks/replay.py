@@ -0,0 +1,238 @@
+"""
+OR-day replay driver.
+
+Drives the schedule of a generated dataset (`benchmarks/dataset.py`) against
+the API the way the cart preparation workflow does: every operation gets a
+cart an hour before it starts, its checklist is evaluated, the batches of
+its medications are looked up and added in bulk, and the cart goes
+`In-Use` at the start and `Closed` at the end of the operation. Cancelled
+operations delete their cart instead. Latencies are reported per step.
+
+Against a running server:
+
+    python -m Application.backend.benchmarks.replay --dataset or_day --base-url http://localhost:8000
+
+or in-process, loading the dataset into the given database first:
+
+    python -m Application.backend.benchmarks.replay --dataset or_day \\
+        --database-url sqlite+aiosqlite:///bench.db --load
+
+`--speed` compresses the day: 3600 replays one hour per second, 0 (the
+default) runs every step as soon as the previous one of the same operation
+has finished. `--concurrency` bounds the requests in flight.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+STEPS = [
+    "create_cart",
+    "evaluate_checklist",
+    "list_inventory_by_medication",
+    "add_to_cart_bulk",
+    "start_operation",
+    "close_cart",
+    "delete_cart",
+]
+
+
+class ReplayClock:
+    """Maps schedule times onto wall-clock time at a given speed."""
+
+    def __init__(self, origin: datetime, speed: float):
+        """
+        Create the clock.
+
+        Args:
+            origin: Schedule time that corresponds to the start of the replay.
+            speed: Schedule seconds per real second, 0 disables pacing.
+        """
+        self.origin = origin
+        self.speed = speed
+        self.started = time.perf_counter()
+
+    async def wait_until(self, when: datetime) -> None:
+        """Sleep until the given schedule time has been reached."""
+        if not self.speed:
+            return
+        delay = (when - self.origin).total_seconds() / self.speed - (time.perf_counter() - self.started)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class Replay:
+    """Replays the operations of one schedule against an HTTP client."""
+
+    def __init__(self, client, schedule: list[dict], concurrency: int, speed: float, lead_minutes: int):
+        """
+        Prepare the replay.
+
+        Args:
+            client: `httpx.AsyncClient` with the API as base URL.
+            schedule: Operations from the dataset's `schedule.json`.
+            concurrency: Maximum requests in flight.
+            speed: Schedule seconds per real second, 0 disables pacing.
+            lead_minutes: Minutes before the operation start its cart is prepared.
+        """
+        self.client = client
+        self.schedule = schedule
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.lead = timedelta(minutes=lead_minutes)
+        origin = min((datetime.fromisoformat(op["start"]) for op in schedule), default=datetime.now()) - self.lead
+        self.clock = ReplayClock(origin, speed)
+        self.latencies: dict[str, list[float]] = {step: [] for step in STEPS}
+        self.errors: dict[str, int] = {step: 0 for step in STEPS}
+
+    async def call(self, step: str, method: str, url: str, **kwargs):
+        """Send one request, record its latency and return the response (None on failure)."""
+        import httpx
+
+        async with self.semaphore:
+            t0 = time.perf_counter()
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except httpx.HTTPError:
+                response = None
+            self.latencies[step].append(time.perf_counter() - t0)
+        if response is None or response.status_code >= 400:
+            self.errors[step] += 1
+            return None
+        return response
+
+    async def operation(self, op: dict) -> None:
+        """Run the cart lifecycle of one scheduled operation."""
+        start = datetime.fromisoformat(op["start"])
+        await self.clock.wait_until(start - self.lead)
+
+        response = await self.call("create_cart", "POST", "/api/carts/", json={
+            "status": "Prepared",
+            **{key: op[key] for key in ("patientId", "operation", "operationDate", "anaesthesiaType", "roomNumber")},
+        })
+        if response is None:
+            return
+        cart_id = response.json()["id"]
+
+        await self.call("evaluate_checklist", "POST", "/api/checklist/", json=op["checklist"])
+
+        items = []
+        for item in op["items"]:
+            response = await self.call("list_inventory_by_medication", "GET", f"/api/inventory/{item['medication_id']}")
+            batches = response.json() if response is not None else []
+            # Like the workflow: the first batch with enough stock
+            batch = next((b for b in batches if b["amount"] >= item["amount"]), None)
+            if batch:
+                items.append({"cart_id": cart_id, "inventory_id": batch["id"], **item})
+        if items:
+            await self.call("add_to_cart_bulk", "POST", "/api/cart-items/add-bulk", json=items)
+
+        if op.get("cancelled"):
+            await self.clock.wait_until(start)
+            await self.call("delete_cart", "DELETE", f"/api/carts/{cart_id}")
+            return
+
+        await self.clock.wait_until(start)
+        await self.call("start_operation", "PATCH", f"/api/carts/{cart_id}/status", json={"new_status": "In-Use"})
+        await self.clock.wait_until(datetime.fromisoformat(op["end"]))
+        await self.call("close_cart", "PATCH", f"/api/carts/{cart_id}/status", json={"new_status": "Closed"})
+
+    async def run(self) -> dict:
+        """Replay all operations and summarize latencies per step."""
+        from Application.backend.benchmarks.endpoints import summarize
+
+        started = time.perf_counter()
+        await asyncio.gather(*(self.operation(op) for op in self.schedule))
+        elapsed = time.perf_counter() - started
+        steps = {
+            step: summarize(latencies, self.errors[step], elapsed)
+            for step, latencies in self.latencies.items()
+            if latencies
+        }
+        return {
+            "operations": len(self.schedule),
+            "cancelled": sum(1 for op in self.schedule if op.get("cancelled")),
+            "requests": sum(len(latencies) for latencies in self.latencies.values()),
+            "errors": sum(self.errors.values()),
+            "elapsed_s": round(elapsed, 2),
+            "steps": steps,
+        }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    """Replay the dataset's schedule over HTTP or in-process."""
+    import httpx
+
+    from Application.backend.benchmarks.dataset import load_dataset, read_dataset
+    from Application.backend.benchmarks.endpoints import git_revision
+
+    dataset = read_dataset(args.dataset)
+
+    if args.base_url:
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout) as client:
+            results = await Replay(client, dataset["schedule"], args.concurrency, args.speed, args.lead_minutes).run()
+        database = None
+    else:
+        # Imported here: the app reads DATABASE_URL at import time
+        from Application.backend.core.database import engine
+        from Application.backend.main import app
+
+        engine.sync_engine.echo = False
+        try:
+            if args.load:
+                await load_dataset(engine, dataset)
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app, raise_app_exceptions=False),
+                base_url="http://replay",
+                timeout=args.timeout,
+            ) as client:
+                results = await Replay(client, dataset["schedule"], args.concurrency, args.speed, args.lead_minutes).run()
+        finally:
+            await engine.dispose()
+        database = engine.dialect.name
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_revision": git_revision(),
+            "dataset": args.dataset,
+            "target": args.base_url or database,
+            "rows": {name: len(rows) for name, rows in dataset.items()},
+            "concurrency": args.concurrency,
+            "speed": args.speed,
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dataset", default="or_day", help="Directory written by benchmarks.dataset")
+    parser.add_argument("--base-url", help="Replay against a running server instead of in-process")
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL", "sqlite+aiosqlite:///bench.db"))
+    parser.add_argument("--load", action="store_true", help="Load the dataset into --database-url first (tables are dropped)")
+    parser.add_argument("--concurrency", type=int, default=12)
+    parser.add_argument("--speed", type=float, default=0, help="Schedule seconds per real second, 0 = unpaced")
+    parser.add_argument("--lead-minutes", type=int, default=60, help="Minutes before the operation its cart is prepared")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    # The app reads its database URL at import time
+    os.environ["DATABASE_URL"] = args.database_url
+    # Keep the per-request client log out of the JSON report
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Scalable, reproducible seed data for benchmarks.
+
+Generates inventory batches, carts and cart items on top of the medication
+catalog in `core/data/medication_data_template.json`. The same `--seed`
+always produces the same rows.
+"""
+import json
+import os
+import random
+from datetime import date, timedelta
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import SQLModel
+
+from Application.backend.core.migrations import run_migrations
+from Application.backend.models.cart import Cart, CartStatus
+from Application.backend.models.cart_item import CartItem
+from Application.backend.models.inventory import Inventory
+from Application.backend.models.medication import Medication
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "core", "data")
+MEDICATION_TEMPLATE = os.path.join(DATA_DIR, "medication_data_template.json")
+
+ROOMS = [f"OR-{i:02d}" for i in range(1, 13)]
+OPERATIONS = ["Appendectomy", "Knee Meniscectomy", "Dekompression", "Cholecystectomy", "Hip Replacement"]
+ANAESTHESIA_TYPES = ["General", "Regional", "Local", "Sedation"]
+LOCATIONS = [f"{area} {shelf}{row}" for area in ("Fridge", "Shelf", "Safe") for shelf in "ABC" for row in range(1, 5)]
+
+CHUNK_SIZE = 5000
+
+
+def load_medications() -> list[dict]:
+    """Return the medication catalog used for seeding."""
+    with open(MEDICATION_TEMPLATE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+async def reset_schema(engine: AsyncEngine) -> None:
+    """Drop and recreate all tables and indexes."""
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+    await run_migrations(engine)
+
+
+async def insert_rows(conn, table, rows: list[dict]) -> None:
+    """Insert rows in chunks with executemany."""
+    for start in range(0, len(rows), CHUNK_SIZE):
+        await conn.execute(insert(table), rows[start:start + CHUNK_SIZE])
+
+
+async def seed_database(
+    engine: AsyncEngine,
+    inventory_rows: int = 1000,
+    carts: int = 10000,
+    items_per_cart: int = 3,
+    seed: int = 42,
+    medications: list[dict] | None = None,
+) -> dict:
+    """
+    Recreate the schema and fill it with generated data.
+
+    Args:
+        engine: Engine of the database to seed (its tables are dropped).
+        inventory_rows: Number of inventory batches, spread over all medications.
+        carts: Number of carts.
+        items_per_cart: Cart items per cart.
+        seed: Random seed, the same seed gives the same data.
+        medications: Medication catalog, defaults to the JSON template.
+
+    Returns:
+        dict with the number of rows per table.
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    medications = medications or load_medications()
+
+    await reset_schema(engine)
+
+    inventory = []
+    for i in range(inventory_rows):
+        medication = medications[i % len(medications)]
+        inventory.append({
+            "medicationId": medication["medicationId"],
+            "batchNumber": f"B{i:07d}",
+            "amount": float(rng.randint(100, 1000)),
+            "unit": medication["baseUnit"],
+            "location": rng.choice(LOCATIONS),
+            "expirationDate": today + timedelta(days=rng.randint(-30, 720)),
+            "min_stock": float(rng.randint(5, 50)),
+        })
+
+    cart_rows = [
+        {
+            "status": rng.choices(list(CartStatus), weights=[3, 2, 5])[0],
+            "patientId": f"patient-{i:06d}",
+            "operation": rng.choice(OPERATIONS),
+            "operationDate": today + timedelta(days=rng.randint(-30, 30)),
+            "anaesthesiaType": rng.choice(ANAESTHESIA_TYPES),
+            "roomNumber": rng.choice(ROOMS),
+        }
+        for i in range(carts)
+    ]
+
+    async with engine.begin() as conn:
+        await insert_rows(conn, Medication, medications)
+        await insert_rows(conn, Inventory, inventory)
+        await insert_rows(conn, Cart, cart_rows)
+
+        inventory_ids = (await conn.execute(
+            select(Inventory.id, Inventory.medicationId, Inventory.unit, Inventory.expirationDate)
+        )).all()
+        cart_ids = (await conn.execute(select(Cart.id))).scalars().all()
+
+        items = []
+        for cart_id in cart_ids:
+            for inv in rng.sample(inventory_ids, min(items_per_cart, len(inventory_ids))):
+                items.append({
+                    "cart_id": cart_id,
+                    "inventory_id": inv.id,
+                    "medication_id": inv.medicationId,
+                    "time_sensitive": rng.random() < 0.3,
+                    "amount": float(rng.randint(1, 5)),
+                    "unit": inv.unit,
+                    "expiration_date": inv.expirationDate,
+                })
+        await insert_rows(conn, CartItem, items)
+
+    return {
+        "medications": len(medications),
+        "inventory": len(inventory),
+        "carts": len(cart_rows),
+        "cart_items": len(items),
+    }
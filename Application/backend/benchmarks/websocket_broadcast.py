@@ -0,0 +1,128 @@
+"""
+WebSocket broadcast benchmark with simulated clients.
+
+Run from the project root:
+
+    python -m Application.backend.benchmarks.websocket_broadcast --clients 500 --slow 50
+
+Prints a JSON report with broadcast call latency, delivery latency to fast
+clients, and queue/drop metrics from the ConnectionManager. With `--rooms N`
+every client subscribes to one of N rooms and each event targets one room.
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from Application.backend.socket_manager import ConnectionManager, OverflowPolicy
+
+
+class SimulatedWebSocket:
+    """Minimal stand-in for a Starlette WebSocket with a configurable send delay."""
+
+    def __init__(self, send_delay: float = 0.0):
+        self.send_delay = send_delay
+        self.received = 0
+        self.last_received_at = 0.0
+        self.closed = False
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, message: str) -> None:
+        if self.send_delay:
+            await asyncio.sleep(self.send_delay)
+        else:
+            # Yield like a real socket write would
+            await asyncio.sleep(0)
+        self.received += 1
+        self.last_received_at = time.perf_counter()
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed = True
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the pct-th percentile of values (nearest-rank)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run(
+    clients: int, slow: int, messages: int, slow_delay: float, queue_size: int, policy: str, rooms: int = 0
+) -> dict:
+    """Connect simulated clients, broadcast messages and collect timings."""
+    manager = ConnectionManager(queue_size=queue_size, overflow_policy=OverflowPolicy(policy))
+    sockets = [SimulatedWebSocket(slow_delay if i < slow else 0.0) for i in range(clients)]
+    for i, ws in enumerate(sockets):
+        await manager.connect(ws, rooms=[f"OR-{i % rooms}"] if rooms else None)
+    fast_sockets = sockets[slow:]
+    expected = {ws: 0 for ws in sockets}
+    for i in range(messages):
+        for j, ws in enumerate(sockets):
+            if not rooms or j % rooms == i % rooms:
+                expected[ws] += 1
+
+    broadcast_latencies = []
+    start = time.perf_counter()
+    for i in range(messages):
+        payload = {"event_type": "Benchmark", "message": f"event {i}", "cart_id": None}
+        room = f"OR-{i % rooms}" if rooms else None
+        t0 = time.perf_counter()
+        await manager.broadcast(payload, room=room, event_type="Benchmark")
+        broadcast_latencies.append(time.perf_counter() - t0)
+        # Let writer tasks run between events, as the event loop would between requests
+        await asyncio.sleep(0)
+
+    # Wait until every fast client has received all messages
+    deadline = time.perf_counter() + 30
+    while any(ws.received < expected[ws] for ws in fast_sockets) and time.perf_counter() < deadline:
+        await asyncio.sleep(0.001)
+    fast_delivery = max((ws.last_received_at for ws in fast_sockets), default=start) - start
+    metrics_snapshot = manager.metrics()
+
+    for ws in list(manager.active_connections):
+        manager.disconnect(ws)
+
+    return {
+        "clients": clients,
+        "slow_clients": slow,
+        "slow_send_delay_s": slow_delay,
+        "messages": messages,
+        "rooms": rooms,
+        "queue_size": queue_size,
+        "overflow_policy": policy,
+        "broadcast_call_ms": {
+            "p50": round(percentile(broadcast_latencies, 50) * 1000, 3),
+            "p95": round(percentile(broadcast_latencies, 95) * 1000, 3),
+            "p99": round(percentile(broadcast_latencies, 99) * 1000, 3),
+            "max": round(max(broadcast_latencies) * 1000, 3),
+        },
+        "fast_clients_all_delivered_ms": round(fast_delivery * 1000, 3),
+        "fast_clients_complete": all(ws.received == expected[ws] for ws in fast_sockets),
+        "manager_metrics": metrics_snapshot,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--slow", type=int, default=50, help="Number of slow clients")
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--slow-delay", type=float, default=0.05, help="Seconds per send for slow clients")
+    parser.add_argument("--queue-size", type=int, default=64)
+    parser.add_argument("--rooms", type=int, default=0, help="Spread clients over this many room subscriptions")
+    parser.add_argument("--policy", choices=[p.value for p in OverflowPolicy], default=OverflowPolicy.drop_oldest.value)
+    args = parser.parse_args()
+
+    report = asyncio.run(
+        run(args.clients, args.slow, args.messages, args.slow_delay, args.queue_size, args.policy, args.rooms)
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
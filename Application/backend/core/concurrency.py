@@ -0,0 +1,51 @@
+from typing import Optional
+
+from fastapi import HTTPException, Response
+
+
+def etag(version: int) -> str:
+    """Render a row version as a strong entity tag."""
+    return f'"{version}"'
+
+
+def parse_if_match(header: Optional[str]) -> Optional[list[int]]:
+    """
+    Parse an `If-Match` header into the row versions it accepts.
+
+    - **header**: Raw header value, e.g. `"3"`, `"3", "4"` or `*`.
+
+    Returns `None` when there is no precondition (no header or `*`).
+    Tags that are not versions of this API match nothing, so a header made
+    only of those fails with 412 like any stale version. `If-Match` uses the
+    strong comparison, so weak tags (`W/"3"`) never match either.
+    """
+    if header is None or header.strip() == "*":
+        return None
+    versions = []
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            continue
+        tag = tag.strip('"')
+        if tag.isdigit():
+            versions.append(int(tag))
+    return versions
+
+
+def set_etag(response: Response, version: int) -> None:
+    """Expose the row version of the returned resource as `ETag`."""
+    response.headers["ETag"] = etag(version)
+
+
+def precondition_failed(resource: str, version: int) -> HTTPException:
+    """
+    Build the 412 raised when `If-Match` does not match the current version.
+
+    The current `ETag` is included, so the client can re-read and retry.
+    """
+    return HTTPException(
+        status_code=412,
+        detail=f"{resource} was modified concurrently (current version {version})",
+        headers={"ETag": etag(version)},
+    )
+
@@ -0,0 +1,147 @@
+import logging
+import os
+import time
+from uuid import uuid4
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from Application.backend.core.query_stats import SQL_ECHO, instrument_engine
+from Application.backend.core.request_metrics import Histogram, LATENCY_BUCKETS_MS
+
+logger = logging.getLogger(__name__)
+
+
+def _env_bool(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() in ("1", "true", "yes")
+
+
+# Replica for read-only requests, all requests use the primary when unset
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Seconds after which connections are replaced, below typical server/firewall idle timeouts
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = _env_bool("DB_POOL_PRE_PING", "true")
+# Prepared statements cached per asyncpg connection
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+# PgBouncer in transaction pooling mode cannot keep named prepared statements
+DB_PGBOUNCER = _env_bool("DB_PGBOUNCER", "false")
+# Direct connection to Postgres for session state (advisory locks, LISTEN), required with DB_PGBOUNCER
+DATABASE_DIRECT_URL = os.getenv("DATABASE_DIRECT_URL")
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each connection checkout waited."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.failures = 0
+
+    def _do_get(self):
+        t0 = time.perf_counter()
+        try:
+            return super()._do_get()
+        except Exception:
+            self.failures += 1
+            raise
+        finally:
+            self.checkout_ms.observe((time.perf_counter() - t0) * 1000)
+
+
+def direct_url(url: str) -> str:
+    """
+    Return the URL for connections that keep session state.
+
+    Leader election and the migration lock hold advisory locks for the whole
+    session and the Postgres notification backend `LISTEN`s, which PgBouncer
+    in transaction mode cannot provide. They use `DATABASE_DIRECT_URL` when it
+    is set and `url` otherwise.
+
+    - **url**: SQLAlchemy URL of the pooled primary.
+
+    Raises:
+        ValueError if `DB_PGBOUNCER` is set for Postgres without `DATABASE_DIRECT_URL`.
+    """
+    if DATABASE_DIRECT_URL:
+        return DATABASE_DIRECT_URL
+    if DB_PGBOUNCER and make_url(url).get_backend_name() == "postgresql":
+        raise ValueError("DB_PGBOUNCER requires DATABASE_DIRECT_URL, a connection that bypasses PgBouncer")
+    return url
+
+
+def engine_options(url: str, pgbouncer: bool = DB_PGBOUNCER) -> dict:
+    """
+    Build the `create_async_engine` options for a database URL from the environment.
+
+    - **url**: SQLAlchemy database URL.
+    - **pgbouncer**: Whether the URL points to PgBouncer in transaction pooling mode.
+
+    Returns a dict of keyword arguments. SQLite keeps SQLAlchemy's defaults.
+    """
+    options: dict = {"echo": SQL_ECHO, "future": True}
+    backend = make_url(url).get_backend_name()
+    if backend == "sqlite":
+        return options
+
+    options.update(
+        poolclass=TimedQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+    )
+    if make_url(url).get_driver_name() == "asyncpg":
+        if pgbouncer:
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                # Unique names, so statements never clash across server connections
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            }
+        else:
+            options["connect_args"] = {"prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE}
+    return options
+
+
+_engines: dict[str, AsyncEngine] = {}
+
+
+def create_engine(url: str, name: str = "primary", pgbouncer: bool = DB_PGBOUNCER) -> AsyncEngine:
+    """
+    Create an instrumented async engine configured from the environment.
+
+    - **url**: SQLAlchemy database URL.
+    - **name**: Label of the engine in the pool metrics (`primary`, `replica`, `direct`).
+    - **pgbouncer**: Whether the URL points to PgBouncer in transaction pooling mode.
+    """
+    engine = create_async_engine(url, **engine_options(url, pgbouncer))
+    instrument_engine(engine)
+    _engines[name] = engine
+    logger.info(f"Database engine '{name}' created ({make_url(url).render_as_string(hide_password=True)})")
+    return engine
+
+
+def pool_metrics() -> dict:
+    """
+    Return the state of every connection pool.
+
+    Includes the pool size, connections in use and overflow, and for queue
+    pools the checkout wait histogram in milliseconds and the number of
+    checkouts that failed (e.g. on `DB_POOL_TIMEOUT`).
+    """
+    metrics = {}
+    for name, engine in _engines.items():
+        pool = engine.sync_engine.pool
+        entry: dict = {"pool": type(pool).__name__}
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            entry.update(size=pool.size(), checked_out=pool.checkedout(), overflow=pool.overflow())
+        if isinstance(pool, TimedQueuePool):
+            entry.update(checkout_wait_ms=pool.checkout_ms.snapshot(), checkout_failures=pool.failures)
+        metrics[name] = entry
+    return metrics
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import os
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy.engine import make_url
+
+logger = logging.getLogger(__name__)
+
+# Postgres advisory lock held by the process running the Camunda workers and the seeding
+LEADER_LOCK_KEY = 7_203_114_002
+# Seconds between attempts to become leader, also the interval of the leader's liveness check
+LEADER_RETRY_SECONDS = float(os.getenv("LEADER_RETRY_SECONDS", "5"))
+
+Callback = Callable[[], Awaitable[None]]
+
+
+class LeaderElection:
+    """
+    Elects one leader among all processes sharing a Postgres database.
+
+    Every candidate keeps trying to take a session-level advisory lock on a
+    dedicated connection. The process holding it is the leader until its
+    connection ends: when the process dies, Postgres releases the lock and
+    another candidate takes over within `LEADER_RETRY_SECONDS`. A leader
+    that loses its connection steps down before campaigning again.
+
+    On other databases (e.g. SQLite in development and benchmarks) there is
+    only one process, which becomes leader immediately.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        on_elected: Callback,
+        on_demoted: Optional[Callback] = None,
+        key: int = LEADER_LOCK_KEY,
+        retry_interval: float = LEADER_RETRY_SECONDS,
+    ):
+        """
+        Create a candidate.
+
+        Args:
+            dsn: Database URL, SQLAlchemy style URLs (`postgresql+asyncpg://`) are accepted.
+            on_elected: Called after this process became leader.
+            on_demoted: Called after this process stopped being leader.
+            key: Advisory lock key identifying the election.
+            retry_interval: Seconds between attempts and between liveness checks.
+        """
+        url = make_url(dsn)
+        self.postgres = url.get_backend_name() == "postgresql"
+        self.dsn = url.set(drivername="postgresql").render_as_string(hide_password=False) if self.postgres else dsn
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.key = key
+        self.retry_interval = retry_interval
+        self.is_leader = False
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start campaigning in the background."""
+        if not self.postgres:
+            await self._elected()
+            return
+        self._task = asyncio.create_task(self._campaign())
+
+    async def stop(self) -> None:
+        """Stop campaigning and step down, releasing the lock."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        elif self.is_leader:
+            await self._demoted()
+
+    async def _elected(self) -> None:
+        self.is_leader = True
+        logger.info("This process is now the leader")
+        await self.on_elected()
+
+    async def _demoted(self) -> None:
+        self.is_leader = False
+        logger.warning("This process is no longer the leader")
+        if self.on_demoted is not None:
+            await self.on_demoted()
+
+    async def _campaign(self) -> None:
+        """Try to take the lock; once held, check the connection until it fails."""
+        import asyncpg
+
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                while not await connection.fetchval("SELECT pg_try_advisory_lock($1)", self.key):
+                    await asyncio.sleep(self.retry_interval)
+                await self._elected()
+                while True:
+                    await asyncio.sleep(self.retry_interval)
+                    await asyncio.wait_for(connection.fetchval("SELECT 1"), timeout=self.retry_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Leader election connection failed: {e}")
+            finally:
+                if self.is_leader:
+                    await asyncio.shield(self._demoted())
+                if connection is not None:
+                    # Closing the session releases the advisory lock
+                    connection.terminate()
+            await asyncio.sleep(self.retry_interval)
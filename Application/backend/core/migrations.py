@@ -0,0 +1,219 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Optional, Sequence, Union
+
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.schema import CreateIndex
+from sqlmodel import Field, SQLModel, select
+
+# Indexes are looked up in the model metadata, so every model must be loaded
+from Application.backend.models import analytics, cart, cart_item, inventory, medication, order, reservation  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+# Serializes migrations of processes starting at the same time (Postgres advisory lock key)
+MIGRATION_LOCK_KEY = 7_203_114_001
+MIGRATION_LOCK_POLL_SECONDS = 0.5
+
+
+class SchemaMigration(SQLModel, table=True):
+    __tablename__ = "schema_migrations"
+
+    version: int = Field(primary_key=True)
+    name: str
+    applied_at: datetime
+
+
+class Migration:
+    """
+    One schema change, applied once per database in version order.
+
+    Columns and indexes are referenced by table and name and created from
+    their model definition, so models stay the single source of the schema.
+    Columns are only added where missing; new columns need a server default
+    to fill existing rows. On Postgres indexes are built with
+    `CREATE INDEX CONCURRENTLY`, which does not block writes to the table.
+    Statements must be idempotent (`IF NOT EXISTS`); a statement given as
+    dict holds one variant per dialect name.
+    """
+
+    def __init__(
+        self,
+        version: int,
+        name: str,
+        indexes: Sequence[tuple[str, str]] = (),
+        statements: Sequence[Union[str, dict[str, str]]] = (),
+        columns: Sequence[tuple[str, str]] = (),
+    ):
+        """
+        Define a migration.
+
+        - **version**: Unique, increasing version number.
+        - **name**: Short description, stored with the applied version.
+        - **indexes**: `(table, index name)` pairs of model indexes to create.
+        - **statements**: Further SQL statements, run after the columns and before the indexes; dicts map dialect names to SQL.
+        - **columns**: `(table, column name)` pairs of model columns to add.
+        """
+        self.version = version
+        self.name = name
+        self.indexes = indexes
+        self.statements = statements
+        self.columns = columns
+
+
+MIGRATIONS = [
+    Migration(1, "Cart status and operation date", indexes=[
+        ("carts", "ix_carts_status_operationDate"),
+    ]),
+    Migration(2, "Indexes for hot query predicates", indexes=[
+        ("cart_items", "ix_cart_items_cart_id"),
+        ("cart_items", "ix_cart_items_expiration_date"),
+        ("carts", "ix_carts_patientId"),
+        ("inventory", "ix_inventory_batchNumber_medicationId"),
+        ("medications", "ix_medications_lower_name"),
+    ]),
+    Migration(3, "Row versions for optimistic concurrency", columns=[
+        ("inventory", "version"),
+        ("carts", "version"),
+    ]),
+    # The stock_reservations table itself is created with the other missing tables
+    Migration(4, "Stock reservations for prepared carts", columns=[
+        ("cart_items", "reserved"),
+    ]),
+    Migration(5, "Stability deadlines of prepared cart items", columns=[
+        ("cart_items", "prepared_at"),
+        ("cart_items", "stable_until"),
+        ("cart_items", "stability_notified_at"),
+    ], indexes=[
+        ("cart_items", "ix_cart_items_stable_until"),
+    ]),
+    # The waste_daily_rollups table is created with the other missing tables,
+    # fill it for existing carts with POST /admin/analytics/backfill
+    Migration(6, "Cart close time for waste analytics", columns=[
+        ("carts", "closed_at"),
+    ]),
+    # The order_lines table is created with the other missing tables; fill it
+    # from the medications JSON of the orders that have no lines yet
+    Migration(7, "Order lines for demand queries", statements=[{
+        "postgresql": """
+            INSERT INTO order_lines (order_id, "medicationId", amount)
+            SELECT o.id, line->>'medicationId', COALESCE((line->>'amount')::double precision, 0)
+            FROM orders o
+            CROSS JOIN LATERAL json_array_elements(
+                CASE WHEN json_typeof(o.medications) = 'array' THEN o.medications ELSE '[]'::json END
+            ) AS line
+            WHERE line->>'medicationId' IS NOT NULL
+              AND NOT EXISTS (SELECT 1 FROM order_lines l WHERE l.order_id = o.id)
+        """,
+        "sqlite": """
+            INSERT INTO order_lines (order_id, "medicationId", amount)
+            SELECT o.id, json_extract(line.value, '$.medicationId'), COALESCE(CAST(json_extract(line.value, '$.amount') AS REAL), 0)
+            FROM orders o, json_each(o.medications) AS line
+            WHERE json_type(o.medications) = 'array'
+              AND json_extract(line.value, '$.medicationId') IS NOT NULL
+              AND NOT EXISTS (SELECT 1 FROM order_lines l WHERE l.order_id = o.id)
+        """,
+    }], indexes=[
+        ("orders", "ix_orders_date"),
+    ]),
+]
+
+
+def _model_index(table: str, name: str):
+    """Look up an index definition in the model metadata."""
+    for index in SQLModel.metadata.tables[table].indexes:
+        if index.name == name:
+            return index
+    raise KeyError(f"Index '{name}' is not defined on table '{table}'")
+
+
+def create_index_sql(table: str, name: str, dialect) -> str:
+    """Render `CREATE INDEX [CONCURRENTLY] IF NOT EXISTS` for a model index."""
+    sql = str(CreateIndex(_model_index(table, name), if_not_exists=True).compile(dialect=dialect))
+    if dialect.name == "postgresql":
+        sql = sql.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1)
+    return sql
+
+
+def add_column_sql(table: str, name: str, dialect) -> str:
+    """Render `ALTER TABLE ... ADD COLUMN` for a model column, with its type, default and nullability."""
+    column = SQLModel.metadata.tables[table].c[name]
+    preparer = dialect.identifier_preparer
+    sql = f"ALTER TABLE {preparer.format_table(column.table)} ADD COLUMN {preparer.format_column(column)} {column.type.compile(dialect=dialect)}"
+    if column.server_default is not None:
+        default = column.server_default.arg
+        sql += f" DEFAULT {default}" if isinstance(default, str) else f" DEFAULT {default.compile(dialect=dialect)}"
+    if not column.nullable:
+        sql += " NOT NULL"
+    return sql
+
+
+async def _has_column(conn, table: str, name: str) -> bool:
+    columns = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_columns(table))
+    return any(column["name"] == name for column in columns)
+
+
+async def _drop_if_invalid(conn, name: str) -> None:
+    """Drop an index left invalid by an interrupted concurrent build, so it is rebuilt."""
+    invalid = (await conn.execute(
+        text("SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name AND NOT i.indisvalid"),
+        {"name": name},
+    )).first()
+    if invalid:
+        logger.warning(f"Rebuilding invalid index {name}")
+        await conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+
+
+async def run_migrations(engine: AsyncEngine, migrations: Optional[list[Migration]] = None) -> list[int]:
+    """
+    Create missing tables and apply all pending migrations.
+
+    Runs outside a transaction, as concurrent index builds require. On
+    Postgres an advisory lock makes processes starting at the same time
+    apply migrations one after another.
+
+    Returns the versions applied by this call.
+    """
+    migrations = sorted(migrations or MIGRATIONS, key=lambda migration: migration.version)
+    applied_now = []
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        postgres = conn.dialect.name == "postgresql"
+        if postgres:
+            # Poll instead of blocking in pg_advisory_lock: a waiting session would hold
+            # a transaction open, which a concurrent index build waits for (deadlock)
+            while not (await conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})).scalar():
+                await asyncio.sleep(MIGRATION_LOCK_POLL_SECONDS)
+        try:
+            # Missing tables first: new tables come with their indexes, new indexes on
+            # existing tables need a migration
+            await conn.run_sync(lambda sync_conn: SQLModel.metadata.create_all(sync_conn, checkfirst=True))
+            applied = set((await conn.execute(select(SchemaMigration.version))).scalars())
+
+            for migration in migrations:
+                if migration.version in applied:
+                    continue
+                logger.info(f"Applying migration {migration.version}: {migration.name}")
+                for table, name in migration.columns:
+                    # Tables created above already have the column
+                    if not await _has_column(conn, table, name):
+                        await conn.execute(text(add_column_sql(table, name, conn.dialect)))
+                for statement in migration.statements:
+                    if isinstance(statement, dict):
+                        statement = statement[conn.dialect.name]
+                    await conn.execute(text(statement))
+                for table, name in migration.indexes:
+                    if postgres:
+                        await _drop_if_invalid(conn, name)
+                    await conn.execute(text(create_index_sql(table, name, conn.dialect)))
+                await conn.execute(SchemaMigration.__table__.insert().values(
+                    version=migration.version, name=migration.name, applied_at=datetime.now(timezone.utc).replace(tzinfo=None)
+                ))
+                applied_now.append(migration.version)
+        finally:
+            # A broken connection releases the lock when it closes
+            if postgres and not conn.invalidated:
+                await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+    return applied_now
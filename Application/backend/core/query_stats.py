@@ -0,0 +1,161 @@
+import logging
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# Log every SQL statement (SQLAlchemy echo), off by default
+SQL_ECHO = os.getenv("SQL_ECHO", "false").lower() in ("1", "true", "yes")
+# Requests issuing more statements than this are logged, 0 disables the check
+SQL_QUERY_BUDGET = int(os.getenv("SQL_QUERY_BUDGET", "25"))
+# The same statement repeated this often within one request is reported as a likely N+1
+SQL_REPEAT_THRESHOLD = int(os.getenv("SQL_REPEAT_THRESHOLD", "10"))
+
+
+class QueryStats:
+    """Statements issued and database time spent within one scope (usually a request)."""
+
+    def __init__(self, parent: Optional["QueryStats"] = None):
+        """
+        Create empty statistics.
+
+        - **parent**: Enclosing statistics that also receive every recorded statement.
+        """
+        self.parent = parent
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter[str] = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        """Account one executed statement."""
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+        if self.parent is not None:
+            self.parent.record(statement, duration)
+
+    def repeated(self, threshold: int = SQL_REPEAT_THRESHOLD) -> list[tuple[str, int]]:
+        """Return statements executed at least `threshold` times, most frequent first."""
+        return [(statement, n) for statement, n in self.statements.most_common() if n >= threshold]
+
+    def server_timing(self) -> str:
+        """Format the statistics as a `Server-Timing` header value."""
+        return f'db;dur={self.duration * 1000:.1f};desc="{self.count} queries"'
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_stats() -> Optional[QueryStats]:
+    """Return the statistics of the current scope, if one is active."""
+    return _current.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Collect the statements executed inside the `with` block.
+
+    Scopes nest: statements are also counted by any enclosing scope.
+    """
+    stats = QueryStats(parent=_current.get())
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryStats]:
+    """
+    Test helper: fail if the block issues more than `limit` statements.
+
+    Works with requests made through `httpx.ASGITransport`, which run the app
+    in the caller's context:
+
+        with assert_max_queries(3):
+            await client.get("/api/carts/available")
+
+    Raises:
+        AssertionError listing the executed statements when over the limit.
+    """
+    with track_queries() as stats:
+        yield stats
+    if stats.count > limit:
+        listing = "\n".join(f"  {n}x {statement}" for statement, n in stats.statements.most_common())
+        raise AssertionError(f"Expected at most {limit} queries, {stats.count} were executed:\n{listing}")
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Count statements and their duration for the active `QueryStats` scope."""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info["query_start"].pop()
+        stats = _current.get()
+        if stats is not None:
+            stats.record(statement, duration)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start"):
+            conn.info["query_start"].pop()
+
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware that counts the statements of each HTTP request.
+
+    Adds a `Server-Timing` header with the statement count and database time,
+    and logs requests over `SQL_QUERY_BUDGET` statements as well as statements
+    repeated `SQL_REPEAT_THRESHOLD` times or more (a typical N+1 pattern).
+    """
+
+    def __init__(self, app, budget: int = SQL_QUERY_BUDGET, repeat_threshold: int = SQL_REPEAT_THRESHOLD):
+        self.app = app
+        self.budget = budget
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_with_timing(message):
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", stats.server_timing().encode("latin-1")))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._report(scope, stats)
+
+    def _report(self, scope, stats: QueryStats) -> None:
+        """Log budget overruns and repeated statements of a finished request."""
+        route = scope.get("route")
+        name = f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+        if self.budget and stats.count > self.budget:
+            logger.warning(
+                f"{name} issued {stats.count} queries ({stats.duration * 1000:.1f} ms), budget is {self.budget}"
+            )
+        for statement, n in stats.repeated(self.repeat_threshold):
+            logger.warning(f"{name} repeated a statement {n} times, possible N+1: {' '.join(statement.split())[:200]}")
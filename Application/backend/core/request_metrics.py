@@ -0,0 +1,254 @@
+import bisect
+import functools
+import inspect
+import logging
+import os
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+
+from Application.backend.core.query_stats import track_queries
+
+logger = logging.getLogger(__name__)
+
+# Requests slower than this are logged with their time split into DB and serialization
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", "500"))
+
+# Upper bucket bounds; the last bucket takes everything above
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+SIZE_BUCKETS_BYTES = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+# Route label of requests that did not match an API route (404s, static files)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram.
+
+    Only updated from the event loop and never across an `await`, so the
+    plain counters need no locking.
+    """
+
+    def __init__(self, bounds: tuple):
+        """
+        Create an empty histogram.
+
+        - **bounds**: Ascending upper bounds of the buckets.
+        """
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add one observation."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> float:
+        """Estimate the `q`-th percentile as the upper bound of its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(self.bounds[i], self.max) if i < len(self.bounds) else self.max
+        return self.max
+
+    def snapshot(self) -> dict:
+        """Return the buckets as `{upper bound: count}` plus summary values."""
+        labels = [str(bound) for bound in self.bounds] + ["+Inf"]
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else 0.0,
+            "p50": round(self.percentile(50), 3),
+            "p95": round(self.percentile(95), 3),
+            "p99": round(self.percentile(99), 3),
+            "max": round(self.max, 3),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class RouteMetrics:
+    """Latency, status and payload size statistics of one route template."""
+
+    def __init__(self):
+        self.latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.size_bytes = Histogram(SIZE_BUCKETS_BYTES)
+        self.statuses: Counter[int] = Counter()
+        self.db_ms = 0.0
+        self.queries = 0
+
+    def observe(self, status: int, duration_ms: float, size: int, db_ms: float, queries: int) -> None:
+        """Add one finished request."""
+        self.latency_ms.observe(duration_ms)
+        self.size_bytes.observe(size)
+        self.statuses[status] += 1
+        self.db_ms += db_ms
+        self.queries += queries
+
+    def snapshot(self) -> dict:
+        """Return the statistics as a JSON-serializable dict."""
+        count = self.latency_ms.count
+        return {
+            "count": count,
+            "total_ms": round(self.latency_ms.total, 1),
+            "statuses": {str(status): n for status, n in sorted(self.statuses.items())},
+            "latency_ms": self.latency_ms.snapshot(),
+            "size_bytes": self.size_bytes.snapshot(),
+            "db_ms_mean": round(self.db_ms / count, 3) if count else 0.0,
+            "queries_mean": round(self.queries / count, 2) if count else 0.0,
+        }
+
+
+class RequestMetrics:
+    """In-process request statistics keyed by method and route template."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.routes: dict[tuple[str, str], RouteMetrics] = {}
+
+    def observe(self, method: str, route: str, status: int, duration_ms: float, size: int,
+                db_ms: float = 0.0, queries: int = 0) -> None:
+        """Add one finished request to the statistics of its route."""
+        key = (method, route)
+        metrics = self.routes.get(key)
+        if metrics is None:
+            metrics = self.routes[key] = RouteMetrics()
+        metrics.observe(status, duration_ms, size, db_ms, queries)
+
+    def reset(self) -> None:
+        """Forget all collected statistics."""
+        self.started = time.time()
+        self.routes = {}
+
+    def snapshot(self) -> dict:
+        """
+        Return all routes, the ones with the most total time first.
+
+        Returns:
+            dict with the collection window in seconds and one entry per route.
+        """
+        routes = [
+            {"method": method, "route": route, **metrics.snapshot()}
+            for (method, route), metrics in self.routes.items()
+        ]
+        routes.sort(key=lambda route: route["total_ms"], reverse=True)
+        return {"window_s": round(time.time() - self.started, 1), "routes": routes}
+
+
+class RequestTiming:
+    """Timestamps of the phases of the current request."""
+
+    def __init__(self):
+        self.endpoint_done: Optional[float] = None
+        self.response_started: Optional[float] = None
+
+
+_current: ContextVar[Optional[RequestTiming]] = ContextVar("request_timing", default=None)
+
+
+def _timed_endpoint(call):
+    """Wrap an endpoint function to note when it returned, keeping it sync or async."""
+    if inspect.iscoroutinefunction(call):
+        @functools.wraps(call)
+        async def timed(*args, **kwargs):
+            try:
+                return await call(*args, **kwargs)
+            finally:
+                timing = _current.get()
+                if timing is not None:
+                    timing.endpoint_done = time.perf_counter()
+    else:
+        @functools.wraps(call)
+        def timed(*args, **kwargs):
+            try:
+                return call(*args, **kwargs)
+            finally:
+                timing = _current.get()
+                if timing is not None:
+                    timing.endpoint_done = time.perf_counter()
+    return timed
+
+
+def instrument_routes(app: FastAPI) -> None:
+    """
+    Mark the end of every endpoint function of the app.
+
+    The time between the endpoint returning and the response starting is the
+    response model validation and JSON serialization. Call this after all
+    routers have been included.
+    """
+    for route in app.routes:
+        if isinstance(route, APIRoute) and not getattr(route.dependant.call, "__timed__", False):
+            route.dependant.call = _timed_endpoint(route.dependant.call)
+            route.dependant.call.__timed__ = True
+
+
+# Global instance shared by the middleware and the metrics endpoint
+request_metrics = RequestMetrics()
+
+
+class RequestTimingMiddleware:
+    """
+    ASGI middleware recording the latency, status and response size of every
+    HTTP request per route template into `request_metrics`.
+
+    Requests slower than `SLOW_REQUEST_MS` are logged with their database and
+    serialization time.
+    """
+
+    def __init__(self, app, metrics: RequestMetrics = request_metrics, slow_ms: float = SLOW_REQUEST_MS):
+        self.app = app
+        self.metrics = metrics
+        self.slow_ms = slow_ms
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming()
+        token = _current.set(timing)
+        status = 500
+        size = 0
+
+        async def send_with_timing(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                timing.response_started = time.perf_counter()
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            with track_queries() as queries:
+                await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            duration_ms = (time.perf_counter() - start) * 1000
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            db_ms = queries.duration * 1000
+            self.metrics.observe(scope["method"], route, status, duration_ms, size, db_ms, queries.count)
+
+            if duration_ms >= self.slow_ms:
+                serialization = ""
+                if timing.endpoint_done and timing.response_started:
+                    serialization = f", serialization {(timing.response_started - timing.endpoint_done) * 1000:.1f} ms"
+                logger.warning(
+                    f"Slow request {scope['method']} {route} -> {status} took {duration_ms:.1f} ms "
+                    f"(db {db_ms:.1f} ms in {queries.count} queries{serialization}, {size} bytes)"
+                )
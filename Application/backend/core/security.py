@@ -0,0 +1,23 @@
+import os
+import secrets
+from typing import Optional
+
+from fastapi import Header, HTTPException
+
+# Shared secret for administrative endpoints; they are disabled when unset
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+
+async def require_admin(x_admin_token: Optional[str] = Header(None, description="Administrator token")) -> None:
+    """
+    Dependency guarding administrative endpoints.
+
+    - **x_admin_token**: Value of the `X-Admin-Token` header, must equal `ADMIN_TOKEN`.
+
+    Raises:
+        HTTPException 403 if no `ADMIN_TOKEN` is configured, 401 if the token is missing or wrong.
+    """
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled, set ADMIN_TOKEN to enable them")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
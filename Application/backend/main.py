@@ -1,13 +1,28 @@
+import os
 from contextlib import asynccontextmanager
 import uvicorn
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from Application.backend.core.database import init_db
+from Application.backend.core.database import DATABASE_DIRECT_URL, async_session_maker, init_db
+from Application.backend.core.leader import LeaderElection
+from Application.backend.core.query_stats import QueryStatsMiddleware
+from Application.backend.core.request_metrics import RequestTimingMiddleware, instrument_routes
+from Application.backend.notification_backends import create_backend
+from Application.backend.services.analytics_service import waste_aggregator
+from Application.backend.services.low_stock_index import low_stock_index
+from Application.backend.services.medication_index import medication_index
+from Application.backend.services.order_batcher import order_batcher
+from Application.backend.services.stability_scheduler import stability_scheduler
+from Application.backend.socket_manager import WS_PING_INTERVAL, WS_PING_TIMEOUT, manager
 from Application.backend.routers import (
+    admin,
+    analytics,
     cart_items,
     carts,
     checklists,
+    dashboard,
+    forecast,
     utils,
     inventories,
     medications,
@@ -16,13 +31,34 @@ from Application.backend.routers import (
     frontend,
 )
 
-from Application.backend.worker import start_camunda_workers
+from Application.backend.worker import on_demoted, on_elected
+
+# `embedded`: the elected leader among the API processes runs the Camunda workers and the seeding
+# `external`: both are left to a separate `python -m Application.backend.worker` process
+CAMUNDA_WORKERS = os.getenv("CAMUNDA_WORKERS", "embedded")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db()
-    start_camunda_workers()
+    await manager.start(create_backend(dsn=DATABASE_DIRECT_URL))
+    await stability_scheduler.start(async_session_maker)
+    await low_stock_index.start(async_session_maker)
+    await medication_index.start(async_session_maker)
+    order_batcher.start(async_session_maker)
+    waste_aggregator.start(async_session_maker)
+    leader = LeaderElection(DATABASE_DIRECT_URL, on_elected, on_demoted) if CAMUNDA_WORKERS == "embedded" else None
+    if leader:
+        await leader.start()
     yield
+    if leader:
+        await leader.stop()
+    await waste_aggregator.stop()
+    await order_batcher.stop()
+    await medication_index.stop()
+    await low_stock_index.stop()
+    await stability_scheduler.stop()
+    await manager.stop()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -38,7 +74,10 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(RequestTimingMiddleware)
 
 api_router = APIRouter(prefix="/api")
 
@@ -50,11 +89,23 @@ api_router.include_router(carts.router)
 api_router.include_router(cart_items.router)
 api_router.include_router(checklists.router)
 api_router.include_router(notifications.router)
+api_router.include_router(analytics.router)
+api_router.include_router(dashboard.router)
+api_router.include_router(forecast.router)
 
 app.include_router(api_router)
 app.include_router(frontend.router)
 app.include_router(utils.router)
+app.include_router(admin.router)
+instrument_routes(app)
 
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        ws_ping_interval=WS_PING_INTERVAL,
+        ws_ping_timeout=WS_PING_TIMEOUT,
+    )
\ No newline at end of file
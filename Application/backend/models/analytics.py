@@ -0,0 +1,67 @@
+from sqlmodel import SQLModel, Field
+from datetime import date
+from enum import Enum
+from typing import Optional
+
+
+class WasteDimension(str, Enum):
+    medication = "medication"
+    operation = "operation"
+    room = "room"
+
+
+class WasteRollup(SQLModel, table=True):
+    """
+    Daily totals per medication, operation type or room, aggregated from the waste events.
+
+    The day is the operation date of the cart. The primary key order serves
+    date-range queries of one dimension.
+    """
+    __tablename__ = "waste_daily_rollups"
+
+    # A `WasteDimension` value, kept as plain string to stay portable in INSERT ... SELECT
+    dimension: str = Field(primary_key=True)
+    day: date = Field(primary_key=True)
+    key: str = Field(primary_key=True)
+    # Added to carts
+    dispensed: float = 0
+    # Removed from carts again, back to stock
+    returned: float = 0
+    # Past their chemical stability or batch expiration when the cart was closed
+    expired: float = 0
+
+
+class WasteEvent(SQLModel, table=True):
+    """
+    An amount recorded with a cart change, not yet added to the daily rollups.
+
+    Cart changes only append events, so they never wait for each other on a
+    shared rollup row; the waste aggregator folds them into
+    `waste_daily_rollups` in the background and deletes them.
+    """
+    __tablename__ = "waste_events"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    # Operation date of the cart
+    day: date
+    medicationId: str
+    operation: str
+    room: str
+    # `dispensed`, `returned` or `expired`
+    metric: str
+    amount: float
+
+
+class WasteReport(SQLModel):
+    key: str
+    dispensed: float
+    returned: float
+    expired: float
+    waste_rate: float
+
+
+class WasteDailyReport(SQLModel):
+    day: date
+    dispensed: float
+    returned: float
+    expired: float
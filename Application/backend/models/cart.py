@@ -1,6 +1,7 @@
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
 from typing import Optional
-from datetime import date
+from datetime import date, datetime
 from enum import Enum
 
 
@@ -11,14 +12,21 @@ class CartStatus(str, Enum):
 
 class Cart(SQLModel, table=True):
     __tablename__ = "carts"
+    __table_args__ = (
+        Index("ix_carts_status_operationDate", "status", "operationDate"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True, index=True)
     status: CartStatus
-    patientId: str
+    patientId: str = Field(index=True)
     operation: str
     operationDate: date
     anaesthesiaType: str
     roomNumber: str
+    # First time the cart was closed, expired items are judged against it
+    closed_at: Optional[datetime] = None
+    # Incremented by every update, exposed as ETag for If-Match requests
+    version: int = Field(default=1, sa_column_kwargs={"server_default": "1"})
 
 
 class CartCreate(SQLModel):
@@ -30,6 +38,11 @@ class CartCreate(SQLModel):
     roomNumber: str
 
 
+class CartAvailability(SQLModel):
+    available: bool
+    cart_id: Optional[int] = None
+
+
 CART_EXAMPLE = {
     "status": "Prepared",
     "patientId": "patient-123",
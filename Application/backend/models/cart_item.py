@@ -1,6 +1,7 @@
 from sqlmodel import SQLModel, Field
+from sqlalchemy import false
 from typing import Optional
-from datetime import date
+from datetime import date, datetime
 
 
 class CartItem(SQLModel, table=True):
@@ -8,7 +9,7 @@ class CartItem(SQLModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
 
-    cart_id: int = Field(foreign_key="carts.id")
+    cart_id: int = Field(foreign_key="carts.id", index=True)
     inventory_id: int = Field(foreign_key="inventory.id")
 
     medication_id: str = Field(foreign_key="medications.medicationId")
@@ -16,7 +17,14 @@ class CartItem(SQLModel, table=True):
     time_sensitive: bool
     amount: float
     unit: str
-    expiration_date: Optional[date] = None
+    expiration_date: Optional[date] = Field(default=None, index=True)
+    # Stock is held by a reservation and not yet decremented (cart still `Prepared`)
+    reserved: bool = Field(default=False, sa_column_kwargs={"server_default": false()})
+    # Time-sensitive items: prepared at, chemically stable until (plus the medication's stability hours)
+    prepared_at: Optional[datetime] = None
+    stable_until: Optional[datetime] = Field(default=None, index=True)
+    # Set once the warning before `stable_until` was sent
+    stability_notified_at: Optional[datetime] = None
 
 
 class AddToCartRequest(SQLModel):
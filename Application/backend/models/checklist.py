@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from typing import Optional
 
 class ChecklistItem(BaseModel):
     checked: bool
@@ -12,6 +13,9 @@ class ChecklistItemResponse(BaseModel):
     name: str
     location: str
     amount: float
+    medication_id: Optional[str] = None
+    # 1.0 for an exact name match, the similarity for a fuzzy match, None if no medication matched
+    match_confidence: Optional[float] = None
 
 
 CHECKLIST_EXAMPLE = [
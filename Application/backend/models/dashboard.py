@@ -0,0 +1,38 @@
+from sqlmodel import SQLModel
+from typing import Dict, List
+from datetime import date
+
+
+class LowStockItem(SQLModel):
+    medicationId: str
+    name: str
+    # Total across all batches, against the largest `min_stock` of the batches
+    amount: float
+    min_stock: float
+    batches: int
+
+
+class ExpiringBatch(SQLModel):
+    inventory_id: int
+    medicationId: str
+    batchNumber: str
+    expirationDate: date
+    amount: float
+
+
+class OpenOrder(SQLModel):
+    id: int
+    name: str
+    date: date
+    isRush: bool
+    isInternal: bool
+
+
+class DashboardSummary(SQLModel):
+    carts_by_status: Dict[str, int]
+    low_stock_count: int
+    low_stock: List[LowStockItem]
+    expiring_count: int
+    expiring_batches: List[ExpiringBatch]
+    open_orders_count: int
+    open_orders: List[OpenOrder]
@@ -0,0 +1,22 @@
+from sqlmodel import SQLModel
+from typing import List, Optional
+
+
+class MinStockRecommendation(SQLModel):
+    inventory_id: int
+    medicationId: str
+    location: str
+    current_min_stock: float
+    # Mean and standard deviation of the daily consumption at the batch's location
+    daily_mean: float
+    daily_std: float
+    # Days between two orders of the medication, covered by the stock on top of the lead time
+    review_days: float
+    safety_stock: float
+    reorder_point: float
+    recommended_min_stock: float
+
+
+class MinStockApplyRequest(SQLModel):
+    # Only these inventory items, all recommendations if omitted
+    inventory_ids: Optional[List[int]] = None
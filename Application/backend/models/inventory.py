@@ -1,10 +1,14 @@
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
 from typing import Optional
 from datetime import date
 
 
 class Inventory(SQLModel, table=True):
     __tablename__ = "inventory"
+    __table_args__ = (
+        Index("ix_inventory_batchNumber_medicationId", "batchNumber", "medicationId"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     medicationId: str = Field(foreign_key="medications.medicationId", index=True)
@@ -14,6 +18,18 @@ class Inventory(SQLModel, table=True):
     location: str
     expirationDate: date
     min_stock: float
+    # Incremented by every update, exposed as ETag for If-Match requests
+    version: int = Field(default=1, sa_column_kwargs={"server_default": "1"})
+
+
+class InventoryAvailability(SQLModel):
+    inventory_id: int
+    batchNumber: str
+    location: str
+    expirationDate: date
+    amount: float
+    held: float
+    available: float
 
 
 class InventoryCreate(SQLModel):
@@ -34,4 +50,10 @@ INVENTORY_POST_EXAMPLE = {
     "location": "A1",
     "expirationDate": "2025-12-31",
     "min_stock": 10
-}
\ No newline at end of file
+}
+
+class StockLevel(SQLModel):
+    medicationId: str
+    total: float
+    min_stock: float
+    low: bool
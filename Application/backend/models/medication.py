@@ -1,8 +1,13 @@
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index, func, literal_column
 
 
 class Medication(SQLModel, table=True):
     __tablename__ = "medications"
+    __table_args__ = (
+        # Case-insensitive name lookup of the checklist evaluation
+        Index("ix_medications_lower_name", func.lower(literal_column("name"))),
+    )
 
     medicationId: str = Field(primary_key=True, index=True)
 
@@ -26,6 +31,15 @@ class MedicationCreate(SQLModel):
     chemicalStabilityHours: int
 
 
+class MedicationMatch(SQLModel):
+    medicationId: str
+    name: str
+    # Name or alias the query matched
+    matched_name: str
+    # Similarity between 0 and 1
+    score: float
+
+
 MEDICATION_EXAMPLE = {
     "medicationId": "relaxant-001",
     "name": "Midazolam",
@@ -1,10 +1,14 @@
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import JSON
+from sqlalchemy import JSON, Index
 from typing import Optional, List, Dict
-from datetime import date
+from datetime import date, datetime
 
 class Order(SQLModel, table=True):
     __tablename__ = "orders"
+    __table_args__ = (
+        # Date ranges of the demand queries
+        Index("ix_orders_date", "date"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True, index=True)
     name: str
@@ -14,6 +18,39 @@ class Order(SQLModel, table=True):
     isRush: bool
 
 
+class OrderLine(SQLModel, table=True):
+    """One medication of an order, kept in sync with `Order.medications` for SQL aggregates."""
+    __tablename__ = "order_lines"
+    __table_args__ = (
+        Index("ix_order_lines_medicationId_order_id", "medicationId", "order_id"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    order_id: int = Field(foreign_key="orders.id", index=True)
+    medicationId: str
+    amount: float
+
+
+class ReorderLine(SQLModel, table=True):
+    """A reorder request, pending until it is written to an order of its supplier."""
+    __tablename__ = "reorder_requests"
+    __table_args__ = (
+        Index("ix_reorder_requests_supplier_isInternal_order_id", "supplier", "isInternal", "order_id"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    # Retried requests with the same ID are only counted once
+    request_id: Optional[str] = Field(default=None, unique=True)
+    medicationId: str
+    supplier: str
+    amount: float
+    isRush: bool
+    isInternal: bool
+    created_at: datetime
+    # Order the request was written to, NULL while pending; no foreign key, so orders can be deleted
+    order_id: Optional[int] = None
+
+
 class OrderCreate(SQLModel):
     name: str
     date: date
@@ -22,6 +59,35 @@ class OrderCreate(SQLModel):
     isRush: bool
 
 
+class ReorderRequest(SQLModel):
+    medicationId: str
+    amount: float
+    isRush: bool = False
+    isInternal: bool = False
+    # Retried requests with the same ID are only counted once
+    request_id: Optional[str] = None
+
+
+class ReorderReceipt(SQLModel):
+    supplier: str
+    queued: bool
+    order_id: Optional[int] = None
+    lines: int
+
+
+class MedicationDemand(SQLModel):
+    medicationId: str
+    amount: float
+    rush_amount: float
+    orders: int
+
+
+class DailyDemand(SQLModel):
+    day: date
+    amount: float
+    orders: int
+
+
 ORDER_EXAMPLE = {
     "name": "Weekly Restock",
     "date": "2025-12-01",
@@ -31,4 +97,12 @@ ORDER_EXAMPLE = {
     ],
     "isInternal": False,
     "isRush": True
-}
\ No newline at end of file
+}
+
+
+REORDER_EXAMPLE = {
+    "medicationId": "relaxant-001",
+    "amount": 20,
+    "isRush": False,
+    "isInternal": False
+}
@@ -0,0 +1,26 @@
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
+from typing import Optional
+from datetime import datetime
+
+
+class StockReservation(SQLModel, table=True):
+    """
+    Hold on inventory stock for an item of a `Prepared` cart.
+
+    The stock is only decremented when the cart moves to `In-Use`; until
+    then the hold keeps the amount from being promised to other carts, up
+    to `expires_at`. Expired holds are deleted by the reservation sweeper.
+    """
+    __tablename__ = "stock_reservations"
+    __table_args__ = (
+        # Available-to-promise: active holds per inventory item
+        Index("ix_stock_reservations_inventory_id_expires_at", "inventory_id", "expires_at"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    cart_id: int = Field(foreign_key="carts.id", index=True)
+    cart_item_id: int = Field(foreign_key="cart_items.id", index=True)
+    inventory_id: int = Field(foreign_key="inventory.id")
+    amount: float
+    expires_at: datetime = Field(index=True)
@@ -0,0 +1,222 @@
+import asyncio
+import itertools
+import json
+import logging
+import os
+from typing import Callable
+
+from sqlalchemy.engine import make_url
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATION_BACKEND = os.getenv("NOTIFICATION_BACKEND", "memory")
+NOTIFICATION_CHANNEL = os.getenv("NOTIFICATION_CHANNEL", "gotthard_notifications")
+NOTIFICATION_SEQUENCE = "gotthard_notification_seq"
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+PG_NOTIFY_MAX_BYTES = 7999
+# Oversized events kept by the publishing process until their NOTIFY comes back
+PG_OVERSIZED_PENDING = 100
+
+Deliver = Callable[[dict], None]
+
+
+class BroadcastBackend:
+    """
+    Transport between `ConnectionManager.broadcast` and the local sockets.
+
+    `publish` hands an event to the transport; the transport assigns it the
+    next sequence number (`seq`) and calls the `deliver` callback given to
+    `start` in every process that should forward the event to its own
+    WebSocket connections. Sequence numbers increase monotonically across
+    all processes sharing the transport, but a transport may deliver them
+    out of order or skip some; `deliver` has to cope with both.
+
+    An event delivered with `"truncated": true` only carries its `seq` and
+    `routing`: its payload could not be transported to this process.
+    """
+
+    async def start(self, deliver: Deliver) -> None:
+        """
+        Start the transport.
+
+        Args:
+            deliver: Callback that routes an event to the local sockets.
+        """
+        raise NotImplementedError
+
+    async def stop(self) -> None:
+        """Stop the transport and release its resources."""
+
+    async def publish(self, event: dict) -> None:
+        """
+        Publish an event to all processes.
+
+        Args:
+            event: JSON-serializable event with `payload` and `routing`.
+        """
+        raise NotImplementedError
+
+
+class InMemoryBackend(BroadcastBackend):
+    """Single-process transport: events are delivered directly to the local sockets."""
+
+    def __init__(self, deliver: Deliver | None = None):
+        """
+        Create the in-memory transport.
+
+        Args:
+            deliver: Optional callback, can also be set through `start`.
+        """
+        self._deliver = deliver
+        self._sequence = itertools.count(1)
+
+    async def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+
+    async def publish(self, event: dict) -> None:
+        self._deliver({**event, "seq": next(self._sequence)})
+
+
+class PostgresBackend(BroadcastBackend):
+    """
+    Cross-process transport using Postgres `LISTEN/NOTIFY`.
+
+    Every process listens on the same channel on a dedicated connection and
+    delivers received events to its local sockets. Publishing goes through
+    a small separate pool, so the listening connection is never busy.
+    Sequence numbers come from a database sequence, so they are shared by
+    all processes. Events too large for `NOTIFY` are announced to the other
+    processes as truncated events carrying only their `seq` and `routing`;
+    the publishing process delivers the full event when the announcement
+    comes back, so its position in the stream is the same everywhere.
+    """
+
+    def __init__(self, dsn: str, channel: str = NOTIFICATION_CHANNEL, reconnect_delay: float = 2.0):
+        """
+        Create the Postgres transport.
+
+        Args:
+            dsn: Database URL, SQLAlchemy style URLs (`postgresql+asyncpg://`) are accepted.
+            channel: Name of the NOTIFY channel.
+            reconnect_delay: Seconds to wait between reconnect attempts of the listener.
+        """
+        self.dsn = make_url(dsn).set(drivername="postgresql").render_as_string(hide_password=False)
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self._deliver: Deliver | None = None
+        self._listener = None
+        self._pool = None
+        self._supervisor: asyncio.Task | None = None
+        self._connection_lost = asyncio.Event()
+        # seq -> full event of the oversized events published by this process
+        self._oversized: dict[int, dict] = {}
+
+    async def start(self, deliver: Deliver) -> None:
+        import asyncpg
+
+        self._deliver = deliver
+        self._pool = await asyncpg.create_pool(self.dsn, min_size=1, max_size=2)
+        await self._pool.execute(f"CREATE SEQUENCE IF NOT EXISTS {NOTIFICATION_SEQUENCE}")
+        await self._listen()
+        self._supervisor = asyncio.create_task(self._supervise())
+
+    async def stop(self) -> None:
+        if self._supervisor:
+            self._supervisor.cancel()
+            self._supervisor = None
+        if self._listener is not None:
+            try:
+                await self._listener.close()
+            except Exception:
+                pass
+            self._listener = None
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+        self._oversized.clear()
+
+    async def publish(self, event: dict) -> None:
+        payload = json.dumps(event)
+        # Leave room for the "seq" key added by the database
+        if len(payload.encode("utf-8")) + 32 > PG_NOTIFY_MAX_BYTES:
+            # Too large for NOTIFY: announce it truncated, the full event stays in this process
+            logger.warning(f"Notification of {len(payload)} bytes exceeds NOTIFY limit, other processes get it truncated")
+            seq = await self._pool.fetchval(f"SELECT nextval('{NOTIFICATION_SEQUENCE}')")
+            self._oversized[seq] = event
+            if len(self._oversized) > PG_OVERSIZED_PENDING:
+                # The announcement of the oldest one was lost
+                del self._oversized[next(iter(self._oversized))]
+            await self._pool.execute(
+                "SELECT pg_notify($1, $2)",
+                self.channel,
+                json.dumps({"seq": seq, "routing": event["routing"], "truncated": True}),
+            )
+            return
+        # Assign the sequence number and notify in a single round trip
+        await self._pool.execute(
+            f"""
+            SELECT pg_notify($1, jsonb_set($2::jsonb, '{{seq}}', to_jsonb(nextval('{NOTIFICATION_SEQUENCE}')))::text)
+            """,
+            self.channel,
+            payload,
+        )
+
+    async def _listen(self) -> None:
+        """Open the listening connection and subscribe to the channel."""
+        import asyncpg
+
+        self._connection_lost.clear()
+        self._listener = await asyncpg.connect(self.dsn)
+        self._listener.add_termination_listener(lambda connection: self._connection_lost.set())
+        await self._listener.add_listener(self.channel, self._on_notify)
+        logger.info(f"Listening for notifications on channel '{self.channel}'")
+
+    async def _supervise(self) -> None:
+        """Re-establish the listener whenever its connection is lost."""
+        while True:
+            await self._connection_lost.wait()
+            logger.warning("Notification listener connection lost, reconnecting")
+            while True:
+                try:
+                    await self._listen()
+                    break
+                except Exception as e:
+                    logger.warning(f"Notification listener reconnect failed: {e}")
+                    await asyncio.sleep(self.reconnect_delay)
+
+    def _on_notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        """asyncpg listener callback: decode the event and deliver it locally."""
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning(f"Ignoring malformed notification payload on '{channel}'")
+            return
+        if event.get("truncated"):
+            own = self._oversized.pop(event["seq"], None)
+            if own is not None:
+                event = {**own, "seq": event["seq"]}
+        self._deliver(event)
+
+
+def create_backend(name: str = NOTIFICATION_BACKEND, dsn: str | None = None) -> BroadcastBackend:
+    """
+    Build the broadcast backend selected by configuration.
+
+    Args:
+        name: `memory` (default, single process) or `postgres`.
+        dsn: Database URL, required for the `postgres` backend.
+
+    Returns:
+        An unstarted `BroadcastBackend`.
+
+    Raises:
+        ValueError if the backend name is unknown or the DSN is missing.
+    """
+    if name == "memory":
+        return InMemoryBackend()
+    if name == "postgres":
+        if not dsn:
+            raise ValueError("The postgres notification backend requires a database URL")
+        return PostgresBackend(dsn)
+    raise ValueError(f"Unknown notification backend '{name}'")
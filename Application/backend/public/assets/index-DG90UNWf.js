@@ -1,2 +1,2 @@
-const __vite__mapDeps=(i,m=__vite__mapDeps,d=(m.f||(m.f=["assets/DashboardView-DGB-Tnma.js","assets/medications-CUUmES17.js","assets/orders-CiJExhQP.js","assets/DashboardView-CMWnOXuU.css","assets/OrderCreation-BFuxMzy3.js","assets/carts-24VO2FHY.js","assets/OrderCreation-6PATXdQM.css","assets/InventoryView-DNBNrsgu.js","assets/InventoryView-ndYvFtEs.css","assets/RapportView-CmTJorgL.js","assets/RapportView-CklyJV1R.css","assets/DigitalCarts-9inRqxYa.js","assets/DigitalCarts-B9Avb8AG.css","assets/ChatView-DLrpkhZn.js","assets/ChatView-Du_JmXfT.css","assets/ChecklistView-CeLgIAnn.js","assets/ChecklistView-6GM64Mai.css"])))=>i.map(i=>d[i]);
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const r of document.querySelectorAll('link[rel="modulepreload"]'))s(r);new MutationObserver(r=>{for(const i of r)if(i.type==="childList")for(const o of i.addedNodes)o.tagName==="LINK"&&o.rel==="modulepreload"&&s(o)}).observe(document,{childList:!0,subtree:!0});function n(r){const i={};return r.integrity&&(i.integrity=r.integrity),r.referrerPolicy&&(i.referrerPolicy=r.referrerPolicy),r.crossOrigin==="use-credentials"?i.credentials="include":r.crossOrigin==="anonymous"?i.credentials="omit":i.credentials="same-origin",i}function s(r){if(r.ep)return;r.ep=!0;const i=n(r);fetch(r.href,i)}})();function Os(e){const t=Object.create(null);for(const n of e.split(","))t[n]=1;return n=>n in t}const ee={},Mt=[],qe=()=>{},Zr=()=>!1,Vn=e=>e.charCodeAt(0)===111&&e.charCodeAt(1)===110&&(e.charCodeAt(2)>122||e.charCodeAt(2)<97),Ps=e=>e.startsWith("onUpdate:"),pe=Object.assign,Is=(e,t)=>{const n=e.indexOf(t);n>-1&&e.splice(n,1)},No=Object.prototype.hasOwnProperty,Q=(e,t)=>No.call(e,t),V=Array.isArray,Lt=e=>pn(e)==="[object Map]",Kt=e=>pn(e)==="[object Set]",Zs=e=>pn(e)==="[object Date]",U=e=>typeof e=="function",le=e=>typeof e=="string",Je=e=>typeof e=="symbol",Z=e=>e!==null&&typeof e=="object",ei=e=>(Z(e)||U(e))&&U(e.then)&&U(e.catch),ti=Object.prototype.toString,pn=e=>ti.call(e),Do=e=>pn(e).slice(8,-1),ni=e=>pn(e)==="[object Object]",Ts=e=>le(e)&&e!=="NaN"&&e[0]!=="-"&&""+parseInt(e,10)===e,Qt=Os(",key,ref,ref_for,ref_key,onVnodeBeforeMount,onVnodeMounted,onVnodeBeforeUpdate,onVnodeUpdated,onVnodeBeforeUnmount,onVnodeUnmounted"),Fn=e=>{const t=Object.create(null);return(n=>t[n]||(t[n]=e(n)))},Mo=/-\w/g,De=Fn(e=>e.replace(Mo,t=>t.slice(1).toUpperCase())),Lo=/\B([A-Z])/g,Ct=Fn(e=>e.replace(Lo,"-$1").toLowerCase()),jn=Fn(e=>e.charAt(0).toUpperCase()+e.slice(1)),Yn=Fn(e=>e?`on${jn(e)}`:""),pt=(e,t)=>!Object.is(e,t),Sn=(e,...t)=>{for(let n=0;n<e.length;n++)e[n](...t)},si=(e,t,n,s=!1)=>{Object.defineProperty(e,t,{configurable:!0,enumerable:!1,writable:s,value:n})},Un=e=>{const t=parseFloat(e);return isNaN(t)?e:t};let er;const kn=()=>er||(er=typeof globalThis<"u"?globalThis:typeof self<"u"?self:typeof window<"u"?window:typeof global<"u"?global:{});function Ns(e){if(V(e)){const t={};for(let n=0;n<e.length;n++){const s=e[n],r=le(s)?Uo(s):Ns(s);if(r)for(const i in r)t[i]=r[i]}return t}else if(le(e)||Z(e))return e}const Vo=/;(?![^(]*\))/g,Fo=/:([^]+)/,jo=/\/\*[^]*?\*\//g;function Uo(e){const t={};return e.replace(jo,"").split(Vo).forEach(n=>{if(n){const s=n.split(Fo);s.length>1&&(t[s[0].trim()]=s[1].trim())}}),t}function Hn(e){let t="";if(le(e))t=e;else if(V(e))for(let n=0;n<e.length;n++){const s=Hn(e[n]);s&&(t+=s+" ")}else if(Z(e))for(const n in e)e[n]&&(t+=n+" ");return t.trim()}const ko="itemscope,allowfullscreen,formnovalidate,ismap,nomodule,novalidate,readonly",Ho=Os(ko);function ri(e){return!!e||e===""}function Bo(e,t){if(e.length!==t.length)return!1;let n=!0;for(let s=0;n&&s<e.length;s++)n=gn(e[s],t[s]);return n}function gn(e,t){if(e===t)return!0;let n=Zs(e),s=Zs(t);if(n||s)return n&&s?e.getTime()===t.getTime():!1;if(n=Je(e),s=Je(t),n||s)return e===t;if(n=V(e),s=V(t),n||s)return n&&s?Bo(e,t):!1;if(n=Z(e),s=Z(t),n||s){if(!n||!s)return!1;const r=Object.keys(e).length,i=Object.keys(t).length;if(r!==i)return!1;for(const o in e){const l=e.hasOwnProperty(o),c=t.hasOwnProperty(o);if(l&&!c||!l&&c||!gn(e[o],t[o]))return!1}}return String(e)===String(t)}function Ds(e,t){return e.findIndex(n=>gn(n,t))}const ii=e=>!!(e&&e.__v_isRef===!0),Jt=e=>le(e)?e:e==null?"":V(e)||Z(e)&&(e.toString===ti||!U(e.toString))?ii(e)?Jt(e.value):JSON.stringify(e,oi,2):String(e),oi=(e,t)=>ii(t)?oi(e,t.value):Lt(t)?{[`Map(${t.size})`]:[...t.entries()].reduce((n,[s,r],i)=>(n[Xn(s,i)+" =>"]=r,n),{})}:Kt(t)?{[`Set(${t.size})`]:[...t.values()].map(n=>Xn(n))}:Je(t)?Xn(t):Z(t)&&!V(t)&&!ni(t)?String(t):t,Xn=(e,t="")=>{var n;return Je(e)?`Symbol(${(n=e.description)!=null?n:t})`:e};let ae;class li{constructor(t=!1){this.detached=t,this._active=!0,this._on=0,this.effects=[],this.cleanups=[],this._isPaused=!1,this.parent=ae,!t&&ae&&(this.index=(ae.scopes||(ae.scopes=[])).push(this)-1)}get active(){return this._active}pause(){if(this._active){this._isPaused=!0;let t,n;if(this.scopes)for(t=0,n=this.scopes.length;t<n;t++)this.scopes[t].pause();for(t=0,n=this.effects.length;t<n;t++)this.effects[t].pause()}}resume(){if(this._active&&this._isPaused){this._isPaused=!1;let t,n;if(this.scopes)for(t=0,n=this.scopes.length;t<n;t++)this.scopes[t].resume();for(t=0,n=this.effects.length;t<n;t++)this.effects[t].resume()}}run(t){if(this._active){const n=ae;try{return ae=this,t()}finally{ae=n}}}on(){++this._on===1&&(this.prevScope=ae,ae=this)}off(){this._on>0&&--this._on===0&&(ae=this.prevScope,this.prevScope=void 0)}stop(t){if(this._active){this._active=!1;let n,s;for(n=0,s=this.effects.length;n<s;n++)this.effects[n].stop();for(this.effects.length=0,n=0,s=this.cleanups.length;n<s;n++)this.cleanups[n]();if(this.cleanups.length=0,this.scopes){for(n=0,s=this.scopes.length;n<s;n++)this.scopes[n].stop(!0);this.scopes.length=0}if(!this.detached&&this.parent&&!t){const r=this.parent.scopes.pop();r&&r!==this&&(this.parent.scopes[this.index]=r,r.index=this.index)}this.parent=void 0}}}function ci(e){return new li(e)}function ui(){return ae}function Ko(e,t=!1){ae&&ae.cleanups.push(e)}let ne;const Zn=new WeakSet;class fi{constructor(t){this.fn=t,this.deps=void 0,this.depsTail=void 0,this.flags=5,this.next=void 0,this.cleanup=void 0,this.scheduler=void 0,ae&&ae.active&&ae.effects.push(this)}pause(){this.flags|=64}resume(){this.flags&64&&(this.flags&=-65,Zn.has(this)&&(Zn.delete(this),this.trigger()))}notify(){this.flags&2&&!(this.flags&32)||this.flags&8||di(this)}run(){if(!(this.flags&1))return this.fn();this.flags|=2,tr(this),hi(this);const t=ne,n=Fe;ne=this,Fe=!0;try{return this.fn()}finally{pi(this),ne=t,Fe=n,this.flags&=-3}}stop(){if(this.flags&1){for(let t=this.deps;t;t=t.nextDep)Vs(t);this.deps=this.depsTail=void 0,tr(this),this.onStop&&this.onStop(),this.flags&=-2}}trigger(){this.flags&64?Zn.add(this):this.scheduler?this.scheduler():this.runIfDirty()}runIfDirty(){ds(this)&&this.run()}get dirty(){return ds(this)}}let ai=0,Yt,Xt;function di(e,t=!1){if(e.flags|=8,t){e.next=Xt,Xt=e;return}e.next=Yt,Yt=e}function Ms(){ai++}function Ls(){if(--ai>0)return;if(Xt){let t=Xt;for(Xt=void 0;t;){const n=t.next;t.next=void 0,t.flags&=-9,t=n}}let e;for(;Yt;){let t=Yt;for(Yt=void 0;t;){const n=t.next;if(t.next=void 0,t.flags&=-9,t.flags&1)try{t.trigger()}catch(s){e||(e=s)}t=n}}if(e)throw e}function hi(e){for(let t=e.deps;t;t=t.nextDep)t.version=-1,t.prevActiveLink=t.dep.activeLink,t.dep.activeLink=t}function pi(e){let t,n=e.depsTail,s=n;for(;s;){const r=s.prevDep;s.version===-1?(s===n&&(n=r),Vs(s),Go(s)):t=s,s.dep.activeLink=s.prevActiveLink,s.prevActiveLink=void 0,s=r}e.deps=t,e.depsTail=n}function ds(e){for(let t=e.deps;t;t=t.nextDep)if(t.dep.version!==t.version||t.dep.computed&&(gi(t.dep.computed)||t.dep.version!==t.version))return!0;return!!e._dirty}function gi(e){if(e.flags&4&&!(e.flags&16)||(e.flags&=-17,e.globalVersion===ln)||(e.globalVersion=ln,!e.isSSR&&e.flags&128&&(!e.deps&&!e._dirty||!ds(e))))return;e.flags|=2;const t=e.dep,n=ne,s=Fe;ne=e,Fe=!0;try{hi(e);const r=e.fn(e._value);(t.version===0||pt(r,e._value))&&(e.flags|=128,e._value=r,t.version++)}catch(r){throw t.version++,r}finally{ne=n,Fe=s,pi(e),e.flags&=-3}}function Vs(e,t=!1){const{dep:n,prevSub:s,nextSub:r}=e;if(s&&(s.nextSub=r,e.prevSub=void 0),r&&(r.prevSub=s,e.nextSub=void 0),n.subs===e&&(n.subs=s,!s&&n.computed)){n.computed.flags&=-5;for(let i=n.computed.deps;i;i=i.nextDep)Vs(i,!0)}!t&&!--n.sc&&n.map&&n.map.delete(n.key)}function Go(e){const{prevDep:t,nextDep:n}=e;t&&(t.nextDep=n,e.prevDep=void 0),n&&(n.prevDep=t,e.nextDep=void 0)}let Fe=!0;const mi=[];function st(){mi.push(Fe),Fe=!1}function rt(){const e=mi.pop();Fe=e===void 0?!0:e}function tr(e){const{cleanup:t}=e;if(e.cleanup=void 0,t){const n=ne;ne=void 0;try{t()}finally{ne=n}}}let ln=0;class Wo{constructor(t,n){this.sub=t,this.dep=n,this.version=n.version,this.nextDep=this.prevDep=this.nextSub=this.prevSub=this.prevActiveLink=void 0}}class Fs{constructor(t){this.computed=t,this.version=0,this.activeLink=void 0,this.subs=void 0,this.map=void 0,this.key=void 0,this.sc=0,this.__v_skip=!0}track(t){if(!ne||!Fe||ne===this.computed)return;let n=this.activeLink;if(n===void 0||n.sub!==ne)n=this.activeLink=new Wo(ne,this),ne.deps?(n.prevDep=ne.depsTail,ne.depsTail.nextDep=n,ne.depsTail=n):ne.deps=ne.depsTail=n,_i(n);else if(n.version===-1&&(n.version=this.version,n.nextDep)){const s=n.nextDep;s.prevDep=n.prevDep,n.prevDep&&(n.prevDep.nextDep=s),n.prevDep=ne.depsTail,n.nextDep=void 0,ne.depsTail.nextDep=n,ne.depsTail=n,ne.deps===n&&(ne.deps=s)}return n}trigger(t){this.version++,ln++,this.notify(t)}notify(t){Ms();try{for(let n=this.subs;n;n=n.prevSub)n.sub.notify()&&n.sub.dep.notify()}finally{Ls()}}}function _i(e){if(e.dep.sc++,e.sub.flags&4){const t=e.dep.computed;if(t&&!e.dep.subs){t.flags|=20;for(let s=t.deps;s;s=s.nextDep)_i(s)}const n=e.dep.subs;n!==e&&(e.prevSub=n,n&&(n.nextSub=e)),e.dep.subs=e}}const wn=new WeakMap,At=Symbol(""),hs=Symbol(""),cn=Symbol("");function de(e,t,n){if(Fe&&ne){let s=wn.get(e);s||wn.set(e,s=new Map);let r=s.get(n);r||(s.set(n,r=new Fs),r.map=s,r.key=n),r.track()}}function et(e,t,n,s,r,i){const o=wn.get(e);if(!o){ln++;return}const l=c=>{c&&c.trigger()};if(Ms(),t==="clear")o.forEach(l);else{const c=V(e),d=c&&Ts(n);if(c&&n==="length"){const f=Number(s);o.forEach((h,g)=>{(g==="length"||g===cn||!Je(g)&&g>=f)&&l(h)})}else switch((n!==void 0||o.has(void 0))&&l(o.get(n)),d&&l(o.get(cn)),t){case"add":c?d&&l(o.get("length")):(l(o.get(At)),Lt(e)&&l(o.get(hs)));break;case"delete":c||(l(o.get(At)),Lt(e)&&l(o.get(hs)));break;case"set":Lt(e)&&l(o.get(At));break}}Ls()}function qo(e,t){const n=wn.get(e);return n&&n.get(t)}function It(e){const t=$(e);return t===e?t:(de(t,"iterate",cn),Ne(e)?t:t.map(fe))}function Bn(e){return de(e=$(e),"iterate",cn),e}const $o={__proto__:null,[Symbol.iterator](){return es(this,Symbol.iterator,fe)},concat(...e){return It(this).concat(...e.map(t=>V(t)?It(t):t))},entries(){return es(this,"entries",e=>(e[1]=fe(e[1]),e))},every(e,t){return Ye(this,"every",e,t,void 0,arguments)},filter(e,t){return Ye(this,"filter",e,t,n=>n.map(fe),arguments)},find(e,t){return Ye(this,"find",e,t,fe,arguments)},findIndex(e,t){return Ye(this,"findIndex",e,t,void 0,arguments)},findLast(e,t){return Ye(this,"findLast",e,t,fe,arguments)},findLastIndex(e,t){return Ye(this,"findLastIndex",e,t,void 0,arguments)},forEach(e,t){return Ye(this,"forEach",e,t,void 0,arguments)},includes(...e){return ts(this,"includes",e)},indexOf(...e){return ts(this,"indexOf",e)},join(e){return It(this).join(e)},lastIndexOf(...e){return ts(this,"lastIndexOf",e)},map(e,t){return Ye(this,"map",e,t,void 0,arguments)},pop(){return Wt(this,"pop")},push(...e){return Wt(this,"push",e)},reduce(e,...t){return nr(this,"reduce",e,t)},reduceRight(e,...t){return nr(this,"reduceRight",e,t)},shift(){return Wt(this,"shift")},some(e,t){return Ye(this,"some",e,t,void 0,arguments)},splice(...e){return Wt(this,"splice",e)},toReversed(){return It(this).toReversed()},toSorted(e){return It(this).toSorted(e)},toSpliced(...e){return It(this).toSpliced(...e)},unshift(...e){return Wt(this,"unshift",e)},values(){return es(this,"values",fe)}};function es(e,t,n){const s=Bn(e),r=s[t]();return s!==e&&!Ne(e)&&(r._next=r.next,r.next=()=>{const i=r._next();return i.done||(i.value=n(i.value)),i}),r}const Jo=Array.prototype;function Ye(e,t,n,s,r,i){const o=Bn(e),l=o!==e&&!Ne(e),c=o[t];if(c!==Jo[t]){const h=c.apply(e,i);return l?fe(h):h}let d=n;o!==e&&(l?d=function(h,g){return n.call(this,fe(h),g,e)}:n.length>2&&(d=function(h,g){return n.call(this,h,g,e)}));const f=c.call(o,d,s);return l&&r?r(f):f}function nr(e,t,n,s){const r=Bn(e);let i=n;return r!==e&&(Ne(e)?n.length>3&&(i=function(o,l,c){return n.call(this,o,l,c,e)}):i=function(o,l,c){return n.call(this,o,fe(l),c,e)}),r[t](i,...s)}function ts(e,t,n){const s=$(e);de(s,"iterate",cn);const r=s[t](...n);return(r===-1||r===!1)&&ks(n[0])?(n[0]=$(n[0]),s[t](...n)):r}function Wt(e,t,n=[]){st(),Ms();const s=$(e)[t].apply(e,n);return Ls(),rt(),s}const zo=Os("__proto__,__v_isRef,__isVue"),yi=new Set(Object.getOwnPropertyNames(Symbol).filter(e=>e!=="arguments"&&e!=="caller").map(e=>Symbol[e]).filter(Je));function Qo(e){Je(e)||(e=String(e));const t=$(this);return de(t,"has",e),t.hasOwnProperty(e)}class vi{constructor(t=!1,n=!1){this._isReadonly=t,this._isShallow=n}get(t,n,s){if(n==="__v_skip")return t.__v_skip;const r=this._isReadonly,i=this._isShallow;if(n==="__v_isReactive")return!r;if(n==="__v_isReadonly")return r;if(n==="__v_isShallow")return i;if(n==="__v_raw")return s===(r?i?ol:xi:i?Si:Ei).get(t)||Object.getPrototypeOf(t)===Object.getPrototypeOf(s)?t:void 0;const o=V(t);if(!r){let c;if(o&&(c=$o[n]))return c;if(n==="hasOwnProperty")return Qo}const l=Reflect.get(t,n,oe(t)?t:s);if((Je(n)?yi.has(n):zo(n))||(r||de(t,"get",n),i))return l;if(oe(l)){const c=o&&Ts(n)?l:l.value;return r&&Z(c)?gs(c):c}return Z(l)?r?gs(l):mn(l):l}}class bi extends vi{constructor(t=!1){super(!1,t)}set(t,n,s,r){let i=t[n];if(!this._isShallow){const c=mt(i);if(!Ne(s)&&!mt(s)&&(i=$(i),s=$(s)),!V(t)&&oe(i)&&!oe(s))return c||(i.value=s),!0}const o=V(t)&&Ts(n)?Number(n)<t.length:Q(t,n),l=Reflect.set(t,n,s,oe(t)?t:r);return t===$(r)&&(o?pt(s,i)&&et(t,"set",n,s):et(t,"add",n,s)),l}deleteProperty(t,n){const s=Q(t,n);t[n];const r=Reflect.deleteProperty(t,n);return r&&s&&et(t,"delete",n,void 0),r}has(t,n){const s=Reflect.has(t,n);return(!Je(n)||!yi.has(n))&&de(t,"has",n),s}ownKeys(t){return de(t,"iterate",V(t)?"length":At),Reflect.ownKeys(t)}}class Yo extends vi{constructor(t=!1){super(!0,t)}set(t,n){return!0}deleteProperty(t,n){return!0}}const Xo=new bi,Zo=new Yo,el=new bi(!0);const ps=e=>e,vn=e=>Reflect.getPrototypeOf(e);function tl(e,t,n){return function(...s){const r=this.__v_raw,i=$(r),o=Lt(i),l=e==="entries"||e===Symbol.iterator&&o,c=e==="keys"&&o,d=r[e](...s),f=n?ps:t?Cn:fe;return!t&&de(i,"iterate",c?hs:At),{next(){const{value:h,done:g}=d.next();return g?{value:h,done:g}:{value:l?[f(h[0]),f(h[1])]:f(h),done:g}},[Symbol.iterator](){return this}}}}function bn(e){return function(...t){return e==="delete"?!1:e==="clear"?void 0:this}}function nl(e,t){const n={get(r){const i=this.__v_raw,o=$(i),l=$(r);e||(pt(r,l)&&de(o,"get",r),de(o,"get",l));const{has:c}=vn(o),d=t?ps:e?Cn:fe;if(c.call(o,r))return d(i.get(r));if(c.call(o,l))return d(i.get(l));i!==o&&i.get(r)},get size(){const r=this.__v_raw;return!e&&de($(r),"iterate",At),r.size},has(r){const i=this.__v_raw,o=$(i),l=$(r);return e||(pt(r,l)&&de(o,"has",r),de(o,"has",l)),r===l?i.has(r):i.has(r)||i.has(l)},forEach(r,i){const o=this,l=o.__v_raw,c=$(l),d=t?ps:e?Cn:fe;return!e&&de(c,"iterate",At),l.forEach((f,h)=>r.call(i,d(f),d(h),o))}};return pe(n,e?{add:bn("add"),set:bn("set"),delete:bn("delete"),clear:bn("clear")}:{add(r){!t&&!Ne(r)&&!mt(r)&&(r=$(r));const i=$(this);return vn(i).has.call(i,r)||(i.add(r),et(i,"add",r,r)),this},set(r,i){!t&&!Ne(i)&&!mt(i)&&(i=$(i));const o=$(this),{has:l,get:c}=vn(o);let d=l.call(o,r);d||(r=$(r),d=l.call(o,r));const f=c.call(o,r);return o.set(r,i),d?pt(i,f)&&et(o,"set",r,i):et(o,"add",r,i),this},delete(r){const i=$(this),{has:o,get:l}=vn(i);let c=o.call(i,r);c||(r=$(r),c=o.call(i,r)),l&&l.call(i,r);const d=i.delete(r);return c&&et(i,"delete",r,void 0),d},clear(){const r=$(this),i=r.size!==0,o=r.clear();return i&&et(r,"clear",void 0,void 0),o}}),["keys","values","entries",Symbol.iterator].forEach(r=>{n[r]=tl(r,e,t)}),n}function js(e,t){const n=nl(e,t);return(s,r,i)=>r==="__v_isReactive"?!e:r==="__v_isReadonly"?e:r==="__v_raw"?s:Reflect.get(Q(n,r)&&r in s?n:s,r,i)}const sl={get:js(!1,!1)},rl={get:js(!1,!0)},il={get:js(!0,!1)};const Ei=new WeakMap,Si=new WeakMap,xi=new WeakMap,ol=new WeakMap;function ll(e){switch(e){case"Object":case"Array":return 1;case"Map":case"Set":case"WeakMap":case"WeakSet":return 2;default:return 0}}function cl(e){return e.__v_skip||!Object.isExtensible(e)?0:ll(Do(e))}function mn(e){return mt(e)?e:Us(e,!1,Xo,sl,Ei)}function Ri(e){return Us(e,!1,el,rl,Si)}function gs(e){return Us(e,!0,Zo,il,xi)}function Us(e,t,n,s,r){if(!Z(e)||e.__v_raw&&!(t&&e.__v_isReactive))return e;const i=cl(e);if(i===0)return e;const o=r.get(e);if(o)return o;const l=new Proxy(e,i===2?s:n);return r.set(e,l),l}function gt(e){return mt(e)?gt(e.__v_raw):!!(e&&e.__v_isReactive)}function mt(e){return!!(e&&e.__v_isReadonly)}function Ne(e){return!!(e&&e.__v_isShallow)}function ks(e){return e?!!e.__v_raw:!1}function $(e){const t=e&&e.__v_raw;return t?$(t):e}function Hs(e){return!Q(e,"__v_skip")&&Object.isExtensible(e)&&si(e,"__v_skip",!0),e}const fe=e=>Z(e)?mn(e):e,Cn=e=>Z(e)?gs(e):e;function oe(e){return e?e.__v_isRef===!0:!1}function jt(e){return Ai(e,!1)}function ul(e){return Ai(e,!0)}function Ai(e,t){return oe(e)?e:new fl(e,t)}class fl{constructor(t,n){this.dep=new Fs,this.__v_isRef=!0,this.__v_isShallow=!1,this._rawValue=n?t:$(t),this._value=n?t:fe(t),this.__v_isShallow=n}get value(){return this.dep.track(),this._value}set value(t){const n=this._rawValue,s=this.__v_isShallow||Ne(t)||mt(t);t=s?t:$(t),pt(t,n)&&(this._rawValue=t,this._value=s?t:fe(t),this.dep.trigger())}}function Vt(e){return oe(e)?e.value:e}const al={get:(e,t,n)=>t==="__v_raw"?e:Vt(Reflect.get(e,t,n)),set:(e,t,n,s)=>{const r=e[t];return oe(r)&&!oe(n)?(r.value=n,!0):Reflect.set(e,t,n,s)}};function wi(e){return gt(e)?e:new Proxy(e,al)}function dl(e){const t=V(e)?new Array(e.length):{};for(const n in e)t[n]=Ci(e,n);return t}class hl{constructor(t,n,s){this._object=t,this._key=n,this._defaultValue=s,this.__v_isRef=!0,this._value=void 0}get value(){const t=this._object[this._key];return this._value=t===void 0?this._defaultValue:t}set value(t){this._object[this._key]=t}get dep(){return qo($(this._object),this._key)}}class pl{constructor(t){this._getter=t,this.__v_isRef=!0,this.__v_isReadonly=!0,this._value=void 0}get value(){return this._value=this._getter()}}function Wf(e,t,n){return oe(e)?e:U(e)?new pl(e):Z(e)&&arguments.length>1?Ci(e,t,n):jt(e)}function Ci(e,t,n){const s=e[t];return oe(s)?s:new hl(e,t,n)}class gl{constructor(t,n,s){this.fn=t,this.setter=n,this._value=void 0,this.dep=new Fs(this),this.__v_isRef=!0,this.deps=void 0,this.depsTail=void 0,this.flags=16,this.globalVersion=ln-1,this.next=void 0,this.effect=this,this.__v_isReadonly=!n,this.isSSR=s}notify(){if(this.flags|=16,!(this.flags&8)&&ne!==this)return di(this,!0),!0}get value(){const t=this.dep.track();return gi(this),t&&(t.version=this.dep.version),this._value}set value(t){this.setter&&this.setter(t)}}function ml(e,t,n=!1){let s,r;return U(e)?s=e:(s=e.get,r=e.set),new gl(s,r,n)}const En={},On=new WeakMap;let xt;function _l(e,t=!1,n=xt){if(n){let s=On.get(n);s||On.set(n,s=[]),s.push(e)}}function yl(e,t,n=ee){const{immediate:s,deep:r,once:i,scheduler:o,augmentJob:l,call:c}=n,d=T=>r?T:Ne(T)||r===!1||r===0?tt(T,1):tt(T);let f,h,g,m,R=!1,O=!1;if(oe(e)?(h=()=>e.value,R=Ne(e)):gt(e)?(h=()=>d(e),R=!0):V(e)?(O=!0,R=e.some(T=>gt(T)||Ne(T)),h=()=>e.map(T=>{if(oe(T))return T.value;if(gt(T))return d(T);if(U(T))return c?c(T,2):T()})):U(e)?t?h=c?()=>c(e,2):e:h=()=>{if(g){st();try{g()}finally{rt()}}const T=xt;xt=f;try{return c?c(e,3,[m]):e(m)}finally{xt=T}}:h=qe,t&&r){const T=h,B=r===!0?1/0:r;h=()=>tt(T(),B)}const k=ui(),N=()=>{f.stop(),k&&k.active&&Is(k.effects,f)};if(i&&t){const T=t;t=(...B)=>{T(...B),N()}}let I=O?new Array(e.length).fill(En):En;const D=T=>{if(!(!(f.flags&1)||!f.dirty&&!T))if(t){const B=f.run();if(r||R||(O?B.some((ue,Y)=>pt(ue,I[Y])):pt(B,I))){g&&g();const ue=xt;xt=f;try{const Y=[B,I===En?void 0:O&&I[0]===En?[]:I,m];I=B,c?c(t,3,Y):t(...Y)}finally{xt=ue}}}else f.run()};return l&&l(D),f=new fi(h),f.scheduler=o?()=>o(D,!1):D,m=T=>_l(T,!1,f),g=f.onStop=()=>{const T=On.get(f);if(T){if(c)c(T,4);else for(const B of T)B();On.delete(f)}},t?s?D(!0):I=f.run():o?o(D.bind(null,!0),!0):f.run(),N.pause=f.pause.bind(f),N.resume=f.resume.bind(f),N.stop=N,N}function tt(e,t=1/0,n){if(t<=0||!Z(e)||e.__v_skip||(n=n||new Map,(n.get(e)||0)>=t))return e;if(n.set(e,t),t--,oe(e))tt(e.value,t,n);else if(V(e))for(let s=0;s<e.length;s++)tt(e[s],t,n);else if(Kt(e)||Lt(e))e.forEach(s=>{tt(s,t,n)});else if(ni(e)){for(const s in e)tt(e[s],t,n);for(const s of Object.getOwnPropertySymbols(e))Object.prototype.propertyIsEnumerable.call(e,s)&&tt(e[s],t,n)}return e}function _n(e,t,n,s){try{return s?e(...s):e()}catch(r){Kn(r,t,n)}}function ze(e,t,n,s){if(U(e)){const r=_n(e,t,n,s);return r&&ei(r)&&r.catch(i=>{Kn(i,t,n)}),r}if(V(e)){const r=[];for(let i=0;i<e.length;i++)r.push(ze(e[i],t,n,s));return r}}function Kn(e,t,n,s=!0){const r=t?t.vnode:null,{errorHandler:i,throwUnhandledErrorInProduction:o}=t&&t.appContext.config||ee;if(t){let l=t.parent;const c=t.proxy,d=`https://vuejs.org/error-reference/#runtime-${n}`;for(;l;){const f=l.ec;if(f){for(let h=0;h<f.length;h++)if(f[h](e,c,d)===!1)return}l=l.parent}if(i){st(),_n(i,null,10,[e,c,d]),rt();return}}vl(e,n,r,s,o)}function vl(e,t,n,s=!0,r=!1){if(r)throw e;console.error(e)}const ye=[];let Ge=-1;const Ft=[];let ft=null,Nt=0;const Oi=Promise.resolve();let Pn=null;function Gn(e){const t=Pn||Oi;return e?t.then(this?e.bind(this):e):t}function bl(e){let t=Ge+1,n=ye.length;for(;t<n;){const s=t+n>>>1,r=ye[s],i=un(r);i<e||i===e&&r.flags&2?t=s+1:n=s}return t}function Bs(e){if(!(e.flags&1)){const t=un(e),n=ye[ye.length-1];!n||!(e.flags&2)&&t>=un(n)?ye.push(e):ye.splice(bl(t),0,e),e.flags|=1,Pi()}}function Pi(){Pn||(Pn=Oi.then(Ti))}function El(e){V(e)?Ft.push(...e):ft&&e.id===-1?ft.splice(Nt+1,0,e):e.flags&1||(Ft.push(e),e.flags|=1),Pi()}function sr(e,t,n=Ge+1){for(;n<ye.length;n++){const s=ye[n];if(s&&s.flags&2){if(e&&s.id!==e.uid)continue;ye.splice(n,1),n--,s.flags&4&&(s.flags&=-2),s(),s.flags&4||(s.flags&=-2)}}}function Ii(e){if(Ft.length){const t=[...new Set(Ft)].sort((n,s)=>un(n)-un(s));if(Ft.length=0,ft){ft.push(...t);return}for(ft=t,Nt=0;Nt<ft.length;Nt++){const n=ft[Nt];n.flags&4&&(n.flags&=-2),n.flags&8||n(),n.flags&=-2}ft=null,Nt=0}}const un=e=>e.id==null?e.flags&2?-1:1/0:e.id;function Ti(e){try{for(Ge=0;Ge<ye.length;Ge++){const t=ye[Ge];t&&!(t.flags&8)&&(t.flags&4&&(t.flags&=-2),_n(t,t.i,t.i?15:14),t.flags&4||(t.flags&=-2))}}finally{for(;Ge<ye.length;Ge++){const t=ye[Ge];t&&(t.flags&=-2)}Ge=-1,ye.length=0,Ii(),Pn=null,(ye.length||Ft.length)&&Ti()}}let Oe=null,Ni=null;function In(e){const t=Oe;return Oe=e,Ni=e&&e.type.__scopeId||null,t}function Di(e,t=Oe,n){if(!t||e._n)return e;const s=(...r)=>{s._d&&Dn(-1);const i=In(t);let o;try{o=e(...r)}finally{In(i),s._d&&Dn(1)}return o};return s._n=!0,s._c=!0,s._d=!0,s}function Sl(e,t){if(Oe===null)return e;const n=Jn(Oe),s=e.dirs||(e.dirs=[]);for(let r=0;r<t.length;r++){let[i,o,l,c=ee]=t[r];i&&(U(i)&&(i={mounted:i,updated:i}),i.deep&&tt(o),s.push({dir:i,instance:n,value:o,oldValue:void 0,arg:l,modifiers:c}))}return e}function bt(e,t,n,s){const r=e.dirs,i=t&&t.dirs;for(let o=0;o<r.length;o++){const l=r[o];i&&(l.oldValue=i[o].value);let c=l.dir[s];c&&(st(),ze(c,n,8,[e.el,l,e,t]),rt())}}const xl=Symbol("_vte"),Rl=e=>e.__isTeleport,Al=Symbol("_leaveCb");function Ks(e,t){e.shapeFlag&6&&e.component?(e.transition=t,Ks(e.component.subTree,t)):e.shapeFlag&128?(e.ssContent.transition=t.clone(e.ssContent),e.ssFallback.transition=t.clone(e.ssFallback)):e.transition=t}function Mi(e,t){return U(e)?pe({name:e.name},t,{setup:e}):e}function Li(e){e.ids=[e.ids[0]+e.ids[2]+++"-",0,0]}const Tn=new WeakMap;function Zt(e,t,n,s,r=!1){if(V(e)){e.forEach((R,O)=>Zt(R,t&&(V(t)?t[O]:t),n,s,r));return}if(en(s)&&!r){s.shapeFlag&512&&s.type.__asyncResolved&&s.component.subTree.component&&Zt(e,t,n,s.component.subTree);return}const i=s.shapeFlag&4?Jn(s.component):s.el,o=r?null:i,{i:l,r:c}=e,d=t&&t.r,f=l.refs===ee?l.refs={}:l.refs,h=l.setupState,g=$(h),m=h===ee?Zr:R=>Q(g,R);if(d!=null&&d!==c){if(rr(t),le(d))f[d]=null,m(d)&&(h[d]=null);else if(oe(d)){d.value=null;const R=t;R.k&&(f[R.k]=null)}}if(U(c))_n(c,l,12,[o,f]);else{const R=le(c),O=oe(c);if(R||O){const k=()=>{if(e.f){const N=R?m(c)?h[c]:f[c]:c.value;if(r)V(N)&&Is(N,i);else if(V(N))N.includes(i)||N.push(i);else if(R)f[c]=[i],m(c)&&(h[c]=f[c]);else{const I=[i];c.value=I,e.k&&(f[e.k]=I)}}else R?(f[c]=o,m(c)&&(h[c]=o)):O&&(c.value=o,e.k&&(f[e.k]=o))};if(o){const N=()=>{k(),Tn.delete(e)};N.id=-1,Tn.set(e,N),we(N,n)}else rr(e),k()}}}function rr(e){const t=Tn.get(e);t&&(t.flags|=8,Tn.delete(e))}kn().requestIdleCallback;kn().cancelIdleCallback;const en=e=>!!e.type.__asyncLoader,Vi=e=>e.type.__isKeepAlive;function wl(e,t){Fi(e,"a",t)}function Cl(e,t){Fi(e,"da",t)}function Fi(e,t,n=he){const s=e.__wdc||(e.__wdc=()=>{let r=n;for(;r;){if(r.isDeactivated)return;r=r.parent}return e()});if(Wn(t,s,n),n){let r=n.parent;for(;r&&r.parent;)Vi(r.parent.vnode)&&Ol(s,t,n,r),r=r.parent}}function Ol(e,t,n,s){const r=Wn(t,e,s,!0);ji(()=>{Is(s[t],r)},n)}function Wn(e,t,n=he,s=!1){if(n){const r=n[e]||(n[e]=[]),i=t.__weh||(t.__weh=(...o)=>{st();const l=yn(n),c=ze(t,n,e,o);return l(),rt(),c});return s?r.unshift(i):r.push(i),i}}const it=e=>(t,n=he)=>{(!an||e==="sp")&&Wn(e,(...s)=>t(...s),n)},Pl=it("bm"),Il=it("m"),Tl=it("bu"),Nl=it("u"),Dl=it("bum"),ji=it("um"),Ml=it("sp"),Ll=it("rtg"),Vl=it("rtc");function Fl(e,t=he){Wn("ec",e,t)}const jl="components";function Ui(e,t){return kl(jl,e,!0,t)||e}const Ul=Symbol.for("v-ndc");function kl(e,t,n=!0,s=!1){const r=Oe||he;if(r){const i=r.type;{const l=Pc(i,!1);if(l&&(l===t||l===De(t)||l===jn(De(t))))return i}const o=ir(r[e]||i[e],t)||ir(r.appContext[e],t);return!o&&s?i:o}}function ir(e,t){return e&&(e[t]||e[De(t)]||e[jn(De(t))])}function or(e,t,n,s){let r;const i=n,o=V(e);if(o||le(e)){const l=o&&gt(e);let c=!1,d=!1;l&&(c=!Ne(e),d=mt(e),e=Bn(e)),r=new Array(e.length);for(let f=0,h=e.length;f<h;f++)r[f]=t(c?d?Cn(fe(e[f])):fe(e[f]):e[f],f,void 0,i)}else if(typeof e=="number"){r=new Array(e);for(let l=0;l<e;l++)r[l]=t(l+1,l,void 0,i)}else if(Z(e))if(e[Symbol.iterator])r=Array.from(e,(l,c)=>t(l,c,void 0,i));else{const l=Object.keys(e);r=new Array(l.length);for(let c=0,d=l.length;c<d;c++){const f=l[c];r[c]=t(e[f],f,c,i)}}else r=[];return r}const ms=e=>e?lo(e)?Jn(e):ms(e.parent):null,tn=pe(Object.create(null),{$:e=>e,$el:e=>e.vnode.el,$data:e=>e.data,$props:e=>e.props,$attrs:e=>e.attrs,$slots:e=>e.slots,$refs:e=>e.refs,$parent:e=>ms(e.parent),$root:e=>ms(e.root),$host:e=>e.ce,$emit:e=>e.emit,$options:e=>Hi(e),$forceUpdate:e=>e.f||(e.f=()=>{Bs(e.update)}),$nextTick:e=>e.n||(e.n=Gn.bind(e.proxy)),$watch:e=>cc.bind(e)}),ns=(e,t)=>e!==ee&&!e.__isScriptSetup&&Q(e,t),Hl={get({_:e},t){if(t==="__v_skip")return!0;const{ctx:n,setupState:s,data:r,props:i,accessCache:o,type:l,appContext:c}=e;let d;if(t[0]!=="$"){const m=o[t];if(m!==void 0)switch(m){case 1:return s[t];case 2:return r[t];case 4:return n[t];case 3:return i[t]}else{if(ns(s,t))return o[t]=1,s[t];if(r!==ee&&Q(r,t))return o[t]=2,r[t];if((d=e.propsOptions[0])&&Q(d,t))return o[t]=3,i[t];if(n!==ee&&Q(n,t))return o[t]=4,n[t];_s&&(o[t]=0)}}const f=tn[t];let h,g;if(f)return t==="$attrs"&&de(e.attrs,"get",""),f(e);if((h=l.__cssModules)&&(h=h[t]))return h;if(n!==ee&&Q(n,t))return o[t]=4,n[t];if(g=c.config.globalProperties,Q(g,t))return g[t]},set({_:e},t,n){const{data:s,setupState:r,ctx:i}=e;return ns(r,t)?(r[t]=n,!0):s!==ee&&Q(s,t)?(s[t]=n,!0):Q(e.props,t)||t[0]==="$"&&t.slice(1)in e?!1:(i[t]=n,!0)},has({_:{data:e,setupState:t,accessCache:n,ctx:s,appContext:r,propsOptions:i,type:o}},l){let c,d;return!!(n[l]||e!==ee&&l[0]!=="$"&&Q(e,l)||ns(t,l)||(c=i[0])&&Q(c,l)||Q(s,l)||Q(tn,l)||Q(r.config.globalProperties,l)||(d=o.__cssModules)&&d[l])},defineProperty(e,t,n){return n.get!=null?e._.accessCache[t]=0:Q(n,"value")&&this.set(e,t,n.value,null),Reflect.defineProperty(e,t,n)}};function lr(e){return V(e)?e.reduce((t,n)=>(t[n]=null,t),{}):e}let _s=!0;function Bl(e){const t=Hi(e),n=e.proxy,s=e.ctx;_s=!1,t.beforeCreate&&cr(t.beforeCreate,e,"bc");const{data:r,computed:i,methods:o,watch:l,provide:c,inject:d,created:f,beforeMount:h,mounted:g,beforeUpdate:m,updated:R,activated:O,deactivated:k,beforeDestroy:N,beforeUnmount:I,destroyed:D,unmounted:T,render:B,renderTracked:ue,renderTriggered:Y,errorCaptured:K,serverPrefetch:G,expose:re,inheritAttrs:ge,components:Re,directives:be,filters:yt}=t;if(d&&Kl(d,s,null),o)for(const H in o){const J=o[H];U(J)&&(s[H]=J.bind(n))}if(r){const H=r.call(n,n);Z(H)&&(e.data=mn(H))}if(_s=!0,i)for(const H in i){const J=i[H],Qe=U(J)?J.bind(n,n):U(J.get)?J.get.bind(n,n):qe,lt=!U(J)&&U(J.set)?J.set.bind(n):qe,Ue=Te({get:Qe,set:lt});Object.defineProperty(s,H,{enumerable:!0,configurable:!0,get:()=>Ue.value,set:Ee=>Ue.value=Ee})}if(l)for(const H in l)ki(l[H],s,n,H);if(c){const H=U(c)?c.call(n):c;Reflect.ownKeys(H).forEach(J=>{xn(J,H[J])})}f&&cr(f,e,"c");function se(H,J){V(J)?J.forEach(Qe=>H(Qe.bind(n))):J&&H(J.bind(n))}if(se(Pl,h),se(Il,g),se(Tl,m),se(Nl,R),se(wl,O),se(Cl,k),se(Fl,K),se(Vl,ue),se(Ll,Y),se(Dl,I),se(ji,T),se(Ml,G),V(re))if(re.length){const H=e.exposed||(e.exposed={});re.forEach(J=>{Object.defineProperty(H,J,{get:()=>n[J],set:Qe=>n[J]=Qe,enumerable:!0})})}else e.exposed||(e.exposed={});B&&e.render===qe&&(e.render=B),ge!=null&&(e.inheritAttrs=ge),Re&&(e.components=Re),be&&(e.directives=be),G&&Li(e)}function Kl(e,t,n=qe){V(e)&&(e=ys(e));for(const s in e){const r=e[s];let i;Z(r)?"default"in r?i=$e(r.from||s,r.default,!0):i=$e(r.from||s):i=$e(r),oe(i)?Object.defineProperty(t,s,{enumerable:!0,configurable:!0,get:()=>i.value,set:o=>i.value=o}):t[s]=i}}function cr(e,t,n){ze(V(e)?e.map(s=>s.bind(t.proxy)):e.bind(t.proxy),t,n)}function ki(e,t,n,s){let r=s.includes(".")?eo(n,s):()=>n[s];if(le(e)){const i=t[e];U(i)&&nn(r,i)}else if(U(e))nn(r,e.bind(n));else if(Z(e))if(V(e))e.forEach(i=>ki(i,t,n,s));else{const i=U(e.handler)?e.handler.bind(n):t[e.handler];U(i)&&nn(r,i,e)}}function Hi(e){const t=e.type,{mixins:n,extends:s}=t,{mixins:r,optionsCache:i,config:{optionMergeStrategies:o}}=e.appContext,l=i.get(t);let c;return l?c=l:!r.length&&!n&&!s?c=t:(c={},r.length&&r.forEach(d=>Nn(c,d,o,!0)),Nn(c,t,o)),Z(t)&&i.set(t,c),c}function Nn(e,t,n,s=!1){const{mixins:r,extends:i}=t;i&&Nn(e,i,n,!0),r&&r.forEach(o=>Nn(e,o,n,!0));for(const o in t)if(!(s&&o==="expose")){const l=Gl[o]||n&&n[o];e[o]=l?l(e[o],t[o]):t[o]}return e}const Gl={data:ur,props:fr,emits:fr,methods:zt,computed:zt,beforeCreate:me,created:me,beforeMount:me,mounted:me,beforeUpdate:me,updated:me,beforeDestroy:me,beforeUnmount:me,destroyed:me,unmounted:me,activated:me,deactivated:me,errorCaptured:me,serverPrefetch:me,components:zt,directives:zt,watch:ql,provide:ur,inject:Wl};function ur(e,t){return t?e?function(){return pe(U(e)?e.call(this,this):e,U(t)?t.call(this,this):t)}:t:e}function Wl(e,t){return zt(ys(e),ys(t))}function ys(e){if(V(e)){const t={};for(let n=0;n<e.length;n++)t[e[n]]=e[n];return t}return e}function me(e,t){return e?[...new Set([].concat(e,t))]:t}function zt(e,t){return e?pe(Object.create(null),e,t):t}function fr(e,t){return e?V(e)&&V(t)?[...new Set([...e,...t])]:pe(Object.create(null),lr(e),lr(t??{})):t}function ql(e,t){if(!e)return t;if(!t)return e;const n=pe(Object.create(null),e);for(const s in t)n[s]=me(e[s],t[s]);return n}function Bi(){return{app:null,config:{isNativeTag:Zr,performance:!1,globalProperties:{},optionMergeStrategies:{},errorHandler:void 0,warnHandler:void 0,compilerOptions:{}},mixins:[],components:{},directives:{},provides:Object.create(null),optionsCache:new WeakMap,propsCache:new WeakMap,emitsCache:new WeakMap}}let $l=0;function Jl(e,t){return function(s,r=null){U(s)||(s=pe({},s)),r!=null&&!Z(r)&&(r=null);const i=Bi(),o=new WeakSet,l=[];let c=!1;const d=i.app={_uid:$l++,_component:s,_props:r,_container:null,_context:i,_instance:null,version:Tc,get config(){return i.config},set config(f){},use(f,...h){return o.has(f)||(f&&U(f.install)?(o.add(f),f.install(d,...h)):U(f)&&(o.add(f),f(d,...h))),d},mixin(f){return i.mixins.includes(f)||i.mixins.push(f),d},component(f,h){return h?(i.components[f]=h,d):i.components[f]},directive(f,h){return h?(i.directives[f]=h,d):i.directives[f]},mount(f,h,g){if(!c){const m=d._ceVNode||ve(s,r);return m.appContext=i,g===!0?g="svg":g===!1&&(g=void 0),e(m,f,g),c=!0,d._container=f,f.__vue_app__=d,Jn(m.component)}},onUnmount(f){l.push(f)},unmount(){c&&(ze(l,d._instance,16),e(null,d._container),delete d._container.__vue_app__)},provide(f,h){return i.provides[f]=h,d},runWithContext(f){const h=wt;wt=d;try{return f()}finally{wt=h}}};return d}}let wt=null;function xn(e,t){if(he){let n=he.provides;const s=he.parent&&he.parent.provides;s===n&&(n=he.provides=Object.create(s)),n[e]=t}}function $e(e,t,n=!1){const s=oo();if(s||wt){let r=wt?wt._context.provides:s?s.parent==null||s.ce?s.vnode.appContext&&s.vnode.appContext.provides:s.parent.provides:void 0;if(r&&e in r)return r[e];if(arguments.length>1)return n&&U(t)?t.call(s&&s.proxy):t}}function zl(){return!!(oo()||wt)}const Ki={},Gi=()=>Object.create(Ki),Wi=e=>Object.getPrototypeOf(e)===Ki;function Ql(e,t,n,s=!1){const r={},i=Gi();e.propsDefaults=Object.create(null),qi(e,t,r,i);for(const o in e.propsOptions[0])o in r||(r[o]=void 0);n?e.props=s?r:Ri(r):e.type.props?e.props=r:e.props=i,e.attrs=i}function Yl(e,t,n,s){const{props:r,attrs:i,vnode:{patchFlag:o}}=e,l=$(r),[c]=e.propsOptions;let d=!1;if((s||o>0)&&!(o&16)){if(o&8){const f=e.vnode.dynamicProps;for(let h=0;h<f.length;h++){let g=f[h];if(qn(e.emitsOptions,g))continue;const m=t[g];if(c)if(Q(i,g))m!==i[g]&&(i[g]=m,d=!0);else{const R=De(g);r[R]=vs(c,l,R,m,e,!1)}else m!==i[g]&&(i[g]=m,d=!0)}}}else{qi(e,t,r,i)&&(d=!0);let f;for(const h in l)(!t||!Q(t,h)&&((f=Ct(h))===h||!Q(t,f)))&&(c?n&&(n[h]!==void 0||n[f]!==void 0)&&(r[h]=vs(c,l,h,void 0,e,!0)):delete r[h]);if(i!==l)for(const h in i)(!t||!Q(t,h))&&(delete i[h],d=!0)}d&&et(e.attrs,"set","")}function qi(e,t,n,s){const[r,i]=e.propsOptions;let o=!1,l;if(t)for(let c in t){if(Qt(c))continue;const d=t[c];let f;r&&Q(r,f=De(c))?!i||!i.includes(f)?n[f]=d:(l||(l={}))[f]=d:qn(e.emitsOptions,c)||(!(c in s)||d!==s[c])&&(s[c]=d,o=!0)}if(i){const c=$(n),d=l||ee;for(let f=0;f<i.length;f++){const h=i[f];n[h]=vs(r,c,h,d[h],e,!Q(d,h))}}return o}function vs(e,t,n,s,r,i){const o=e[n];if(o!=null){const l=Q(o,"default");if(l&&s===void 0){const c=o.default;if(o.type!==Function&&!o.skipFactory&&U(c)){const{propsDefaults:d}=r;if(n in d)s=d[n];else{const f=yn(r);s=d[n]=c.call(null,t),f()}}else s=c;r.ce&&r.ce._setProp(n,s)}o[0]&&(i&&!l?s=!1:o[1]&&(s===""||s===Ct(n))&&(s=!0))}return s}const Xl=new WeakMap;function $i(e,t,n=!1){const s=n?Xl:t.propsCache,r=s.get(e);if(r)return r;const i=e.props,o={},l=[];let c=!1;if(!U(e)){const f=h=>{c=!0;const[g,m]=$i(h,t,!0);pe(o,g),m&&l.push(...m)};!n&&t.mixins.length&&t.mixins.forEach(f),e.extends&&f(e.extends),e.mixins&&e.mixins.forEach(f)}if(!i&&!c)return Z(e)&&s.set(e,Mt),Mt;if(V(i))for(let f=0;f<i.length;f++){const h=De(i[f]);ar(h)&&(o[h]=ee)}else if(i)for(const f in i){const h=De(f);if(ar(h)){const g=i[f],m=o[h]=V(g)||U(g)?{type:g}:pe({},g),R=m.type;let O=!1,k=!0;if(V(R))for(let N=0;N<R.length;++N){const I=R[N],D=U(I)&&I.name;if(D==="Boolean"){O=!0;break}else D==="String"&&(k=!1)}else O=U(R)&&R.name==="Boolean";m[0]=O,m[1]=k,(O||Q(m,"default"))&&l.push(h)}}const d=[o,l];return Z(e)&&s.set(e,d),d}function ar(e){return e[0]!=="$"&&!Qt(e)}const Gs=e=>e==="_"||e==="_ctx"||e==="$stable",Ws=e=>V(e)?e.map(We):[We(e)],Zl=(e,t,n)=>{if(t._n)return t;const s=Di((...r)=>Ws(t(...r)),n);return s._c=!1,s},Ji=(e,t,n)=>{const s=e._ctx;for(const r in e){if(Gs(r))continue;const i=e[r];if(U(i))t[r]=Zl(r,i,s);else if(i!=null){const o=Ws(i);t[r]=()=>o}}},zi=(e,t)=>{const n=Ws(t);e.slots.default=()=>n},Qi=(e,t,n)=>{for(const s in t)(n||!Gs(s))&&(e[s]=t[s])},ec=(e,t,n)=>{const s=e.slots=Gi();if(e.vnode.shapeFlag&32){const r=t._;r?(Qi(s,t,n),n&&si(s,"_",r,!0)):Ji(t,s)}else t&&zi(e,t)},tc=(e,t,n)=>{const{vnode:s,slots:r}=e;let i=!0,o=ee;if(s.shapeFlag&32){const l=t._;l?n&&l===1?i=!1:Qi(r,t,n):(i=!t.$stable,Ji(t,r)),o=t}else t&&(zi(e,t),o={default:1});if(i)for(const l in r)!Gs(l)&&o[l]==null&&delete r[l]},we=mc;function nc(e){return sc(e)}function sc(e,t){const n=kn();n.__VUE__=!0;const{insert:s,remove:r,patchProp:i,createElement:o,createText:l,createComment:c,setText:d,setElementText:f,parentNode:h,nextSibling:g,setScopeId:m=qe,insertStaticContent:R}=e,O=(u,a,p,y=null,b=null,_=null,A=void 0,x=null,S=!!a.dynamicChildren)=>{if(u===a)return;u&&!qt(u,a)&&(y=v(u),Ee(u,b,_,!0),u=null),a.patchFlag===-2&&(S=!1,a.dynamicChildren=null);const{type:E,ref:F,shapeFlag:C}=a;switch(E){case $n:k(u,a,p,y);break;case _t:N(u,a,p,y);break;case rs:u==null&&I(a,p,y,A);break;case Ve:Re(u,a,p,y,b,_,A,x,S);break;default:C&1?B(u,a,p,y,b,_,A,x,S):C&6?be(u,a,p,y,b,_,A,x,S):(C&64||C&128)&&E.process(u,a,p,y,b,_,A,x,S,M)}F!=null&&b?Zt(F,u&&u.ref,_,a||u,!a):F==null&&u&&u.ref!=null&&Zt(u.ref,null,_,u,!0)},k=(u,a,p,y)=>{if(u==null)s(a.el=l(a.children),p,y);else{const b=a.el=u.el;a.children!==u.children&&d(b,a.children)}},N=(u,a,p,y)=>{u==null?s(a.el=c(a.children||""),p,y):a.el=u.el},I=(u,a,p,y)=>{[u.el,u.anchor]=R(u.children,a,p,y,u.el,u.anchor)},D=({el:u,anchor:a},p,y)=>{let b;for(;u&&u!==a;)b=g(u),s(u,p,y),u=b;s(a,p,y)},T=({el:u,anchor:a})=>{let p;for(;u&&u!==a;)p=g(u),r(u),u=p;r(a)},B=(u,a,p,y,b,_,A,x,S)=>{if(a.type==="svg"?A="svg":a.type==="math"&&(A="mathml"),u==null)ue(a,p,y,b,_,A,x,S);else{const E=u.el&&u.el._isVueCE?u.el:null;try{E&&E._beginPatch(),G(u,a,b,_,A,x,S)}finally{E&&E._endPatch()}}},ue=(u,a,p,y,b,_,A,x)=>{let S,E;const{props:F,shapeFlag:C,transition:L,dirs:j}=u;if(S=u.el=o(u.type,_,F&&F.is,F),C&8?f(S,u.children):C&16&&K(u.children,S,null,y,b,ss(u,_),A,x),j&&bt(u,null,y,"created"),Y(S,u,u.scopeId,A,y),F){for(const te in F)te!=="value"&&!Qt(te)&&i(S,te,null,F[te],_,y);"value"in F&&i(S,"value",null,F.value,_),(E=F.onVnodeBeforeMount)&&Ke(E,y,u)}j&&bt(u,null,y,"beforeMount");const q=rc(b,L);q&&L.beforeEnter(S),s(S,a,p),((E=F&&F.onVnodeMounted)||q||j)&&we(()=>{E&&Ke(E,y,u),q&&L.enter(S),j&&bt(u,null,y,"mounted")},b)},Y=(u,a,p,y,b)=>{if(p&&m(u,p),y)for(let _=0;_<y.length;_++)m(u,y[_]);if(b){let _=b.subTree;if(a===_||no(_.type)&&(_.ssContent===a||_.ssFallback===a)){const A=b.vnode;Y(u,A,A.scopeId,A.slotScopeIds,b.parent)}}},K=(u,a,p,y,b,_,A,x,S=0)=>{for(let E=S;E<u.length;E++){const F=u[E]=x?at(u[E]):We(u[E]);O(null,F,a,p,y,b,_,A,x)}},G=(u,a,p,y,b,_,A)=>{const x=a.el=u.el;let{patchFlag:S,dynamicChildren:E,dirs:F}=a;S|=u.patchFlag&16;const C=u.props||ee,L=a.props||ee;let j;if(p&&Et(p,!1),(j=L.onVnodeBeforeUpdate)&&Ke(j,p,a,u),F&&bt(a,u,p,"beforeUpdate"),p&&Et(p,!0),(C.innerHTML&&L.innerHTML==null||C.textContent&&L.textContent==null)&&f(x,""),E?re(u.dynamicChildren,E,x,p,y,ss(a,b),_):A||J(u,a,x,null,p,y,ss(a,b),_,!1),S>0){if(S&16)ge(x,C,L,p,b);else if(S&2&&C.class!==L.class&&i(x,"class",null,L.class,b),S&4&&i(x,"style",C.style,L.style,b),S&8){const q=a.dynamicProps;for(let te=0;te<q.length;te++){const X=q[te],Se=C[X],xe=L[X];(xe!==Se||X==="value")&&i(x,X,Se,xe,b,p)}}S&1&&u.children!==a.children&&f(x,a.children)}else!A&&E==null&&ge(x,C,L,p,b);((j=L.onVnodeUpdated)||F)&&we(()=>{j&&Ke(j,p,a,u),F&&bt(a,u,p,"updated")},y)},re=(u,a,p,y,b,_,A)=>{for(let x=0;x<a.length;x++){const S=u[x],E=a[x],F=S.el&&(S.type===Ve||!qt(S,E)||S.shapeFlag&198)?h(S.el):p;O(S,E,F,null,y,b,_,A,!0)}},ge=(u,a,p,y,b)=>{if(a!==p){if(a!==ee)for(const _ in a)!Qt(_)&&!(_ in p)&&i(u,_,a[_],null,b,y);for(const _ in p){if(Qt(_))continue;const A=p[_],x=a[_];A!==x&&_!=="value"&&i(u,_,x,A,b,y)}"value"in p&&i(u,"value",a.value,p.value,b)}},Re=(u,a,p,y,b,_,A,x,S)=>{const E=a.el=u?u.el:l(""),F=a.anchor=u?u.anchor:l("");let{patchFlag:C,dynamicChildren:L,slotScopeIds:j}=a;j&&(x=x?x.concat(j):j),u==null?(s(E,p,y),s(F,p,y),K(a.children||[],p,F,b,_,A,x,S)):C>0&&C&64&&L&&u.dynamicChildren?(re(u.dynamicChildren,L,p,b,_,A,x),(a.key!=null||b&&a===b.subTree)&&Yi(u,a,!0)):J(u,a,p,F,b,_,A,x,S)},be=(u,a,p,y,b,_,A,x,S)=>{a.slotScopeIds=x,u==null?a.shapeFlag&512?b.ctx.activate(a,p,y,A,S):yt(a,p,y,b,_,A,S):ot(u,a,S)},yt=(u,a,p,y,b,_,A)=>{const x=u.component=Rc(u,y,b);if(Vi(u)&&(x.ctx.renderer=M),Ac(x,!1,A),x.asyncDep){if(b&&b.registerDep(x,se,A),!u.el){const S=x.subTree=ve(_t);N(null,S,a,p),u.placeholder=S.el}}else se(x,u,a,p,b,_,A)},ot=(u,a,p)=>{const y=a.component=u.component;if(pc(u,a,p))if(y.asyncDep&&!y.asyncResolved){H(y,a,p);return}else y.next=a,y.update();else a.el=u.el,y.vnode=a},se=(u,a,p,y,b,_,A)=>{const x=()=>{if(u.isMounted){let{next:C,bu:L,u:j,parent:q,vnode:te}=u;{const He=Xi(u);if(He){C&&(C.el=te.el,H(u,C,A)),He.asyncDep.then(()=>{u.isUnmounted||x()});return}}let X=C,Se;Et(u,!1),C?(C.el=te.el,H(u,C,A)):C=te,L&&Sn(L),(Se=C.props&&C.props.onVnodeBeforeUpdate)&&Ke(Se,q,C,te),Et(u,!0);const xe=hr(u),ke=u.subTree;u.subTree=xe,O(ke,xe,h(ke.el),v(ke),u,b,_),C.el=xe.el,X===null&&gc(u,xe.el),j&&we(j,b),(Se=C.props&&C.props.onVnodeUpdated)&&we(()=>Ke(Se,q,C,te),b)}else{let C;const{el:L,props:j}=a,{bm:q,m:te,parent:X,root:Se,type:xe}=u,ke=en(a);Et(u,!1),q&&Sn(q),!ke&&(C=j&&j.onVnodeBeforeMount)&&Ke(C,X,a),Et(u,!0);{Se.ce&&Se.ce._def.shadowRoot!==!1&&Se.ce._injectChildStyle(xe);const He=u.subTree=hr(u);O(null,He,p,y,u,b,_),a.el=He.el}if(te&&we(te,b),!ke&&(C=j&&j.onVnodeMounted)){const He=a;we(()=>Ke(C,X,He),b)}(a.shapeFlag&256||X&&en(X.vnode)&&X.vnode.shapeFlag&256)&&u.a&&we(u.a,b),u.isMounted=!0,a=p=y=null}};u.scope.on();const S=u.effect=new fi(x);u.scope.off();const E=u.update=S.run.bind(S),F=u.job=S.runIfDirty.bind(S);F.i=u,F.id=u.uid,S.scheduler=()=>Bs(F),Et(u,!0),E()},H=(u,a,p)=>{a.component=u;const y=u.vnode.props;u.vnode=a,u.next=null,Yl(u,a.props,y,p),tc(u,a.children,p),st(),sr(u),rt()},J=(u,a,p,y,b,_,A,x,S=!1)=>{const E=u&&u.children,F=u?u.shapeFlag:0,C=a.children,{patchFlag:L,shapeFlag:j}=a;if(L>0){if(L&128){lt(E,C,p,y,b,_,A,x,S);return}else if(L&256){Qe(E,C,p,y,b,_,A,x,S);return}}j&8?(F&16&&Ie(E,b,_),C!==E&&f(p,C)):F&16?j&16?lt(E,C,p,y,b,_,A,x,S):Ie(E,b,_,!0):(F&8&&f(p,""),j&16&&K(C,p,y,b,_,A,x,S))},Qe=(u,a,p,y,b,_,A,x,S)=>{u=u||Mt,a=a||Mt;const E=u.length,F=a.length,C=Math.min(E,F);let L;for(L=0;L<C;L++){const j=a[L]=S?at(a[L]):We(a[L]);O(u[L],j,p,null,b,_,A,x,S)}E>F?Ie(u,b,_,!0,!1,C):K(a,p,y,b,_,A,x,S,C)},lt=(u,a,p,y,b,_,A,x,S)=>{let E=0;const F=a.length;let C=u.length-1,L=F-1;for(;E<=C&&E<=L;){const j=u[E],q=a[E]=S?at(a[E]):We(a[E]);if(qt(j,q))O(j,q,p,null,b,_,A,x,S);else break;E++}for(;E<=C&&E<=L;){const j=u[C],q=a[L]=S?at(a[L]):We(a[L]);if(qt(j,q))O(j,q,p,null,b,_,A,x,S);else break;C--,L--}if(E>C){if(E<=L){const j=L+1,q=j<F?a[j].el:y;for(;E<=L;)O(null,a[E]=S?at(a[E]):We(a[E]),p,q,b,_,A,x,S),E++}}else if(E>L)for(;E<=C;)Ee(u[E],b,_,!0),E++;else{const j=E,q=E,te=new Map;for(E=q;E<=L;E++){const Ae=a[E]=S?at(a[E]):We(a[E]);Ae.key!=null&&te.set(Ae.key,E)}let X,Se=0;const xe=L-q+1;let ke=!1,He=0;const Gt=new Array(xe);for(E=0;E<xe;E++)Gt[E]=0;for(E=j;E<=C;E++){const Ae=u[E];if(Se>=xe){Ee(Ae,b,_,!0);continue}let Be;if(Ae.key!=null)Be=te.get(Ae.key);else for(X=q;X<=L;X++)if(Gt[X-q]===0&&qt(Ae,a[X])){Be=X;break}Be===void 0?Ee(Ae,b,_,!0):(Gt[Be-q]=E+1,Be>=He?He=Be:ke=!0,O(Ae,a[Be],p,null,b,_,A,x,S),Se++)}const Qs=ke?ic(Gt):Mt;for(X=Qs.length-1,E=xe-1;E>=0;E--){const Ae=q+E,Be=a[Ae],Ys=a[Ae+1],Xs=Ae+1<F?Ys.el||Ys.placeholder:y;Gt[E]===0?O(null,Be,p,Xs,b,_,A,x,S):ke&&(X<0||E!==Qs[X]?Ue(Be,p,Xs,2):X--)}}},Ue=(u,a,p,y,b=null)=>{const{el:_,type:A,transition:x,children:S,shapeFlag:E}=u;if(E&6){Ue(u.component.subTree,a,p,y);return}if(E&128){u.suspense.move(a,p,y);return}if(E&64){A.move(u,a,p,M);return}if(A===Ve){s(_,a,p);for(let C=0;C<S.length;C++)Ue(S[C],a,p,y);s(u.anchor,a,p);return}if(A===rs){D(u,a,p);return}if(y!==2&&E&1&&x)if(y===0)x.beforeEnter(_),s(_,a,p),we(()=>x.enter(_),b);else{const{leave:C,delayLeave:L,afterLeave:j}=x,q=()=>{u.ctx.isUnmounted?r(_):s(_,a,p)},te=()=>{_._isLeaving&&_[Al](!0),C(_,()=>{q(),j&&j()})};L?L(_,q,te):te()}else s(_,a,p)},Ee=(u,a,p,y=!1,b=!1)=>{const{type:_,props:A,ref:x,children:S,dynamicChildren:E,shapeFlag:F,patchFlag:C,dirs:L,cacheIndex:j}=u;if(C===-2&&(b=!1),x!=null&&(st(),Zt(x,null,p,u,!0),rt()),j!=null&&(a.renderCache[j]=void 0),F&256){a.ctx.deactivate(u);return}const q=F&1&&L,te=!en(u);let X;if(te&&(X=A&&A.onVnodeBeforeUnmount)&&Ke(X,a,u),F&6)vt(u.component,p,y);else{if(F&128){u.suspense.unmount(p,y);return}q&&bt(u,null,a,"beforeUnmount"),F&64?u.type.remove(u,a,p,M,y):E&&!E.hasOnce&&(_!==Ve||C>0&&C&64)?Ie(E,a,p,!1,!0):(_===Ve&&C&384||!b&&F&16)&&Ie(S,a,p),y&&Ot(u)}(te&&(X=A&&A.onVnodeUnmounted)||q)&&we(()=>{X&&Ke(X,a,u),q&&bt(u,null,a,"unmounted")},p)},Ot=u=>{const{type:a,el:p,anchor:y,transition:b}=u;if(a===Ve){Pt(p,y);return}if(a===rs){T(u);return}const _=()=>{r(p),b&&!b.persisted&&b.afterLeave&&b.afterLeave()};if(u.shapeFlag&1&&b&&!b.persisted){const{leave:A,delayLeave:x}=b,S=()=>A(p,_);x?x(u.el,_,S):S()}else _()},Pt=(u,a)=>{let p;for(;u!==a;)p=g(u),r(u),u=p;r(a)},vt=(u,a,p)=>{const{bum:y,scope:b,job:_,subTree:A,um:x,m:S,a:E}=u;dr(S),dr(E),y&&Sn(y),b.stop(),_&&(_.flags|=8,Ee(A,u,a,p)),x&&we(x,a),we(()=>{u.isUnmounted=!0},a)},Ie=(u,a,p,y=!1,b=!1,_=0)=>{for(let A=_;A<u.length;A++)Ee(u[A],a,p,y,b)},v=u=>{if(u.shapeFlag&6)return v(u.component.subTree);if(u.shapeFlag&128)return u.suspense.next();const a=g(u.anchor||u.el),p=a&&a[xl];return p?g(p):a};let P=!1;const w=(u,a,p)=>{u==null?a._vnode&&Ee(a._vnode,null,null,!0):O(a._vnode||null,u,a,null,null,null,p),a._vnode=u,P||(P=!0,sr(),Ii(),P=!1)},M={p:O,um:Ee,m:Ue,r:Ot,mt:yt,mc:K,pc:J,pbc:re,n:v,o:e};return{render:w,hydrate:void 0,createApp:Jl(w)}}function ss({type:e,props:t},n){return n==="svg"&&e==="foreignObject"||n==="mathml"&&e==="annotation-xml"&&t&&t.encoding&&t.encoding.includes("html")?void 0:n}function Et({effect:e,job:t},n){n?(e.flags|=32,t.flags|=4):(e.flags&=-33,t.flags&=-5)}function rc(e,t){return(!e||e&&!e.pendingBranch)&&t&&!t.persisted}function Yi(e,t,n=!1){const s=e.children,r=t.children;if(V(s)&&V(r))for(let i=0;i<s.length;i++){const o=s[i];let l=r[i];l.shapeFlag&1&&!l.dynamicChildren&&((l.patchFlag<=0||l.patchFlag===32)&&(l=r[i]=at(r[i]),l.el=o.el),!n&&l.patchFlag!==-2&&Yi(o,l)),l.type===$n&&l.patchFlag!==-1&&(l.el=o.el),l.type===_t&&!l.el&&(l.el=o.el)}}function ic(e){const t=e.slice(),n=[0];let s,r,i,o,l;const c=e.length;for(s=0;s<c;s++){const d=e[s];if(d!==0){if(r=n[n.length-1],e[r]<d){t[s]=r,n.push(s);continue}for(i=0,o=n.length-1;i<o;)l=i+o>>1,e[n[l]]<d?i=l+1:o=l;d<e[n[i]]&&(i>0&&(t[s]=n[i-1]),n[i]=s)}}for(i=n.length,o=n[i-1];i-- >0;)n[i]=o,o=t[o];return n}function Xi(e){const t=e.subTree.component;if(t)return t.asyncDep&&!t.asyncResolved?t:Xi(t)}function dr(e){if(e)for(let t=0;t<e.length;t++)e[t].flags|=8}const oc=Symbol.for("v-scx"),lc=()=>$e(oc);function nn(e,t,n){return Zi(e,t,n)}function Zi(e,t,n=ee){const{immediate:s,deep:r,flush:i,once:o}=n,l=pe({},n),c=t&&s||!t&&i!=="post";let d;if(an){if(i==="sync"){const m=lc();d=m.__watcherHandles||(m.__watcherHandles=[])}else if(!c){const m=()=>{};return m.stop=qe,m.resume=qe,m.pause=qe,m}}const f=he;l.call=(m,R,O)=>ze(m,f,R,O);let h=!1;i==="post"?l.scheduler=m=>{we(m,f&&f.suspense)}:i!=="sync"&&(h=!0,l.scheduler=(m,R)=>{R?m():Bs(m)}),l.augmentJob=m=>{t&&(m.flags|=4),h&&(m.flags|=2,f&&(m.id=f.uid,m.i=f))};const g=yl(e,t,l);return an&&(d?d.push(g):c&&g()),g}function cc(e,t,n){const s=this.proxy,r=le(e)?e.includes(".")?eo(s,e):()=>s[e]:e.bind(s,s);let i;U(t)?i=t:(i=t.handler,n=t);const o=yn(this),l=Zi(r,i.bind(s),n);return o(),l}function eo(e,t){const n=t.split(".");return()=>{let s=e;for(let r=0;r<n.length&&s;r++)s=s[n[r]];return s}}const uc=(e,t)=>t==="modelValue"||t==="model-value"?e.modelModifiers:e[`${t}Modifiers`]||e[`${De(t)}Modifiers`]||e[`${Ct(t)}Modifiers`];function fc(e,t,...n){if(e.isUnmounted)return;const s=e.vnode.props||ee;let r=n;const i=t.startsWith("update:"),o=i&&uc(s,t.slice(7));o&&(o.trim&&(r=n.map(f=>le(f)?f.trim():f)),o.number&&(r=n.map(Un)));let l,c=s[l=Yn(t)]||s[l=Yn(De(t))];!c&&i&&(c=s[l=Yn(Ct(t))]),c&&ze(c,e,6,r);const d=s[l+"Once"];if(d){if(!e.emitted)e.emitted={};else if(e.emitted[l])return;e.emitted[l]=!0,ze(d,e,6,r)}}const ac=new WeakMap;function to(e,t,n=!1){const s=n?ac:t.emitsCache,r=s.get(e);if(r!==void 0)return r;const i=e.emits;let o={},l=!1;if(!U(e)){const c=d=>{const f=to(d,t,!0);f&&(l=!0,pe(o,f))};!n&&t.mixins.length&&t.mixins.forEach(c),e.extends&&c(e.extends),e.mixins&&e.mixins.forEach(c)}return!i&&!l?(Z(e)&&s.set(e,null),null):(V(i)?i.forEach(c=>o[c]=null):pe(o,i),Z(e)&&s.set(e,o),o)}function qn(e,t){return!e||!Vn(t)?!1:(t=t.slice(2).replace(/Once$/,""),Q(e,t[0].toLowerCase()+t.slice(1))||Q(e,Ct(t))||Q(e,t))}function hr(e){const{type:t,vnode:n,proxy:s,withProxy:r,propsOptions:[i],slots:o,attrs:l,emit:c,render:d,renderCache:f,props:h,data:g,setupState:m,ctx:R,inheritAttrs:O}=e,k=In(e);let N,I;try{if(n.shapeFlag&4){const T=r||s,B=T;N=We(d.call(B,T,f,h,m,g,R)),I=l}else{const T=t;N=We(T.length>1?T(h,{attrs:l,slots:o,emit:c}):T(h,null)),I=t.props?l:dc(l)}}catch(T){sn.length=0,Kn(T,e,1),N=ve(_t)}let D=N;if(I&&O!==!1){const T=Object.keys(I),{shapeFlag:B}=D;T.length&&B&7&&(i&&T.some(Ps)&&(I=hc(I,i)),D=Ut(D,I,!1,!0))}return n.dirs&&(D=Ut(D,null,!1,!0),D.dirs=D.dirs?D.dirs.concat(n.dirs):n.dirs),n.transition&&Ks(D,n.transition),N=D,In(k),N}const dc=e=>{let t;for(const n in e)(n==="class"||n==="style"||Vn(n))&&((t||(t={}))[n]=e[n]);return t},hc=(e,t)=>{const n={};for(const s in e)(!Ps(s)||!(s.slice(9)in t))&&(n[s]=e[s]);return n};function pc(e,t,n){const{props:s,children:r,component:i}=e,{props:o,children:l,patchFlag:c}=t,d=i.emitsOptions;if(t.dirs||t.transition)return!0;if(n&&c>=0){if(c&1024)return!0;if(c&16)return s?pr(s,o,d):!!o;if(c&8){const f=t.dynamicProps;for(let h=0;h<f.length;h++){const g=f[h];if(o[g]!==s[g]&&!qn(d,g))return!0}}}else return(r||l)&&(!l||!l.$stable)?!0:s===o?!1:s?o?pr(s,o,d):!0:!!o;return!1}function pr(e,t,n){const s=Object.keys(t);if(s.length!==Object.keys(e).length)return!0;for(let r=0;r<s.length;r++){const i=s[r];if(t[i]!==e[i]&&!qn(n,i))return!0}return!1}function gc({vnode:e,parent:t},n){for(;t;){const s=t.subTree;if(s.suspense&&s.suspense.activeBranch===e&&(s.el=e.el),s===e)(e=t.vnode).el=n,t=t.parent;else break}}const no=e=>e.__isSuspense;function mc(e,t){t&&t.pendingBranch?V(e)?t.effects.push(...e):t.effects.push(e):El(e)}const Ve=Symbol.for("v-fgt"),$n=Symbol.for("v-txt"),_t=Symbol.for("v-cmt"),rs=Symbol.for("v-stc"),sn=[];let Pe=null;function Ce(e=!1){sn.push(Pe=e?null:[])}function _c(){sn.pop(),Pe=sn[sn.length-1]||null}let fn=1;function Dn(e,t=!1){fn+=e,e<0&&Pe&&t&&(Pe.hasOnce=!0)}function so(e){return e.dynamicChildren=fn>0?Pe||Mt:null,_c(),fn>0&&Pe&&Pe.push(e),e}function Me(e,t,n,s,r,i){return so(Le(e,t,n,s,r,i,!0))}function ro(e,t,n,s,r){return so(ve(e,t,n,s,r,!0))}function Mn(e){return e?e.__v_isVNode===!0:!1}function qt(e,t){return e.type===t.type&&e.key===t.key}const io=({key:e})=>e??null,Rn=({ref:e,ref_key:t,ref_for:n})=>(typeof e=="number"&&(e=""+e),e!=null?le(e)||oe(e)||U(e)?{i:Oe,r:e,k:t,f:!!n}:e:null);function Le(e,t=null,n=null,s=0,r=null,i=e===Ve?0:1,o=!1,l=!1){const c={__v_isVNode:!0,__v_skip:!0,type:e,props:t,key:t&&io(t),ref:t&&Rn(t),scopeId:Ni,slotScopeIds:null,children:n,component:null,suspense:null,ssContent:null,ssFallback:null,dirs:null,transition:null,el:null,anchor:null,target:null,targetStart:null,targetAnchor:null,staticCount:0,shapeFlag:i,patchFlag:s,dynamicProps:r,dynamicChildren:null,appContext:null,ctx:Oe};return l?(qs(c,n),i&128&&e.normalize(c)):n&&(c.shapeFlag|=le(n)?8:16),fn>0&&!o&&Pe&&(c.patchFlag>0||i&6)&&c.patchFlag!==32&&Pe.push(c),c}const ve=yc;function yc(e,t=null,n=null,s=0,r=null,i=!1){if((!e||e===Ul)&&(e=_t),Mn(e)){const l=Ut(e,t,!0);return n&&qs(l,n),fn>0&&!i&&Pe&&(l.shapeFlag&6?Pe[Pe.indexOf(e)]=l:Pe.push(l)),l.patchFlag=-2,l}if(Ic(e)&&(e=e.__vccOpts),t){t=vc(t);let{class:l,style:c}=t;l&&!le(l)&&(t.class=Hn(l)),Z(c)&&(ks(c)&&!V(c)&&(c=pe({},c)),t.style=Ns(c))}const o=le(e)?1:no(e)?128:Rl(e)?64:Z(e)?4:U(e)?2:0;return Le(e,t,n,s,r,o,i,!0)}function vc(e){return e?ks(e)||Wi(e)?pe({},e):e:null}function Ut(e,t,n=!1,s=!1){const{props:r,ref:i,patchFlag:o,children:l,transition:c}=e,d=t?Ec(r||{},t):r,f={__v_isVNode:!0,__v_skip:!0,type:e.type,props:d,key:d&&io(d),ref:t&&t.ref?n&&i?V(i)?i.concat(Rn(t)):[i,Rn(t)]:Rn(t):i,scopeId:e.scopeId,slotScopeIds:e.slotScopeIds,children:l,target:e.target,targetStart:e.targetStart,targetAnchor:e.targetAnchor,staticCount:e.staticCount,shapeFlag:e.shapeFlag,patchFlag:t&&e.type!==Ve?o===-1?16:o|16:o,dynamicProps:e.dynamicProps,dynamicChildren:e.dynamicChildren,appContext:e.appContext,dirs:e.dirs,transition:c,component:e.component,suspense:e.suspense,ssContent:e.ssContent&&Ut(e.ssContent),ssFallback:e.ssFallback&&Ut(e.ssFallback),placeholder:e.placeholder,el:e.el,anchor:e.anchor,ctx:e.ctx,ce:e.ce};return c&&s&&Ks(f,c.clone(f)),f}function bc(e=" ",t=0){return ve($n,null,e,t)}function gr(e="",t=!1){return t?(Ce(),ro(_t,null,e)):ve(_t,null,e)}function We(e){return e==null||typeof e=="boolean"?ve(_t):V(e)?ve(Ve,null,e.slice()):Mn(e)?at(e):ve($n,null,String(e))}function at(e){return e.el===null&&e.patchFlag!==-1||e.memo?e:Ut(e)}function qs(e,t){let n=0;const{shapeFlag:s}=e;if(t==null)t=null;else if(V(t))n=16;else if(typeof t=="object")if(s&65){const r=t.default;r&&(r._c&&(r._d=!1),qs(e,r()),r._c&&(r._d=!0));return}else{n=32;const r=t._;!r&&!Wi(t)?t._ctx=Oe:r===3&&Oe&&(Oe.slots._===1?t._=1:(t._=2,e.patchFlag|=1024))}else U(t)?(t={default:t,_ctx:Oe},n=32):(t=String(t),s&64?(n=16,t=[bc(t)]):n=8);e.children=t,e.shapeFlag|=n}function Ec(...e){const t={};for(let n=0;n<e.length;n++){const s=e[n];for(const r in s)if(r==="class")t.class!==s.class&&(t.class=Hn([t.class,s.class]));else if(r==="style")t.style=Ns([t.style,s.style]);else if(Vn(r)){const i=t[r],o=s[r];o&&i!==o&&!(V(i)&&i.includes(o))&&(t[r]=i?[].concat(i,o):o)}else r!==""&&(t[r]=s[r])}return t}function Ke(e,t,n,s=null){ze(e,t,7,[n,s])}const Sc=Bi();let xc=0;function Rc(e,t,n){const s=e.type,r=(t?t.appContext:e.appContext)||Sc,i={uid:xc++,vnode:e,type:s,parent:t,appContext:r,root:null,next:null,subTree:null,effect:null,update:null,job:null,scope:new li(!0),render:null,proxy:null,exposed:null,exposeProxy:null,withProxy:null,provides:t?t.provides:Object.create(r.provides),ids:t?t.ids:["",0,0],accessCache:null,renderCache:[],components:null,directives:null,propsOptions:$i(s,r),emitsOptions:to(s,r),emit:null,emitted:null,propsDefaults:ee,inheritAttrs:s.inheritAttrs,ctx:ee,data:ee,props:ee,attrs:ee,slots:ee,refs:ee,setupState:ee,setupContext:null,suspense:n,suspenseId:n?n.pendingId:0,asyncDep:null,asyncResolved:!1,isMounted:!1,isUnmounted:!1,isDeactivated:!1,bc:null,c:null,bm:null,m:null,bu:null,u:null,um:null,bum:null,da:null,a:null,rtg:null,rtc:null,ec:null,sp:null};return i.ctx={_:i},i.root=t?t.root:i,i.emit=fc.bind(null,i),e.ce&&e.ce(i),i}let he=null;const oo=()=>he||Oe;let Ln,bs;{const e=kn(),t=(n,s)=>{let r;return(r=e[n])||(r=e[n]=[]),r.push(s),i=>{r.length>1?r.forEach(o=>o(i)):r[0](i)}};Ln=t("__VUE_INSTANCE_SETTERS__",n=>he=n),bs=t("__VUE_SSR_SETTERS__",n=>an=n)}const yn=e=>{const t=he;return Ln(e),e.scope.on(),()=>{e.scope.off(),Ln(t)}},mr=()=>{he&&he.scope.off(),Ln(null)};function lo(e){return e.vnode.shapeFlag&4}let an=!1;function Ac(e,t=!1,n=!1){t&&bs(t);const{props:s,children:r}=e.vnode,i=lo(e);Ql(e,s,i,t),ec(e,r,n||t);const o=i?wc(e,t):void 0;return t&&bs(!1),o}function wc(e,t){const n=e.type;e.accessCache=Object.create(null),e.proxy=new Proxy(e.ctx,Hl);const{setup:s}=n;if(s){st();const r=e.setupContext=s.length>1?Oc(e):null,i=yn(e),o=_n(s,e,0,[e.props,r]),l=ei(o);if(rt(),i(),(l||e.sp)&&!en(e)&&Li(e),l){if(o.then(mr,mr),t)return o.then(c=>{_r(e,c)}).catch(c=>{Kn(c,e,0)});e.asyncDep=o}else _r(e,o)}else co(e)}function _r(e,t,n){U(t)?e.type.__ssrInlineRender?e.ssrRender=t:e.render=t:Z(t)&&(e.setupState=wi(t)),co(e)}function co(e,t,n){const s=e.type;e.render||(e.render=s.render||qe);{const r=yn(e);st();try{Bl(e)}finally{rt(),r()}}}const Cc={get(e,t){return de(e,"get",""),e[t]}};function Oc(e){const t=n=>{e.exposed=n||{}};return{attrs:new Proxy(e.attrs,Cc),slots:e.slots,emit:e.emit,expose:t}}function Jn(e){return e.exposed?e.exposeProxy||(e.exposeProxy=new Proxy(wi(Hs(e.exposed)),{get(t,n){if(n in t)return t[n];if(n in tn)return tn[n](e)},has(t,n){return n in t||n in tn}})):e.proxy}function Pc(e,t=!0){return U(e)?e.displayName||e.name:e.name||t&&e.__name}function Ic(e){return U(e)&&"__vccOpts"in e}const Te=(e,t)=>ml(e,t,an);function uo(e,t,n){try{Dn(-1);const s=arguments.length;return s===2?Z(t)&&!V(t)?Mn(t)?ve(e,null,[t]):ve(e,t):ve(e,null,t):(s>3?n=Array.prototype.slice.call(arguments,2):s===3&&Mn(n)&&(n=[n]),ve(e,t,n))}finally{Dn(1)}}const Tc="3.5.24";let Es;const yr=typeof window<"u"&&window.trustedTypes;if(yr)try{Es=yr.createPolicy("vue",{createHTML:e=>e})}catch{}const fo=Es?e=>Es.createHTML(e):e=>e,Nc="http://www.w3.org/2000/svg",Dc="http://www.w3.org/1998/Math/MathML",Ze=typeof document<"u"?document:null,vr=Ze&&Ze.createElement("template"),Mc={insert:(e,t,n)=>{t.insertBefore(e,n||null)},remove:e=>{const t=e.parentNode;t&&t.removeChild(e)},createElement:(e,t,n,s)=>{const r=t==="svg"?Ze.createElementNS(Nc,e):t==="mathml"?Ze.createElementNS(Dc,e):n?Ze.createElement(e,{is:n}):Ze.createElement(e);return e==="select"&&s&&s.multiple!=null&&r.setAttribute("multiple",s.multiple),r},createText:e=>Ze.createTextNode(e),createComment:e=>Ze.createComment(e),setText:(e,t)=>{e.nodeValue=t},setElementText:(e,t)=>{e.textContent=t},parentNode:e=>e.parentNode,nextSibling:e=>e.nextSibling,querySelector:e=>Ze.querySelector(e),setScopeId(e,t){e.setAttribute(t,"")},insertStaticContent(e,t,n,s,r,i){const o=n?n.previousSibling:t.lastChild;if(r&&(r===i||r.nextSibling))for(;t.insertBefore(r.cloneNode(!0),n),!(r===i||!(r=r.nextSibling)););else{vr.innerHTML=fo(s==="svg"?`<svg>${e}</svg>`:s==="mathml"?`<math>${e}</math>`:e);const l=vr.content;if(s==="svg"||s==="mathml"){const c=l.firstChild;for(;c.firstChild;)l.appendChild(c.firstChild);l.removeChild(c)}t.insertBefore(l,n)}return[o?o.nextSibling:t.firstChild,n?n.previousSibling:t.lastChild]}},Lc=Symbol("_vtc");function Vc(e,t,n){const s=e[Lc];s&&(t=(t?[t,...s]:[...s]).join(" ")),t==null?e.removeAttribute("class"):n?e.setAttribute("class",t):e.className=t}const br=Symbol("_vod"),Fc=Symbol("_vsh"),jc=Symbol(""),Uc=/(?:^|;)\s*display\s*:/;function kc(e,t,n){const s=e.style,r=le(n);let i=!1;if(n&&!r){if(t)if(le(t))for(const o of t.split(";")){const l=o.slice(0,o.indexOf(":")).trim();n[l]==null&&An(s,l,"")}else for(const o in t)n[o]==null&&An(s,o,"");for(const o in n)o==="display"&&(i=!0),An(s,o,n[o])}else if(r){if(t!==n){const o=s[jc];o&&(n+=";"+o),s.cssText=n,i=Uc.test(n)}}else t&&e.removeAttribute("style");br in e&&(e[br]=i?s.display:"",e[Fc]&&(s.display="none"))}const Er=/\s*!important$/;function An(e,t,n){if(V(n))n.forEach(s=>An(e,t,s));else if(n==null&&(n=""),t.startsWith("--"))e.setProperty(t,n);else{const s=Hc(e,t);Er.test(n)?e.setProperty(Ct(s),n.replace(Er,""),"important"):e[s]=n}}const Sr=["Webkit","Moz","ms"],is={};function Hc(e,t){const n=is[t];if(n)return n;let s=De(t);if(s!=="filter"&&s in e)return is[t]=s;s=jn(s);for(let r=0;r<Sr.length;r++){const i=Sr[r]+s;if(i in e)return is[t]=i}return t}const xr="http://www.w3.org/1999/xlink";function Rr(e,t,n,s,r,i=Ho(t)){s&&t.startsWith("xlink:")?n==null?e.removeAttributeNS(xr,t.slice(6,t.length)):e.setAttributeNS(xr,t,n):n==null||i&&!ri(n)?e.removeAttribute(t):e.setAttribute(t,i?"":Je(n)?String(n):n)}function Ar(e,t,n,s,r){if(t==="innerHTML"||t==="textContent"){n!=null&&(e[t]=t==="innerHTML"?fo(n):n);return}const i=e.tagName;if(t==="value"&&i!=="PROGRESS"&&!i.includes("-")){const l=i==="OPTION"?e.getAttribute("value")||"":e.value,c=n==null?e.type==="checkbox"?"on":"":String(n);(l!==c||!("_value"in e))&&(e.value=c),n==null&&e.removeAttribute(t),e._value=n;return}let o=!1;if(n===""||n==null){const l=typeof e[t];l==="boolean"?n=ri(n):n==null&&l==="string"?(n="",o=!0):l==="number"&&(n=0,o=!0)}try{e[t]=n}catch{}o&&e.removeAttribute(r||t)}function ht(e,t,n,s){e.addEventListener(t,n,s)}function Bc(e,t,n,s){e.removeEventListener(t,n,s)}const wr=Symbol("_vei");function Kc(e,t,n,s,r=null){const i=e[wr]||(e[wr]={}),o=i[t];if(s&&o)o.value=s;else{const[l,c]=Gc(t);if(s){const d=i[t]=$c(s,r);ht(e,l,d,c)}else o&&(Bc(e,l,o,c),i[t]=void 0)}}const Cr=/(?:Once|Passive|Capture)$/;function Gc(e){let t;if(Cr.test(e)){t={};let s;for(;s=e.match(Cr);)e=e.slice(0,e.length-s[0].length),t[s[0].toLowerCase()]=!0}return[e[2]===":"?e.slice(3):Ct(e.slice(2)),t]}let os=0;const Wc=Promise.resolve(),qc=()=>os||(Wc.then(()=>os=0),os=Date.now());function $c(e,t){const n=s=>{if(!s._vts)s._vts=Date.now();else if(s._vts<=n.attached)return;ze(Jc(s,n.value),t,5,[s])};return n.value=e,n.attached=qc(),n}function Jc(e,t){if(V(t)){const n=e.stopImmediatePropagation;return e.stopImmediatePropagation=()=>{n.call(e),e._stopped=!0},t.map(s=>r=>!r._stopped&&s&&s(r))}else return t}const Or=e=>e.charCodeAt(0)===111&&e.charCodeAt(1)===110&&e.charCodeAt(2)>96&&e.charCodeAt(2)<123,zc=(e,t,n,s,r,i)=>{const o=r==="svg";t==="class"?Vc(e,s,o):t==="style"?kc(e,n,s):Vn(t)?Ps(t)||Kc(e,t,n,s,i):(t[0]==="."?(t=t.slice(1),!0):t[0]==="^"?(t=t.slice(1),!1):Qc(e,t,s,o))?(Ar(e,t,s),!e.tagName.includes("-")&&(t==="value"||t==="checked"||t==="selected")&&Rr(e,t,s,o,i,t!=="value")):e._isVueCE&&(/[A-Z]/.test(t)||!le(s))?Ar(e,De(t),s,i,t):(t==="true-value"?e._trueValue=s:t==="false-value"&&(e._falseValue=s),Rr(e,t,s,o))};function Qc(e,t,n,s){if(s)return!!(t==="innerHTML"||t==="textContent"||t in e&&Or(t)&&U(n));if(t==="spellcheck"||t==="draggable"||t==="translate"||t==="autocorrect"||t==="sandbox"&&e.tagName==="IFRAME"||t==="form"||t==="list"&&e.tagName==="INPUT"||t==="type"&&e.tagName==="TEXTAREA")return!1;if(t==="width"||t==="height"){const r=e.tagName;if(r==="IMG"||r==="VIDEO"||r==="CANVAS"||r==="SOURCE")return!1}return Or(t)&&le(n)?!1:t in e}const kt=e=>{const t=e.props["onUpdate:modelValue"]||!1;return V(t)?n=>Sn(t,n):t};function Yc(e){e.target.composing=!0}function Pr(e){const t=e.target;t.composing&&(t.composing=!1,t.dispatchEvent(new Event("input")))}const nt=Symbol("_assign");function Ir(e,t,n){return t&&(e=e.trim()),n&&(e=Un(e)),e}const qf={created(e,{modifiers:{lazy:t,trim:n,number:s}},r){e[nt]=kt(r);const i=s||r.props&&r.props.type==="number";ht(e,t?"change":"input",o=>{o.target.composing||e[nt](Ir(e.value,n,i))}),(n||i)&&ht(e,"change",()=>{e.value=Ir(e.value,n,i)}),t||(ht(e,"compositionstart",Yc),ht(e,"compositionend",Pr),ht(e,"change",Pr))},mounted(e,{value:t}){e.value=t??""},beforeUpdate(e,{value:t,oldValue:n,modifiers:{lazy:s,trim:r,number:i}},o){if(e[nt]=kt(o),e.composing)return;const l=(i||e.type==="number")&&!/^0\d/.test(e.value)?Un(e.value):e.value,c=t??"";l!==c&&(document.activeElement===e&&e.type!=="range"&&(s&&t===n||r&&e.value.trim()===c)||(e.value=c))}},$f={deep:!0,created(e,t,n){e[nt]=kt(n),ht(e,"change",()=>{const s=e._modelValue,r=dn(e),i=e.checked,o=e[nt];if(V(s)){const l=Ds(s,r),c=l!==-1;if(i&&!c)o(s.concat(r));else if(!i&&c){const d=[...s];d.splice(l,1),o(d)}}else if(Kt(s)){const l=new Set(s);i?l.add(r):l.delete(r),o(l)}else o(ao(e,i))})},mounted:Tr,beforeUpdate(e,t,n){e[nt]=kt(n),Tr(e,t,n)}};function Tr(e,{value:t,oldValue:n},s){e._modelValue=t;let r;if(V(t))r=Ds(t,s.props.value)>-1;else if(Kt(t))r=t.has(s.props.value);else{if(t===n)return;r=gn(t,ao(e,!0))}e.checked!==r&&(e.checked=r)}const Xc={deep:!0,created(e,{value:t,modifiers:{number:n}},s){const r=Kt(t);ht(e,"change",()=>{const i=Array.prototype.filter.call(e.options,o=>o.selected).map(o=>n?Un(dn(o)):dn(o));e[nt](e.multiple?r?new Set(i):i:i[0]),e._assigning=!0,Gn(()=>{e._assigning=!1})}),e[nt]=kt(s)},mounted(e,{value:t}){Nr(e,t)},beforeUpdate(e,t,n){e[nt]=kt(n)},updated(e,{value:t}){e._assigning||Nr(e,t)}};function Nr(e,t){const n=e.multiple,s=V(t);if(!(n&&!s&&!Kt(t))){for(let r=0,i=e.options.length;r<i;r++){const o=e.options[r],l=dn(o);if(n)if(s){const c=typeof l;c==="string"||c==="number"?o.selected=t.some(d=>String(d)===String(l)):o.selected=Ds(t,l)>-1}else o.selected=t.has(l);else if(gn(dn(o),t)){e.selectedIndex!==r&&(e.selectedIndex=r);return}}!n&&e.selectedIndex!==-1&&(e.selectedIndex=-1)}}function dn(e){return"_value"in e?e._value:e.value}function ao(e,t){const n=t?"_trueValue":"_falseValue";return n in e?e[n]:t}const Zc=["ctrl","shift","alt","meta"],eu={stop:e=>e.stopPropagation(),prevent:e=>e.preventDefault(),self:e=>e.target!==e.currentTarget,ctrl:e=>!e.ctrlKey,shift:e=>!e.shiftKey,alt:e=>!e.altKey,meta:e=>!e.metaKey,left:e=>"button"in e&&e.button!==0,middle:e=>"button"in e&&e.button!==1,right:e=>"button"in e&&e.button!==2,exact:(e,t)=>Zc.some(n=>e[`${n}Key`]&&!t.includes(n))},Jf=(e,t)=>{const n=e._withMods||(e._withMods={}),s=t.join(".");return n[s]||(n[s]=((r,...i)=>{for(let o=0;o<t.length;o++){const l=eu[t[o]];if(l&&l(r,t))return}return e(r,...i)}))},tu=pe({patchProp:zc},Mc);let Dr;function nu(){return Dr||(Dr=nc(tu))}const su=((...e)=>{const t=nu().createApp(...e),{mount:n}=t;return t.mount=s=>{const r=iu(s);if(!r)return;const i=t._component;!U(i)&&!i.render&&!i.template&&(i.template=r.innerHTML),r.nodeType===1&&(r.textContent="");const o=n(r,!1,ru(r));return r instanceof Element&&(r.removeAttribute("v-cloak"),r.setAttribute("data-v-app","")),o},t});function ru(e){if(e instanceof SVGElement)return"svg";if(typeof MathMLElement=="function"&&e instanceof MathMLElement)return"mathml"}function iu(e){return le(e)?document.querySelector(e):e}let ho;const zn=e=>ho=e,po=Symbol();function Ss(e){return e&&typeof e=="object"&&Object.prototype.toString.call(e)==="[object Object]"&&typeof e.toJSON!="function"}var rn;(function(e){e.direct="direct",e.patchObject="patch object",e.patchFunction="patch function"})(rn||(rn={}));function ou(){const e=ci(!0),t=e.run(()=>jt({}));let n=[],s=[];const r=Hs({install(i){zn(r),r._a=i,i.provide(po,r),i.config.globalProperties.$pinia=r,s.forEach(o=>n.push(o)),s=[]},use(i){return this._a?n.push(i):s.push(i),this},_p:n,_a:null,_e:e,_s:new Map,state:t});return r}const go=()=>{};function Mr(e,t,n,s=go){e.add(t);const r=()=>{e.delete(t)&&s()};return!n&&ui()&&Ko(r),r}function Tt(e,...t){e.forEach(n=>{n(...t)})}const lu=e=>e(),Lr=Symbol(),ls=Symbol();function xs(e,t){e instanceof Map&&t instanceof Map?t.forEach((n,s)=>e.set(s,n)):e instanceof Set&&t instanceof Set&&t.forEach(e.add,e);for(const n in t){if(!t.hasOwnProperty(n))continue;const s=t[n],r=e[n];Ss(r)&&Ss(s)&&e.hasOwnProperty(n)&&!oe(s)&&!gt(s)?e[n]=xs(r,s):e[n]=s}return e}const cu=Symbol();function uu(e){return!Ss(e)||!Object.prototype.hasOwnProperty.call(e,cu)}const{assign:ut}=Object;function fu(e){return!!(oe(e)&&e.effect)}function au(e,t,n,s){const{state:r,actions:i,getters:o}=t,l=n.state.value[e];let c;function d(){l||(n.state.value[e]=r?r():{});const f=dl(n.state.value[e]);return ut(f,i,Object.keys(o||{}).reduce((h,g)=>(h[g]=Hs(Te(()=>{zn(n);const m=n._s.get(e);return o[g].call(m,m)})),h),{}))}return c=mo(e,d,t,n,s,!0),c}function mo(e,t,n={},s,r,i){let o;const l=ut({actions:{}},n),c={deep:!0};let d,f,h=new Set,g=new Set,m;const R=s.state.value[e];!i&&!R&&(s.state.value[e]={}),jt({});let O;function k(K){let G;d=f=!1,typeof K=="function"?(K(s.state.value[e]),G={type:rn.patchFunction,storeId:e,events:m}):(xs(s.state.value[e],K),G={type:rn.patchObject,payload:K,storeId:e,events:m});const re=O=Symbol();Gn().then(()=>{O===re&&(d=!0)}),f=!0,Tt(h,G,s.state.value[e])}const N=i?function(){const{state:G}=n,re=G?G():{};this.$patch(ge=>{ut(ge,re)})}:go;function I(){o.stop(),h.clear(),g.clear(),s._s.delete(e)}const D=(K,G="")=>{if(Lr in K)return K[ls]=G,K;const re=function(){zn(s);const ge=Array.from(arguments),Re=new Set,be=new Set;function yt(H){Re.add(H)}function ot(H){be.add(H)}Tt(g,{args:ge,name:re[ls],store:B,after:yt,onError:ot});let se;try{se=K.apply(this&&this.$id===e?this:B,ge)}catch(H){throw Tt(be,H),H}return se instanceof Promise?se.then(H=>(Tt(Re,H),H)).catch(H=>(Tt(be,H),Promise.reject(H))):(Tt(Re,se),se)};return re[Lr]=!0,re[ls]=G,re},T={_p:s,$id:e,$onAction:Mr.bind(null,g),$patch:k,$reset:N,$subscribe(K,G={}){const re=Mr(h,K,G.detached,()=>ge()),ge=o.run(()=>nn(()=>s.state.value[e],Re=>{(G.flush==="sync"?f:d)&&K({storeId:e,type:rn.direct,events:m},Re)},ut({},c,G)));return re},$dispose:I},B=mn(T);s._s.set(e,B);const Y=(s._a&&s._a.runWithContext||lu)(()=>s._e.run(()=>(o=ci()).run(()=>t({action:D}))));for(const K in Y){const G=Y[K];if(oe(G)&&!fu(G)||gt(G))i||(R&&uu(G)&&(oe(G)?G.value=R[K]:xs(G,R[K])),s.state.value[e][K]=G);else if(typeof G=="function"){const re=D(G,K);Y[K]=re,l.actions[K]=G}}return ut(B,Y),ut($(B),Y),Object.defineProperty(B,"$state",{get:()=>s.state.value[e],set:K=>{k(G=>{ut(G,K)})}}),s._p.forEach(K=>{ut(B,o.run(()=>K({store:B,app:s._a,pinia:s,options:l})))}),R&&i&&n.hydrate&&n.hydrate(B.$state,R),d=!0,f=!0,B}function du(e,t,n){let s;const r=typeof t=="function";s=r?n:t;function i(o,l){const c=zl();return o=o||(c?$e(po,null):null),o&&zn(o),o=ho,o._s.has(e)||(r?mo(e,t,s,o):au(e,s,o)),o._s.get(e)}return i.$id=e,i}const hu=du("user_session",()=>{const e=jt([{id:"1",name:"Merel",role:"admin",preferences:{theme:"light"}},{id:"2",name:"Dj",role:"backend",preferences:{theme:"dark"}},{id:"3",name:"Donna",role:"viewer",preferences:{theme:"light"}},{id:"4",name:"Viktorija",role:"viewer",preferences:{theme:"light"}},{id:"4",name:"Janosh",role:"viewer",preferences:{theme:"light"}}]),t=jt(e.value[0]);function n(i){const o=e.value.find(l=>l.id===String(i));return o&&(t.value={...o}),t.value}function s(i){t.value=i?{...i}:null}function r(i={}){t.value&&(t.value.preferences={...t.value.preferences||{},...i})}return{mockUsers:e,currentUser:t,switchUser:n,setUser:s,updatePreferences:r}}),_o=(e,t)=>{const n=e.__vccOpts||e;for(const[s,r]of t)n[s]=r;return n},pu={name:"Navigation",data(){return{collapsed:!1,isDark:document.documentElement.getAttribute("data-theme")==="dark",links:[{name:"dashboard",label:"Dashboard",icon:"🏠"},{name:"orderCreation",label:"Create Order",icon:"📝"},{name:"inventory",label:"Inventory",icon:"📦"},{name:"Reports and analyse",label:"Reports",icon:"📊"},{name:"digital carts",label:"Carts",icon:"🛒"},{name:"chat",label:"Chat",icon:"💬"},{name:"checklist",label:"Checklist",icon:"✅"}],selectedId:"",store:null}},created(){this.store=hu(),this.selectedId=this.store&&this.store.currentUser?this.store.currentUser.id:this.store&&this.store.mockUsers[0]&&this.store.mockUsers[0].id||"";const e=this.store?.currentUser?.preferences?.theme;e&&this.applyTheme(e)},methods:{onSwitchUser(){if(!this.selectedId||!this.store)return;this.store.switchUser(this.selectedId);const e=this.store?.currentUser?.preferences?.theme;e&&this.applyTheme(e)},applyTheme(e){const t=e==="dark"?"dark":"light";document.documentElement.setAttribute("data-theme",t),localStorage.setItem("theme",t),this.isDark=t==="dark",this.store?.currentUser&&this.store.updatePreferences({theme:t})},toggleTheme(){const e=this.isDark?"light":"dark";this.applyTheme(e)}}},gu=["aria-expanded"],mu={key:0},_u={key:1},yu={class:"links"},vu={class:"icon"},bu={key:0,class:"label"},Eu={class:"theme-toggle"},Su=["aria-pressed"],xu={key:0},Ru={key:1},Au=["title"],wu={key:0,class:"user-controls"},Cu=["value"];function Ou(e,t,n,s,r,i){const o=Ui("router-link");return Ce(),Me("aside",{class:Hn(["app-nav",{collapsed:r.collapsed}]),"aria-label":"Main navigation"},[Le("button",{class:"toggle",onClick:t[0]||(t[0]=l=>r.collapsed=!r.collapsed),"aria-expanded":!r.collapsed},[r.collapsed?(Ce(),Me("span",mu,"☰")):(Ce(),Me("span",_u,"✖"))],8,gu),Le("nav",yu,[(Ce(!0),Me(Ve,null,or(r.links,l=>(Ce(),ro(o,{key:l.name,to:{name:l.name},class:"nav-link","active-class":"active"},{default:Di(()=>[Le("span",vu,Jt(l.icon),1),r.collapsed?gr("",!0):(Ce(),Me("span",bu,Jt(l.label),1))]),_:2},1032,["to"]))),128))]),Le("div",Eu,[Le("button",{class:"toggle",onClick:t[1]||(t[1]=(...l)=>i.toggleTheme&&i.toggleTheme(...l)),"aria-pressed":r.isDark,title:"Toggle dark mode"},[r.isDark?(Ce(),Me("span",xu,"🌙 Dark")):(Ce(),Me("span",Ru,"☀️ Light"))],8,Su)]),Le("div",{class:"user-area",title:r.store&&r.store.currentUser?r.store.currentUser.name:"Not signed in"},[r.collapsed?gr("",!0):(Ce(),Me("div",wu,[t[4]||(t[4]=Le("label",{class:"sr-only"},"Switch user",-1)),Sl(Le("select",{"onUpdate:modelValue":t[2]||(t[2]=l=>r.selectedId=l),onChange:t[3]||(t[3]=(...l)=>i.onSwitchUser&&i.onSwitchUser(...l))},[(Ce(!0),Me(Ve,null,or(r.store?r.store.mockUsers:[],l=>(Ce(),Me("option",{key:l.id,value:l.id},Jt(l.name)+" — "+Jt(l.role),9,Cu))),128))],544),[[Xc,r.selectedId]])]))],8,Au)],2)}const Pu=_o(pu,[["render",Ou],["__scopeId","data-v-735aee46"]]),Iu={id:"app",class:"app-shell"},Tu={class:"content"},Nu={name:"App"},Du=Object.assign(Nu,{setup(e){return(t,n)=>{const s=Ui("router-view");return Ce(),Me("div",Iu,[Le("main",Tu,[ve(s)]),ve(Pu)])}}}),Mu=_o(Du,[["__scopeId","data-v-72ca7610"]]),Lu="modulepreload",Vu=function(e){return"/front/"+e},Vr={},St=function(t,n,s){let r=Promise.resolve();if(n&&n.length>0){let c=function(d){return Promise.all(d.map(f=>Promise.resolve(f).then(h=>({status:"fulfilled",value:h}),h=>({status:"rejected",reason:h}))))};document.getElementsByTagName("link");const o=document.querySelector("meta[property=csp-nonce]"),l=o?.nonce||o?.getAttribute("nonce");r=c(n.map(d=>{if(d=Vu(d),d in Vr)return;Vr[d]=!0;const f=d.endsWith(".css"),h=f?'[rel="stylesheet"]':"";if(document.querySelector(`link[href="${d}"]${h}`))return;const g=document.createElement("link");if(g.rel=f?"stylesheet":Lu,f||(g.as="script"),g.crossOrigin="",g.href=d,l&&g.setAttribute("nonce",l),document.head.appendChild(g),f)return new Promise((m,R)=>{g.addEventListener("load",m),g.addEventListener("error",()=>R(new Error(`Unable to preload CSS for ${d}`)))})}))}function i(o){const l=new Event("vite:preloadError",{cancelable:!0});if(l.payload=o,window.dispatchEvent(l),!l.defaultPrevented)throw o}return r.then(o=>{for(const l of o||[])l.status==="rejected"&&i(l.reason);return t().catch(i)})};const Dt=typeof document<"u";function yo(e){return typeof e=="object"||"displayName"in e||"props"in e||"__vccOpts"in e}function Fu(e){return e.__esModule||e[Symbol.toStringTag]==="Module"||e.default&&yo(e.default)}const z=Object.assign;function cs(e,t){const n={};for(const s in t){const r=t[s];n[s]=je(r)?r.map(e):e(r)}return n}const on=()=>{},je=Array.isArray;function Fr(e,t){const n={};for(const s in e)n[s]=s in t?t[s]:e[s];return n}const vo=/#/g,ju=/&/g,Uu=/\//g,ku=/=/g,Hu=/\?/g,bo=/\+/g,Bu=/%5B/g,Ku=/%5D/g,Eo=/%5E/g,Gu=/%60/g,So=/%7B/g,Wu=/%7C/g,xo=/%7D/g,qu=/%20/g;function $s(e){return e==null?"":encodeURI(""+e).replace(Wu,"|").replace(Bu,"[").replace(Ku,"]")}function $u(e){return $s(e).replace(So,"{").replace(xo,"}").replace(Eo,"^")}function Rs(e){return $s(e).replace(bo,"%2B").replace(qu,"+").replace(vo,"%23").replace(ju,"%26").replace(Gu,"`").replace(So,"{").replace(xo,"}").replace(Eo,"^")}function Ju(e){return Rs(e).replace(ku,"%3D")}function zu(e){return $s(e).replace(vo,"%23").replace(Hu,"%3F")}function Qu(e){return zu(e).replace(Uu,"%2F")}function hn(e){if(e==null)return null;try{return decodeURIComponent(""+e)}catch{}return""+e}const Yu=/\/$/,Xu=e=>e.replace(Yu,"");function us(e,t,n="/"){let s,r={},i="",o="";const l=t.indexOf("#");let c=t.indexOf("?");return c=l>=0&&c>l?-1:c,c>=0&&(s=t.slice(0,c),i=t.slice(c,l>0?l:t.length),r=e(i.slice(1))),l>=0&&(s=s||t.slice(0,l),o=t.slice(l,t.length)),s=nf(s??t,n),{fullPath:s+i+o,path:s,query:r,hash:hn(o)}}function Zu(e,t){const n=t.query?e(t.query):"";return t.path+(n&&"?")+n+(t.hash||"")}function jr(e,t){return!t||!e.toLowerCase().startsWith(t.toLowerCase())?e:e.slice(t.length)||"/"}function ef(e,t,n){const s=t.matched.length-1,r=n.matched.length-1;return s>-1&&s===r&&Ht(t.matched[s],n.matched[r])&&Ro(t.params,n.params)&&e(t.query)===e(n.query)&&t.hash===n.hash}function Ht(e,t){return(e.aliasOf||e)===(t.aliasOf||t)}function Ro(e,t){if(Object.keys(e).length!==Object.keys(t).length)return!1;for(const n in e)if(!tf(e[n],t[n]))return!1;return!0}function tf(e,t){return je(e)?Ur(e,t):je(t)?Ur(t,e):e===t}function Ur(e,t){return je(t)?e.length===t.length&&e.every((n,s)=>n===t[s]):e.length===1&&e[0]===t}function nf(e,t){if(e.startsWith("/"))return e;if(!e)return t;const n=t.split("/"),s=e.split("/"),r=s[s.length-1];(r===".."||r===".")&&s.push("");let i=n.length-1,o,l;for(o=0;o<s.length;o++)if(l=s[o],l!==".")if(l==="..")i>1&&i--;else break;return n.slice(0,i).join("/")+"/"+s.slice(o).join("/")}const ct={path:"/",name:void 0,params:{},query:{},hash:"",fullPath:"/",matched:[],meta:{},redirectedFrom:void 0};let As=(function(e){return e.pop="pop",e.push="push",e})({}),fs=(function(e){return e.back="back",e.forward="forward",e.unknown="",e})({});function sf(e){if(!e)if(Dt){const t=document.querySelector("base");e=t&&t.getAttribute("href")||"/",e=e.replace(/^\w+:\/\/[^\/]+/,"")}else e="/";return e[0]!=="/"&&e[0]!=="#"&&(e="/"+e),Xu(e)}const rf=/^[^#]+#/;function of(e,t){return e.replace(rf,"#")+t}function lf(e,t){const n=document.documentElement.getBoundingClientRect(),s=e.getBoundingClientRect();return{behavior:t.behavior,left:s.left-n.left-(t.left||0),top:s.top-n.top-(t.top||0)}}const Qn=()=>({left:window.scrollX,top:window.scrollY});function cf(e){let t;if("el"in e){const n=e.el,s=typeof n=="string"&&n.startsWith("#"),r=typeof n=="string"?s?document.getElementById(n.slice(1)):document.querySelector(n):n;if(!r)return;t=lf(r,e)}else t=e;"scrollBehavior"in document.documentElement.style?window.scrollTo(t):window.scrollTo(t.left!=null?t.left:window.scrollX,t.top!=null?t.top:window.scrollY)}function kr(e,t){return(history.state?history.state.position-t:-1)+e}const ws=new Map;function uf(e,t){ws.set(e,t)}function ff(e){const t=ws.get(e);return ws.delete(e),t}function af(e){return typeof e=="string"||e&&typeof e=="object"}function Ao(e){return typeof e=="string"||typeof e=="symbol"}let ie=(function(e){return e[e.MATCHER_NOT_FOUND=1]="MATCHER_NOT_FOUND",e[e.NAVIGATION_GUARD_REDIRECT=2]="NAVIGATION_GUARD_REDIRECT",e[e.NAVIGATION_ABORTED=4]="NAVIGATION_ABORTED",e[e.NAVIGATION_CANCELLED=8]="NAVIGATION_CANCELLED",e[e.NAVIGATION_DUPLICATED=16]="NAVIGATION_DUPLICATED",e})({});const wo=Symbol("");ie.MATCHER_NOT_FOUND+"",ie.NAVIGATION_GUARD_REDIRECT+"",ie.NAVIGATION_ABORTED+"",ie.NAVIGATION_CANCELLED+"",ie.NAVIGATION_DUPLICATED+"";function Bt(e,t){return z(new Error,{type:e,[wo]:!0},t)}function Xe(e,t){return e instanceof Error&&wo in e&&(t==null||!!(e.type&t))}const df=["params","query","hash"];function hf(e){if(typeof e=="string")return e;if(e.path!=null)return e.path;const t={};for(const n of df)n in e&&(t[n]=e[n]);return JSON.stringify(t,null,2)}function pf(e){const t={};if(e===""||e==="?")return t;const n=(e[0]==="?"?e.slice(1):e).split("&");for(let s=0;s<n.length;++s){const r=n[s].replace(bo," "),i=r.indexOf("="),o=hn(i<0?r:r.slice(0,i)),l=i<0?null:hn(r.slice(i+1));if(o in t){let c=t[o];je(c)||(c=t[o]=[c]),c.push(l)}else t[o]=l}return t}function Hr(e){let t="";for(let n in e){const s=e[n];if(n=Ju(n),s==null){s!==void 0&&(t+=(t.length?"&":"")+n);continue}(je(s)?s.map(r=>r&&Rs(r)):[s&&Rs(s)]).forEach(r=>{r!==void 0&&(t+=(t.length?"&":"")+n,r!=null&&(t+="="+r))})}return t}function gf(e){const t={};for(const n in e){const s=e[n];s!==void 0&&(t[n]=je(s)?s.map(r=>r==null?null:""+r):s==null?s:""+s)}return t}const mf=Symbol(""),Br=Symbol(""),Js=Symbol(""),Co=Symbol(""),Cs=Symbol("");function $t(){let e=[];function t(s){return e.push(s),()=>{const r=e.indexOf(s);r>-1&&e.splice(r,1)}}function n(){e=[]}return{add:t,list:()=>e.slice(),reset:n}}function dt(e,t,n,s,r,i=o=>o()){const o=s&&(s.enterCallbacks[r]=s.enterCallbacks[r]||[]);return()=>new Promise((l,c)=>{const d=g=>{g===!1?c(Bt(ie.NAVIGATION_ABORTED,{from:n,to:t})):g instanceof Error?c(g):af(g)?c(Bt(ie.NAVIGATION_GUARD_REDIRECT,{from:t,to:g})):(o&&s.enterCallbacks[r]===o&&typeof g=="function"&&o.push(g),l())},f=i(()=>e.call(s&&s.instances[r],t,n,d));let h=Promise.resolve(f);e.length<3&&(h=h.then(d)),h.catch(g=>c(g))})}function as(e,t,n,s,r=i=>i()){const i=[];for(const o of e)for(const l in o.components){let c=o.components[l];if(!(t!=="beforeRouteEnter"&&!o.instances[l]))if(yo(c)){const d=(c.__vccOpts||c)[t];d&&i.push(dt(d,n,s,o,l,r))}else{let d=c();i.push(()=>d.then(f=>{if(!f)throw new Error(`Couldn't resolve component "${l}" at "${o.path}"`);const h=Fu(f)?f.default:f;o.mods[l]=f,o.components[l]=h;const g=(h.__vccOpts||h)[t];return g&&dt(g,n,s,o,l,r)()}))}}return i}function _f(e,t){const n=[],s=[],r=[],i=Math.max(t.matched.length,e.matched.length);for(let o=0;o<i;o++){const l=t.matched[o];l&&(e.matched.find(d=>Ht(d,l))?s.push(l):n.push(l));const c=e.matched[o];c&&(t.matched.find(d=>Ht(d,c))||r.push(c))}return[n,s,r]}let yf=()=>location.protocol+"//"+location.host;function Oo(e,t){const{pathname:n,search:s,hash:r}=t,i=e.indexOf("#");if(i>-1){let o=r.includes(e.slice(i))?e.slice(i).length:1,l=r.slice(o);return l[0]!=="/"&&(l="/"+l),jr(l,"")}return jr(n,e)+s+r}function vf(e,t,n,s){let r=[],i=[],o=null;const l=({state:g})=>{const m=Oo(e,location),R=n.value,O=t.value;let k=0;if(g){if(n.value=m,t.value=g,o&&o===R){o=null;return}k=O?g.position-O.position:0}else s(m);r.forEach(N=>{N(n.value,R,{delta:k,type:As.pop,direction:k?k>0?fs.forward:fs.back:fs.unknown})})};function c(){o=n.value}function d(g){r.push(g);const m=()=>{const R=r.indexOf(g);R>-1&&r.splice(R,1)};return i.push(m),m}function f(){if(document.visibilityState==="hidden"){const{history:g}=window;if(!g.state)return;g.replaceState(z({},g.state,{scroll:Qn()}),"")}}function h(){for(const g of i)g();i=[],window.removeEventListener("popstate",l),window.removeEventListener("pagehide",f),document.removeEventListener("visibilitychange",f)}return window.addEventListener("popstate",l),window.addEventListener("pagehide",f),document.addEventListener("visibilitychange",f),{pauseListeners:c,listen:d,destroy:h}}function Kr(e,t,n,s=!1,r=!1){return{back:e,current:t,forward:n,replaced:s,position:window.history.length,scroll:r?Qn():null}}function bf(e){const{history:t,location:n}=window,s={value:Oo(e,n)},r={value:t.state};r.value||i(s.value,{back:null,current:s.value,forward:null,position:t.length-1,replaced:!0,scroll:null},!0);function i(c,d,f){const h=e.indexOf("#"),g=h>-1?(n.host&&document.querySelector("base")?e:e.slice(h))+c:yf()+e+c;try{t[f?"replaceState":"pushState"](d,"",g),r.value=d}catch(m){console.error(m),n[f?"replace":"assign"](g)}}function o(c,d){i(c,z({},t.state,Kr(r.value.back,c,r.value.forward,!0),d,{position:r.value.position}),!0),s.value=c}function l(c,d){const f=z({},r.value,t.state,{forward:c,scroll:Qn()});i(f.current,f,!0),i(c,z({},Kr(s.value,c,null),{position:f.position+1},d),!1),s.value=c}return{location:s,state:r,push:l,replace:o}}function Ef(e){e=sf(e);const t=bf(e),n=vf(e,t.state,t.location,t.replace);function s(i,o=!0){o||n.pauseListeners(),history.go(i)}const r=z({location:"",base:e,go:s,createHref:of.bind(null,e)},t,n);return Object.defineProperty(r,"location",{enumerable:!0,get:()=>t.location.value}),Object.defineProperty(r,"state",{enumerable:!0,get:()=>t.state.value}),r}let Rt=(function(e){return e[e.Static=0]="Static",e[e.Param=1]="Param",e[e.Group=2]="Group",e})({});var ce=(function(e){return e[e.Static=0]="Static",e[e.Param=1]="Param",e[e.ParamRegExp=2]="ParamRegExp",e[e.ParamRegExpEnd=3]="ParamRegExpEnd",e[e.EscapeNext=4]="EscapeNext",e})(ce||{});const Sf={type:Rt.Static,value:""},xf=/[a-zA-Z0-9_]/;function Rf(e){if(!e)return[[]];if(e==="/")return[[Sf]];if(!e.startsWith("/"))throw new Error(`Invalid path "${e}"`);function t(m){throw new Error(`ERR (${n})/"${d}": ${m}`)}let n=ce.Static,s=n;const r=[];let i;function o(){i&&r.push(i),i=[]}let l=0,c,d="",f="";function h(){d&&(n===ce.Static?i.push({type:Rt.Static,value:d}):n===ce.Param||n===ce.ParamRegExp||n===ce.ParamRegExpEnd?(i.length>1&&(c==="*"||c==="+")&&t(`A repeatable param (${d}) must be alone in its segment. eg: '/:ids+.`),i.push({type:Rt.Param,value:d,regexp:f,repeatable:c==="*"||c==="+",optional:c==="*"||c==="?"})):t("Invalid state to consume buffer"),d="")}function g(){d+=c}for(;l<e.length;){if(c=e[l++],c==="\\"&&n!==ce.ParamRegExp){s=n,n=ce.EscapeNext;continue}switch(n){case ce.Static:c==="/"?(d&&h(),o()):c===":"?(h(),n=ce.Param):g();break;case ce.EscapeNext:g(),n=s;break;case ce.Param:c==="("?n=ce.ParamRegExp:xf.test(c)?g():(h(),n=ce.Static,c!=="*"&&c!=="?"&&c!=="+"&&l--);break;case ce.ParamRegExp:c===")"?f[f.length-1]=="\\"?f=f.slice(0,-1)+c:n=ce.ParamRegExpEnd:f+=c;break;case ce.ParamRegExpEnd:h(),n=ce.Static,c!=="*"&&c!=="?"&&c!=="+"&&l--,f="";break;default:t("Unknown state");break}}return n===ce.ParamRegExp&&t(`Unfinished custom RegExp for param "${d}"`),h(),o(),r}const Gr="[^/]+?",Af={sensitive:!1,strict:!1,start:!0,end:!0};var _e=(function(e){return e[e._multiplier=10]="_multiplier",e[e.Root=90]="Root",e[e.Segment=40]="Segment",e[e.SubSegment=30]="SubSegment",e[e.Static=40]="Static",e[e.Dynamic=20]="Dynamic",e[e.BonusCustomRegExp=10]="BonusCustomRegExp",e[e.BonusWildcard=-50]="BonusWildcard",e[e.BonusRepeatable=-20]="BonusRepeatable",e[e.BonusOptional=-8]="BonusOptional",e[e.BonusStrict=.7000000000000001]="BonusStrict",e[e.BonusCaseSensitive=.25]="BonusCaseSensitive",e})(_e||{});const wf=/[.+*?^${}()[\]/\\]/g;function Cf(e,t){const n=z({},Af,t),s=[];let r=n.start?"^":"";const i=[];for(const d of e){const f=d.length?[]:[_e.Root];n.strict&&!d.length&&(r+="/");for(let h=0;h<d.length;h++){const g=d[h];let m=_e.Segment+(n.sensitive?_e.BonusCaseSensitive:0);if(g.type===Rt.Static)h||(r+="/"),r+=g.value.replace(wf,"\\$&"),m+=_e.Static;else if(g.type===Rt.Param){const{value:R,repeatable:O,optional:k,regexp:N}=g;i.push({name:R,repeatable:O,optional:k});const I=N||Gr;if(I!==Gr){m+=_e.BonusCustomRegExp;try{`${I}`}catch(T){throw new Error(`Invalid custom RegExp for param "${R}" (${I}): `+T.message)}}let D=O?`((?:${I})(?:/(?:${I}))*)`:`(${I})`;h||(D=k&&d.length<2?`(?:/${D})`:"/"+D),k&&(D+="?"),r+=D,m+=_e.Dynamic,k&&(m+=_e.BonusOptional),O&&(m+=_e.BonusRepeatable),I===".*"&&(m+=_e.BonusWildcard)}f.push(m)}s.push(f)}if(n.strict&&n.end){const d=s.length-1;s[d][s[d].length-1]+=_e.BonusStrict}n.strict||(r+="/?"),n.end?r+="$":n.strict&&!r.endsWith("/")&&(r+="(?:/|$)");const o=new RegExp(r,n.sensitive?"":"i");function l(d){const f=d.match(o),h={};if(!f)return null;for(let g=1;g<f.length;g++){const m=f[g]||"",R=i[g-1];h[R.name]=m&&R.repeatable?m.split("/"):m}return h}function c(d){let f="",h=!1;for(const g of e){(!h||!f.endsWith("/"))&&(f+="/"),h=!1;for(const m of g)if(m.type===Rt.Static)f+=m.value;else if(m.type===Rt.Param){const{value:R,repeatable:O,optional:k}=m,N=R in d?d[R]:"";if(je(N)&&!O)throw new Error(`Provided param "${R}" is an array but it is not repeatable (* or + modifiers)`);const I=je(N)?N.join("/"):N;if(!I)if(k)g.length<2&&(f.endsWith("/")?f=f.slice(0,-1):h=!0);else throw new Error(`Missing required param "${R}"`);f+=I}}return f||"/"}return{re:o,score:s,keys:i,parse:l,stringify:c}}function Of(e,t){let n=0;for(;n<e.length&&n<t.length;){const s=t[n]-e[n];if(s)return s;n++}return e.length<t.length?e.length===1&&e[0]===_e.Static+_e.Segment?-1:1:e.length>t.length?t.length===1&&t[0]===_e.Static+_e.Segment?1:-1:0}function Po(e,t){let n=0;const s=e.score,r=t.score;for(;n<s.length&&n<r.length;){const i=Of(s[n],r[n]);if(i)return i;n++}if(Math.abs(r.length-s.length)===1){if(Wr(s))return 1;if(Wr(r))return-1}return r.length-s.length}function Wr(e){const t=e[e.length-1];return e.length>0&&t[t.length-1]<0}const Pf={strict:!1,end:!0,sensitive:!1};function If(e,t,n){const s=Cf(Rf(e.path),n),r=z(s,{record:e,parent:t,children:[],alias:[]});return t&&!r.record.aliasOf==!t.record.aliasOf&&t.children.push(r),r}function Tf(e,t){const n=[],s=new Map;t=Fr(Pf,t);function r(h){return s.get(h)}function i(h,g,m){const R=!m,O=$r(h);O.aliasOf=m&&m.record;const k=Fr(t,h),N=[O];if("alias"in h){const T=typeof h.alias=="string"?[h.alias]:h.alias;for(const B of T)N.push($r(z({},O,{components:m?m.record.components:O.components,path:B,aliasOf:m?m.record:O})))}let I,D;for(const T of N){const{path:B}=T;if(g&&B[0]!=="/"){const ue=g.record.path,Y=ue[ue.length-1]==="/"?"":"/";T.path=g.record.path+(B&&Y+B)}if(I=If(T,g,k),m?m.alias.push(I):(D=D||I,D!==I&&D.alias.push(I),R&&h.name&&!Jr(I)&&o(h.name)),Io(I)&&c(I),O.children){const ue=O.children;for(let Y=0;Y<ue.length;Y++)i(ue[Y],I,m&&m.children[Y])}m=m||I}return D?()=>{o(D)}:on}function o(h){if(Ao(h)){const g=s.get(h);g&&(s.delete(h),n.splice(n.indexOf(g),1),g.children.forEach(o),g.alias.forEach(o))}else{const g=n.indexOf(h);g>-1&&(n.splice(g,1),h.record.name&&s.delete(h.record.name),h.children.forEach(o),h.alias.forEach(o))}}function l(){return n}function c(h){const g=Mf(h,n);n.splice(g,0,h),h.record.name&&!Jr(h)&&s.set(h.record.name,h)}function d(h,g){let m,R={},O,k;if("name"in h&&h.name){if(m=s.get(h.name),!m)throw Bt(ie.MATCHER_NOT_FOUND,{location:h});k=m.record.name,R=z(qr(g.params,m.keys.filter(D=>!D.optional).concat(m.parent?m.parent.keys.filter(D=>D.optional):[]).map(D=>D.name)),h.params&&qr(h.params,m.keys.map(D=>D.name))),O=m.stringify(R)}else if(h.path!=null)O=h.path,m=n.find(D=>D.re.test(O)),m&&(R=m.parse(O),k=m.record.name);else{if(m=g.name?s.get(g.name):n.find(D=>D.re.test(g.path)),!m)throw Bt(ie.MATCHER_NOT_FOUND,{location:h,currentLocation:g});k=m.record.name,R=z({},g.params,h.params),O=m.stringify(R)}const N=[];let I=m;for(;I;)N.unshift(I.record),I=I.parent;return{name:k,path:O,params:R,matched:N,meta:Df(N)}}e.forEach(h=>i(h));function f(){n.length=0,s.clear()}return{addRoute:i,resolve:d,removeRoute:o,clearRoutes:f,getRoutes:l,getRecordMatcher:r}}function qr(e,t){const n={};for(const s of t)s in e&&(n[s]=e[s]);return n}function $r(e){const t={path:e.path,redirect:e.redirect,name:e.name,meta:e.meta||{},aliasOf:e.aliasOf,beforeEnter:e.beforeEnter,props:Nf(e),children:e.children||[],instances:{},leaveGuards:new Set,updateGuards:new Set,enterCallbacks:{},components:"components"in e?e.components||null:e.component&&{default:e.component}};return Object.defineProperty(t,"mods",{value:{}}),t}function Nf(e){const t={},n=e.props||!1;if("component"in e)t.default=n;else for(const s in e.components)t[s]=typeof n=="object"?n[s]:n;return t}function Jr(e){for(;e;){if(e.record.aliasOf)return!0;e=e.parent}return!1}function Df(e){return e.reduce((t,n)=>z(t,n.meta),{})}function Mf(e,t){let n=0,s=t.length;for(;n!==s;){const i=n+s>>1;Po(e,t[i])<0?s=i:n=i+1}const r=Lf(e);return r&&(s=t.lastIndexOf(r,s-1)),s}function Lf(e){let t=e;for(;t=t.parent;)if(Io(t)&&Po(e,t)===0)return t}function Io({record:e}){return!!(e.name||e.components&&Object.keys(e.components).length||e.redirect)}function zr(e){const t=$e(Js),n=$e(Co),s=Te(()=>{const c=Vt(e.to);return t.resolve(c)}),r=Te(()=>{const{matched:c}=s.value,{length:d}=c,f=c[d-1],h=n.matched;if(!f||!h.length)return-1;const g=h.findIndex(Ht.bind(null,f));if(g>-1)return g;const m=Qr(c[d-2]);return d>1&&Qr(f)===m&&h[h.length-1].path!==m?h.findIndex(Ht.bind(null,c[d-2])):g}),i=Te(()=>r.value>-1&&kf(n.params,s.value.params)),o=Te(()=>r.value>-1&&r.value===n.matched.length-1&&Ro(n.params,s.value.params));function l(c={}){if(Uf(c)){const d=t[Vt(e.replace)?"replace":"push"](Vt(e.to)).catch(on);return e.viewTransition&&typeof document<"u"&&"startViewTransition"in document&&document.startViewTransition(()=>d),d}return Promise.resolve()}return{route:s,href:Te(()=>s.value.href),isActive:i,isExactActive:o,navigate:l}}function Vf(e){return e.length===1?e[0]:e}const Ff=Mi({name:"RouterLink",compatConfig:{MODE:3},props:{to:{type:[String,Object],required:!0},replace:Boolean,activeClass:String,exactActiveClass:String,custom:Boolean,ariaCurrentValue:{type:String,default:"page"},viewTransition:Boolean},useLink:zr,setup(e,{slots:t}){const n=mn(zr(e)),{options:s}=$e(Js),r=Te(()=>({[Yr(e.activeClass,s.linkActiveClass,"router-link-active")]:n.isActive,[Yr(e.exactActiveClass,s.linkExactActiveClass,"router-link-exact-active")]:n.isExactActive}));return()=>{const i=t.default&&Vf(t.default(n));return e.custom?i:uo("a",{"aria-current":n.isExactActive?e.ariaCurrentValue:null,href:n.href,onClick:n.navigate,class:r.value},i)}}}),jf=Ff;function Uf(e){if(!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)&&!e.defaultPrevented&&!(e.button!==void 0&&e.button!==0)){if(e.currentTarget&&e.currentTarget.getAttribute){const t=e.currentTarget.getAttribute("target");if(/\b_blank\b/i.test(t))return}return e.preventDefault&&e.preventDefault(),!0}}function kf(e,t){for(const n in t){const s=t[n],r=e[n];if(typeof s=="string"){if(s!==r)return!1}else if(!je(r)||r.length!==s.length||s.some((i,o)=>i!==r[o]))return!1}return!0}function Qr(e){return e?e.aliasOf?e.aliasOf.path:e.path:""}const Yr=(e,t,n)=>e??t??n,Hf=Mi({name:"RouterView",inheritAttrs:!1,props:{name:{type:String,default:"default"},route:Object},compatConfig:{MODE:3},setup(e,{attrs:t,slots:n}){const s=$e(Cs),r=Te(()=>e.route||s.value),i=$e(Br,0),o=Te(()=>{let d=Vt(i);const{matched:f}=r.value;let h;for(;(h=f[d])&&!h.components;)d++;return d}),l=Te(()=>r.value.matched[o.value]);xn(Br,Te(()=>o.value+1)),xn(mf,l),xn(Cs,r);const c=jt();return nn(()=>[c.value,l.value,e.name],([d,f,h],[g,m,R])=>{f&&(f.instances[h]=d,m&&m!==f&&d&&d===g&&(f.leaveGuards.size||(f.leaveGuards=m.leaveGuards),f.updateGuards.size||(f.updateGuards=m.updateGuards))),d&&f&&(!m||!Ht(f,m)||!g)&&(f.enterCallbacks[h]||[]).forEach(O=>O(d))},{flush:"post"}),()=>{const d=r.value,f=e.name,h=l.value,g=h&&h.components[f];if(!g)return Xr(n.default,{Component:g,route:d});const m=h.props[f],R=m?m===!0?d.params:typeof m=="function"?m(d):m:null,k=uo(g,z({},R,t,{onVnodeUnmounted:N=>{N.component.isUnmounted&&(h.instances[f]=null)},ref:c}));return Xr(n.default,{Component:k,route:d})||k}}});function Xr(e,t){if(!e)return null;const n=e(t);return n.length===1?n[0]:n}const Bf=Hf;function Kf(e){const t=Tf(e.routes,e),n=e.parseQuery||pf,s=e.stringifyQuery||Hr,r=e.history,i=$t(),o=$t(),l=$t(),c=ul(ct);let d=ct;Dt&&e.scrollBehavior&&"scrollRestoration"in history&&(history.scrollRestoration="manual");const f=cs.bind(null,v=>""+v),h=cs.bind(null,Qu),g=cs.bind(null,hn);function m(v,P){let w,M;return Ao(v)?(w=t.getRecordMatcher(v),M=P):M=v,t.addRoute(M,w)}function R(v){const P=t.getRecordMatcher(v);P&&t.removeRoute(P)}function O(){return t.getRoutes().map(v=>v.record)}function k(v){return!!t.getRecordMatcher(v)}function N(v,P){if(P=z({},P||c.value),typeof v=="string"){const p=us(n,v,P.path),y=t.resolve({path:p.path},P),b=r.createHref(p.fullPath);return z(p,y,{params:g(y.params),hash:hn(p.hash),redirectedFrom:void 0,href:b})}let w;if(v.path!=null)w=z({},v,{path:us(n,v.path,P.path).path});else{const p=z({},v.params);for(const y in p)p[y]==null&&delete p[y];w=z({},v,{params:h(p)}),P.params=h(P.params)}const M=t.resolve(w,P),W=v.hash||"";M.params=f(g(M.params));const u=Zu(s,z({},v,{hash:$u(W),path:M.path})),a=r.createHref(u);return z({fullPath:u,hash:W,query:s===Hr?gf(v.query):v.query||{}},M,{redirectedFrom:void 0,href:a})}function I(v){return typeof v=="string"?us(n,v,c.value.path):z({},v)}function D(v,P){if(d!==v)return Bt(ie.NAVIGATION_CANCELLED,{from:P,to:v})}function T(v){return Y(v)}function B(v){return T(z(I(v),{replace:!0}))}function ue(v,P){const w=v.matched[v.matched.length-1];if(w&&w.redirect){const{redirect:M}=w;let W=typeof M=="function"?M(v,P):M;return typeof W=="string"&&(W=W.includes("?")||W.includes("#")?W=I(W):{path:W},W.params={}),z({query:v.query,hash:v.hash,params:W.path!=null?{}:v.params},W)}}function Y(v,P){const w=d=N(v),M=c.value,W=v.state,u=v.force,a=v.replace===!0,p=ue(w,M);if(p)return Y(z(I(p),{state:typeof p=="object"?z({},W,p.state):W,force:u,replace:a}),P||w);const y=w;y.redirectedFrom=P;let b;return!u&&ef(s,M,w)&&(b=Bt(ie.NAVIGATION_DUPLICATED,{to:y,from:M}),Ue(M,M,!0,!1)),(b?Promise.resolve(b):re(y,M)).catch(_=>Xe(_)?Xe(_,ie.NAVIGATION_GUARD_REDIRECT)?_:lt(_):J(_,y,M)).then(_=>{if(_){if(Xe(_,ie.NAVIGATION_GUARD_REDIRECT))return Y(z({replace:a},I(_.to),{state:typeof _.to=="object"?z({},W,_.to.state):W,force:u}),P||y)}else _=Re(y,M,!0,a,W);return ge(y,M,_),_})}function K(v,P){const w=D(v,P);return w?Promise.reject(w):Promise.resolve()}function G(v){const P=Pt.values().next().value;return P&&typeof P.runWithContext=="function"?P.runWithContext(v):v()}function re(v,P){let w;const[M,W,u]=_f(v,P);w=as(M.reverse(),"beforeRouteLeave",v,P);for(const p of M)p.leaveGuards.forEach(y=>{w.push(dt(y,v,P))});const a=K.bind(null,v,P);return w.push(a),Ie(w).then(()=>{w=[];for(const p of i.list())w.push(dt(p,v,P));return w.push(a),Ie(w)}).then(()=>{w=as(W,"beforeRouteUpdate",v,P);for(const p of W)p.updateGuards.forEach(y=>{w.push(dt(y,v,P))});return w.push(a),Ie(w)}).then(()=>{w=[];for(const p of u)if(p.beforeEnter)if(je(p.beforeEnter))for(const y of p.beforeEnter)w.push(dt(y,v,P));else w.push(dt(p.beforeEnter,v,P));return w.push(a),Ie(w)}).then(()=>(v.matched.forEach(p=>p.enterCallbacks={}),w=as(u,"beforeRouteEnter",v,P,G),w.push(a),Ie(w))).then(()=>{w=[];for(const p of o.list())w.push(dt(p,v,P));return w.push(a),Ie(w)}).catch(p=>Xe(p,ie.NAVIGATION_CANCELLED)?p:Promise.reject(p))}function ge(v,P,w){l.list().forEach(M=>G(()=>M(v,P,w)))}function Re(v,P,w,M,W){const u=D(v,P);if(u)return u;const a=P===ct,p=Dt?history.state:{};w&&(M||a?r.replace(v.fullPath,z({scroll:a&&p&&p.scroll},W)):r.push(v.fullPath,W)),c.value=v,Ue(v,P,w,a),lt()}let be;function yt(){be||(be=r.listen((v,P,w)=>{if(!vt.listening)return;const M=N(v),W=ue(M,vt.currentRoute.value);if(W){Y(z(W,{replace:!0,force:!0}),M).catch(on);return}d=M;const u=c.value;Dt&&uf(kr(u.fullPath,w.delta),Qn()),re(M,u).catch(a=>Xe(a,ie.NAVIGATION_ABORTED|ie.NAVIGATION_CANCELLED)?a:Xe(a,ie.NAVIGATION_GUARD_REDIRECT)?(Y(z(I(a.to),{force:!0}),M).then(p=>{Xe(p,ie.NAVIGATION_ABORTED|ie.NAVIGATION_DUPLICATED)&&!w.delta&&w.type===As.pop&&r.go(-1,!1)}).catch(on),Promise.reject()):(w.delta&&r.go(-w.delta,!1),J(a,M,u))).then(a=>{a=a||Re(M,u,!1),a&&(w.delta&&!Xe(a,ie.NAVIGATION_CANCELLED)?r.go(-w.delta,!1):w.type===As.pop&&Xe(a,ie.NAVIGATION_ABORTED|ie.NAVIGATION_DUPLICATED)&&r.go(-1,!1)),ge(M,u,a)}).catch(on)}))}let ot=$t(),se=$t(),H;function J(v,P,w){lt(v);const M=se.list();return M.length?M.forEach(W=>W(v,P,w)):console.error(v),Promise.reject(v)}function Qe(){return H&&c.value!==ct?Promise.resolve():new Promise((v,P)=>{ot.add([v,P])})}function lt(v){return H||(H=!v,yt(),ot.list().forEach(([P,w])=>v?w(v):P()),ot.reset()),v}function Ue(v,P,w,M){const{scrollBehavior:W}=e;if(!Dt||!W)return Promise.resolve();const u=!w&&ff(kr(v.fullPath,0))||(M||!w)&&history.state&&history.state.scroll||null;return Gn().then(()=>W(v,P,u)).then(a=>a&&cf(a)).catch(a=>J(a,v,P))}const Ee=v=>r.go(v);let Ot;const Pt=new Set,vt={currentRoute:c,listening:!0,addRoute:m,removeRoute:R,clearRoutes:t.clearRoutes,hasRoute:k,getRoutes:O,resolve:N,options:e,push:T,replace:B,go:Ee,back:()=>Ee(-1),forward:()=>Ee(1),beforeEach:i.add,beforeResolve:o.add,afterEach:l.add,onError:se.add,isReady:Qe,install(v){v.component("RouterLink",jf),v.component("RouterView",Bf),v.config.globalProperties.$router=vt,Object.defineProperty(v.config.globalProperties,"$route",{enumerable:!0,get:()=>Vt(c)}),Dt&&!Ot&&c.value===ct&&(Ot=!0,T(r.location).catch(M=>{}));const P={};for(const M in ct)Object.defineProperty(P,M,{get:()=>c.value[M],enumerable:!0});v.provide(Js,vt),v.provide(Co,Ri(P)),v.provide(Cs,c);const w=v.unmount;Pt.add(v),v.unmount=function(){Pt.delete(v),Pt.size<1&&(d=ct,be&&be(),be=null,c.value=ct,Ot=!1,H=!1),w()}}};function Ie(v){return v.reduce((P,w)=>P.then(()=>G(w)),Promise.resolve())}return vt}const Gf=Kf({history:Ef("/front/"),routes:[{name:"dashboard",props:!1,component:()=>St(()=>import("./DashboardView-DGB-Tnma.js"),__vite__mapDeps([0,1,2,3]))},{name:"orderCreation",props:!1,component:()=>St(()=>import("./OrderCreation-BFuxMzy3.js"),__vite__mapDeps([4,5,1,2,6]))},{name:"inventory",props:!1,component:()=>St(()=>import("./InventoryView-DNBNrsgu.js"),__vite__mapDeps([7,5,1,8]))},{name:"Reports and analyse",propse:!1,component:()=>St(()=>import("./RapportView-CmTJorgL.js"),__vite__mapDeps([9,10]))},{name:"digital carts",props:!1,component:()=>St(()=>import("./DigitalCarts-9inRqxYa.js"),__vite__mapDeps([11,5,1,12]))},{name:"chat",props:!1,component:()=>St(()=>import("./ChatView-DLrpkhZn.js"),__vite__mapDeps([13,14]))},{name:"checklist",props:!1,component:()=>St(()=>import("./ChecklistView-CeLgIAnn.js"),__vite__mapDeps([15,16]))}]}),To=e=>{const t=e==="dark"?"dark":"light";return document.documentElement.setAttribute("data-theme",t),localStorage.setItem("theme",t),t};To(localStorage.getItem("theme")||"light");window.toggleTheme=e=>{const t=document.documentElement.getAttribute("data-theme")==="dark"?"dark":"light";To(e||(t==="dark"?"light":"dark"))};const zs=su(Mu);zs.use(ou());zs.use(Gf);zs.mount("#app");export{Ve as F,_o as _,ji as a,Me as b,Te as c,Le as d,gr as e,or as f,Ce as g,bc as h,hu as i,Sl as j,Xc as k,$f as l,du as m,Hn as n,Il as o,Wf as p,ve as q,jt as r,Gn as s,Jt as t,Vt as u,qf as v,Jf as w};
+const __vite__mapDeps=(i,m=__vite__mapDeps,d=(m.f||(m.f=["assets/DashboardView-DGB-Tnma.js","assets/medications-CUUmES17.js","assets/orders-CiJExhQP.js","assets/DashboardView-CMWnOXuU.css","assets/OrderCreation-BFuxMzy3.js","assets/carts-24VO2FHY.js","assets/OrderCreation-6PATXdQM.css","assets/InventoryView-DNBNrsgu.js","assets/InventoryView-ndYvFtEs.css","assets/RapportView-CmTJorgL.js","assets/RapportView-CklyJV1R.css","assets/DigitalCarts-9inRqxYa.js","assets/DigitalCarts-B9Avb8AG.css","assets/ChatView-dJGv8r71.js","assets/ChatView-Du_JmXfT.css","assets/ChecklistView-CeLgIAnn.js","assets/ChecklistView-6GM64Mai.css"])))=>i.map(i=>d[i]);
+(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const r of document.querySelectorAll('link[rel="modulepreload"]'))s(r);new MutationObserver(r=>{for(const i of r)if(i.type==="childList")for(const o of i.addedNodes)o.tagName==="LINK"&&o.rel==="modulepreload"&&s(o)}).observe(document,{childList:!0,subtree:!0});function n(r){const i={};return r.integrity&&(i.integrity=r.integrity),r.referrerPolicy&&(i.referrerPolicy=r.referrerPolicy),r.crossOrigin==="use-credentials"?i.credentials="include":r.crossOrigin==="anonymous"?i.credentials="omit":i.credentials="same-origin",i}function s(r){if(r.ep)return;r.ep=!0;const i=n(r);fetch(r.href,i)}})();function Os(e){const t=Object.create(null);for(const n of e.split(","))t[n]=1;return n=>n in t}const ee={},Mt=[],qe=()=>{},Zr=()=>!1,Vn=e=>e.charCodeAt(0)===111&&e.charCodeAt(1)===110&&(e.charCodeAt(2)>122||e.charCodeAt(2)<97),Ps=e=>e.startsWith("onUpdate:"),pe=Object.assign,Is=(e,t)=>{const n=e.indexOf(t);n>-1&&e.splice(n,1)},No=Object.prototype.hasOwnProperty,Q=(e,t)=>No.call(e,t),V=Array.isArray,Lt=e=>pn(e)==="[object Map]",Kt=e=>pn(e)==="[object Set]",Zs=e=>pn(e)==="[object Date]",U=e=>typeof e=="function",le=e=>typeof e=="string",Je=e=>typeof e=="symbol",Z=e=>e!==null&&typeof e=="object",ei=e=>(Z(e)||U(e))&&U(e.then)&&U(e.catch),ti=Object.prototype.toString,pn=e=>ti.call(e),Do=e=>pn(e).slice(8,-1),ni=e=>pn(e)==="[object Object]",Ts=e=>le(e)&&e!=="NaN"&&e[0]!=="-"&&""+parseInt(e,10)===e,Qt=Os(",key,ref,ref_for,ref_key,onVnodeBeforeMount,onVnodeMounted,onVnodeBeforeUpdate,onVnodeUpdated,onVnodeBeforeUnmount,onVnodeUnmounted"),Fn=e=>{const t=Object.create(null);return(n=>t[n]||(t[n]=e(n)))},Mo=/-\w/g,De=Fn(e=>e.replace(Mo,t=>t.slice(1).toUpperCase())),Lo=/\B([A-Z])/g,Ct=Fn(e=>e.replace(Lo,"-$1").toLowerCase()),jn=Fn(e=>e.charAt(0).toUpperCase()+e.slice(1)),Yn=Fn(e=>e?`on${jn(e)}`:""),pt=(e,t)=>!Object.is(e,t),Sn=(e,...t)=>{for(let n=0;n<e.length;n++)e[n](...t)},si=(e,t,n,s=!1)=>{Object.defineProperty(e,t,{configurable:!0,enumerable:!1,writable:s,value:n})},Un=e=>{const t=parseFloat(e);return isNaN(t)?e:t};let er;const kn=()=>er||(er=typeof globalThis<"u"?globalThis:typeof self<"u"?self:typeof window<"u"?window:typeof global<"u"?global:{});function Ns(e){if(V(e)){const t={};for(let n=0;n<e.length;n++){const s=e[n],r=le(s)?Uo(s):Ns(s);if(r)for(const i in r)t[i]=r[i]}return t}else if(le(e)||Z(e))return e}const Vo=/;(?![^(]*\))/g,Fo=/:([^]+)/,jo=/\/\*[^]*?\*\//g;function Uo(e){const t={};return e.replace(jo,"").split(Vo).forEach(n=>{if(n){const s=n.split(Fo);s.length>1&&(t[s[0].trim()]=s[1].trim())}}),t}function Hn(e){let t="";if(le(e))t=e;else if(V(e))for(let n=0;n<e.length;n++){const s=Hn(e[n]);s&&(t+=s+" ")}else if(Z(e))for(const n in e)e[n]&&(t+=n+" ");return t.trim()}const ko="itemscope,allowfullscreen,formnovalidate,ismap,nomodule,novalidate,readonly",Ho=Os(ko);function ri(e){return!!e||e===""}function Bo(e,t){if(e.length!==t.length)return!1;let n=!0;for(let s=0;n&&s<e.length;s++)n=gn(e[s],t[s]);return n}function gn(e,t){if(e===t)return!0;let n=Zs(e),s=Zs(t);if(n||s)return n&&s?e.getTime()===t.getTime():!1;if(n=Je(e),s=Je(t),n||s)return e===t;if(n=V(e),s=V(t),n||s)return n&&s?Bo(e,t):!1;if(n=Z(e),s=Z(t),n||s){if(!n||!s)return!1;const r=Object.keys(e).length,i=Object.keys(t).length;if(r!==i)return!1;for(const o in e){const l=e.hasOwnProperty(o),c=t.hasOwnProperty(o);if(l&&!c||!l&&c||!gn(e[o],t[o]))return!1}}return String(e)===String(t)}function Ds(e,t){return e.findIndex(n=>gn(n,t))}const ii=e=>!!(e&&e.__v_isRef===!0),Jt=e=>le(e)?e:e==null?"":V(e)||Z(e)&&(e.toString===ti||!U(e.toString))?ii(e)?Jt(e.value):JSON.stringify(e,oi,2):String(e),oi=(e,t)=>ii(t)?oi(e,t.value):Lt(t)?{[`Map(${t.size})`]:[...t.entries()].reduce((n,[s,r],i)=>(n[Xn(s,i)+" =>"]=r,n),{})}:Kt(t)?{[`Set(${t.size})`]:[...t.values()].map(n=>Xn(n))}:Je(t)?Xn(t):Z(t)&&!V(t)&&!ni(t)?String(t):t,Xn=(e,t="")=>{var n;return Je(e)?`Symbol(${(n=e.description)!=null?n:t})`:e};let ae;class li{constructor(t=!1){this.detached=t,this._active=!0,this._on=0,this.effects=[],this.cleanups=[],this._isPaused=!1,this.parent=ae,!t&&ae&&(this.index=(ae.scopes||(ae.scopes=[])).push(this)-1)}get active(){return this._active}pause(){if(this._active){this._isPaused=!0;let t,n;if(this.scopes)for(t=0,n=this.scopes.length;t<n;t++)this.scopes[t].pause();for(t=0,n=this.effects.length;t<n;t++)this.effects[t].pause()}}resume(){if(this._active&&this._isPaused){this._isPaused=!1;let t,n;if(this.scopes)for(t=0,n=this.scopes.length;t<n;t++)this.scopes[t].resume();for(t=0,n=this.effects.length;t<n;t++)this.effects[t].resume()}}run(t){if(this._active){const n=ae;try{return ae=this,t()}finally{ae=n}}}on(){++this._on===1&&(this.prevScope=ae,ae=this)}off(){this._on>0&&--this._on===0&&(ae=this.prevScope,this.prevScope=void 0)}stop(t){if(this._active){this._active=!1;let n,s;for(n=0,s=this.effects.length;n<s;n++)this.effects[n].stop();for(this.effects.length=0,n=0,s=this.cleanups.length;n<s;n++)this.cleanups[n]();if(this.cleanups.length=0,this.scopes){for(n=0,s=this.scopes.length;n<s;n++)this.scopes[n].stop(!0);this.scopes.length=0}if(!this.detached&&this.parent&&!t){const r=this.parent.scopes.pop();r&&r!==this&&(this.parent.scopes[this.index]=r,r.index=this.index)}this.parent=void 0}}}function ci(e){return new li(e)}function ui(){return ae}function Ko(e,t=!1){ae&&ae.cleanups.push(e)}let ne;const Zn=new WeakSet;class fi{constructor(t){this.fn=t,this.deps=void 0,this.depsTail=void 0,this.flags=5,this.next=void 0,this.cleanup=void 0,this.scheduler=void 0,ae&&ae.active&&ae.effects.push(this)}pause(){this.flags|=64}resume(){this.flags&64&&(this.flags&=-65,Zn.has(this)&&(Zn.delete(this),this.trigger()))}notify(){this.flags&2&&!(this.flags&32)||this.flags&8||di(this)}run(){if(!(this.flags&1))return this.fn();this.flags|=2,tr(this),hi(this);const t=ne,n=Fe;ne=this,Fe=!0;try{return this.fn()}finally{pi(this),ne=t,Fe=n,this.flags&=-3}}stop(){if(this.flags&1){for(let t=this.deps;t;t=t.nextDep)Vs(t);this.deps=this.depsTail=void 0,tr(this),this.onStop&&this.onStop(),this.flags&=-2}}trigger(){this.flags&64?Zn.add(this):this.scheduler?this.scheduler():this.runIfDirty()}runIfDirty(){ds(this)&&this.run()}get dirty(){return ds(this)}}let ai=0,Yt,Xt;function di(e,t=!1){if(e.flags|=8,t){e.next=Xt,Xt=e;return}e.next=Yt,Yt=e}function Ms(){ai++}function Ls(){if(--ai>0)return;if(Xt){let t=Xt;for(Xt=void 0;t;){const n=t.next;t.next=void 0,t.flags&=-9,t=n}}let e;for(;Yt;){let t=Yt;for(Yt=void 0;t;){const n=t.next;if(t.next=void 0,t.flags&=-9,t.flags&1)try{t.trigger()}catch(s){e||(e=s)}t=n}}if(e)throw e}function hi(e){for(let t=e.deps;t;t=t.nextDep)t.version=-1,t.prevActiveLink=t.dep.activeLink,t.dep.activeLink=t}function pi(e){let t,n=e.depsTail,s=n;for(;s;){const r=s.prevDep;s.version===-1?(s===n&&(n=r),Vs(s),Go(s)):t=s,s.dep.activeLink=s.prevActiveLink,s.prevActiveLink=void 0,s=r}e.deps=t,e.depsTail=n}function ds(e){for(let t=e.deps;t;t=t.nextDep)if(t.dep.version!==t.version||t.dep.computed&&(gi(t.dep.computed)||t.dep.version!==t.version))return!0;return!!e._dirty}function gi(e){if(e.flags&4&&!(e.flags&16)||(e.flags&=-17,e.globalVersion===ln)||(e.globalVersion=ln,!e.isSSR&&e.flags&128&&(!e.deps&&!e._dirty||!ds(e))))return;e.flags|=2;const t=e.dep,n=ne,s=Fe;ne=e,Fe=!0;try{hi(e);const r=e.fn(e._value);(t.version===0||pt(r,e._value))&&(e.flags|=128,e._value=r,t.version++)}catch(r){throw t.version++,r}finally{ne=n,Fe=s,pi(e),e.flags&=-3}}function Vs(e,t=!1){const{dep:n,prevSub:s,nextSub:r}=e;if(s&&(s.nextSub=r,e.prevSub=void 0),r&&(r.prevSub=s,e.nextSub=void 0),n.subs===e&&(n.subs=s,!s&&n.computed)){n.computed.flags&=-5;for(let i=n.computed.deps;i;i=i.nextDep)Vs(i,!0)}!t&&!--n.sc&&n.map&&n.map.delete(n.key)}function Go(e){const{prevDep:t,nextDep:n}=e;t&&(t.nextDep=n,e.prevDep=void 0),n&&(n.prevDep=t,e.nextDep=void 0)}let Fe=!0;const mi=[];function st(){mi.push(Fe),Fe=!1}function rt(){const e=mi.pop();Fe=e===void 0?!0:e}function tr(e){const{cleanup:t}=e;if(e.cleanup=void 0,t){const n=ne;ne=void 0;try{t()}finally{ne=n}}}let ln=0;class Wo{constructor(t,n){this.sub=t,this.dep=n,this.version=n.version,this.nextDep=this.prevDep=this.nextSub=this.prevSub=this.prevActiveLink=void 0}}class Fs{constructor(t){this.computed=t,this.version=0,this.activeLink=void 0,this.subs=void 0,this.map=void 0,this.key=void 0,this.sc=0,this.__v_skip=!0}track(t){if(!ne||!Fe||ne===this.computed)return;let n=this.activeLink;if(n===void 0||n.sub!==ne)n=this.activeLink=new Wo(ne,this),ne.deps?(n.prevDep=ne.depsTail,ne.depsTail.nextDep=n,ne.depsTail=n):ne.deps=ne.depsTail=n,_i(n);else if(n.version===-1&&(n.version=this.version,n.nextDep)){const s=n.nextDep;s.prevDep=n.prevDep,n.prevDep&&(n.prevDep.nextDep=s),n.prevDep=ne.depsTail,n.nextDep=void 0,ne.depsTail.nextDep=n,ne.depsTail=n,ne.deps===n&&(ne.deps=s)}return n}trigger(t){this.version++,ln++,this.notify(t)}notify(t){Ms();try{for(let n=this.subs;n;n=n.prevSub)n.sub.notify()&&n.sub.dep.notify()}finally{Ls()}}}function _i(e){if(e.dep.sc++,e.sub.flags&4){const t=e.dep.computed;if(t&&!e.dep.subs){t.flags|=20;for(let s=t.deps;s;s=s.nextDep)_i(s)}const n=e.dep.subs;n!==e&&(e.prevSub=n,n&&(n.nextSub=e)),e.dep.subs=e}}const wn=new WeakMap,At=Symbol(""),hs=Symbol(""),cn=Symbol("");function de(e,t,n){if(Fe&&ne){let s=wn.get(e);s||wn.set(e,s=new Map);let r=s.get(n);r||(s.set(n,r=new Fs),r.map=s,r.key=n),r.track()}}function et(e,t,n,s,r,i){const o=wn.get(e);if(!o){ln++;return}const l=c=>{c&&c.trigger()};if(Ms(),t==="clear")o.forEach(l);else{const c=V(e),d=c&&Ts(n);if(c&&n==="length"){const f=Number(s);o.forEach((h,g)=>{(g==="length"||g===cn||!Je(g)&&g>=f)&&l(h)})}else switch((n!==void 0||o.has(void 0))&&l(o.get(n)),d&&l(o.get(cn)),t){case"add":c?d&&l(o.get("length")):(l(o.get(At)),Lt(e)&&l(o.get(hs)));break;case"delete":c||(l(o.get(At)),Lt(e)&&l(o.get(hs)));break;case"set":Lt(e)&&l(o.get(At));break}}Ls()}function qo(e,t){const n=wn.get(e);return n&&n.get(t)}function It(e){const t=$(e);return t===e?t:(de(t,"iterate",cn),Ne(e)?t:t.map(fe))}function Bn(e){return de(e=$(e),"iterate",cn),e}const $o={__proto__:null,[Symbol.iterator](){return es(this,Symbol.iterator,fe)},concat(...e){return It(this).concat(...e.map(t=>V(t)?It(t):t))},entries(){return es(this,"entries",e=>(e[1]=fe(e[1]),e))},every(e,t){return Ye(this,"every",e,t,void 0,arguments)},filter(e,t){return Ye(this,"filter",e,t,n=>n.map(fe),arguments)},find(e,t){return Ye(this,"find",e,t,fe,arguments)},findIndex(e,t){return Ye(this,"findIndex",e,t,void 0,arguments)},findLast(e,t){return Ye(this,"findLast",e,t,fe,arguments)},findLastIndex(e,t){return Ye(this,"findLastIndex",e,t,void 0,arguments)},forEach(e,t){return Ye(this,"forEach",e,t,void 0,arguments)},includes(...e){return ts(this,"includes",e)},indexOf(...e){return ts(this,"indexOf",e)},join(e){return It(this).join(e)},lastIndexOf(...e){return ts(this,"lastIndexOf",e)},map(e,t){return Ye(this,"map",e,t,void 0,arguments)},pop(){return Wt(this,"pop")},push(...e){return Wt(this,"push",e)},reduce(e,...t){return nr(this,"reduce",e,t)},reduceRight(e,...t){return nr(this,"reduceRight",e,t)},shift(){return Wt(this,"shift")},some(e,t){return Ye(this,"some",e,t,void 0,arguments)},splice(...e){return Wt(this,"splice",e)},toReversed(){return It(this).toReversed()},toSorted(e){return It(this).toSorted(e)},toSpliced(...e){return It(this).toSpliced(...e)},unshift(...e){return Wt(this,"unshift",e)},values(){return es(this,"values",fe)}};function es(e,t,n){const s=Bn(e),r=s[t]();return s!==e&&!Ne(e)&&(r._next=r.next,r.next=()=>{const i=r._next();return i.done||(i.value=n(i.value)),i}),r}const Jo=Array.prototype;function Ye(e,t,n,s,r,i){const o=Bn(e),l=o!==e&&!Ne(e),c=o[t];if(c!==Jo[t]){const h=c.apply(e,i);return l?fe(h):h}let d=n;o!==e&&(l?d=function(h,g){return n.call(this,fe(h),g,e)}:n.length>2&&(d=function(h,g){return n.call(this,h,g,e)}));const f=c.call(o,d,s);return l&&r?r(f):f}function nr(e,t,n,s){const r=Bn(e);let i=n;return r!==e&&(Ne(e)?n.length>3&&(i=function(o,l,c){return n.call(this,o,l,c,e)}):i=function(o,l,c){return n.call(this,o,fe(l),c,e)}),r[t](i,...s)}function ts(e,t,n){const s=$(e);de(s,"iterate",cn);const r=s[t](...n);return(r===-1||r===!1)&&ks(n[0])?(n[0]=$(n[0]),s[t](...n)):r}function Wt(e,t,n=[]){st(),Ms();const s=$(e)[t].apply(e,n);return Ls(),rt(),s}const zo=Os("__proto__,__v_isRef,__isVue"),yi=new Set(Object.getOwnPropertyNames(Symbol).filter(e=>e!=="arguments"&&e!=="caller").map(e=>Symbol[e]).filter(Je));function Qo(e){Je(e)||(e=String(e));const t=$(this);return de(t,"has",e),t.hasOwnProperty(e)}class vi{constructor(t=!1,n=!1){this._isReadonly=t,this._isShallow=n}get(t,n,s){if(n==="__v_skip")return t.__v_skip;const r=this._isReadonly,i=this._isShallow;if(n==="__v_isReactive")return!r;if(n==="__v_isReadonly")return r;if(n==="__v_isShallow")return i;if(n==="__v_raw")return s===(r?i?ol:xi:i?Si:Ei).get(t)||Object.getPrototypeOf(t)===Object.getPrototypeOf(s)?t:void 0;const o=V(t);if(!r){let c;if(o&&(c=$o[n]))return c;if(n==="hasOwnProperty")return Qo}const l=Reflect.get(t,n,oe(t)?t:s);if((Je(n)?yi.has(n):zo(n))||(r||de(t,"get",n),i))return l;if(oe(l)){const c=o&&Ts(n)?l:l.value;return r&&Z(c)?gs(c):c}return Z(l)?r?gs(l):mn(l):l}}class bi extends vi{constructor(t=!1){super(!1,t)}set(t,n,s,r){let i=t[n];if(!this._isShallow){const c=mt(i);if(!Ne(s)&&!mt(s)&&(i=$(i),s=$(s)),!V(t)&&oe(i)&&!oe(s))return c||(i.value=s),!0}const o=V(t)&&Ts(n)?Number(n)<t.length:Q(t,n),l=Reflect.set(t,n,s,oe(t)?t:r);return t===$(r)&&(o?pt(s,i)&&et(t,"set",n,s):et(t,"add",n,s)),l}deleteProperty(t,n){const s=Q(t,n);t[n];const r=Reflect.deleteProperty(t,n);return r&&s&&et(t,"delete",n,void 0),r}has(t,n){const s=Reflect.has(t,n);return(!Je(n)||!yi.has(n))&&de(t,"has",n),s}ownKeys(t){return de(t,"iterate",V(t)?"length":At),Reflect.ownKeys(t)}}class Yo extends vi{constructor(t=!1){super(!0,t)}set(t,n){return!0}deleteProperty(t,n){return!0}}const Xo=new bi,Zo=new Yo,el=new bi(!0);const ps=e=>e,vn=e=>Reflect.getPrototypeOf(e);function tl(e,t,n){return function(...s){const r=this.__v_raw,i=$(r),o=Lt(i),l=e==="entries"||e===Symbol.iterator&&o,c=e==="keys"&&o,d=r[e](...s),f=n?ps:t?Cn:fe;return!t&&de(i,"iterate",c?hs:At),{next(){const{value:h,done:g}=d.next();return g?{value:h,done:g}:{value:l?[f(h[0]),f(h[1])]:f(h),done:g}},[Symbol.iterator](){return this}}}}function bn(e){return function(...t){return e==="delete"?!1:e==="clear"?void 0:this}}function nl(e,t){const n={get(r){const i=this.__v_raw,o=$(i),l=$(r);e||(pt(r,l)&&de(o,"get",r),de(o,"get",l));const{has:c}=vn(o),d=t?ps:e?Cn:fe;if(c.call(o,r))return d(i.get(r));if(c.call(o,l))return d(i.get(l));i!==o&&i.get(r)},get size(){const r=this.__v_raw;return!e&&de($(r),"iterate",At),r.size},has(r){const i=this.__v_raw,o=$(i),l=$(r);return e||(pt(r,l)&&de(o,"has",r),de(o,"has",l)),r===l?i.has(r):i.has(r)||i.has(l)},forEach(r,i){const o=this,l=o.__v_raw,c=$(l),d=t?ps:e?Cn:fe;return!e&&de(c,"iterate",At),l.forEach((f,h)=>r.call(i,d(f),d(h),o))}};return pe(n,e?{add:bn("add"),set:bn("set"),delete:bn("delete"),clear:bn("clear")}:{add(r){!t&&!Ne(r)&&!mt(r)&&(r=$(r));const i=$(this);return vn(i).has.call(i,r)||(i.add(r),et(i,"add",r,r)),this},set(r,i){!t&&!Ne(i)&&!mt(i)&&(i=$(i));const o=$(this),{has:l,get:c}=vn(o);let d=l.call(o,r);d||(r=$(r),d=l.call(o,r));const f=c.call(o,r);return o.set(r,i),d?pt(i,f)&&et(o,"set",r,i):et(o,"add",r,i),this},delete(r){const i=$(this),{has:o,get:l}=vn(i);let c=o.call(i,r);c||(r=$(r),c=o.call(i,r)),l&&l.call(i,r);const d=i.delete(r);return c&&et(i,"delete",r,void 0),d},clear(){const r=$(this),i=r.size!==0,o=r.clear();return i&&et(r,"clear",void 0,void 0),o}}),["keys","values","entries",Symbol.iterator].forEach(r=>{n[r]=tl(r,e,t)}),n}function js(e,t){const n=nl(e,t);return(s,r,i)=>r==="__v_isReactive"?!e:r==="__v_isReadonly"?e:r==="__v_raw"?s:Reflect.get(Q(n,r)&&r in s?n:s,r,i)}const sl={get:js(!1,!1)},rl={get:js(!1,!0)},il={get:js(!0,!1)};const Ei=new WeakMap,Si=new WeakMap,xi=new WeakMap,ol=new WeakMap;function ll(e){switch(e){case"Object":case"Array":return 1;case"Map":case"Set":case"WeakMap":case"WeakSet":return 2;default:return 0}}function cl(e){return e.__v_skip||!Object.isExtensible(e)?0:ll(Do(e))}function mn(e){return mt(e)?e:Us(e,!1,Xo,sl,Ei)}function Ri(e){return Us(e,!1,el,rl,Si)}function gs(e){return Us(e,!0,Zo,il,xi)}function Us(e,t,n,s,r){if(!Z(e)||e.__v_raw&&!(t&&e.__v_isReactive))return e;const i=cl(e);if(i===0)return e;const o=r.get(e);if(o)return o;const l=new Proxy(e,i===2?s:n);return r.set(e,l),l}function gt(e){return mt(e)?gt(e.__v_raw):!!(e&&e.__v_isReactive)}function mt(e){return!!(e&&e.__v_isReadonly)}function Ne(e){return!!(e&&e.__v_isShallow)}function ks(e){return e?!!e.__v_raw:!1}function $(e){const t=e&&e.__v_raw;return t?$(t):e}function Hs(e){return!Q(e,"__v_skip")&&Object.isExtensible(e)&&si(e,"__v_skip",!0),e}const fe=e=>Z(e)?mn(e):e,Cn=e=>Z(e)?gs(e):e;function oe(e){return e?e.__v_isRef===!0:!1}function jt(e){return Ai(e,!1)}function ul(e){return Ai(e,!0)}function Ai(e,t){return oe(e)?e:new fl(e,t)}class fl{constructor(t,n){this.dep=new Fs,this.__v_isRef=!0,this.__v_isShallow=!1,this._rawValue=n?t:$(t),this._value=n?t:fe(t),this.__v_isShallow=n}get value(){return this.dep.track(),this._value}set value(t){const n=this._rawValue,s=this.__v_isShallow||Ne(t)||mt(t);t=s?t:$(t),pt(t,n)&&(this._rawValue=t,this._value=s?t:fe(t),this.dep.trigger())}}function Vt(e){return oe(e)?e.value:e}const al={get:(e,t,n)=>t==="__v_raw"?e:Vt(Reflect.get(e,t,n)),set:(e,t,n,s)=>{const r=e[t];return oe(r)&&!oe(n)?(r.value=n,!0):Reflect.set(e,t,n,s)}};function wi(e){return gt(e)?e:new Proxy(e,al)}function dl(e){const t=V(e)?new Array(e.length):{};for(const n in e)t[n]=Ci(e,n);return t}class hl{constructor(t,n,s){this._object=t,this._key=n,this._defaultValue=s,this.__v_isRef=!0,this._value=void 0}get value(){const t=this._object[this._key];return this._value=t===void 0?this._defaultValue:t}set value(t){this._object[this._key]=t}get dep(){return qo($(this._object),this._key)}}class pl{constructor(t){this._getter=t,this.__v_isRef=!0,this.__v_isReadonly=!0,this._value=void 0}get value(){return this._value=this._getter()}}function Wf(e,t,n){return oe(e)?e:U(e)?new pl(e):Z(e)&&arguments.length>1?Ci(e,t,n):jt(e)}function Ci(e,t,n){const s=e[t];return oe(s)?s:new hl(e,t,n)}class gl{constructor(t,n,s){this.fn=t,this.setter=n,this._value=void 0,this.dep=new Fs(this),this.__v_isRef=!0,this.deps=void 0,this.depsTail=void 0,this.flags=16,this.globalVersion=ln-1,this.next=void 0,this.effect=this,this.__v_isReadonly=!n,this.isSSR=s}notify(){if(this.flags|=16,!(this.flags&8)&&ne!==this)return di(this,!0),!0}get value(){const t=this.dep.track();return gi(this),t&&(t.version=this.dep.version),this._value}set value(t){this.setter&&this.setter(t)}}function ml(e,t,n=!1){let s,r;return U(e)?s=e:(s=e.get,r=e.set),new gl(s,r,n)}const En={},On=new WeakMap;let xt;function _l(e,t=!1,n=xt){if(n){let s=On.get(n);s||On.set(n,s=[]),s.push(e)}}function yl(e,t,n=ee){const{immediate:s,deep:r,once:i,scheduler:o,augmentJob:l,call:c}=n,d=T=>r?T:Ne(T)||r===!1||r===0?tt(T,1):tt(T);let f,h,g,m,R=!1,O=!1;if(oe(e)?(h=()=>e.value,R=Ne(e)):gt(e)?(h=()=>d(e),R=!0):V(e)?(O=!0,R=e.some(T=>gt(T)||Ne(T)),h=()=>e.map(T=>{if(oe(T))return T.value;if(gt(T))return d(T);if(U(T))return c?c(T,2):T()})):U(e)?t?h=c?()=>c(e,2):e:h=()=>{if(g){st();try{g()}finally{rt()}}const T=xt;xt=f;try{return c?c(e,3,[m]):e(m)}finally{xt=T}}:h=qe,t&&r){const T=h,B=r===!0?1/0:r;h=()=>tt(T(),B)}const k=ui(),N=()=>{f.stop(),k&&k.active&&Is(k.effects,f)};if(i&&t){const T=t;t=(...B)=>{T(...B),N()}}let I=O?new Array(e.length).fill(En):En;const D=T=>{if(!(!(f.flags&1)||!f.dirty&&!T))if(t){const B=f.run();if(r||R||(O?B.some((ue,Y)=>pt(ue,I[Y])):pt(B,I))){g&&g();const ue=xt;xt=f;try{const Y=[B,I===En?void 0:O&&I[0]===En?[]:I,m];I=B,c?c(t,3,Y):t(...Y)}finally{xt=ue}}}else f.run()};return l&&l(D),f=new fi(h),f.scheduler=o?()=>o(D,!1):D,m=T=>_l(T,!1,f),g=f.onStop=()=>{const T=On.get(f);if(T){if(c)c(T,4);else for(const B of T)B();On.delete(f)}},t?s?D(!0):I=f.run():o?o(D.bind(null,!0),!0):f.run(),N.pause=f.pause.bind(f),N.resume=f.resume.bind(f),N.stop=N,N}function tt(e,t=1/0,n){if(t<=0||!Z(e)||e.__v_skip||(n=n||new Map,(n.get(e)||0)>=t))return e;if(n.set(e,t),t--,oe(e))tt(e.value,t,n);else if(V(e))for(let s=0;s<e.length;s++)tt(e[s],t,n);else if(Kt(e)||Lt(e))e.forEach(s=>{tt(s,t,n)});else if(ni(e)){for(const s in e)tt(e[s],t,n);for(const s of Object.getOwnPropertySymbols(e))Object.prototype.propertyIsEnumerable.call(e,s)&&tt(e[s],t,n)}return e}function _n(e,t,n,s){try{return s?e(...s):e()}catch(r){Kn(r,t,n)}}function ze(e,t,n,s){if(U(e)){const r=_n(e,t,n,s);return r&&ei(r)&&r.catch(i=>{Kn(i,t,n)}),r}if(V(e)){const r=[];for(let i=0;i<e.length;i++)r.push(ze(e[i],t,n,s));return r}}function Kn(e,t,n,s=!0){const r=t?t.vnode:null,{errorHandler:i,throwUnhandledErrorInProduction:o}=t&&t.appContext.config||ee;if(t){let l=t.parent;const c=t.proxy,d=`https://vuejs.org/error-reference/#runtime-${n}`;for(;l;){const f=l.ec;if(f){for(let h=0;h<f.length;h++)if(f[h](e,c,d)===!1)return}l=l.parent}if(i){st(),_n(i,null,10,[e,c,d]),rt();return}}vl(e,n,r,s,o)}function vl(e,t,n,s=!0,r=!1){if(r)throw e;console.error(e)}const ye=[];let Ge=-1;const Ft=[];let ft=null,Nt=0;const Oi=Promise.resolve();let Pn=null;function Gn(e){const t=Pn||Oi;return e?t.then(this?e.bind(this):e):t}function bl(e){let t=Ge+1,n=ye.length;for(;t<n;){const s=t+n>>>1,r=ye[s],i=un(r);i<e||i===e&&r.flags&2?t=s+1:n=s}return t}function Bs(e){if(!(e.flags&1)){const t=un(e),n=ye[ye.length-1];!n||!(e.flags&2)&&t>=un(n)?ye.push(e):ye.splice(bl(t),0,e),e.flags|=1,Pi()}}function Pi(){Pn||(Pn=Oi.then(Ti))}function El(e){V(e)?Ft.push(...e):ft&&e.id===-1?ft.splice(Nt+1,0,e):e.flags&1||(Ft.push(e),e.flags|=1),Pi()}function sr(e,t,n=Ge+1){for(;n<ye.length;n++){const s=ye[n];if(s&&s.flags&2){if(e&&s.id!==e.uid)continue;ye.splice(n,1),n--,s.flags&4&&(s.flags&=-2),s(),s.flags&4||(s.flags&=-2)}}}function Ii(e){if(Ft.length){const t=[...new Set(Ft)].sort((n,s)=>un(n)-un(s));if(Ft.length=0,ft){ft.push(...t);return}for(ft=t,Nt=0;Nt<ft.length;Nt++){const n=ft[Nt];n.flags&4&&(n.flags&=-2),n.flags&8||n(),n.flags&=-2}ft=null,Nt=0}}const un=e=>e.id==null?e.flags&2?-1:1/0:e.id;function Ti(e){try{for(Ge=0;Ge<ye.length;Ge++){const t=ye[Ge];t&&!(t.flags&8)&&(t.flags&4&&(t.flags&=-2),_n(t,t.i,t.i?15:14),t.flags&4||(t.flags&=-2))}}finally{for(;Ge<ye.length;Ge++){const t=ye[Ge];t&&(t.flags&=-2)}Ge=-1,ye.length=0,Ii(),Pn=null,(ye.length||Ft.length)&&Ti()}}let Oe=null,Ni=null;function In(e){const t=Oe;return Oe=e,Ni=e&&e.type.__scopeId||null,t}function Di(e,t=Oe,n){if(!t||e._n)return e;const s=(...r)=>{s._d&&Dn(-1);const i=In(t);let o;try{o=e(...r)}finally{In(i),s._d&&Dn(1)}return o};return s._n=!0,s._c=!0,s._d=!0,s}function Sl(e,t){if(Oe===null)return e;const n=Jn(Oe),s=e.dirs||(e.dirs=[]);for(let r=0;r<t.length;r++){let[i,o,l,c=ee]=t[r];i&&(U(i)&&(i={mounted:i,updated:i}),i.deep&&tt(o),s.push({dir:i,instance:n,value:o,oldValue:void 0,arg:l,modifiers:c}))}return e}function bt(e,t,n,s){const r=e.dirs,i=t&&t.dirs;for(let o=0;o<r.length;o++){const l=r[o];i&&(l.oldValue=i[o].value);let c=l.dir[s];c&&(st(),ze(c,n,8,[e.el,l,e,t]),rt())}}const xl=Symbol("_vte"),Rl=e=>e.__isTeleport,Al=Symbol("_leaveCb");function Ks(e,t){e.shapeFlag&6&&e.component?(e.transition=t,Ks(e.component.subTree,t)):e.shapeFlag&128?(e.ssContent.transition=t.clone(e.ssContent),e.ssFallback.transition=t.clone(e.ssFallback)):e.transition=t}function Mi(e,t){return U(e)?pe({name:e.name},t,{setup:e}):e}function Li(e){e.ids=[e.ids[0]+e.ids[2]+++"-",0,0]}const Tn=new WeakMap;function Zt(e,t,n,s,r=!1){if(V(e)){e.forEach((R,O)=>Zt(R,t&&(V(t)?t[O]:t),n,s,r));return}if(en(s)&&!r){s.shapeFlag&512&&s.type.__asyncResolved&&s.component.subTree.component&&Zt(e,t,n,s.component.subTree);return}const i=s.shapeFlag&4?Jn(s.component):s.el,o=r?null:i,{i:l,r:c}=e,d=t&&t.r,f=l.refs===ee?l.refs={}:l.refs,h=l.setupState,g=$(h),m=h===ee?Zr:R=>Q(g,R);if(d!=null&&d!==c){if(rr(t),le(d))f[d]=null,m(d)&&(h[d]=null);else if(oe(d)){d.value=null;const R=t;R.k&&(f[R.k]=null)}}if(U(c))_n(c,l,12,[o,f]);else{const R=le(c),O=oe(c);if(R||O){const k=()=>{if(e.f){const N=R?m(c)?h[c]:f[c]:c.value;if(r)V(N)&&Is(N,i);else if(V(N))N.includes(i)||N.push(i);else if(R)f[c]=[i],m(c)&&(h[c]=f[c]);else{const I=[i];c.value=I,e.k&&(f[e.k]=I)}}else R?(f[c]=o,m(c)&&(h[c]=o)):O&&(c.value=o,e.k&&(f[e.k]=o))};if(o){const N=()=>{k(),Tn.delete(e)};N.id=-1,Tn.set(e,N),we(N,n)}else rr(e),k()}}}function rr(e){const t=Tn.get(e);t&&(t.flags|=8,Tn.delete(e))}kn().requestIdleCallback;kn().cancelIdleCallback;const en=e=>!!e.type.__asyncLoader,Vi=e=>e.type.__isKeepAlive;function wl(e,t){Fi(e,"a",t)}function Cl(e,t){Fi(e,"da",t)}function Fi(e,t,n=he){const s=e.__wdc||(e.__wdc=()=>{let r=n;for(;r;){if(r.isDeactivated)return;r=r.parent}return e()});if(Wn(t,s,n),n){let r=n.parent;for(;r&&r.parent;)Vi(r.parent.vnode)&&Ol(s,t,n,r),r=r.parent}}function Ol(e,t,n,s){const r=Wn(t,e,s,!0);ji(()=>{Is(s[t],r)},n)}function Wn(e,t,n=he,s=!1){if(n){const r=n[e]||(n[e]=[]),i=t.__weh||(t.__weh=(...o)=>{st();const l=yn(n),c=ze(t,n,e,o);return l(),rt(),c});return s?r.unshift(i):r.push(i),i}}const it=e=>(t,n=he)=>{(!an||e==="sp")&&Wn(e,(...s)=>t(...s),n)},Pl=it("bm"),Il=it("m"),Tl=it("bu"),Nl=it("u"),Dl=it("bum"),ji=it("um"),Ml=it("sp"),Ll=it("rtg"),Vl=it("rtc");function Fl(e,t=he){Wn("ec",e,t)}const jl="components";function Ui(e,t){return kl(jl,e,!0,t)||e}const Ul=Symbol.for("v-ndc");function kl(e,t,n=!0,s=!1){const r=Oe||he;if(r){const i=r.type;{const l=Pc(i,!1);if(l&&(l===t||l===De(t)||l===jn(De(t))))return i}const o=ir(r[e]||i[e],t)||ir(r.appContext[e],t);return!o&&s?i:o}}function ir(e,t){return e&&(e[t]||e[De(t)]||e[jn(De(t))])}function or(e,t,n,s){let r;const i=n,o=V(e);if(o||le(e)){const l=o&&gt(e);let c=!1,d=!1;l&&(c=!Ne(e),d=mt(e),e=Bn(e)),r=new Array(e.length);for(let f=0,h=e.length;f<h;f++)r[f]=t(c?d?Cn(fe(e[f])):fe(e[f]):e[f],f,void 0,i)}else if(typeof e=="number"){r=new Array(e);for(let l=0;l<e;l++)r[l]=t(l+1,l,void 0,i)}else if(Z(e))if(e[Symbol.iterator])r=Array.from(e,(l,c)=>t(l,c,void 0,i));else{const l=Object.keys(e);r=new Array(l.length);for(let c=0,d=l.length;c<d;c++){const f=l[c];r[c]=t(e[f],f,c,i)}}else r=[];return r}const ms=e=>e?lo(e)?Jn(e):ms(e.parent):null,tn=pe(Object.create(null),{$:e=>e,$el:e=>e.vnode.el,$data:e=>e.data,$props:e=>e.props,$attrs:e=>e.attrs,$slots:e=>e.slots,$refs:e=>e.refs,$parent:e=>ms(e.parent),$root:e=>ms(e.root),$host:e=>e.ce,$emit:e=>e.emit,$options:e=>Hi(e),$forceUpdate:e=>e.f||(e.f=()=>{Bs(e.update)}),$nextTick:e=>e.n||(e.n=Gn.bind(e.proxy)),$watch:e=>cc.bind(e)}),ns=(e,t)=>e!==ee&&!e.__isScriptSetup&&Q(e,t),Hl={get({_:e},t){if(t==="__v_skip")return!0;const{ctx:n,setupState:s,data:r,props:i,accessCache:o,type:l,appContext:c}=e;let d;if(t[0]!=="$"){const m=o[t];if(m!==void 0)switch(m){case 1:return s[t];case 2:return r[t];case 4:return n[t];case 3:return i[t]}else{if(ns(s,t))return o[t]=1,s[t];if(r!==ee&&Q(r,t))return o[t]=2,r[t];if((d=e.propsOptions[0])&&Q(d,t))return o[t]=3,i[t];if(n!==ee&&Q(n,t))return o[t]=4,n[t];_s&&(o[t]=0)}}const f=tn[t];let h,g;if(f)return t==="$attrs"&&de(e.attrs,"get",""),f(e);if((h=l.__cssModules)&&(h=h[t]))return h;if(n!==ee&&Q(n,t))return o[t]=4,n[t];if(g=c.config.globalProperties,Q(g,t))return g[t]},set({_:e},t,n){const{data:s,setupState:r,ctx:i}=e;return ns(r,t)?(r[t]=n,!0):s!==ee&&Q(s,t)?(s[t]=n,!0):Q(e.props,t)||t[0]==="$"&&t.slice(1)in e?!1:(i[t]=n,!0)},has({_:{data:e,setupState:t,accessCache:n,ctx:s,appContext:r,propsOptions:i,type:o}},l){let c,d;return!!(n[l]||e!==ee&&l[0]!=="$"&&Q(e,l)||ns(t,l)||(c=i[0])&&Q(c,l)||Q(s,l)||Q(tn,l)||Q(r.config.globalProperties,l)||(d=o.__cssModules)&&d[l])},defineProperty(e,t,n){return n.get!=null?e._.accessCache[t]=0:Q(n,"value")&&this.set(e,t,n.value,null),Reflect.defineProperty(e,t,n)}};function lr(e){return V(e)?e.reduce((t,n)=>(t[n]=null,t),{}):e}let _s=!0;function Bl(e){const t=Hi(e),n=e.proxy,s=e.ctx;_s=!1,t.beforeCreate&&cr(t.beforeCreate,e,"bc");const{data:r,computed:i,methods:o,watch:l,provide:c,inject:d,created:f,beforeMount:h,mounted:g,beforeUpdate:m,updated:R,activated:O,deactivated:k,beforeDestroy:N,beforeUnmount:I,destroyed:D,unmounted:T,render:B,renderTracked:ue,renderTriggered:Y,errorCaptured:K,serverPrefetch:G,expose:re,inheritAttrs:ge,components:Re,directives:be,filters:yt}=t;if(d&&Kl(d,s,null),o)for(const H in o){const J=o[H];U(J)&&(s[H]=J.bind(n))}if(r){const H=r.call(n,n);Z(H)&&(e.data=mn(H))}if(_s=!0,i)for(const H in i){const J=i[H],Qe=U(J)?J.bind(n,n):U(J.get)?J.get.bind(n,n):qe,lt=!U(J)&&U(J.set)?J.set.bind(n):qe,Ue=Te({get:Qe,set:lt});Object.defineProperty(s,H,{enumerable:!0,configurable:!0,get:()=>Ue.value,set:Ee=>Ue.value=Ee})}if(l)for(const H in l)ki(l[H],s,n,H);if(c){const H=U(c)?c.call(n):c;Reflect.ownKeys(H).forEach(J=>{xn(J,H[J])})}f&&cr(f,e,"c");function se(H,J){V(J)?J.forEach(Qe=>H(Qe.bind(n))):J&&H(J.bind(n))}if(se(Pl,h),se(Il,g),se(Tl,m),se(Nl,R),se(wl,O),se(Cl,k),se(Fl,K),se(Vl,ue),se(Ll,Y),se(Dl,I),se(ji,T),se(Ml,G),V(re))if(re.length){const H=e.exposed||(e.exposed={});re.forEach(J=>{Object.defineProperty(H,J,{get:()=>n[J],set:Qe=>n[J]=Qe,enumerable:!0})})}else e.exposed||(e.exposed={});B&&e.render===qe&&(e.render=B),ge!=null&&(e.inheritAttrs=ge),Re&&(e.components=Re),be&&(e.directives=be),G&&Li(e)}function Kl(e,t,n=qe){V(e)&&(e=ys(e));for(const s in e){const r=e[s];let i;Z(r)?"default"in r?i=$e(r.from||s,r.default,!0):i=$e(r.from||s):i=$e(r),oe(i)?Object.defineProperty(t,s,{enumerable:!0,configurable:!0,get:()=>i.value,set:o=>i.value=o}):t[s]=i}}function cr(e,t,n){ze(V(e)?e.map(s=>s.bind(t.proxy)):e.bind(t.proxy),t,n)}function ki(e,t,n,s){let r=s.includes(".")?eo(n,s):()=>n[s];if(le(e)){const i=t[e];U(i)&&nn(r,i)}else if(U(e))nn(r,e.bind(n));else if(Z(e))if(V(e))e.forEach(i=>ki(i,t,n,s));else{const i=U(e.handler)?e.handler.bind(n):t[e.handler];U(i)&&nn(r,i,e)}}function Hi(e){const t=e.type,{mixins:n,extends:s}=t,{mixins:r,optionsCache:i,config:{optionMergeStrategies:o}}=e.appContext,l=i.get(t);let c;return l?c=l:!r.length&&!n&&!s?c=t:(c={},r.length&&r.forEach(d=>Nn(c,d,o,!0)),Nn(c,t,o)),Z(t)&&i.set(t,c),c}function Nn(e,t,n,s=!1){const{mixins:r,extends:i}=t;i&&Nn(e,i,n,!0),r&&r.forEach(o=>Nn(e,o,n,!0));for(const o in t)if(!(s&&o==="expose")){const l=Gl[o]||n&&n[o];e[o]=l?l(e[o],t[o]):t[o]}return e}const Gl={data:ur,props:fr,emits:fr,methods:zt,computed:zt,beforeCreate:me,created:me,beforeMount:me,mounted:me,beforeUpdate:me,updated:me,beforeDestroy:me,beforeUnmount:me,destroyed:me,unmounted:me,activated:me,deactivated:me,errorCaptured:me,serverPrefetch:me,components:zt,directives:zt,watch:ql,provide:ur,inject:Wl};function ur(e,t){return t?e?function(){return pe(U(e)?e.call(this,this):e,U(t)?t.call(this,this):t)}:t:e}function Wl(e,t){return zt(ys(e),ys(t))}function ys(e){if(V(e)){const t={};for(let n=0;n<e.length;n++)t[e[n]]=e[n];return t}return e}function me(e,t){return e?[...new Set([].concat(e,t))]:t}function zt(e,t){return e?pe(Object.create(null),e,t):t}function fr(e,t){return e?V(e)&&V(t)?[...new Set([...e,...t])]:pe(Object.create(null),lr(e),lr(t??{})):t}function ql(e,t){if(!e)return t;if(!t)return e;const n=pe(Object.create(null),e);for(const s in t)n[s]=me(e[s],t[s]);return n}function Bi(){return{app:null,config:{isNativeTag:Zr,performance:!1,globalProperties:{},optionMergeStrategies:{},errorHandler:void 0,warnHandler:void 0,compilerOptions:{}},mixins:[],components:{},directives:{},provides:Object.create(null),optionsCache:new WeakMap,propsCache:new WeakMap,emitsCache:new WeakMap}}let $l=0;function Jl(e,t){return function(s,r=null){U(s)||(s=pe({},s)),r!=null&&!Z(r)&&(r=null);const i=Bi(),o=new WeakSet,l=[];let c=!1;const d=i.app={_uid:$l++,_component:s,_props:r,_container:null,_context:i,_instance:null,version:Tc,get config(){return i.config},set config(f){},use(f,...h){return o.has(f)||(f&&U(f.install)?(o.add(f),f.install(d,...h)):U(f)&&(o.add(f),f(d,...h))),d},mixin(f){return i.mixins.includes(f)||i.mixins.push(f),d},component(f,h){return h?(i.components[f]=h,d):i.components[f]},directive(f,h){return h?(i.directives[f]=h,d):i.directives[f]},mount(f,h,g){if(!c){const m=d._ceVNode||ve(s,r);return m.appContext=i,g===!0?g="svg":g===!1&&(g=void 0),e(m,f,g),c=!0,d._container=f,f.__vue_app__=d,Jn(m.component)}},onUnmount(f){l.push(f)},unmount(){c&&(ze(l,d._instance,16),e(null,d._container),delete d._container.__vue_app__)},provide(f,h){return i.provides[f]=h,d},runWithContext(f){const h=wt;wt=d;try{return f()}finally{wt=h}}};return d}}let wt=null;function xn(e,t){if(he){let n=he.provides;const s=he.parent&&he.parent.provides;s===n&&(n=he.provides=Object.create(s)),n[e]=t}}function $e(e,t,n=!1){const s=oo();if(s||wt){let r=wt?wt._context.provides:s?s.parent==null||s.ce?s.vnode.appContext&&s.vnode.appContext.provides:s.parent.provides:void 0;if(r&&e in r)return r[e];if(arguments.length>1)return n&&U(t)?t.call(s&&s.proxy):t}}function zl(){return!!(oo()||wt)}const Ki={},Gi=()=>Object.create(Ki),Wi=e=>Object.getPrototypeOf(e)===Ki;function Ql(e,t,n,s=!1){const r={},i=Gi();e.propsDefaults=Object.create(null),qi(e,t,r,i);for(const o in e.propsOptions[0])o in r||(r[o]=void 0);n?e.props=s?r:Ri(r):e.type.props?e.props=r:e.props=i,e.attrs=i}function Yl(e,t,n,s){const{props:r,attrs:i,vnode:{patchFlag:o}}=e,l=$(r),[c]=e.propsOptions;let d=!1;if((s||o>0)&&!(o&16)){if(o&8){const f=e.vnode.dynamicProps;for(let h=0;h<f.length;h++){let g=f[h];if(qn(e.emitsOptions,g))continue;const m=t[g];if(c)if(Q(i,g))m!==i[g]&&(i[g]=m,d=!0);else{const R=De(g);r[R]=vs(c,l,R,m,e,!1)}else m!==i[g]&&(i[g]=m,d=!0)}}}else{qi(e,t,r,i)&&(d=!0);let f;for(const h in l)(!t||!Q(t,h)&&((f=Ct(h))===h||!Q(t,f)))&&(c?n&&(n[h]!==void 0||n[f]!==void 0)&&(r[h]=vs(c,l,h,void 0,e,!0)):delete r[h]);if(i!==l)for(const h in i)(!t||!Q(t,h))&&(delete i[h],d=!0)}d&&et(e.attrs,"set","")}function qi(e,t,n,s){const[r,i]=e.propsOptions;let o=!1,l;if(t)for(let c in t){if(Qt(c))continue;const d=t[c];let f;r&&Q(r,f=De(c))?!i||!i.includes(f)?n[f]=d:(l||(l={}))[f]=d:qn(e.emitsOptions,c)||(!(c in s)||d!==s[c])&&(s[c]=d,o=!0)}if(i){const c=$(n),d=l||ee;for(let f=0;f<i.length;f++){const h=i[f];n[h]=vs(r,c,h,d[h],e,!Q(d,h))}}return o}function vs(e,t,n,s,r,i){const o=e[n];if(o!=null){const l=Q(o,"default");if(l&&s===void 0){const c=o.default;if(o.type!==Function&&!o.skipFactory&&U(c)){const{propsDefaults:d}=r;if(n in d)s=d[n];else{const f=yn(r);s=d[n]=c.call(null,t),f()}}else s=c;r.ce&&r.ce._setProp(n,s)}o[0]&&(i&&!l?s=!1:o[1]&&(s===""||s===Ct(n))&&(s=!0))}return s}const Xl=new WeakMap;function $i(e,t,n=!1){const s=n?Xl:t.propsCache,r=s.get(e);if(r)return r;const i=e.props,o={},l=[];let c=!1;if(!U(e)){const f=h=>{c=!0;const[g,m]=$i(h,t,!0);pe(o,g),m&&l.push(...m)};!n&&t.mixins.length&&t.mixins.forEach(f),e.extends&&f(e.extends),e.mixins&&e.mixins.forEach(f)}if(!i&&!c)return Z(e)&&s.set(e,Mt),Mt;if(V(i))for(let f=0;f<i.length;f++){const h=De(i[f]);ar(h)&&(o[h]=ee)}else if(i)for(const f in i){const h=De(f);if(ar(h)){const g=i[f],m=o[h]=V(g)||U(g)?{type:g}:pe({},g),R=m.type;let O=!1,k=!0;if(V(R))for(let N=0;N<R.length;++N){const I=R[N],D=U(I)&&I.name;if(D==="Boolean"){O=!0;break}else D==="String"&&(k=!1)}else O=U(R)&&R.name==="Boolean";m[0]=O,m[1]=k,(O||Q(m,"default"))&&l.push(h)}}const d=[o,l];return Z(e)&&s.set(e,d),d}function ar(e){return e[0]!=="$"&&!Qt(e)}const Gs=e=>e==="_"||e==="_ctx"||e==="$stable",Ws=e=>V(e)?e.map(We):[We(e)],Zl=(e,t,n)=>{if(t._n)return t;const s=Di((...r)=>Ws(t(...r)),n);return s._c=!1,s},Ji=(e,t,n)=>{const s=e._ctx;for(const r in e){if(Gs(r))continue;const i=e[r];if(U(i))t[r]=Zl(r,i,s);else if(i!=null){const o=Ws(i);t[r]=()=>o}}},zi=(e,t)=>{const n=Ws(t);e.slots.default=()=>n},Qi=(e,t,n)=>{for(const s in t)(n||!Gs(s))&&(e[s]=t[s])},ec=(e,t,n)=>{const s=e.slots=Gi();if(e.vnode.shapeFlag&32){const r=t._;r?(Qi(s,t,n),n&&si(s,"_",r,!0)):Ji(t,s)}else t&&zi(e,t)},tc=(e,t,n)=>{const{vnode:s,slots:r}=e;let i=!0,o=ee;if(s.shapeFlag&32){const l=t._;l?n&&l===1?i=!1:Qi(r,t,n):(i=!t.$stable,Ji(t,r)),o=t}else t&&(zi(e,t),o={default:1});if(i)for(const l in r)!Gs(l)&&o[l]==null&&delete r[l]},we=mc;function nc(e){return sc(e)}function sc(e,t){const n=kn();n.__VUE__=!0;const{insert:s,remove:r,patchProp:i,createElement:o,createText:l,createComment:c,setText:d,setElementText:f,parentNode:h,nextSibling:g,setScopeId:m=qe,insertStaticContent:R}=e,O=(u,a,p,y=null,b=null,_=null,A=void 0,x=null,S=!!a.dynamicChildren)=>{if(u===a)return;u&&!qt(u,a)&&(y=v(u),Ee(u,b,_,!0),u=null),a.patchFlag===-2&&(S=!1,a.dynamicChildren=null);const{type:E,ref:F,shapeFlag:C}=a;switch(E){case $n:k(u,a,p,y);break;case _t:N(u,a,p,y);break;case rs:u==null&&I(a,p,y,A);break;case Ve:Re(u,a,p,y,b,_,A,x,S);break;default:C&1?B(u,a,p,y,b,_,A,x,S):C&6?be(u,a,p,y,b,_,A,x,S):(C&64||C&128)&&E.process(u,a,p,y,b,_,A,x,S,M)}F!=null&&b?Zt(F,u&&u.ref,_,a||u,!a):F==null&&u&&u.ref!=null&&Zt(u.ref,null,_,u,!0)},k=(u,a,p,y)=>{if(u==null)s(a.el=l(a.children),p,y);else{const b=a.el=u.el;a.children!==u.children&&d(b,a.children)}},N=(u,a,p,y)=>{u==null?s(a.el=c(a.children||""),p,y):a.el=u.el},I=(u,a,p,y)=>{[u.el,u.anchor]=R(u.children,a,p,y,u.el,u.anchor)},D=({el:u,anchor:a},p,y)=>{let b;for(;u&&u!==a;)b=g(u),s(u,p,y),u=b;s(a,p,y)},T=({el:u,anchor:a})=>{let p;for(;u&&u!==a;)p=g(u),r(u),u=p;r(a)},B=(u,a,p,y,b,_,A,x,S)=>{if(a.type==="svg"?A="svg":a.type==="math"&&(A="mathml"),u==null)ue(a,p,y,b,_,A,x,S);else{const E=u.el&&u.el._isVueCE?u.el:null;try{E&&E._beginPatch(),G(u,a,b,_,A,x,S)}finally{E&&E._endPatch()}}},ue=(u,a,p,y,b,_,A,x)=>{let S,E;const{props:F,shapeFlag:C,transition:L,dirs:j}=u;if(S=u.el=o(u.type,_,F&&F.is,F),C&8?f(S,u.children):C&16&&K(u.children,S,null,y,b,ss(u,_),A,x),j&&bt(u,null,y,"created"),Y(S,u,u.scopeId,A,y),F){for(const te in F)te!=="value"&&!Qt(te)&&i(S,te,null,F[te],_,y);"value"in F&&i(S,"value",null,F.value,_),(E=F.onVnodeBeforeMount)&&Ke(E,y,u)}j&&bt(u,null,y,"beforeMount");const q=rc(b,L);q&&L.beforeEnter(S),s(S,a,p),((E=F&&F.onVnodeMounted)||q||j)&&we(()=>{E&&Ke(E,y,u),q&&L.enter(S),j&&bt(u,null,y,"mounted")},b)},Y=(u,a,p,y,b)=>{if(p&&m(u,p),y)for(let _=0;_<y.length;_++)m(u,y[_]);if(b){let _=b.subTree;if(a===_||no(_.type)&&(_.ssContent===a||_.ssFallback===a)){const A=b.vnode;Y(u,A,A.scopeId,A.slotScopeIds,b.parent)}}},K=(u,a,p,y,b,_,A,x,S=0)=>{for(let E=S;E<u.length;E++){const F=u[E]=x?at(u[E]):We(u[E]);O(null,F,a,p,y,b,_,A,x)}},G=(u,a,p,y,b,_,A)=>{const x=a.el=u.el;let{patchFlag:S,dynamicChildren:E,dirs:F}=a;S|=u.patchFlag&16;const C=u.props||ee,L=a.props||ee;let j;if(p&&Et(p,!1),(j=L.onVnodeBeforeUpdate)&&Ke(j,p,a,u),F&&bt(a,u,p,"beforeUpdate"),p&&Et(p,!0),(C.innerHTML&&L.innerHTML==null||C.textContent&&L.textContent==null)&&f(x,""),E?re(u.dynamicChildren,E,x,p,y,ss(a,b),_):A||J(u,a,x,null,p,y,ss(a,b),_,!1),S>0){if(S&16)ge(x,C,L,p,b);else if(S&2&&C.class!==L.class&&i(x,"class",null,L.class,b),S&4&&i(x,"style",C.style,L.style,b),S&8){const q=a.dynamicProps;for(let te=0;te<q.length;te++){const X=q[te],Se=C[X],xe=L[X];(xe!==Se||X==="value")&&i(x,X,Se,xe,b,p)}}S&1&&u.children!==a.children&&f(x,a.children)}else!A&&E==null&&ge(x,C,L,p,b);((j=L.onVnodeUpdated)||F)&&we(()=>{j&&Ke(j,p,a,u),F&&bt(a,u,p,"updated")},y)},re=(u,a,p,y,b,_,A)=>{for(let x=0;x<a.length;x++){const S=u[x],E=a[x],F=S.el&&(S.type===Ve||!qt(S,E)||S.shapeFlag&198)?h(S.el):p;O(S,E,F,null,y,b,_,A,!0)}},ge=(u,a,p,y,b)=>{if(a!==p){if(a!==ee)for(const _ in a)!Qt(_)&&!(_ in p)&&i(u,_,a[_],null,b,y);for(const _ in p){if(Qt(_))continue;const A=p[_],x=a[_];A!==x&&_!=="value"&&i(u,_,x,A,b,y)}"value"in p&&i(u,"value",a.value,p.value,b)}},Re=(u,a,p,y,b,_,A,x,S)=>{const E=a.el=u?u.el:l(""),F=a.anchor=u?u.anchor:l("");let{patchFlag:C,dynamicChildren:L,slotScopeIds:j}=a;j&&(x=x?x.concat(j):j),u==null?(s(E,p,y),s(F,p,y),K(a.children||[],p,F,b,_,A,x,S)):C>0&&C&64&&L&&u.dynamicChildren?(re(u.dynamicChildren,L,p,b,_,A,x),(a.key!=null||b&&a===b.subTree)&&Yi(u,a,!0)):J(u,a,p,F,b,_,A,x,S)},be=(u,a,p,y,b,_,A,x,S)=>{a.slotScopeIds=x,u==null?a.shapeFlag&512?b.ctx.activate(a,p,y,A,S):yt(a,p,y,b,_,A,S):ot(u,a,S)},yt=(u,a,p,y,b,_,A)=>{const x=u.component=Rc(u,y,b);if(Vi(u)&&(x.ctx.renderer=M),Ac(x,!1,A),x.asyncDep){if(b&&b.registerDep(x,se,A),!u.el){const S=x.subTree=ve(_t);N(null,S,a,p),u.placeholder=S.el}}else se(x,u,a,p,b,_,A)},ot=(u,a,p)=>{const y=a.component=u.component;if(pc(u,a,p))if(y.asyncDep&&!y.asyncResolved){H(y,a,p);return}else y.next=a,y.update();else a.el=u.el,y.vnode=a},se=(u,a,p,y,b,_,A)=>{const x=()=>{if(u.isMounted){let{next:C,bu:L,u:j,parent:q,vnode:te}=u;{const He=Xi(u);if(He){C&&(C.el=te.el,H(u,C,A)),He.asyncDep.then(()=>{u.isUnmounted||x()});return}}let X=C,Se;Et(u,!1),C?(C.el=te.el,H(u,C,A)):C=te,L&&Sn(L),(Se=C.props&&C.props.onVnodeBeforeUpdate)&&Ke(Se,q,C,te),Et(u,!0);const xe=hr(u),ke=u.subTree;u.subTree=xe,O(ke,xe,h(ke.el),v(ke),u,b,_),C.el=xe.el,X===null&&gc(u,xe.el),j&&we(j,b),(Se=C.props&&C.props.onVnodeUpdated)&&we(()=>Ke(Se,q,C,te),b)}else{let C;const{el:L,props:j}=a,{bm:q,m:te,parent:X,root:Se,type:xe}=u,ke=en(a);Et(u,!1),q&&Sn(q),!ke&&(C=j&&j.onVnodeBeforeMount)&&Ke(C,X,a),Et(u,!0);{Se.ce&&Se.ce._def.shadowRoot!==!1&&Se.ce._injectChildStyle(xe);const He=u.subTree=hr(u);O(null,He,p,y,u,b,_),a.el=He.el}if(te&&we(te,b),!ke&&(C=j&&j.onVnodeMounted)){const He=a;we(()=>Ke(C,X,He),b)}(a.shapeFlag&256||X&&en(X.vnode)&&X.vnode.shapeFlag&256)&&u.a&&we(u.a,b),u.isMounted=!0,a=p=y=null}};u.scope.on();const S=u.effect=new fi(x);u.scope.off();const E=u.update=S.run.bind(S),F=u.job=S.runIfDirty.bind(S);F.i=u,F.id=u.uid,S.scheduler=()=>Bs(F),Et(u,!0),E()},H=(u,a,p)=>{a.component=u;const y=u.vnode.props;u.vnode=a,u.next=null,Yl(u,a.props,y,p),tc(u,a.children,p),st(),sr(u),rt()},J=(u,a,p,y,b,_,A,x,S=!1)=>{const E=u&&u.children,F=u?u.shapeFlag:0,C=a.children,{patchFlag:L,shapeFlag:j}=a;if(L>0){if(L&128){lt(E,C,p,y,b,_,A,x,S);return}else if(L&256){Qe(E,C,p,y,b,_,A,x,S);return}}j&8?(F&16&&Ie(E,b,_),C!==E&&f(p,C)):F&16?j&16?lt(E,C,p,y,b,_,A,x,S):Ie(E,b,_,!0):(F&8&&f(p,""),j&16&&K(C,p,y,b,_,A,x,S))},Qe=(u,a,p,y,b,_,A,x,S)=>{u=u||Mt,a=a||Mt;const E=u.length,F=a.length,C=Math.min(E,F);let L;for(L=0;L<C;L++){const j=a[L]=S?at(a[L]):We(a[L]);O(u[L],j,p,null,b,_,A,x,S)}E>F?Ie(u,b,_,!0,!1,C):K(a,p,y,b,_,A,x,S,C)},lt=(u,a,p,y,b,_,A,x,S)=>{let E=0;const F=a.length;let C=u.length-1,L=F-1;for(;E<=C&&E<=L;){const j=u[E],q=a[E]=S?at(a[E]):We(a[E]);if(qt(j,q))O(j,q,p,null,b,_,A,x,S);else break;E++}for(;E<=C&&E<=L;){const j=u[C],q=a[L]=S?at(a[L]):We(a[L]);if(qt(j,q))O(j,q,p,null,b,_,A,x,S);else break;C--,L--}if(E>C){if(E<=L){const j=L+1,q=j<F?a[j].el:y;for(;E<=L;)O(null,a[E]=S?at(a[E]):We(a[E]),p,q,b,_,A,x,S),E++}}else if(E>L)for(;E<=C;)Ee(u[E],b,_,!0),E++;else{const j=E,q=E,te=new Map;for(E=q;E<=L;E++){const Ae=a[E]=S?at(a[E]):We(a[E]);Ae.key!=null&&te.set(Ae.key,E)}let X,Se=0;const xe=L-q+1;let ke=!1,He=0;const Gt=new Array(xe);for(E=0;E<xe;E++)Gt[E]=0;for(E=j;E<=C;E++){const Ae=u[E];if(Se>=xe){Ee(Ae,b,_,!0);continue}let Be;if(Ae.key!=null)Be=te.get(Ae.key);else for(X=q;X<=L;X++)if(Gt[X-q]===0&&qt(Ae,a[X])){Be=X;break}Be===void 0?Ee(Ae,b,_,!0):(Gt[Be-q]=E+1,Be>=He?He=Be:ke=!0,O(Ae,a[Be],p,null,b,_,A,x,S),Se++)}const Qs=ke?ic(Gt):Mt;for(X=Qs.length-1,E=xe-1;E>=0;E--){const Ae=q+E,Be=a[Ae],Ys=a[Ae+1],Xs=Ae+1<F?Ys.el||Ys.placeholder:y;Gt[E]===0?O(null,Be,p,Xs,b,_,A,x,S):ke&&(X<0||E!==Qs[X]?Ue(Be,p,Xs,2):X--)}}},Ue=(u,a,p,y,b=null)=>{const{el:_,type:A,transition:x,children:S,shapeFlag:E}=u;if(E&6){Ue(u.component.subTree,a,p,y);return}if(E&128){u.suspense.move(a,p,y);return}if(E&64){A.move(u,a,p,M);return}if(A===Ve){s(_,a,p);for(let C=0;C<S.length;C++)Ue(S[C],a,p,y);s(u.anchor,a,p);return}if(A===rs){D(u,a,p);return}if(y!==2&&E&1&&x)if(y===0)x.beforeEnter(_),s(_,a,p),we(()=>x.enter(_),b);else{const{leave:C,delayLeave:L,afterLeave:j}=x,q=()=>{u.ctx.isUnmounted?r(_):s(_,a,p)},te=()=>{_._isLeaving&&_[Al](!0),C(_,()=>{q(),j&&j()})};L?L(_,q,te):te()}else s(_,a,p)},Ee=(u,a,p,y=!1,b=!1)=>{const{type:_,props:A,ref:x,children:S,dynamicChildren:E,shapeFlag:F,patchFlag:C,dirs:L,cacheIndex:j}=u;if(C===-2&&(b=!1),x!=null&&(st(),Zt(x,null,p,u,!0),rt()),j!=null&&(a.renderCache[j]=void 0),F&256){a.ctx.deactivate(u);return}const q=F&1&&L,te=!en(u);let X;if(te&&(X=A&&A.onVnodeBeforeUnmount)&&Ke(X,a,u),F&6)vt(u.component,p,y);else{if(F&128){u.suspense.unmount(p,y);return}q&&bt(u,null,a,"beforeUnmount"),F&64?u.type.remove(u,a,p,M,y):E&&!E.hasOnce&&(_!==Ve||C>0&&C&64)?Ie(E,a,p,!1,!0):(_===Ve&&C&384||!b&&F&16)&&Ie(S,a,p),y&&Ot(u)}(te&&(X=A&&A.onVnodeUnmounted)||q)&&we(()=>{X&&Ke(X,a,u),q&&bt(u,null,a,"unmounted")},p)},Ot=u=>{const{type:a,el:p,anchor:y,transition:b}=u;if(a===Ve){Pt(p,y);return}if(a===rs){T(u);return}const _=()=>{r(p),b&&!b.persisted&&b.afterLeave&&b.afterLeave()};if(u.shapeFlag&1&&b&&!b.persisted){const{leave:A,delayLeave:x}=b,S=()=>A(p,_);x?x(u.el,_,S):S()}else _()},Pt=(u,a)=>{let p;for(;u!==a;)p=g(u),r(u),u=p;r(a)},vt=(u,a,p)=>{const{bum:y,scope:b,job:_,subTree:A,um:x,m:S,a:E}=u;dr(S),dr(E),y&&Sn(y),b.stop(),_&&(_.flags|=8,Ee(A,u,a,p)),x&&we(x,a),we(()=>{u.isUnmounted=!0},a)},Ie=(u,a,p,y=!1,b=!1,_=0)=>{for(let A=_;A<u.length;A++)Ee(u[A],a,p,y,b)},v=u=>{if(u.shapeFlag&6)return v(u.component.subTree);if(u.shapeFlag&128)return u.suspense.next();const a=g(u.anchor||u.el),p=a&&a[xl];return p?g(p):a};let P=!1;const w=(u,a,p)=>{u==null?a._vnode&&Ee(a._vnode,null,null,!0):O(a._vnode||null,u,a,null,null,null,p),a._vnode=u,P||(P=!0,sr(),Ii(),P=!1)},M={p:O,um:Ee,m:Ue,r:Ot,mt:yt,mc:K,pc:J,pbc:re,n:v,o:e};return{render:w,hydrate:void 0,createApp:Jl(w)}}function ss({type:e,props:t},n){return n==="svg"&&e==="foreignObject"||n==="mathml"&&e==="annotation-xml"&&t&&t.encoding&&t.encoding.includes("html")?void 0:n}function Et({effect:e,job:t},n){n?(e.flags|=32,t.flags|=4):(e.flags&=-33,t.flags&=-5)}function rc(e,t){return(!e||e&&!e.pendingBranch)&&t&&!t.persisted}function Yi(e,t,n=!1){const s=e.children,r=t.children;if(V(s)&&V(r))for(let i=0;i<s.length;i++){const o=s[i];let l=r[i];l.shapeFlag&1&&!l.dynamicChildren&&((l.patchFlag<=0||l.patchFlag===32)&&(l=r[i]=at(r[i]),l.el=o.el),!n&&l.patchFlag!==-2&&Yi(o,l)),l.type===$n&&l.patchFlag!==-1&&(l.el=o.el),l.type===_t&&!l.el&&(l.el=o.el)}}function ic(e){const t=e.slice(),n=[0];let s,r,i,o,l;const c=e.length;for(s=0;s<c;s++){const d=e[s];if(d!==0){if(r=n[n.length-1],e[r]<d){t[s]=r,n.push(s);continue}for(i=0,o=n.length-1;i<o;)l=i+o>>1,e[n[l]]<d?i=l+1:o=l;d<e[n[i]]&&(i>0&&(t[s]=n[i-1]),n[i]=s)}}for(i=n.length,o=n[i-1];i-- >0;)n[i]=o,o=t[o];return n}function Xi(e){const t=e.subTree.component;if(t)return t.asyncDep&&!t.asyncResolved?t:Xi(t)}function dr(e){if(e)for(let t=0;t<e.length;t++)e[t].flags|=8}const oc=Symbol.for("v-scx"),lc=()=>$e(oc);function nn(e,t,n){return Zi(e,t,n)}function Zi(e,t,n=ee){const{immediate:s,deep:r,flush:i,once:o}=n,l=pe({},n),c=t&&s||!t&&i!=="post";let d;if(an){if(i==="sync"){const m=lc();d=m.__watcherHandles||(m.__watcherHandles=[])}else if(!c){const m=()=>{};return m.stop=qe,m.resume=qe,m.pause=qe,m}}const f=he;l.call=(m,R,O)=>ze(m,f,R,O);let h=!1;i==="post"?l.scheduler=m=>{we(m,f&&f.suspense)}:i!=="sync"&&(h=!0,l.scheduler=(m,R)=>{R?m():Bs(m)}),l.augmentJob=m=>{t&&(m.flags|=4),h&&(m.flags|=2,f&&(m.id=f.uid,m.i=f))};const g=yl(e,t,l);return an&&(d?d.push(g):c&&g()),g}function cc(e,t,n){const s=this.proxy,r=le(e)?e.includes(".")?eo(s,e):()=>s[e]:e.bind(s,s);let i;U(t)?i=t:(i=t.handler,n=t);const o=yn(this),l=Zi(r,i.bind(s),n);return o(),l}function eo(e,t){const n=t.split(".");return()=>{let s=e;for(let r=0;r<n.length&&s;r++)s=s[n[r]];return s}}const uc=(e,t)=>t==="modelValue"||t==="model-value"?e.modelModifiers:e[`${t}Modifiers`]||e[`${De(t)}Modifiers`]||e[`${Ct(t)}Modifiers`];function fc(e,t,...n){if(e.isUnmounted)return;const s=e.vnode.props||ee;let r=n;const i=t.startsWith("update:"),o=i&&uc(s,t.slice(7));o&&(o.trim&&(r=n.map(f=>le(f)?f.trim():f)),o.number&&(r=n.map(Un)));let l,c=s[l=Yn(t)]||s[l=Yn(De(t))];!c&&i&&(c=s[l=Yn(Ct(t))]),c&&ze(c,e,6,r);const d=s[l+"Once"];if(d){if(!e.emitted)e.emitted={};else if(e.emitted[l])return;e.emitted[l]=!0,ze(d,e,6,r)}}const ac=new WeakMap;function to(e,t,n=!1){const s=n?ac:t.emitsCache,r=s.get(e);if(r!==void 0)return r;const i=e.emits;let o={},l=!1;if(!U(e)){const c=d=>{const f=to(d,t,!0);f&&(l=!0,pe(o,f))};!n&&t.mixins.length&&t.mixins.forEach(c),e.extends&&c(e.extends),e.mixins&&e.mixins.forEach(c)}return!i&&!l?(Z(e)&&s.set(e,null),null):(V(i)?i.forEach(c=>o[c]=null):pe(o,i),Z(e)&&s.set(e,o),o)}function qn(e,t){return!e||!Vn(t)?!1:(t=t.slice(2).replace(/Once$/,""),Q(e,t[0].toLowerCase()+t.slice(1))||Q(e,Ct(t))||Q(e,t))}function hr(e){const{type:t,vnode:n,proxy:s,withProxy:r,propsOptions:[i],slots:o,attrs:l,emit:c,render:d,renderCache:f,props:h,data:g,setupState:m,ctx:R,inheritAttrs:O}=e,k=In(e);let N,I;try{if(n.shapeFlag&4){const T=r||s,B=T;N=We(d.call(B,T,f,h,m,g,R)),I=l}else{const T=t;N=We(T.length>1?T(h,{attrs:l,slots:o,emit:c}):T(h,null)),I=t.props?l:dc(l)}}catch(T){sn.length=0,Kn(T,e,1),N=ve(_t)}let D=N;if(I&&O!==!1){const T=Object.keys(I),{shapeFlag:B}=D;T.length&&B&7&&(i&&T.some(Ps)&&(I=hc(I,i)),D=Ut(D,I,!1,!0))}return n.dirs&&(D=Ut(D,null,!1,!0),D.dirs=D.dirs?D.dirs.concat(n.dirs):n.dirs),n.transition&&Ks(D,n.transition),N=D,In(k),N}const dc=e=>{let t;for(const n in e)(n==="class"||n==="style"||Vn(n))&&((t||(t={}))[n]=e[n]);return t},hc=(e,t)=>{const n={};for(const s in e)(!Ps(s)||!(s.slice(9)in t))&&(n[s]=e[s]);return n};function pc(e,t,n){const{props:s,children:r,component:i}=e,{props:o,children:l,patchFlag:c}=t,d=i.emitsOptions;if(t.dirs||t.transition)return!0;if(n&&c>=0){if(c&1024)return!0;if(c&16)return s?pr(s,o,d):!!o;if(c&8){const f=t.dynamicProps;for(let h=0;h<f.length;h++){const g=f[h];if(o[g]!==s[g]&&!qn(d,g))return!0}}}else return(r||l)&&(!l||!l.$stable)?!0:s===o?!1:s?o?pr(s,o,d):!0:!!o;return!1}function pr(e,t,n){const s=Object.keys(t);if(s.length!==Object.keys(e).length)return!0;for(let r=0;r<s.length;r++){const i=s[r];if(t[i]!==e[i]&&!qn(n,i))return!0}return!1}function gc({vnode:e,parent:t},n){for(;t;){const s=t.subTree;if(s.suspense&&s.suspense.activeBranch===e&&(s.el=e.el),s===e)(e=t.vnode).el=n,t=t.parent;else break}}const no=e=>e.__isSuspense;function mc(e,t){t&&t.pendingBranch?V(e)?t.effects.push(...e):t.effects.push(e):El(e)}const Ve=Symbol.for("v-fgt"),$n=Symbol.for("v-txt"),_t=Symbol.for("v-cmt"),rs=Symbol.for("v-stc"),sn=[];let Pe=null;function Ce(e=!1){sn.push(Pe=e?null:[])}function _c(){sn.pop(),Pe=sn[sn.length-1]||null}let fn=1;function Dn(e,t=!1){fn+=e,e<0&&Pe&&t&&(Pe.hasOnce=!0)}function so(e){return e.dynamicChildren=fn>0?Pe||Mt:null,_c(),fn>0&&Pe&&Pe.push(e),e}function Me(e,t,n,s,r,i){return so(Le(e,t,n,s,r,i,!0))}function ro(e,t,n,s,r){return so(ve(e,t,n,s,r,!0))}function Mn(e){return e?e.__v_isVNode===!0:!1}function qt(e,t){return e.type===t.type&&e.key===t.key}const io=({key:e})=>e??null,Rn=({ref:e,ref_key:t,ref_for:n})=>(typeof e=="number"&&(e=""+e),e!=null?le(e)||oe(e)||U(e)?{i:Oe,r:e,k:t,f:!!n}:e:null);function Le(e,t=null,n=null,s=0,r=null,i=e===Ve?0:1,o=!1,l=!1){const c={__v_isVNode:!0,__v_skip:!0,type:e,props:t,key:t&&io(t),ref:t&&Rn(t),scopeId:Ni,slotScopeIds:null,children:n,component:null,suspense:null,ssContent:null,ssFallback:null,dirs:null,transition:null,el:null,anchor:null,target:null,targetStart:null,targetAnchor:null,staticCount:0,shapeFlag:i,patchFlag:s,dynamicProps:r,dynamicChildren:null,appContext:null,ctx:Oe};return l?(qs(c,n),i&128&&e.normalize(c)):n&&(c.shapeFlag|=le(n)?8:16),fn>0&&!o&&Pe&&(c.patchFlag>0||i&6)&&c.patchFlag!==32&&Pe.push(c),c}const ve=yc;function yc(e,t=null,n=null,s=0,r=null,i=!1){if((!e||e===Ul)&&(e=_t),Mn(e)){const l=Ut(e,t,!0);return n&&qs(l,n),fn>0&&!i&&Pe&&(l.shapeFlag&6?Pe[Pe.indexOf(e)]=l:Pe.push(l)),l.patchFlag=-2,l}if(Ic(e)&&(e=e.__vccOpts),t){t=vc(t);let{class:l,style:c}=t;l&&!le(l)&&(t.class=Hn(l)),Z(c)&&(ks(c)&&!V(c)&&(c=pe({},c)),t.style=Ns(c))}const o=le(e)?1:no(e)?128:Rl(e)?64:Z(e)?4:U(e)?2:0;return Le(e,t,n,s,r,o,i,!0)}function vc(e){return e?ks(e)||Wi(e)?pe({},e):e:null}function Ut(e,t,n=!1,s=!1){const{props:r,ref:i,patchFlag:o,children:l,transition:c}=e,d=t?Ec(r||{},t):r,f={__v_isVNode:!0,__v_skip:!0,type:e.type,props:d,key:d&&io(d),ref:t&&t.ref?n&&i?V(i)?i.concat(Rn(t)):[i,Rn(t)]:Rn(t):i,scopeId:e.scopeId,slotScopeIds:e.slotScopeIds,children:l,target:e.target,targetStart:e.targetStart,targetAnchor:e.targetAnchor,staticCount:e.staticCount,shapeFlag:e.shapeFlag,patchFlag:t&&e.type!==Ve?o===-1?16:o|16:o,dynamicProps:e.dynamicProps,dynamicChildren:e.dynamicChildren,appContext:e.appContext,dirs:e.dirs,transition:c,component:e.component,suspense:e.suspense,ssContent:e.ssContent&&Ut(e.ssContent),ssFallback:e.ssFallback&&Ut(e.ssFallback),placeholder:e.placeholder,el:e.el,anchor:e.anchor,ctx:e.ctx,ce:e.ce};return c&&s&&Ks(f,c.clone(f)),f}function bc(e=" ",t=0){return ve($n,null,e,t)}function gr(e="",t=!1){return t?(Ce(),ro(_t,null,e)):ve(_t,null,e)}function We(e){return e==null||typeof e=="boolean"?ve(_t):V(e)?ve(Ve,null,e.slice()):Mn(e)?at(e):ve($n,null,String(e))}function at(e){return e.el===null&&e.patchFlag!==-1||e.memo?e:Ut(e)}function qs(e,t){let n=0;const{shapeFlag:s}=e;if(t==null)t=null;else if(V(t))n=16;else if(typeof t=="object")if(s&65){const r=t.default;r&&(r._c&&(r._d=!1),qs(e,r()),r._c&&(r._d=!0));return}else{n=32;const r=t._;!r&&!Wi(t)?t._ctx=Oe:r===3&&Oe&&(Oe.slots._===1?t._=1:(t._=2,e.patchFlag|=1024))}else U(t)?(t={default:t,_ctx:Oe},n=32):(t=String(t),s&64?(n=16,t=[bc(t)]):n=8);e.children=t,e.shapeFlag|=n}function Ec(...e){const t={};for(let n=0;n<e.length;n++){const s=e[n];for(const r in s)if(r==="class")t.class!==s.class&&(t.class=Hn([t.class,s.class]));else if(r==="style")t.style=Ns([t.style,s.style]);else if(Vn(r)){const i=t[r],o=s[r];o&&i!==o&&!(V(i)&&i.includes(o))&&(t[r]=i?[].concat(i,o):o)}else r!==""&&(t[r]=s[r])}return t}function Ke(e,t,n,s=null){ze(e,t,7,[n,s])}const Sc=Bi();let xc=0;function Rc(e,t,n){const s=e.type,r=(t?t.appContext:e.appContext)||Sc,i={uid:xc++,vnode:e,type:s,parent:t,appContext:r,root:null,next:null,subTree:null,effect:null,update:null,job:null,scope:new li(!0),render:null,proxy:null,exposed:null,exposeProxy:null,withProxy:null,provides:t?t.provides:Object.create(r.provides),ids:t?t.ids:["",0,0],accessCache:null,renderCache:[],components:null,directives:null,propsOptions:$i(s,r),emitsOptions:to(s,r),emit:null,emitted:null,propsDefaults:ee,inheritAttrs:s.inheritAttrs,ctx:ee,data:ee,props:ee,attrs:ee,slots:ee,refs:ee,setupState:ee,setupContext:null,suspense:n,suspenseId:n?n.pendingId:0,asyncDep:null,asyncResolved:!1,isMounted:!1,isUnmounted:!1,isDeactivated:!1,bc:null,c:null,bm:null,m:null,bu:null,u:null,um:null,bum:null,da:null,a:null,rtg:null,rtc:null,ec:null,sp:null};return i.ctx={_:i},i.root=t?t.root:i,i.emit=fc.bind(null,i),e.ce&&e.ce(i),i}let he=null;const oo=()=>he||Oe;let Ln,bs;{const e=kn(),t=(n,s)=>{let r;return(r=e[n])||(r=e[n]=[]),r.push(s),i=>{r.length>1?r.forEach(o=>o(i)):r[0](i)}};Ln=t("__VUE_INSTANCE_SETTERS__",n=>he=n),bs=t("__VUE_SSR_SETTERS__",n=>an=n)}const yn=e=>{const t=he;return Ln(e),e.scope.on(),()=>{e.scope.off(),Ln(t)}},mr=()=>{he&&he.scope.off(),Ln(null)};function lo(e){return e.vnode.shapeFlag&4}let an=!1;function Ac(e,t=!1,n=!1){t&&bs(t);const{props:s,children:r}=e.vnode,i=lo(e);Ql(e,s,i,t),ec(e,r,n||t);const o=i?wc(e,t):void 0;return t&&bs(!1),o}function wc(e,t){const n=e.type;e.accessCache=Object.create(null),e.proxy=new Proxy(e.ctx,Hl);const{setup:s}=n;if(s){st();const r=e.setupContext=s.length>1?Oc(e):null,i=yn(e),o=_n(s,e,0,[e.props,r]),l=ei(o);if(rt(),i(),(l||e.sp)&&!en(e)&&Li(e),l){if(o.then(mr,mr),t)return o.then(c=>{_r(e,c)}).catch(c=>{Kn(c,e,0)});e.asyncDep=o}else _r(e,o)}else co(e)}function _r(e,t,n){U(t)?e.type.__ssrInlineRender?e.ssrRender=t:e.render=t:Z(t)&&(e.setupState=wi(t)),co(e)}function co(e,t,n){const s=e.type;e.render||(e.render=s.render||qe);{const r=yn(e);st();try{Bl(e)}finally{rt(),r()}}}const Cc={get(e,t){return de(e,"get",""),e[t]}};function Oc(e){const t=n=>{e.exposed=n||{}};return{attrs:new Proxy(e.attrs,Cc),slots:e.slots,emit:e.emit,expose:t}}function Jn(e){return e.exposed?e.exposeProxy||(e.exposeProxy=new Proxy(wi(Hs(e.exposed)),{get(t,n){if(n in t)return t[n];if(n in tn)return tn[n](e)},has(t,n){return n in t||n in tn}})):e.proxy}function Pc(e,t=!0){return U(e)?e.displayName||e.name:e.name||t&&e.__name}function Ic(e){return U(e)&&"__vccOpts"in e}const Te=(e,t)=>ml(e,t,an);function uo(e,t,n){try{Dn(-1);const s=arguments.length;return s===2?Z(t)&&!V(t)?Mn(t)?ve(e,null,[t]):ve(e,t):ve(e,null,t):(s>3?n=Array.prototype.slice.call(arguments,2):s===3&&Mn(n)&&(n=[n]),ve(e,t,n))}finally{Dn(1)}}const Tc="3.5.24";let Es;const yr=typeof window<"u"&&window.trustedTypes;if(yr)try{Es=yr.createPolicy("vue",{createHTML:e=>e})}catch{}const fo=Es?e=>Es.createHTML(e):e=>e,Nc="http://www.w3.org/2000/svg",Dc="http://www.w3.org/1998/Math/MathML",Ze=typeof document<"u"?document:null,vr=Ze&&Ze.createElement("template"),Mc={insert:(e,t,n)=>{t.insertBefore(e,n||null)},remove:e=>{const t=e.parentNode;t&&t.removeChild(e)},createElement:(e,t,n,s)=>{const r=t==="svg"?Ze.createElementNS(Nc,e):t==="mathml"?Ze.createElementNS(Dc,e):n?Ze.createElement(e,{is:n}):Ze.createElement(e);return e==="select"&&s&&s.multiple!=null&&r.setAttribute("multiple",s.multiple),r},createText:e=>Ze.createTextNode(e),createComment:e=>Ze.createComment(e),setText:(e,t)=>{e.nodeValue=t},setElementText:(e,t)=>{e.textContent=t},parentNode:e=>e.parentNode,nextSibling:e=>e.nextSibling,querySelector:e=>Ze.querySelector(e),setScopeId(e,t){e.setAttribute(t,"")},insertStaticContent(e,t,n,s,r,i){const o=n?n.previousSibling:t.lastChild;if(r&&(r===i||r.nextSibling))for(;t.insertBefore(r.cloneNode(!0),n),!(r===i||!(r=r.nextSibling)););else{vr.innerHTML=fo(s==="svg"?`<svg>${e}</svg>`:s==="mathml"?`<math>${e}</math>`:e);const l=vr.content;if(s==="svg"||s==="mathml"){const c=l.firstChild;for(;c.firstChild;)l.appendChild(c.firstChild);l.removeChild(c)}t.insertBefore(l,n)}return[o?o.nextSibling:t.firstChild,n?n.previousSibling:t.lastChild]}},Lc=Symbol("_vtc");function Vc(e,t,n){const s=e[Lc];s&&(t=(t?[t,...s]:[...s]).join(" ")),t==null?e.removeAttribute("class"):n?e.setAttribute("class",t):e.className=t}const br=Symbol("_vod"),Fc=Symbol("_vsh"),jc=Symbol(""),Uc=/(?:^|;)\s*display\s*:/;function kc(e,t,n){const s=e.style,r=le(n);let i=!1;if(n&&!r){if(t)if(le(t))for(const o of t.split(";")){const l=o.slice(0,o.indexOf(":")).trim();n[l]==null&&An(s,l,"")}else for(const o in t)n[o]==null&&An(s,o,"");for(const o in n)o==="display"&&(i=!0),An(s,o,n[o])}else if(r){if(t!==n){const o=s[jc];o&&(n+=";"+o),s.cssText=n,i=Uc.test(n)}}else t&&e.removeAttribute("style");br in e&&(e[br]=i?s.display:"",e[Fc]&&(s.display="none"))}const Er=/\s*!important$/;function An(e,t,n){if(V(n))n.forEach(s=>An(e,t,s));else if(n==null&&(n=""),t.startsWith("--"))e.setProperty(t,n);else{const s=Hc(e,t);Er.test(n)?e.setProperty(Ct(s),n.replace(Er,""),"important"):e[s]=n}}const Sr=["Webkit","Moz","ms"],is={};function Hc(e,t){const n=is[t];if(n)return n;let s=De(t);if(s!=="filter"&&s in e)return is[t]=s;s=jn(s);for(let r=0;r<Sr.length;r++){const i=Sr[r]+s;if(i in e)return is[t]=i}return t}const xr="http://www.w3.org/1999/xlink";function Rr(e,t,n,s,r,i=Ho(t)){s&&t.startsWith("xlink:")?n==null?e.removeAttributeNS(xr,t.slice(6,t.length)):e.setAttributeNS(xr,t,n):n==null||i&&!ri(n)?e.removeAttribute(t):e.setAttribute(t,i?"":Je(n)?String(n):n)}function Ar(e,t,n,s,r){if(t==="innerHTML"||t==="textContent"){n!=null&&(e[t]=t==="innerHTML"?fo(n):n);return}const i=e.tagName;if(t==="value"&&i!=="PROGRESS"&&!i.includes("-")){const l=i==="OPTION"?e.getAttribute("value")||"":e.value,c=n==null?e.type==="checkbox"?"on":"":String(n);(l!==c||!("_value"in e))&&(e.value=c),n==null&&e.removeAttribute(t),e._value=n;return}let o=!1;if(n===""||n==null){const l=typeof e[t];l==="boolean"?n=ri(n):n==null&&l==="string"?(n="",o=!0):l==="number"&&(n=0,o=!0)}try{e[t]=n}catch{}o&&e.removeAttribute(r||t)}function ht(e,t,n,s){e.addEventListener(t,n,s)}function Bc(e,t,n,s){e.removeEventListener(t,n,s)}const wr=Symbol("_vei");function Kc(e,t,n,s,r=null){const i=e[wr]||(e[wr]={}),o=i[t];if(s&&o)o.value=s;else{const[l,c]=Gc(t);if(s){const d=i[t]=$c(s,r);ht(e,l,d,c)}else o&&(Bc(e,l,o,c),i[t]=void 0)}}const Cr=/(?:Once|Passive|Capture)$/;function Gc(e){let t;if(Cr.test(e)){t={};let s;for(;s=e.match(Cr);)e=e.slice(0,e.length-s[0].length),t[s[0].toLowerCase()]=!0}return[e[2]===":"?e.slice(3):Ct(e.slice(2)),t]}let os=0;const Wc=Promise.resolve(),qc=()=>os||(Wc.then(()=>os=0),os=Date.now());function $c(e,t){const n=s=>{if(!s._vts)s._vts=Date.now();else if(s._vts<=n.attached)return;ze(Jc(s,n.value),t,5,[s])};return n.value=e,n.attached=qc(),n}function Jc(e,t){if(V(t)){const n=e.stopImmediatePropagation;return e.stopImmediatePropagation=()=>{n.call(e),e._stopped=!0},t.map(s=>r=>!r._stopped&&s&&s(r))}else return t}const Or=e=>e.charCodeAt(0)===111&&e.charCodeAt(1)===110&&e.charCodeAt(2)>96&&e.charCodeAt(2)<123,zc=(e,t,n,s,r,i)=>{const o=r==="svg";t==="class"?Vc(e,s,o):t==="style"?kc(e,n,s):Vn(t)?Ps(t)||Kc(e,t,n,s,i):(t[0]==="."?(t=t.slice(1),!0):t[0]==="^"?(t=t.slice(1),!1):Qc(e,t,s,o))?(Ar(e,t,s),!e.tagName.includes("-")&&(t==="value"||t==="checked"||t==="selected")&&Rr(e,t,s,o,i,t!=="value")):e._isVueCE&&(/[A-Z]/.test(t)||!le(s))?Ar(e,De(t),s,i,t):(t==="true-value"?e._trueValue=s:t==="false-value"&&(e._falseValue=s),Rr(e,t,s,o))};function Qc(e,t,n,s){if(s)return!!(t==="innerHTML"||t==="textContent"||t in e&&Or(t)&&U(n));if(t==="spellcheck"||t==="draggable"||t==="translate"||t==="autocorrect"||t==="sandbox"&&e.tagName==="IFRAME"||t==="form"||t==="list"&&e.tagName==="INPUT"||t==="type"&&e.tagName==="TEXTAREA")return!1;if(t==="width"||t==="height"){const r=e.tagName;if(r==="IMG"||r==="VIDEO"||r==="CANVAS"||r==="SOURCE")return!1}return Or(t)&&le(n)?!1:t in e}const kt=e=>{const t=e.props["onUpdate:modelValue"]||!1;return V(t)?n=>Sn(t,n):t};function Yc(e){e.target.composing=!0}function Pr(e){const t=e.target;t.composing&&(t.composing=!1,t.dispatchEvent(new Event("input")))}const nt=Symbol("_assign");function Ir(e,t,n){return t&&(e=e.trim()),n&&(e=Un(e)),e}const qf={created(e,{modifiers:{lazy:t,trim:n,number:s}},r){e[nt]=kt(r);const i=s||r.props&&r.props.type==="number";ht(e,t?"change":"input",o=>{o.target.composing||e[nt](Ir(e.value,n,i))}),(n||i)&&ht(e,"change",()=>{e.value=Ir(e.value,n,i)}),t||(ht(e,"compositionstart",Yc),ht(e,"compositionend",Pr),ht(e,"change",Pr))},mounted(e,{value:t}){e.value=t??""},beforeUpdate(e,{value:t,oldValue:n,modifiers:{lazy:s,trim:r,number:i}},o){if(e[nt]=kt(o),e.composing)return;const l=(i||e.type==="number")&&!/^0\d/.test(e.value)?Un(e.value):e.value,c=t??"";l!==c&&(document.activeElement===e&&e.type!=="range"&&(s&&t===n||r&&e.value.trim()===c)||(e.value=c))}},$f={deep:!0,created(e,t,n){e[nt]=kt(n),ht(e,"change",()=>{const s=e._modelValue,r=dn(e),i=e.checked,o=e[nt];if(V(s)){const l=Ds(s,r),c=l!==-1;if(i&&!c)o(s.concat(r));else if(!i&&c){const d=[...s];d.splice(l,1),o(d)}}else if(Kt(s)){const l=new Set(s);i?l.add(r):l.delete(r),o(l)}else o(ao(e,i))})},mounted:Tr,beforeUpdate(e,t,n){e[nt]=kt(n),Tr(e,t,n)}};function Tr(e,{value:t,oldValue:n},s){e._modelValue=t;let r;if(V(t))r=Ds(t,s.props.value)>-1;else if(Kt(t))r=t.has(s.props.value);else{if(t===n)return;r=gn(t,ao(e,!0))}e.checked!==r&&(e.checked=r)}const Xc={deep:!0,created(e,{value:t,modifiers:{number:n}},s){const r=Kt(t);ht(e,"change",()=>{const i=Array.prototype.filter.call(e.options,o=>o.selected).map(o=>n?Un(dn(o)):dn(o));e[nt](e.multiple?r?new Set(i):i:i[0]),e._assigning=!0,Gn(()=>{e._assigning=!1})}),e[nt]=kt(s)},mounted(e,{value:t}){Nr(e,t)},beforeUpdate(e,t,n){e[nt]=kt(n)},updated(e,{value:t}){e._assigning||Nr(e,t)}};function Nr(e,t){const n=e.multiple,s=V(t);if(!(n&&!s&&!Kt(t))){for(let r=0,i=e.options.length;r<i;r++){const o=e.options[r],l=dn(o);if(n)if(s){const c=typeof l;c==="string"||c==="number"?o.selected=t.some(d=>String(d)===String(l)):o.selected=Ds(t,l)>-1}else o.selected=t.has(l);else if(gn(dn(o),t)){e.selectedIndex!==r&&(e.selectedIndex=r);return}}!n&&e.selectedIndex!==-1&&(e.selectedIndex=-1)}}function dn(e){return"_value"in e?e._value:e.value}function ao(e,t){const n=t?"_trueValue":"_falseValue";return n in e?e[n]:t}const Zc=["ctrl","shift","alt","meta"],eu={stop:e=>e.stopPropagation(),prevent:e=>e.preventDefault(),self:e=>e.target!==e.currentTarget,ctrl:e=>!e.ctrlKey,shift:e=>!e.shiftKey,alt:e=>!e.altKey,meta:e=>!e.metaKey,left:e=>"button"in e&&e.button!==0,middle:e=>"button"in e&&e.button!==1,right:e=>"button"in e&&e.button!==2,exact:(e,t)=>Zc.some(n=>e[`${n}Key`]&&!t.includes(n))},Jf=(e,t)=>{const n=e._withMods||(e._withMods={}),s=t.join(".");return n[s]||(n[s]=((r,...i)=>{for(let o=0;o<t.length;o++){const l=eu[t[o]];if(l&&l(r,t))return}return e(r,...i)}))},tu=pe({patchProp:zc},Mc);let Dr;function nu(){return Dr||(Dr=nc(tu))}const su=((...e)=>{const t=nu().createApp(...e),{mount:n}=t;return t.mount=s=>{const r=iu(s);if(!r)return;const i=t._component;!U(i)&&!i.render&&!i.template&&(i.template=r.innerHTML),r.nodeType===1&&(r.textContent="");const o=n(r,!1,ru(r));return r instanceof Element&&(r.removeAttribute("v-cloak"),r.setAttribute("data-v-app","")),o},t});function ru(e){if(e instanceof SVGElement)return"svg";if(typeof MathMLElement=="function"&&e instanceof MathMLElement)return"mathml"}function iu(e){return le(e)?document.querySelector(e):e}let ho;const zn=e=>ho=e,po=Symbol();function Ss(e){return e&&typeof e=="object"&&Object.prototype.toString.call(e)==="[object Object]"&&typeof e.toJSON!="function"}var rn;(function(e){e.direct="direct",e.patchObject="patch object",e.patchFunction="patch function"})(rn||(rn={}));function ou(){const e=ci(!0),t=e.run(()=>jt({}));let n=[],s=[];const r=Hs({install(i){zn(r),r._a=i,i.provide(po,r),i.config.globalProperties.$pinia=r,s.forEach(o=>n.push(o)),s=[]},use(i){return this._a?n.push(i):s.push(i),this},_p:n,_a:null,_e:e,_s:new Map,state:t});return r}const go=()=>{};function Mr(e,t,n,s=go){e.add(t);const r=()=>{e.delete(t)&&s()};return!n&&ui()&&Ko(r),r}function Tt(e,...t){e.forEach(n=>{n(...t)})}const lu=e=>e(),Lr=Symbol(),ls=Symbol();function xs(e,t){e instanceof Map&&t instanceof Map?t.forEach((n,s)=>e.set(s,n)):e instanceof Set&&t instanceof Set&&t.forEach(e.add,e);for(const n in t){if(!t.hasOwnProperty(n))continue;const s=t[n],r=e[n];Ss(r)&&Ss(s)&&e.hasOwnProperty(n)&&!oe(s)&&!gt(s)?e[n]=xs(r,s):e[n]=s}return e}const cu=Symbol();function uu(e){return!Ss(e)||!Object.prototype.hasOwnProperty.call(e,cu)}const{assign:ut}=Object;function fu(e){return!!(oe(e)&&e.effect)}function au(e,t,n,s){const{state:r,actions:i,getters:o}=t,l=n.state.value[e];let c;function d(){l||(n.state.value[e]=r?r():{});const f=dl(n.state.value[e]);return ut(f,i,Object.keys(o||{}).reduce((h,g)=>(h[g]=Hs(Te(()=>{zn(n);const m=n._s.get(e);return o[g].call(m,m)})),h),{}))}return c=mo(e,d,t,n,s,!0),c}function mo(e,t,n={},s,r,i){let o;const l=ut({actions:{}},n),c={deep:!0};let d,f,h=new Set,g=new Set,m;const R=s.state.value[e];!i&&!R&&(s.state.value[e]={}),jt({});let O;function k(K){let G;d=f=!1,typeof K=="function"?(K(s.state.value[e]),G={type:rn.patchFunction,storeId:e,events:m}):(xs(s.state.value[e],K),G={type:rn.patchObject,payload:K,storeId:e,events:m});const re=O=Symbol();Gn().then(()=>{O===re&&(d=!0)}),f=!0,Tt(h,G,s.state.value[e])}const N=i?function(){const{state:G}=n,re=G?G():{};this.$patch(ge=>{ut(ge,re)})}:go;function I(){o.stop(),h.clear(),g.clear(),s._s.delete(e)}const D=(K,G="")=>{if(Lr in K)return K[ls]=G,K;const re=function(){zn(s);const ge=Array.from(arguments),Re=new Set,be=new Set;function yt(H){Re.add(H)}function ot(H){be.add(H)}Tt(g,{args:ge,name:re[ls],store:B,after:yt,onError:ot});let se;try{se=K.apply(this&&this.$id===e?this:B,ge)}catch(H){throw Tt(be,H),H}return se instanceof Promise?se.then(H=>(Tt(Re,H),H)).catch(H=>(Tt(be,H),Promise.reject(H))):(Tt(Re,se),se)};return re[Lr]=!0,re[ls]=G,re},T={_p:s,$id:e,$onAction:Mr.bind(null,g),$patch:k,$reset:N,$subscribe(K,G={}){const re=Mr(h,K,G.detached,()=>ge()),ge=o.run(()=>nn(()=>s.state.value[e],Re=>{(G.flush==="sync"?f:d)&&K({storeId:e,type:rn.direct,events:m},Re)},ut({},c,G)));return re},$dispose:I},B=mn(T);s._s.set(e,B);const Y=(s._a&&s._a.runWithContext||lu)(()=>s._e.run(()=>(o=ci()).run(()=>t({action:D}))));for(const K in Y){const G=Y[K];if(oe(G)&&!fu(G)||gt(G))i||(R&&uu(G)&&(oe(G)?G.value=R[K]:xs(G,R[K])),s.state.value[e][K]=G);else if(typeof G=="function"){const re=D(G,K);Y[K]=re,l.actions[K]=G}}return ut(B,Y),ut($(B),Y),Object.defineProperty(B,"$state",{get:()=>s.state.value[e],set:K=>{k(G=>{ut(G,K)})}}),s._p.forEach(K=>{ut(B,o.run(()=>K({store:B,app:s._a,pinia:s,options:l})))}),R&&i&&n.hydrate&&n.hydrate(B.$state,R),d=!0,f=!0,B}function du(e,t,n){let s;const r=typeof t=="function";s=r?n:t;function i(o,l){const c=zl();return o=o||(c?$e(po,null):null),o&&zn(o),o=ho,o._s.has(e)||(r?mo(e,t,s,o):au(e,s,o)),o._s.get(e)}return i.$id=e,i}const hu=du("user_session",()=>{const e=jt([{id:"1",name:"Merel",role:"admin",preferences:{theme:"light"}},{id:"2",name:"Dj",role:"backend",preferences:{theme:"dark"}},{id:"3",name:"Donna",role:"viewer",preferences:{theme:"light"}},{id:"4",name:"Viktorija",role:"viewer",preferences:{theme:"light"}},{id:"4",name:"Janosh",role:"viewer",preferences:{theme:"light"}}]),t=jt(e.value[0]);function n(i){const o=e.value.find(l=>l.id===String(i));return o&&(t.value={...o}),t.value}function s(i){t.value=i?{...i}:null}function r(i={}){t.value&&(t.value.preferences={...t.value.preferences||{},...i})}return{mockUsers:e,currentUser:t,switchUser:n,setUser:s,updatePreferences:r}}),_o=(e,t)=>{const n=e.__vccOpts||e;for(const[s,r]of t)n[s]=r;return n},pu={name:"Navigation",data(){return{collapsed:!1,isDark:document.documentElement.getAttribute("data-theme")==="dark",links:[{name:"dashboard",label:"Dashboard",icon:"🏠"},{name:"orderCreation",label:"Create Order",icon:"📝"},{name:"inventory",label:"Inventory",icon:"📦"},{name:"Reports and analyse",label:"Reports",icon:"📊"},{name:"digital carts",label:"Carts",icon:"🛒"},{name:"chat",label:"Chat",icon:"💬"},{name:"checklist",label:"Checklist",icon:"✅"}],selectedId:"",store:null}},created(){this.store=hu(),this.selectedId=this.store&&this.store.currentUser?this.store.currentUser.id:this.store&&this.store.mockUsers[0]&&this.store.mockUsers[0].id||"";const e=this.store?.currentUser?.preferences?.theme;e&&this.applyTheme(e)},methods:{onSwitchUser(){if(!this.selectedId||!this.store)return;this.store.switchUser(this.selectedId);const e=this.store?.currentUser?.preferences?.theme;e&&this.applyTheme(e)},applyTheme(e){const t=e==="dark"?"dark":"light";document.documentElement.setAttribute("data-theme",t),localStorage.setItem("theme",t),this.isDark=t==="dark",this.store?.currentUser&&this.store.updatePreferences({theme:t})},toggleTheme(){const e=this.isDark?"light":"dark";this.applyTheme(e)}}},gu=["aria-expanded"],mu={key:0},_u={key:1},yu={class:"links"},vu={class:"icon"},bu={key:0,class:"label"},Eu={class:"theme-toggle"},Su=["aria-pressed"],xu={key:0},Ru={key:1},Au=["title"],wu={key:0,class:"user-controls"},Cu=["value"];function Ou(e,t,n,s,r,i){const o=Ui("router-link");return Ce(),Me("aside",{class:Hn(["app-nav",{collapsed:r.collapsed}]),"aria-label":"Main navigation"},[Le("button",{class:"toggle",onClick:t[0]||(t[0]=l=>r.collapsed=!r.collapsed),"aria-expanded":!r.collapsed},[r.collapsed?(Ce(),Me("span",mu,"☰")):(Ce(),Me("span",_u,"✖"))],8,gu),Le("nav",yu,[(Ce(!0),Me(Ve,null,or(r.links,l=>(Ce(),ro(o,{key:l.name,to:{name:l.name},class:"nav-link","active-class":"active"},{default:Di(()=>[Le("span",vu,Jt(l.icon),1),r.collapsed?gr("",!0):(Ce(),Me("span",bu,Jt(l.label),1))]),_:2},1032,["to"]))),128))]),Le("div",Eu,[Le("button",{class:"toggle",onClick:t[1]||(t[1]=(...l)=>i.toggleTheme&&i.toggleTheme(...l)),"aria-pressed":r.isDark,title:"Toggle dark mode"},[r.isDark?(Ce(),Me("span",xu,"🌙 Dark")):(Ce(),Me("span",Ru,"☀️ Light"))],8,Su)]),Le("div",{class:"user-area",title:r.store&&r.store.currentUser?r.store.currentUser.name:"Not signed in"},[r.collapsed?gr("",!0):(Ce(),Me("div",wu,[t[4]||(t[4]=Le("label",{class:"sr-only"},"Switch user",-1)),Sl(Le("select",{"onUpdate:modelValue":t[2]||(t[2]=l=>r.selectedId=l),onChange:t[3]||(t[3]=(...l)=>i.onSwitchUser&&i.onSwitchUser(...l))},[(Ce(!0),Me(Ve,null,or(r.store?r.store.mockUsers:[],l=>(Ce(),Me("option",{key:l.id,value:l.id},Jt(l.name)+" — "+Jt(l.role),9,Cu))),128))],544),[[Xc,r.selectedId]])]))],8,Au)],2)}const Pu=_o(pu,[["render",Ou],["__scopeId","data-v-735aee46"]]),Iu={id:"app",class:"app-shell"},Tu={class:"content"},Nu={name:"App"},Du=Object.assign(Nu,{setup(e){return(t,n)=>{const s=Ui("router-view");return Ce(),Me("div",Iu,[Le("main",Tu,[ve(s)]),ve(Pu)])}}}),Mu=_o(Du,[["__scopeId","data-v-72ca7610"]]),Lu="modulepreload",Vu=function(e){return"/front/"+e},Vr={},St=function(t,n,s){let r=Promise.resolve();if(n&&n.length>0){let c=function(d){return Promise.all(d.map(f=>Promise.resolve(f).then(h=>({status:"fulfilled",value:h}),h=>({status:"rejected",reason:h}))))};document.getElementsByTagName("link");const o=document.querySelector("meta[property=csp-nonce]"),l=o?.nonce||o?.getAttribute("nonce");r=c(n.map(d=>{if(d=Vu(d),d in Vr)return;Vr[d]=!0;const f=d.endsWith(".css"),h=f?'[rel="stylesheet"]':"";if(document.querySelector(`link[href="${d}"]${h}`))return;const g=document.createElement("link");if(g.rel=f?"stylesheet":Lu,f||(g.as="script"),g.crossOrigin="",g.href=d,l&&g.setAttribute("nonce",l),document.head.appendChild(g),f)return new Promise((m,R)=>{g.addEventListener("load",m),g.addEventListener("error",()=>R(new Error(`Unable to preload CSS for ${d}`)))})}))}function i(o){const l=new Event("vite:preloadError",{cancelable:!0});if(l.payload=o,window.dispatchEvent(l),!l.defaultPrevented)throw o}return r.then(o=>{for(const l of o||[])l.status==="rejected"&&i(l.reason);return t().catch(i)})};const Dt=typeof document<"u";function yo(e){return typeof e=="object"||"displayName"in e||"props"in e||"__vccOpts"in e}function Fu(e){return e.__esModule||e[Symbol.toStringTag]==="Module"||e.default&&yo(e.default)}const z=Object.assign;function cs(e,t){const n={};for(const s in t){const r=t[s];n[s]=je(r)?r.map(e):e(r)}return n}const on=()=>{},je=Array.isArray;function Fr(e,t){const n={};for(const s in e)n[s]=s in t?t[s]:e[s];return n}const vo=/#/g,ju=/&/g,Uu=/\//g,ku=/=/g,Hu=/\?/g,bo=/\+/g,Bu=/%5B/g,Ku=/%5D/g,Eo=/%5E/g,Gu=/%60/g,So=/%7B/g,Wu=/%7C/g,xo=/%7D/g,qu=/%20/g;function $s(e){return e==null?"":encodeURI(""+e).replace(Wu,"|").replace(Bu,"[").replace(Ku,"]")}function $u(e){return $s(e).replace(So,"{").replace(xo,"}").replace(Eo,"^")}function Rs(e){return $s(e).replace(bo,"%2B").replace(qu,"+").replace(vo,"%23").replace(ju,"%26").replace(Gu,"`").replace(So,"{").replace(xo,"}").replace(Eo,"^")}function Ju(e){return Rs(e).replace(ku,"%3D")}function zu(e){return $s(e).replace(vo,"%23").replace(Hu,"%3F")}function Qu(e){return zu(e).replace(Uu,"%2F")}function hn(e){if(e==null)return null;try{return decodeURIComponent(""+e)}catch{}return""+e}const Yu=/\/$/,Xu=e=>e.replace(Yu,"");function us(e,t,n="/"){let s,r={},i="",o="";const l=t.indexOf("#");let c=t.indexOf("?");return c=l>=0&&c>l?-1:c,c>=0&&(s=t.slice(0,c),i=t.slice(c,l>0?l:t.length),r=e(i.slice(1))),l>=0&&(s=s||t.slice(0,l),o=t.slice(l,t.length)),s=nf(s??t,n),{fullPath:s+i+o,path:s,query:r,hash:hn(o)}}function Zu(e,t){const n=t.query?e(t.query):"";return t.path+(n&&"?")+n+(t.hash||"")}function jr(e,t){return!t||!e.toLowerCase().startsWith(t.toLowerCase())?e:e.slice(t.length)||"/"}function ef(e,t,n){const s=t.matched.length-1,r=n.matched.length-1;return s>-1&&s===r&&Ht(t.matched[s],n.matched[r])&&Ro(t.params,n.params)&&e(t.query)===e(n.query)&&t.hash===n.hash}function Ht(e,t){return(e.aliasOf||e)===(t.aliasOf||t)}function Ro(e,t){if(Object.keys(e).length!==Object.keys(t).length)return!1;for(const n in e)if(!tf(e[n],t[n]))return!1;return!0}function tf(e,t){return je(e)?Ur(e,t):je(t)?Ur(t,e):e===t}function Ur(e,t){return je(t)?e.length===t.length&&e.every((n,s)=>n===t[s]):e.length===1&&e[0]===t}function nf(e,t){if(e.startsWith("/"))return e;if(!e)return t;const n=t.split("/"),s=e.split("/"),r=s[s.length-1];(r===".."||r===".")&&s.push("");let i=n.length-1,o,l;for(o=0;o<s.length;o++)if(l=s[o],l!==".")if(l==="..")i>1&&i--;else break;return n.slice(0,i).join("/")+"/"+s.slice(o).join("/")}const ct={path:"/",name:void 0,params:{},query:{},hash:"",fullPath:"/",matched:[],meta:{},redirectedFrom:void 0};let As=(function(e){return e.pop="pop",e.push="push",e})({}),fs=(function(e){return e.back="back",e.forward="forward",e.unknown="",e})({});function sf(e){if(!e)if(Dt){const t=document.querySelector("base");e=t&&t.getAttribute("href")||"/",e=e.replace(/^\w+:\/\/[^\/]+/,"")}else e="/";return e[0]!=="/"&&e[0]!=="#"&&(e="/"+e),Xu(e)}const rf=/^[^#]+#/;function of(e,t){return e.replace(rf,"#")+t}function lf(e,t){const n=document.documentElement.getBoundingClientRect(),s=e.getBoundingClientRect();return{behavior:t.behavior,left:s.left-n.left-(t.left||0),top:s.top-n.top-(t.top||0)}}const Qn=()=>({left:window.scrollX,top:window.scrollY});function cf(e){let t;if("el"in e){const n=e.el,s=typeof n=="string"&&n.startsWith("#"),r=typeof n=="string"?s?document.getElementById(n.slice(1)):document.querySelector(n):n;if(!r)return;t=lf(r,e)}else t=e;"scrollBehavior"in document.documentElement.style?window.scrollTo(t):window.scrollTo(t.left!=null?t.left:window.scrollX,t.top!=null?t.top:window.scrollY)}function kr(e,t){return(history.state?history.state.position-t:-1)+e}const ws=new Map;function uf(e,t){ws.set(e,t)}function ff(e){const t=ws.get(e);return ws.delete(e),t}function af(e){return typeof e=="string"||e&&typeof e=="object"}function Ao(e){return typeof e=="string"||typeof e=="symbol"}let ie=(function(e){return e[e.MATCHER_NOT_FOUND=1]="MATCHER_NOT_FOUND",e[e.NAVIGATION_GUARD_REDIRECT=2]="NAVIGATION_GUARD_REDIRECT",e[e.NAVIGATION_ABORTED=4]="NAVIGATION_ABORTED",e[e.NAVIGATION_CANCELLED=8]="NAVIGATION_CANCELLED",e[e.NAVIGATION_DUPLICATED=16]="NAVIGATION_DUPLICATED",e})({});const wo=Symbol("");ie.MATCHER_NOT_FOUND+"",ie.NAVIGATION_GUARD_REDIRECT+"",ie.NAVIGATION_ABORTED+"",ie.NAVIGATION_CANCELLED+"",ie.NAVIGATION_DUPLICATED+"";function Bt(e,t){return z(new Error,{type:e,[wo]:!0},t)}function Xe(e,t){return e instanceof Error&&wo in e&&(t==null||!!(e.type&t))}const df=["params","query","hash"];function hf(e){if(typeof e=="string")return e;if(e.path!=null)return e.path;const t={};for(const n of df)n in e&&(t[n]=e[n]);return JSON.stringify(t,null,2)}function pf(e){const t={};if(e===""||e==="?")return t;const n=(e[0]==="?"?e.slice(1):e).split("&");for(let s=0;s<n.length;++s){const r=n[s].replace(bo," "),i=r.indexOf("="),o=hn(i<0?r:r.slice(0,i)),l=i<0?null:hn(r.slice(i+1));if(o in t){let c=t[o];je(c)||(c=t[o]=[c]),c.push(l)}else t[o]=l}return t}function Hr(e){let t="";for(let n in e){const s=e[n];if(n=Ju(n),s==null){s!==void 0&&(t+=(t.length?"&":"")+n);continue}(je(s)?s.map(r=>r&&Rs(r)):[s&&Rs(s)]).forEach(r=>{r!==void 0&&(t+=(t.length?"&":"")+n,r!=null&&(t+="="+r))})}return t}function gf(e){const t={};for(const n in e){const s=e[n];s!==void 0&&(t[n]=je(s)?s.map(r=>r==null?null:""+r):s==null?s:""+s)}return t}const mf=Symbol(""),Br=Symbol(""),Js=Symbol(""),Co=Symbol(""),Cs=Symbol("");function $t(){let e=[];function t(s){return e.push(s),()=>{const r=e.indexOf(s);r>-1&&e.splice(r,1)}}function n(){e=[]}return{add:t,list:()=>e.slice(),reset:n}}function dt(e,t,n,s,r,i=o=>o()){const o=s&&(s.enterCallbacks[r]=s.enterCallbacks[r]||[]);return()=>new Promise((l,c)=>{const d=g=>{g===!1?c(Bt(ie.NAVIGATION_ABORTED,{from:n,to:t})):g instanceof Error?c(g):af(g)?c(Bt(ie.NAVIGATION_GUARD_REDIRECT,{from:t,to:g})):(o&&s.enterCallbacks[r]===o&&typeof g=="function"&&o.push(g),l())},f=i(()=>e.call(s&&s.instances[r],t,n,d));let h=Promise.resolve(f);e.length<3&&(h=h.then(d)),h.catch(g=>c(g))})}function as(e,t,n,s,r=i=>i()){const i=[];for(const o of e)for(const l in o.components){let c=o.components[l];if(!(t!=="beforeRouteEnter"&&!o.instances[l]))if(yo(c)){const d=(c.__vccOpts||c)[t];d&&i.push(dt(d,n,s,o,l,r))}else{let d=c();i.push(()=>d.then(f=>{if(!f)throw new Error(`Couldn't resolve component "${l}" at "${o.path}"`);const h=Fu(f)?f.default:f;o.mods[l]=f,o.components[l]=h;const g=(h.__vccOpts||h)[t];return g&&dt(g,n,s,o,l,r)()}))}}return i}function _f(e,t){const n=[],s=[],r=[],i=Math.max(t.matched.length,e.matched.length);for(let o=0;o<i;o++){const l=t.matched[o];l&&(e.matched.find(d=>Ht(d,l))?s.push(l):n.push(l));const c=e.matched[o];c&&(t.matched.find(d=>Ht(d,c))||r.push(c))}return[n,s,r]}let yf=()=>location.protocol+"//"+location.host;function Oo(e,t){const{pathname:n,search:s,hash:r}=t,i=e.indexOf("#");if(i>-1){let o=r.includes(e.slice(i))?e.slice(i).length:1,l=r.slice(o);return l[0]!=="/"&&(l="/"+l),jr(l,"")}return jr(n,e)+s+r}function vf(e,t,n,s){let r=[],i=[],o=null;const l=({state:g})=>{const m=Oo(e,location),R=n.value,O=t.value;let k=0;if(g){if(n.value=m,t.value=g,o&&o===R){o=null;return}k=O?g.position-O.position:0}else s(m);r.forEach(N=>{N(n.value,R,{delta:k,type:As.pop,direction:k?k>0?fs.forward:fs.back:fs.unknown})})};function c(){o=n.value}function d(g){r.push(g);const m=()=>{const R=r.indexOf(g);R>-1&&r.splice(R,1)};return i.push(m),m}function f(){if(document.visibilityState==="hidden"){const{history:g}=window;if(!g.state)return;g.replaceState(z({},g.state,{scroll:Qn()}),"")}}function h(){for(const g of i)g();i=[],window.removeEventListener("popstate",l),window.removeEventListener("pagehide",f),document.removeEventListener("visibilitychange",f)}return window.addEventListener("popstate",l),window.addEventListener("pagehide",f),document.addEventListener("visibilitychange",f),{pauseListeners:c,listen:d,destroy:h}}function Kr(e,t,n,s=!1,r=!1){return{back:e,current:t,forward:n,replaced:s,position:window.history.length,scroll:r?Qn():null}}function bf(e){const{history:t,location:n}=window,s={value:Oo(e,n)},r={value:t.state};r.value||i(s.value,{back:null,current:s.value,forward:null,position:t.length-1,replaced:!0,scroll:null},!0);function i(c,d,f){const h=e.indexOf("#"),g=h>-1?(n.host&&document.querySelector("base")?e:e.slice(h))+c:yf()+e+c;try{t[f?"replaceState":"pushState"](d,"",g),r.value=d}catch(m){console.error(m),n[f?"replace":"assign"](g)}}function o(c,d){i(c,z({},t.state,Kr(r.value.back,c,r.value.forward,!0),d,{position:r.value.position}),!0),s.value=c}function l(c,d){const f=z({},r.value,t.state,{forward:c,scroll:Qn()});i(f.current,f,!0),i(c,z({},Kr(s.value,c,null),{position:f.position+1},d),!1),s.value=c}return{location:s,state:r,push:l,replace:o}}function Ef(e){e=sf(e);const t=bf(e),n=vf(e,t.state,t.location,t.replace);function s(i,o=!0){o||n.pauseListeners(),history.go(i)}const r=z({location:"",base:e,go:s,createHref:of.bind(null,e)},t,n);return Object.defineProperty(r,"location",{enumerable:!0,get:()=>t.location.value}),Object.defineProperty(r,"state",{enumerable:!0,get:()=>t.state.value}),r}let Rt=(function(e){return e[e.Static=0]="Static",e[e.Param=1]="Param",e[e.Group=2]="Group",e})({});var ce=(function(e){return e[e.Static=0]="Static",e[e.Param=1]="Param",e[e.ParamRegExp=2]="ParamRegExp",e[e.ParamRegExpEnd=3]="ParamRegExpEnd",e[e.EscapeNext=4]="EscapeNext",e})(ce||{});const Sf={type:Rt.Static,value:""},xf=/[a-zA-Z0-9_]/;function Rf(e){if(!e)return[[]];if(e==="/")return[[Sf]];if(!e.startsWith("/"))throw new Error(`Invalid path "${e}"`);function t(m){throw new Error(`ERR (${n})/"${d}": ${m}`)}let n=ce.Static,s=n;const r=[];let i;function o(){i&&r.push(i),i=[]}let l=0,c,d="",f="";function h(){d&&(n===ce.Static?i.push({type:Rt.Static,value:d}):n===ce.Param||n===ce.ParamRegExp||n===ce.ParamRegExpEnd?(i.length>1&&(c==="*"||c==="+")&&t(`A repeatable param (${d}) must be alone in its segment. eg: '/:ids+.`),i.push({type:Rt.Param,value:d,regexp:f,repeatable:c==="*"||c==="+",optional:c==="*"||c==="?"})):t("Invalid state to consume buffer"),d="")}function g(){d+=c}for(;l<e.length;){if(c=e[l++],c==="\\"&&n!==ce.ParamRegExp){s=n,n=ce.EscapeNext;continue}switch(n){case ce.Static:c==="/"?(d&&h(),o()):c===":"?(h(),n=ce.Param):g();break;case ce.EscapeNext:g(),n=s;break;case ce.Param:c==="("?n=ce.ParamRegExp:xf.test(c)?g():(h(),n=ce.Static,c!=="*"&&c!=="?"&&c!=="+"&&l--);break;case ce.ParamRegExp:c===")"?f[f.length-1]=="\\"?f=f.slice(0,-1)+c:n=ce.ParamRegExpEnd:f+=c;break;case ce.ParamRegExpEnd:h(),n=ce.Static,c!=="*"&&c!=="?"&&c!=="+"&&l--,f="";break;default:t("Unknown state");break}}return n===ce.ParamRegExp&&t(`Unfinished custom RegExp for param "${d}"`),h(),o(),r}const Gr="[^/]+?",Af={sensitive:!1,strict:!1,start:!0,end:!0};var _e=(function(e){return e[e._multiplier=10]="_multiplier",e[e.Root=90]="Root",e[e.Segment=40]="Segment",e[e.SubSegment=30]="SubSegment",e[e.Static=40]="Static",e[e.Dynamic=20]="Dynamic",e[e.BonusCustomRegExp=10]="BonusCustomRegExp",e[e.BonusWildcard=-50]="BonusWildcard",e[e.BonusRepeatable=-20]="BonusRepeatable",e[e.BonusOptional=-8]="BonusOptional",e[e.BonusStrict=.7000000000000001]="BonusStrict",e[e.BonusCaseSensitive=.25]="BonusCaseSensitive",e})(_e||{});const wf=/[.+*?^${}()[\]/\\]/g;function Cf(e,t){const n=z({},Af,t),s=[];let r=n.start?"^":"";const i=[];for(const d of e){const f=d.length?[]:[_e.Root];n.strict&&!d.length&&(r+="/");for(let h=0;h<d.length;h++){const g=d[h];let m=_e.Segment+(n.sensitive?_e.BonusCaseSensitive:0);if(g.type===Rt.Static)h||(r+="/"),r+=g.value.replace(wf,"\\$&"),m+=_e.Static;else if(g.type===Rt.Param){const{value:R,repeatable:O,optional:k,regexp:N}=g;i.push({name:R,repeatable:O,optional:k});const I=N||Gr;if(I!==Gr){m+=_e.BonusCustomRegExp;try{`${I}`}catch(T){throw new Error(`Invalid custom RegExp for param "${R}" (${I}): `+T.message)}}let D=O?`((?:${I})(?:/(?:${I}))*)`:`(${I})`;h||(D=k&&d.length<2?`(?:/${D})`:"/"+D),k&&(D+="?"),r+=D,m+=_e.Dynamic,k&&(m+=_e.BonusOptional),O&&(m+=_e.BonusRepeatable),I===".*"&&(m+=_e.BonusWildcard)}f.push(m)}s.push(f)}if(n.strict&&n.end){const d=s.length-1;s[d][s[d].length-1]+=_e.BonusStrict}n.strict||(r+="/?"),n.end?r+="$":n.strict&&!r.endsWith("/")&&(r+="(?:/|$)");const o=new RegExp(r,n.sensitive?"":"i");function l(d){const f=d.match(o),h={};if(!f)return null;for(let g=1;g<f.length;g++){const m=f[g]||"",R=i[g-1];h[R.name]=m&&R.repeatable?m.split("/"):m}return h}function c(d){let f="",h=!1;for(const g of e){(!h||!f.endsWith("/"))&&(f+="/"),h=!1;for(const m of g)if(m.type===Rt.Static)f+=m.value;else if(m.type===Rt.Param){const{value:R,repeatable:O,optional:k}=m,N=R in d?d[R]:"";if(je(N)&&!O)throw new Error(`Provided param "${R}" is an array but it is not repeatable (* or + modifiers)`);const I=je(N)?N.join("/"):N;if(!I)if(k)g.length<2&&(f.endsWith("/")?f=f.slice(0,-1):h=!0);else throw new Error(`Missing required param "${R}"`);f+=I}}return f||"/"}return{re:o,score:s,keys:i,parse:l,stringify:c}}function Of(e,t){let n=0;for(;n<e.length&&n<t.length;){const s=t[n]-e[n];if(s)return s;n++}return e.length<t.length?e.length===1&&e[0]===_e.Static+_e.Segment?-1:1:e.length>t.length?t.length===1&&t[0]===_e.Static+_e.Segment?1:-1:0}function Po(e,t){let n=0;const s=e.score,r=t.score;for(;n<s.length&&n<r.length;){const i=Of(s[n],r[n]);if(i)return i;n++}if(Math.abs(r.length-s.length)===1){if(Wr(s))return 1;if(Wr(r))return-1}return r.length-s.length}function Wr(e){const t=e[e.length-1];return e.length>0&&t[t.length-1]<0}const Pf={strict:!1,end:!0,sensitive:!1};function If(e,t,n){const s=Cf(Rf(e.path),n),r=z(s,{record:e,parent:t,children:[],alias:[]});return t&&!r.record.aliasOf==!t.record.aliasOf&&t.children.push(r),r}function Tf(e,t){const n=[],s=new Map;t=Fr(Pf,t);function r(h){return s.get(h)}function i(h,g,m){const R=!m,O=$r(h);O.aliasOf=m&&m.record;const k=Fr(t,h),N=[O];if("alias"in h){const T=typeof h.alias=="string"?[h.alias]:h.alias;for(const B of T)N.push($r(z({},O,{components:m?m.record.components:O.components,path:B,aliasOf:m?m.record:O})))}let I,D;for(const T of N){const{path:B}=T;if(g&&B[0]!=="/"){const ue=g.record.path,Y=ue[ue.length-1]==="/"?"":"/";T.path=g.record.path+(B&&Y+B)}if(I=If(T,g,k),m?m.alias.push(I):(D=D||I,D!==I&&D.alias.push(I),R&&h.name&&!Jr(I)&&o(h.name)),Io(I)&&c(I),O.children){const ue=O.children;for(let Y=0;Y<ue.length;Y++)i(ue[Y],I,m&&m.children[Y])}m=m||I}return D?()=>{o(D)}:on}function o(h){if(Ao(h)){const g=s.get(h);g&&(s.delete(h),n.splice(n.indexOf(g),1),g.children.forEach(o),g.alias.forEach(o))}else{const g=n.indexOf(h);g>-1&&(n.splice(g,1),h.record.name&&s.delete(h.record.name),h.children.forEach(o),h.alias.forEach(o))}}function l(){return n}function c(h){const g=Mf(h,n);n.splice(g,0,h),h.record.name&&!Jr(h)&&s.set(h.record.name,h)}function d(h,g){let m,R={},O,k;if("name"in h&&h.name){if(m=s.get(h.name),!m)throw Bt(ie.MATCHER_NOT_FOUND,{location:h});k=m.record.name,R=z(qr(g.params,m.keys.filter(D=>!D.optional).concat(m.parent?m.parent.keys.filter(D=>D.optional):[]).map(D=>D.name)),h.params&&qr(h.params,m.keys.map(D=>D.name))),O=m.stringify(R)}else if(h.path!=null)O=h.path,m=n.find(D=>D.re.test(O)),m&&(R=m.parse(O),k=m.record.name);else{if(m=g.name?s.get(g.name):n.find(D=>D.re.test(g.path)),!m)throw Bt(ie.MATCHER_NOT_FOUND,{location:h,currentLocation:g});k=m.record.name,R=z({},g.params,h.params),O=m.stringify(R)}const N=[];let I=m;for(;I;)N.unshift(I.record),I=I.parent;return{name:k,path:O,params:R,matched:N,meta:Df(N)}}e.forEach(h=>i(h));function f(){n.length=0,s.clear()}return{addRoute:i,resolve:d,removeRoute:o,clearRoutes:f,getRoutes:l,getRecordMatcher:r}}function qr(e,t){const n={};for(const s of t)s in e&&(n[s]=e[s]);return n}function $r(e){const t={path:e.path,redirect:e.redirect,name:e.name,meta:e.meta||{},aliasOf:e.aliasOf,beforeEnter:e.beforeEnter,props:Nf(e),children:e.children||[],instances:{},leaveGuards:new Set,updateGuards:new Set,enterCallbacks:{},components:"components"in e?e.components||null:e.component&&{default:e.component}};return Object.defineProperty(t,"mods",{value:{}}),t}function Nf(e){const t={},n=e.props||!1;if("component"in e)t.default=n;else for(const s in e.components)t[s]=typeof n=="object"?n[s]:n;return t}function Jr(e){for(;e;){if(e.record.aliasOf)return!0;e=e.parent}return!1}function Df(e){return e.reduce((t,n)=>z(t,n.meta),{})}function Mf(e,t){let n=0,s=t.length;for(;n!==s;){const i=n+s>>1;Po(e,t[i])<0?s=i:n=i+1}const r=Lf(e);return r&&(s=t.lastIndexOf(r,s-1)),s}function Lf(e){let t=e;for(;t=t.parent;)if(Io(t)&&Po(e,t)===0)return t}function Io({record:e}){return!!(e.name||e.components&&Object.keys(e.components).length||e.redirect)}function zr(e){const t=$e(Js),n=$e(Co),s=Te(()=>{const c=Vt(e.to);return t.resolve(c)}),r=Te(()=>{const{matched:c}=s.value,{length:d}=c,f=c[d-1],h=n.matched;if(!f||!h.length)return-1;const g=h.findIndex(Ht.bind(null,f));if(g>-1)return g;const m=Qr(c[d-2]);return d>1&&Qr(f)===m&&h[h.length-1].path!==m?h.findIndex(Ht.bind(null,c[d-2])):g}),i=Te(()=>r.value>-1&&kf(n.params,s.value.params)),o=Te(()=>r.value>-1&&r.value===n.matched.length-1&&Ro(n.params,s.value.params));function l(c={}){if(Uf(c)){const d=t[Vt(e.replace)?"replace":"push"](Vt(e.to)).catch(on);return e.viewTransition&&typeof document<"u"&&"startViewTransition"in document&&document.startViewTransition(()=>d),d}return Promise.resolve()}return{route:s,href:Te(()=>s.value.href),isActive:i,isExactActive:o,navigate:l}}function Vf(e){return e.length===1?e[0]:e}const Ff=Mi({name:"RouterLink",compatConfig:{MODE:3},props:{to:{type:[String,Object],required:!0},replace:Boolean,activeClass:String,exactActiveClass:String,custom:Boolean,ariaCurrentValue:{type:String,default:"page"},viewTransition:Boolean},useLink:zr,setup(e,{slots:t}){const n=mn(zr(e)),{options:s}=$e(Js),r=Te(()=>({[Yr(e.activeClass,s.linkActiveClass,"router-link-active")]:n.isActive,[Yr(e.exactActiveClass,s.linkExactActiveClass,"router-link-exact-active")]:n.isExactActive}));return()=>{const i=t.default&&Vf(t.default(n));return e.custom?i:uo("a",{"aria-current":n.isExactActive?e.ariaCurrentValue:null,href:n.href,onClick:n.navigate,class:r.value},i)}}}),jf=Ff;function Uf(e){if(!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)&&!e.defaultPrevented&&!(e.button!==void 0&&e.button!==0)){if(e.currentTarget&&e.currentTarget.getAttribute){const t=e.currentTarget.getAttribute("target");if(/\b_blank\b/i.test(t))return}return e.preventDefault&&e.preventDefault(),!0}}function kf(e,t){for(const n in t){const s=t[n],r=e[n];if(typeof s=="string"){if(s!==r)return!1}else if(!je(r)||r.length!==s.length||s.some((i,o)=>i!==r[o]))return!1}return!0}function Qr(e){return e?e.aliasOf?e.aliasOf.path:e.path:""}const Yr=(e,t,n)=>e??t??n,Hf=Mi({name:"RouterView",inheritAttrs:!1,props:{name:{type:String,default:"default"},route:Object},compatConfig:{MODE:3},setup(e,{attrs:t,slots:n}){const s=$e(Cs),r=Te(()=>e.route||s.value),i=$e(Br,0),o=Te(()=>{let d=Vt(i);const{matched:f}=r.value;let h;for(;(h=f[d])&&!h.components;)d++;return d}),l=Te(()=>r.value.matched[o.value]);xn(Br,Te(()=>o.value+1)),xn(mf,l),xn(Cs,r);const c=jt();return nn(()=>[c.value,l.value,e.name],([d,f,h],[g,m,R])=>{f&&(f.instances[h]=d,m&&m!==f&&d&&d===g&&(f.leaveGuards.size||(f.leaveGuards=m.leaveGuards),f.updateGuards.size||(f.updateGuards=m.updateGuards))),d&&f&&(!m||!Ht(f,m)||!g)&&(f.enterCallbacks[h]||[]).forEach(O=>O(d))},{flush:"post"}),()=>{const d=r.value,f=e.name,h=l.value,g=h&&h.components[f];if(!g)return Xr(n.default,{Component:g,route:d});const m=h.props[f],R=m?m===!0?d.params:typeof m=="function"?m(d):m:null,k=uo(g,z({},R,t,{onVnodeUnmounted:N=>{N.component.isUnmounted&&(h.instances[f]=null)},ref:c}));return Xr(n.default,{Component:k,route:d})||k}}});function Xr(e,t){if(!e)return null;const n=e(t);return n.length===1?n[0]:n}const Bf=Hf;function Kf(e){const t=Tf(e.routes,e),n=e.parseQuery||pf,s=e.stringifyQuery||Hr,r=e.history,i=$t(),o=$t(),l=$t(),c=ul(ct);let d=ct;Dt&&e.scrollBehavior&&"scrollRestoration"in history&&(history.scrollRestoration="manual");const f=cs.bind(null,v=>""+v),h=cs.bind(null,Qu),g=cs.bind(null,hn);function m(v,P){let w,M;return Ao(v)?(w=t.getRecordMatcher(v),M=P):M=v,t.addRoute(M,w)}function R(v){const P=t.getRecordMatcher(v);P&&t.removeRoute(P)}function O(){return t.getRoutes().map(v=>v.record)}function k(v){return!!t.getRecordMatcher(v)}function N(v,P){if(P=z({},P||c.value),typeof v=="string"){const p=us(n,v,P.path),y=t.resolve({path:p.path},P),b=r.createHref(p.fullPath);return z(p,y,{params:g(y.params),hash:hn(p.hash),redirectedFrom:void 0,href:b})}let w;if(v.path!=null)w=z({},v,{path:us(n,v.path,P.path).path});else{const p=z({},v.params);for(const y in p)p[y]==null&&delete p[y];w=z({},v,{params:h(p)}),P.params=h(P.params)}const M=t.resolve(w,P),W=v.hash||"";M.params=f(g(M.params));const u=Zu(s,z({},v,{hash:$u(W),path:M.path})),a=r.createHref(u);return z({fullPath:u,hash:W,query:s===Hr?gf(v.query):v.query||{}},M,{redirectedFrom:void 0,href:a})}function I(v){return typeof v=="string"?us(n,v,c.value.path):z({},v)}function D(v,P){if(d!==v)return Bt(ie.NAVIGATION_CANCELLED,{from:P,to:v})}function T(v){return Y(v)}function B(v){return T(z(I(v),{replace:!0}))}function ue(v,P){const w=v.matched[v.matched.length-1];if(w&&w.redirect){const{redirect:M}=w;let W=typeof M=="function"?M(v,P):M;return typeof W=="string"&&(W=W.includes("?")||W.includes("#")?W=I(W):{path:W},W.params={}),z({query:v.query,hash:v.hash,params:W.path!=null?{}:v.params},W)}}function Y(v,P){const w=d=N(v),M=c.value,W=v.state,u=v.force,a=v.replace===!0,p=ue(w,M);if(p)return Y(z(I(p),{state:typeof p=="object"?z({},W,p.state):W,force:u,replace:a}),P||w);const y=w;y.redirectedFrom=P;let b;return!u&&ef(s,M,w)&&(b=Bt(ie.NAVIGATION_DUPLICATED,{to:y,from:M}),Ue(M,M,!0,!1)),(b?Promise.resolve(b):re(y,M)).catch(_=>Xe(_)?Xe(_,ie.NAVIGATION_GUARD_REDIRECT)?_:lt(_):J(_,y,M)).then(_=>{if(_){if(Xe(_,ie.NAVIGATION_GUARD_REDIRECT))return Y(z({replace:a},I(_.to),{state:typeof _.to=="object"?z({},W,_.to.state):W,force:u}),P||y)}else _=Re(y,M,!0,a,W);return ge(y,M,_),_})}function K(v,P){const w=D(v,P);return w?Promise.reject(w):Promise.resolve()}function G(v){const P=Pt.values().next().value;return P&&typeof P.runWithContext=="function"?P.runWithContext(v):v()}function re(v,P){let w;const[M,W,u]=_f(v,P);w=as(M.reverse(),"beforeRouteLeave",v,P);for(const p of M)p.leaveGuards.forEach(y=>{w.push(dt(y,v,P))});const a=K.bind(null,v,P);return w.push(a),Ie(w).then(()=>{w=[];for(const p of i.list())w.push(dt(p,v,P));return w.push(a),Ie(w)}).then(()=>{w=as(W,"beforeRouteUpdate",v,P);for(const p of W)p.updateGuards.forEach(y=>{w.push(dt(y,v,P))});return w.push(a),Ie(w)}).then(()=>{w=[];for(const p of u)if(p.beforeEnter)if(je(p.beforeEnter))for(const y of p.beforeEnter)w.push(dt(y,v,P));else w.push(dt(p.beforeEnter,v,P));return w.push(a),Ie(w)}).then(()=>(v.matched.forEach(p=>p.enterCallbacks={}),w=as(u,"beforeRouteEnter",v,P,G),w.push(a),Ie(w))).then(()=>{w=[];for(const p of o.list())w.push(dt(p,v,P));return w.push(a),Ie(w)}).catch(p=>Xe(p,ie.NAVIGATION_CANCELLED)?p:Promise.reject(p))}function ge(v,P,w){l.list().forEach(M=>G(()=>M(v,P,w)))}function Re(v,P,w,M,W){const u=D(v,P);if(u)return u;const a=P===ct,p=Dt?history.state:{};w&&(M||a?r.replace(v.fullPath,z({scroll:a&&p&&p.scroll},W)):r.push(v.fullPath,W)),c.value=v,Ue(v,P,w,a),lt()}let be;function yt(){be||(be=r.listen((v,P,w)=>{if(!vt.listening)return;const M=N(v),W=ue(M,vt.currentRoute.value);if(W){Y(z(W,{replace:!0,force:!0}),M).catch(on);return}d=M;const u=c.value;Dt&&uf(kr(u.fullPath,w.delta),Qn()),re(M,u).catch(a=>Xe(a,ie.NAVIGATION_ABORTED|ie.NAVIGATION_CANCELLED)?a:Xe(a,ie.NAVIGATION_GUARD_REDIRECT)?(Y(z(I(a.to),{force:!0}),M).then(p=>{Xe(p,ie.NAVIGATION_ABORTED|ie.NAVIGATION_DUPLICATED)&&!w.delta&&w.type===As.pop&&r.go(-1,!1)}).catch(on),Promise.reject()):(w.delta&&r.go(-w.delta,!1),J(a,M,u))).then(a=>{a=a||Re(M,u,!1),a&&(w.delta&&!Xe(a,ie.NAVIGATION_CANCELLED)?r.go(-w.delta,!1):w.type===As.pop&&Xe(a,ie.NAVIGATION_ABORTED|ie.NAVIGATION_DUPLICATED)&&r.go(-1,!1)),ge(M,u,a)}).catch(on)}))}let ot=$t(),se=$t(),H;function J(v,P,w){lt(v);const M=se.list();return M.length?M.forEach(W=>W(v,P,w)):console.error(v),Promise.reject(v)}function Qe(){return H&&c.value!==ct?Promise.resolve():new Promise((v,P)=>{ot.add([v,P])})}function lt(v){return H||(H=!v,yt(),ot.list().forEach(([P,w])=>v?w(v):P()),ot.reset()),v}function Ue(v,P,w,M){const{scrollBehavior:W}=e;if(!Dt||!W)return Promise.resolve();const u=!w&&ff(kr(v.fullPath,0))||(M||!w)&&history.state&&history.state.scroll||null;return Gn().then(()=>W(v,P,u)).then(a=>a&&cf(a)).catch(a=>J(a,v,P))}const Ee=v=>r.go(v);let Ot;const Pt=new Set,vt={currentRoute:c,listening:!0,addRoute:m,removeRoute:R,clearRoutes:t.clearRoutes,hasRoute:k,getRoutes:O,resolve:N,options:e,push:T,replace:B,go:Ee,back:()=>Ee(-1),forward:()=>Ee(1),beforeEach:i.add,beforeResolve:o.add,afterEach:l.add,onError:se.add,isReady:Qe,install(v){v.component("RouterLink",jf),v.component("RouterView",Bf),v.config.globalProperties.$router=vt,Object.defineProperty(v.config.globalProperties,"$route",{enumerable:!0,get:()=>Vt(c)}),Dt&&!Ot&&c.value===ct&&(Ot=!0,T(r.location).catch(M=>{}));const P={};for(const M in ct)Object.defineProperty(P,M,{get:()=>c.value[M],enumerable:!0});v.provide(Js,vt),v.provide(Co,Ri(P)),v.provide(Cs,c);const w=v.unmount;Pt.add(v),v.unmount=function(){Pt.delete(v),Pt.size<1&&(d=ct,be&&be(),be=null,c.value=ct,Ot=!1,H=!1),w()}}};function Ie(v){return v.reduce((P,w)=>P.then(()=>G(w)),Promise.resolve())}return vt}const Gf=Kf({history:Ef("/front/"),routes:[{name:"dashboard",props:!1,component:()=>St(()=>import("./DashboardView-DGB-Tnma.js"),__vite__mapDeps([0,1,2,3]))},{name:"orderCreation",props:!1,component:()=>St(()=>import("./OrderCreation-BFuxMzy3.js"),__vite__mapDeps([4,5,1,2,6]))},{name:"inventory",props:!1,component:()=>St(()=>import("./InventoryView-DNBNrsgu.js"),__vite__mapDeps([7,5,1,8]))},{name:"Reports and analyse",propse:!1,component:()=>St(()=>import("./RapportView-CmTJorgL.js"),__vite__mapDeps([9,10]))},{name:"digital carts",props:!1,component:()=>St(()=>import("./DigitalCarts-9inRqxYa.js"),__vite__mapDeps([11,5,1,12]))},{name:"chat",props:!1,component:()=>St(()=>import("./ChatView-dJGv8r71.js"),__vite__mapDeps([13,14]))},{name:"checklist",props:!1,component:()=>St(()=>import("./ChecklistView-CeLgIAnn.js"),__vite__mapDeps([15,16]))}]}),To=e=>{const t=e==="dark"?"dark":"light";return document.documentElement.setAttribute("data-theme",t),localStorage.setItem("theme",t),t};To(localStorage.getItem("theme")||"light");window.toggleTheme=e=>{const t=document.documentElement.getAttribute("data-theme")==="dark"?"dark":"light";To(e||(t==="dark"?"light":"dark"))};const zs=su(Mu);zs.use(ou());zs.use(Gf);zs.mount("#app");export{Ve as F,_o as _,ji as a,Me as b,Te as c,Le as d,gr as e,or as f,Ce as g,bc as h,hu as i,Sl as j,Xc as k,$f as l,du as m,Hn as n,Il as o,Wf as p,ve as q,jt as r,Gn as s,Jt as t,Vt as u,qf as v,Jf as w};
@@ -0,0 +1,74 @@
+import asyncio
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from Application.backend.core.profiler import ProfilerBusyError, format_collapsed, profiler
+from Application.backend.core.database import get_primary_session
+from Application.backend.core.request_metrics import request_metrics
+from Application.backend.core.security import require_admin
+from Application.backend.services.analytics_service import backfill_waste_rollups
+
+router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/profile", response_class=PlainTextResponse, summary="Profile all threads")
+async def profile(
+    seconds: float = Query(10.0, gt=0, le=120, description="Duration of the profile in seconds"),
+    interval_ms: float = Query(5.0, ge=1, le=1000, description="Milliseconds between two samples"),
+):
+    """
+    Sample the stacks of all threads of this process for a while.
+
+    Covers the event loop, the thread pool and the Camunda worker threads. The
+    sampler runs in its own thread, so the app keeps serving requests (and is
+    profiled doing so). Requires the `X-Admin-Token` header.
+
+    - **seconds**: Duration of the profile.
+    - **interval_ms**: Sampling interval.
+
+    Returns collapsed stacks (`thread;frame;...;frame count` per line), ready for
+    `flamegraph.pl` or speedscope. Responds with 409 while another profile runs.
+    """
+    try:
+        stacks, rounds = await asyncio.to_thread(profiler.profile, seconds, interval_ms / 1000)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return PlainTextResponse(format_collapsed(stacks), headers={"X-Profile-Samples": str(rounds)})
+
+
+@router.delete("/metrics", summary="Reset request latency metrics")
+async def reset_metrics():
+    """
+    Reset the request statistics of this process, e.g. before a load test.
+
+    Requires the `X-Admin-Token` header.
+
+    Returns a confirmation message.
+    """
+    request_metrics.reset()
+    return {"message": "Metrics reset"}
+
+
+@router.post("/analytics/backfill", summary="Rebuild the waste rollups from the cart history")
+async def backfill_analytics(
+    start: Optional[date] = Query(None, description="First operation date, all history if omitted"),
+    end: Optional[date] = Query(None, description="Last operation date"),
+    session: AsyncSession = Depends(get_primary_session),
+):
+    """
+    Recompute the dispensed and expired daily rollups from the existing cart items.
+
+    Needed once for carts created before the rollups existed; safe to repeat.
+    Requires the `X-Admin-Token` header.
+
+    - **start**: First operation date to recompute.
+    - **end**: Last operation date to recompute.
+
+    Returns the number of rollup rows written.
+    """
+    written = await backfill_waste_rollups(session, start, end)
+    return {"detail": f"{written} rollup rows written"}
@@ -0,0 +1,60 @@
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from Application.backend.core.database import get_session
+from Application.backend.models.analytics import WasteDailyReport, WasteDimension, WasteReport
+from Application.backend.services.analytics_service import get_daily_waste, get_waste_report
+
+router = APIRouter(prefix="/analytics", tags=["Analytics"])
+
+
+def _check_range(start: date, end: date) -> None:
+    if end < start:
+        raise HTTPException(status_code=422, detail="'end' must not be before 'start'")
+
+
+@router.get("/waste", response_model=List[WasteReport], summary="Medication waste per medication, operation or room")
+async def waste_report(
+    start: date = Query(..., description="First operation date (inclusive)"),
+    end: date = Query(..., description="Last operation date (inclusive)"),
+    group_by: WasteDimension = Query(WasteDimension.medication, description="Dimension to group by"),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    Report dispensed, returned and expired amounts of a date range, read from the daily rollups.
+
+    - **start**: First operation date (inclusive).
+    - **end**: Last operation date (inclusive).
+    - **group_by**: `medication`, `operation` or `room`.
+    - **session**: Async database session (automatically injected).
+
+    Returns a list of `WasteReport` objects, most expired first.
+    """
+    _check_range(start, end)
+    return await get_waste_report(session, group_by, start, end)
+
+
+@router.get("/waste/daily", response_model=List[WasteDailyReport], summary="Medication waste per day")
+async def daily_waste_report(
+    start: date = Query(..., description="First operation date (inclusive)"),
+    end: date = Query(..., description="Last operation date (inclusive)"),
+    group_by: WasteDimension = Query(WasteDimension.medication, description="Dimension `key` refers to"),
+    key: Optional[str] = Query(None, description="Only this medication ID, operation type or room"),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    Report dispensed, returned and expired amounts per day of a date range, read from the daily rollups.
+
+    - **start**: First operation date (inclusive).
+    - **end**: Last operation date (inclusive).
+    - **group_by**: Dimension `key` refers to.
+    - **key**: Only this medication ID, operation type or room; all of them if omitted.
+    - **session**: Async database session (automatically injected).
+
+    Returns a list of `WasteDailyReport` objects ordered by day.
+    """
+    _check_range(start, end)
+    return await get_daily_waste(session, group_by, start, end, key)
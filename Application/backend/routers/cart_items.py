@@ -1,6 +1,6 @@
 from typing import List
 
-from fastapi import APIRouter, Body, Depends, Path
+from fastapi import APIRouter, Body, Depends, Path, Query
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from Application.backend.core.database import get_session
@@ -15,6 +15,7 @@ from Application.backend.services.cart_item_service import (
     get_all_cart_items,
     get_cart_contents,
     get_expiring_items,
+    get_unstable_items,
     remove_cart_item,
 )
 
@@ -45,6 +46,24 @@ async def list_expiring_items(session: AsyncSession = Depends(get_session)):
     return await get_expiring_items(session)
 
 
+@router.get("/unstable", response_model=List[CartItem], summary="List prepared items losing stability")
+async def list_unstable_items(
+    minutes: int = Query(60, ge=0, description="Window from now in minutes"),
+    include_expired: bool = Query(False, description="Also list items whose stability already ended"),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    Retrieve prepared (time-sensitive) cart items whose chemical stability ends within `minutes`.
+
+    - **minutes**: Window from now in minutes.
+    - **include_expired**: Also list items whose stability already ended.
+    - **session**: Async database session (automatically injected).
+
+    Returns a list of `CartItem` objects ordered by `stable_until`.
+    """
+    return await get_unstable_items(session, minutes, include_expired)
+
+
 @router.get(
     "/cart/{cart_id}",
     response_model=List[CartItem],
@@ -1,13 +1,15 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Body, Depends, Path, HTTPException
+from fastapi import APIRouter, Body, Depends, Header, Path, HTTPException, Response
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from Application.backend.core.concurrency import parse_if_match, set_etag
 from Application.backend.core.database import get_session
-from Application.backend.models.cart import CART_EXAMPLE, Cart, CartCreate, CartStatus
+from Application.backend.models.cart import CART_EXAMPLE, Cart, CartAvailability, CartCreate, CartStatus
 from Application.backend.services.cart_service import (
     add_cart,
     get_all_carts,
+    get_available_cart,
     update_cart_status,
     remove_cart,
 )
@@ -27,6 +29,18 @@ async def list_carts(session: AsyncSession = Depends(get_session)):
     return await get_all_carts(session)
 
 
+@router.get("/available", response_model=CartAvailability, summary="Check for a prepared cart")
+async def check_available_cart(session: AsyncSession = Depends(get_session)):
+    """
+    Check whether a cart in `Prepared` state is available.
+
+    - **session**: Async database session (automatically injected).
+
+    Returns `available` and the `cart_id` of the first prepared cart, if any.
+    """
+    return await get_available_cart(session)
+
+
 @router.post("/", response_model=Cart, summary="Create a new cart")
 async def create_cart(
     cart: CartCreate = Body(..., example=CART_EXAMPLE, description="Data for the cart to create"),
@@ -45,8 +59,10 @@ async def create_cart(
 
 @router.patch("/{cart_id}/status", response_model=Cart, summary="Update cart status")
 async def change_cart_status(
+    response: Response,
     cart_id: int = Path(..., description="ID of the cart to update"),
     new_status: CartStatus = Body(..., embed=True, description="New status for the cart"),
+    if_match: Optional[str] = Header(None, description="ETag of the version the update is based on"),
     session: AsyncSession = Depends(get_session),
 ):
     """
@@ -54,11 +70,15 @@ async def change_cart_status(
 
     - **cart_id**: ID of the cart to update.
     - **new_status**: New status for the cart (`Prepared`, `In-Use`, or `Closed`).
+    - **If-Match**: Optional ETag; the update only applies if the cart still has this version.
     - **session**: Async database session (automatically injected).
 
-    Returns the updated `Cart`.
+    Returns the updated `Cart` with its new version as `ETag`. Raises 412 if `If-Match` is stale,
+    409 if moving to `In-Use` and the stock of expired holds was promised to other carts.
     """
-    return await update_cart_status(session, cart_id, new_status)
+    cart = await update_cart_status(session, cart_id, new_status, parse_if_match(if_match))
+    set_etag(response, cart.version)
+    return cart
 
 
 @router.delete("/{cart_id}", summary="Delete a cart")
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from Application.backend.core.database import get_session
+from Application.backend.models.dashboard import DashboardSummary
+from Application.backend.services.dashboard_service import dashboard_cache
+
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+
+
+@router.get("/summary", response_model=DashboardSummary, summary="Dashboard summary")
+async def dashboard_summary(session: AsyncSession = Depends(get_session)):
+    """
+    Summarize carts, stock and orders for the dashboard in one query.
+
+    - **session**: Async database session (automatically injected).
+
+    Returns cart counts by status, inventory items below their minimum stock,
+    batches expiring within `DASHBOARD_EXPIRY_DAYS` and orders dated today or
+    later, each list limited to `DASHBOARD_LIST_LIMIT` entries with a total count.
+    Cached for a few seconds and refreshed after writes.
+    """
+    return await dashboard_cache.get(session)
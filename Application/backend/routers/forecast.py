@@ -0,0 +1,62 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Body, Depends, Query
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from Application.backend.core.database import get_session
+from Application.backend.models.forecast import MinStockApplyRequest, MinStockRecommendation
+from Application.backend.services.forecast_service import (
+    FORECAST_HISTORY_DAYS,
+    FORECAST_LEAD_TIME_DAYS,
+    FORECAST_SERVICE_LEVEL,
+    apply_min_stock_recommendations,
+    get_min_stock_recommendations,
+)
+
+router = APIRouter(prefix="/forecast", tags=["Forecast"])
+
+
+@router.get("/min-stock", response_model=List[MinStockRecommendation], summary="Recommend minimum stock levels")
+async def recommend_min_stock(
+    history_days: int = Query(FORECAST_HISTORY_DAYS, ge=2, le=3650, description="Days of history to base the forecast on"),
+    lead_time_days: float = Query(FORECAST_LEAD_TIME_DAYS, ge=0, description="Days from order to delivery"),
+    service_level: float = Query(FORECAST_SERVICE_LEVEL, gt=0, lt=1, description="Probability of not running out"),
+    medication_id: Optional[str] = Query(None, description="Only this medication"),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    Forecast the consumption of every medication per location and derive reorder points.
+
+    - **history_days**: Days of cart consumption and order history, ending yesterday.
+    - **lead_time_days**: Days from order to delivery.
+    - **service_level**: Probability of not running out before a delivery.
+    - **medication_id**: Only this medication; the whole catalog if omitted.
+    - **session**: Async database session (automatically injected).
+
+    Returns a list of `MinStockRecommendation` objects for the inventory items whose location consumed the medication.
+    """
+    return await get_min_stock_recommendations(session, history_days, lead_time_days, service_level, medication_id)
+
+
+@router.post("/min-stock/apply", summary="Apply the recommended minimum stock levels")
+async def apply_min_stock(
+    request: MinStockApplyRequest = Body(MinStockApplyRequest(), description="Inventory items to update"),
+    history_days: int = Query(FORECAST_HISTORY_DAYS, ge=2, le=3650, description="Days of history to base the forecast on"),
+    lead_time_days: float = Query(FORECAST_LEAD_TIME_DAYS, ge=0, description="Days from order to delivery"),
+    service_level: float = Query(FORECAST_SERVICE_LEVEL, gt=0, lt=1, description="Probability of not running out"),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    Recompute the recommendations and write them to the inventory items' `min_stock` in one batched update.
+
+    - **request**: Optional list of inventory IDs to update; all recommended items if omitted.
+    - **history_days**: Days of cart consumption and order history, ending yesterday.
+    - **lead_time_days**: Days from order to delivery.
+    - **service_level**: Probability of not running out before a delivery.
+    - **session**: Async database session (automatically injected).
+
+    Returns the number of updated inventory items.
+    """
+    recommendations = await get_min_stock_recommendations(session, history_days, lead_time_days, service_level)
+    updated = await apply_min_stock_recommendations(session, recommendations, request.inventory_ids)
+    return {"updated": updated}
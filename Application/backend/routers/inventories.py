@@ -1,17 +1,22 @@
-from fastapi import APIRouter, Depends, Body, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, Body, Header, HTTPException, Response
+from typing import List, Optional
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from Application.backend.models.inventory import Inventory, InventoryCreate, INVENTORY_POST_EXAMPLE
+from Application.backend.models.inventory import Inventory, InventoryAvailability, InventoryCreate, StockLevel, INVENTORY_POST_EXAMPLE
 from Application.backend.services.inventory_service import (
     get_all_inventory,
+    get_inventory_by_id,
     get_inventory_by_medication,
+    get_stock_level,
     add_inventory,
     update_inventory_amount,
     delete_inventory,
     delete_all_inventory,
 )
-from Application.backend.core.database import get_session
+from Application.backend.services.low_stock_index import low_stock_index
+from Application.backend.services.reservation_service import get_availability_by_medication
+from Application.backend.core.concurrency import parse_if_match, set_etag
+from Application.backend.core.database import get_primary_session, get_session
 
 router = APIRouter(prefix="/inventory", tags=["Inventory"])
 
@@ -26,6 +31,18 @@ async def list_inventory(session: AsyncSession = Depends(get_session)):
     return await get_all_inventory(session)
 
 
+@router.get("/low-stock", response_model=List[StockLevel], summary="List medications below their minimum stock")
+async def list_low_stock():
+    """
+    Retrieve the medications whose total stock across all batches is below their minimum stock.
+
+    Served from an index maintained on every inventory change, without querying the database.
+
+    Returns a list of `StockLevel` objects, lowest relative stock first.
+    """
+    return low_stock_index.low_stock()
+
+
 @router.get("/{medication_id}", response_model=List[Inventory], summary="List inventory by medication ID")
 async def list_inventory_by_medication(
     medication_id: str,
@@ -41,6 +58,69 @@ async def list_inventory_by_medication(
     return await get_inventory_by_medication(session, medication_id)
 
 
+@router.get(
+    "/{medication_id}/availability",
+    response_model=List[InventoryAvailability],
+    summary="Available-to-promise stock by medication ID",
+)
+async def list_availability_by_medication(
+    medication_id: str,
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Retrieve the stock of each batch of a medication that can still be promised to carts.
+
+    - **medication_id**: ID of the medication to filter by.
+
+    Returns a list of `InventoryAvailability` objects: stock `amount`, `held` by
+    prepared carts and `available` (stock minus active holds).
+    """
+    return await get_availability_by_medication(session, medication_id)
+
+
+@router.get("/{medication_id}/stock-level", response_model=StockLevel, summary="Total stock of a medication")
+async def read_stock_level(
+    medication_id: str,
+    # Read by the reorder decision, so it must not lag behind on a replica
+    session: AsyncSession = Depends(get_primary_session),
+):
+    """
+    Retrieve the total stock of a medication across all batches and its minimum stock.
+
+    - **medication_id**: ID of the medication.
+
+    Raises:
+        HTTPException 404 if the medication has no inventory.
+
+    Returns the `StockLevel` of the medication.
+    """
+    level = await get_stock_level(session, medication_id)
+    if level is None:
+        raise HTTPException(status_code=404, detail=f"No inventory for medication '{medication_id}'")
+    return level
+
+
+@router.get("/items/{inventory_id}", response_model=Inventory, summary="Get an inventory item")
+async def read_inventory_item(
+    inventory_id: int,
+    response: Response,
+    # Read before a conditional update, so the version must not lag behind on a replica
+    session: AsyncSession = Depends(get_primary_session),
+):
+    """
+    Retrieve a single inventory item by its ID.
+
+    - **inventory_id**: ID of the inventory item.
+
+    Returns the `Inventory` object with its version as `ETag`. Raises 404 if item does not exist.
+    """
+    item = await get_inventory_by_id(session, inventory_id)
+    if item is None:
+        raise HTTPException(status_code=404, detail="Inventory item not found")
+    set_etag(response, item.version)
+    return item
+
+
 @router.post("/", response_model=Inventory, summary="Add a new inventory item")
 async def add_inventory_item(
     inventory: InventoryCreate = Body(..., example=INVENTORY_POST_EXAMPLE),
@@ -59,7 +139,9 @@ async def add_inventory_item(
 @router.patch("/{inventory_id}", response_model=Inventory, summary="Update inventory item amount")
 async def update_inventory_item(
     inventory_id: int,
+    response: Response,
     new_amount: float = Body(..., embed=True, description="New amount for the inventory item"),
+    if_match: Optional[str] = Header(None, description="ETag of the version the update is based on"),
     session: AsyncSession = Depends(get_session),
 ):
     """
@@ -67,12 +149,13 @@ async def update_inventory_item(
 
     - **inventory_id**: ID of the inventory item to update.
     - **new_amount**: New amount value.
+    - **If-Match**: Optional ETag; the update only applies if the item still has this version.
 
-    Returns the updated `Inventory` object. Raises 404 if item does not exist.
+    Returns the updated `Inventory` object with its new version as `ETag`.
+    Raises 404 if item does not exist and 412 if `If-Match` is stale.
     """
-    updated_item = await update_inventory_amount(session, inventory_id, new_amount)
-    if updated_item is None:
-        raise HTTPException(status_code=404, detail="Inventory item not found")
+    updated_item = await update_inventory_amount(session, inventory_id, new_amount, parse_if_match(if_match))
+    set_etag(response, updated_item.version)
     return updated_item
 
 
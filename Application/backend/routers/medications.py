@@ -1,10 +1,11 @@
 from typing import List
 
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, Query
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from Application.backend.core.database import get_session
-from Application.backend.models.medication import MEDICATION_EXAMPLE, Medication, MedicationCreate
+from Application.backend.models.medication import MEDICATION_EXAMPLE, Medication, MedicationCreate, MedicationMatch
+from Application.backend.services.medication_index import medication_index
 from Application.backend.services.medication_service import create_medication, get_all_medications
 
 router = APIRouter(prefix="/medications", tags=["Medications"])
@@ -22,6 +23,25 @@ async def list_medications(session: AsyncSession = Depends(get_session)):
     return await get_all_medications(session)
 
 
+@router.get("/search", response_model=List[MedicationMatch], summary="Autocomplete medication names")
+async def search_medications(
+    q: str = Query(..., min_length=1, description="Typed (part of a) medication name"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of suggestions"),
+):
+    """
+    Suggest medications for a partially typed or misspelled name.
+
+    Served from the in-memory name index: names starting with `q` first, then
+    fuzzy (trigram) matches.
+
+    - **q**: Typed (part of a) medication name.
+    - **limit**: Maximum number of suggestions.
+
+    Returns a list of `MedicationMatch` objects with their similarity `score`.
+    """
+    return medication_index.complete(q, limit)
+
+
 @router.post("/", response_model=Medication, summary="Create a new medication")
 async def add_medication(
     medication: MedicationCreate = Body(
@@ -1,5 +1,8 @@
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from pydantic import BaseModel
+import json
+from typing import List
+
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+from pydantic import BaseModel, ValidationError
 
 from Application.backend.socket_manager import manager
 
@@ -12,39 +15,100 @@ class WorkflowMessage(BaseModel):
     event_type: str
     message: str
     cart_id: int | None = None
+    room: str | None = None
+
+
+class ClientMessage(BaseModel):
+    """Message sent by a client to change its subscription."""
+
+    action: str = "subscribe"
+    cart_ids: List[int] | None = None
+    rooms: List[str] | None = None
+    event_types: List[str] | None = None
 
 
 @router.post("/workflow-event")
 async def workflow_event(data: WorkflowMessage):
     """
-    Broadcast a workflow event to all connected WebSocket clients.
+    Broadcast a workflow event to all WebSocket clients subscribed to it.
+
+    The message is only queued per client, so the request does not wait for
+    slow connections.
 
     Args:
-        data: WorkflowMessage containing event_type, message, and cart_id.
+        data: WorkflowMessage containing event_type, message, cart_id and room.
 
     Returns:
         dict with status confirmation.
     """
-    await manager.broadcast(data.model_dump_json())
+    await manager.broadcast(
+        data.model_dump(mode="json"),
+        cart_id=data.cart_id,
+        room=data.room,
+        event_type=data.event_type,
+    )
     return {"status": "Event broadcasted"}
 
 
+@router.get("/metrics")
+async def notification_metrics():
+    """
+    Report WebSocket queue depth and dropped message counters.
+
+    Returns:
+        dict with connection count, queue depths and drop counters.
+    """
+    return manager.metrics()
+
+
 @router.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket):
+async def websocket_endpoint(
+    websocket: WebSocket,
+    cart_id: List[int] | None = Query(None, description="Only receive events for these carts"),
+    room: List[str] | None = Query(None, description="Only receive events for these rooms"),
+    event_type: List[str] | None = Query(None, description="Only receive these event types"),
+    since: int | None = Query(None, description="Last received sequence number, missed events are replayed"),
+):
     """
     WebSocket endpoint for clients to connect and receive real-time notifications.
 
-    Keeps the connection open and handles disconnects gracefully.
+    Clients receive every event unless they subscribe to specific carts, rooms
+    or event types, either with query parameters (`?room=OR-3&cart_id=5`) or
+    by sending `{"action": "subscribe", "rooms": ["OR-3"]}` on the socket.
+
+    Every event carries a `seq` number. A client reconnecting with
+    `?since=<seq>` receives the events it missed, or a `resync_required`
+    event if they are no longer buffered.
+
+    Liveness is checked with protocol-level WebSocket pings, which browsers
+    answer automatically. Any frame the client sends counts as activity.
 
     Args:
         websocket: The WebSocket connection object.
+        cart_id: Initial cart filter.
+        room: Initial room filter.
+        event_type: Initial event type filter.
+        since: Sequence number to replay from.
     """
-    await manager.connect(websocket)
+    await manager.connect(websocket, since=since, cart_ids=cart_id, rooms=room, event_types=event_type)
     try:
         while True:
-            # Keep the connection open by receiving data
-            # (even though we don't process client messages, this keeps the connection alive)
-            await websocket.receive_text()
+            text = await websocket.receive_text()
+            manager.touch(websocket)
+            try:
+                request = ClientMessage.model_validate(json.loads(text))
+            except (ValueError, ValidationError):
+                # Ignore anything that is not a subscription request
+                continue
+            if request.action == "subscribe":
+                manager.subscribe(
+                    websocket,
+                    cart_ids=request.cart_ids,
+                    rooms=request.rooms,
+                    event_types=request.event_types,
+                )
     except WebSocketDisconnect:
-        # Handle client disconnect by removing from active connections
+        pass
+    finally:
+        # Remove from active connections and stop the writer task
         manager.disconnect(websocket)
\ No newline at end of file
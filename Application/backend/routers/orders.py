@@ -1,14 +1,30 @@
-from fastapi import APIRouter, Depends, Body
+from datetime import date
+from fastapi import APIRouter, Depends, Body, HTTPException, Path, Query
 from sqlmodel.ext.asyncio.session import AsyncSession
-from typing import List
+from typing import List, Optional
 
 from Application.backend.core.database import get_session
-from Application.backend.models.order import Order, OrderCreate, ORDER_EXAMPLE
-from Application.backend.services.order_service import get_all_orders, add_order, delete_order
+from Application.backend.models.order import (
+    DailyDemand,
+    MedicationDemand,
+    Order,
+    OrderCreate,
+    ReorderReceipt,
+    ReorderRequest,
+    ORDER_EXAMPLE,
+    REORDER_EXAMPLE,
+)
+from Application.backend.services.order_batcher import order_batcher
+from Application.backend.services.order_service import get_all_orders, add_order, delete_order, get_daily_demand, get_demand
 
 router = APIRouter(prefix="/orders", tags=["Orders"])
 
 
+def _check_range(start: date, end: date) -> None:
+    if end < start:
+        raise HTTPException(status_code=422, detail="'end' must not be before 'start'")
+
+
 @router.get("/", response_model=List[Order], summary="List all orders")
 async def list_orders(session: AsyncSession = Depends(get_session)):
     """
@@ -21,6 +37,48 @@ async def list_orders(session: AsyncSession = Depends(get_session)):
     return await get_all_orders(session)
 
 
+@router.get("/demand", response_model=List[MedicationDemand], summary="Ordered amounts per medication")
+async def list_demand(
+    start: date = Query(..., description="First order date (inclusive)"),
+    end: date = Query(..., description="Last order date (inclusive)"),
+    medication_id: Optional[str] = Query(None, description="Only this medication"),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Sum the ordered amounts per medication over a date range, computed from the order lines.
+
+    - **start**: First order date (inclusive).
+    - **end**: Last order date (inclusive).
+    - **medication_id**: Only this medication; all of them if omitted.
+    - **session**: Async database session (automatically injected).
+
+    Returns a list of `MedicationDemand` objects, largest amount first.
+    """
+    _check_range(start, end)
+    return await get_demand(session, start, end, medication_id)
+
+
+@router.get("/demand/{medication_id}", response_model=List[DailyDemand], summary="Ordered amounts of a medication per day")
+async def list_daily_demand(
+    medication_id: str = Path(..., description="ID of the medication"),
+    start: date = Query(..., description="First order date (inclusive)"),
+    end: date = Query(..., description="Last order date (inclusive)"),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Sum the ordered amounts of a medication per order date.
+
+    - **medication_id**: ID of the medication.
+    - **start**: First order date (inclusive).
+    - **end**: Last order date (inclusive).
+    - **session**: Async database session (automatically injected).
+
+    Returns a list of `DailyDemand` objects ordered by day.
+    """
+    _check_range(start, end)
+    return await get_daily_demand(session, medication_id, start, end)
+
+
 @router.post("/", response_model=Order, summary="Create a new order")
 async def add_order_item(
     order: OrderCreate = Body(
@@ -42,6 +100,31 @@ async def add_order_item(
     return new_order
 
 
+@router.post("/reorder", response_model=ReorderReceipt, summary="Request a reorder of a medication")
+async def reorder_medication(
+    request: ReorderRequest = Body(
+        ...,
+        example=REORDER_EXAMPLE,
+        description="Medication and amount to reorder"
+    ),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Add a medication to the next consolidated order of its supplier.
+
+    Requests are stored and collected per supplier for
+    `ORDER_BATCH_WINDOW_SECONDS`, then written as one order; rush requests are
+    ordered immediately. A repeated `request_id` returns the receipt of the
+    first request instead of ordering again.
+
+    - **request**: Medication, amount, rush and internal flags, optional request ID for retries.
+    - **session**: Async database session (automatically injected).
+
+    Returns a `ReorderReceipt` with the supplier and, once the request was ordered, the ID of its order.
+    """
+    return await order_batcher.submit(session, request)
+
+
 @router.delete("/{order_id}", summary="Delete an order")
 async def remove_order(
     order_id: int,
@@ -1,6 +1,9 @@
 from fastapi import APIRouter
 import httpx
 
+from Application.backend.core.db_config import pool_metrics
+from Application.backend.core.request_metrics import request_metrics
+
 router = APIRouter(prefix="", tags=["Utilities"])
 
 
@@ -15,6 +18,23 @@ async def health():
     return {"status": "ok"}
 
 
+@router.get("/metrics", summary="Request latency metrics")
+async def metrics():
+    """
+    Per-route request statistics of this process since start or the last reset.
+
+    Routes are keyed by method and path template and sorted by total time spent,
+    so the hottest endpoints come first. Each entry has the request count, status
+    codes, latency and response size histograms (with p50/p95/p99 estimates) and
+    the mean DB time and query count. `db_pool` shows the connection pools with
+    their checkout wait histogram.
+
+    Returns:
+        dict: The collection window in seconds, the statistics per route and the pool state.
+    """
+    return {**request_metrics.snapshot(), "db_pool": pool_metrics()}
+
+
 @router.post("/start_flow")
 async def start_flow():
     async with httpx.AsyncClient() as client:
@@ -0,0 +1,298 @@
+import asyncio
+import logging
+import os
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Iterable, List, Optional
+
+from sqlalchemy import and_, case, delete, func, insert, literal, or_, true
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from Application.backend.models.analytics import WasteDailyReport, WasteDimension, WasteEvent, WasteReport, WasteRollup
+from Application.backend.models.cart import Cart
+from Application.backend.models.cart_item import CartItem
+
+logger = logging.getLogger(__name__)
+
+METRICS = ("dispensed", "returned", "expired")
+# Seconds between two runs of the aggregator folding waste events into the rollups
+WASTE_AGGREGATE_SECONDS = float(os.getenv("WASTE_AGGREGATE_SECONDS", "5"))
+# Waste events folded per transaction
+WASTE_AGGREGATE_BATCH = int(os.getenv("WASTE_AGGREGATE_BATCH", "1000"))
+
+
+def _dimension_keys(event: WasteEvent) -> dict:
+    """The rollup key of a waste event in every dimension."""
+    return {
+        WasteDimension.medication.value: event.medicationId,
+        WasteDimension.operation.value: event.operation,
+        WasteDimension.room.value: event.room,
+    }
+
+
+def _insert(session: AsyncSession):
+    """The `INSERT` construct with `ON CONFLICT` support of the session's database."""
+    return postgresql.insert if session.get_bind().dialect.name == "postgresql" else sqlite.insert
+
+
+def is_expired(item: CartItem, closed_at: datetime) -> bool:
+    """Whether a cart item was past its chemical stability or batch expiration when its cart was closed."""
+    return (item.stable_until is not None and item.stable_until <= closed_at) or (
+        item.expiration_date is not None and item.expiration_date < closed_at.date()
+    )
+
+
+async def record_waste(session: AsyncSession, cart: Cart, metric: str, items: Iterable[tuple[str, float]]) -> None:
+    """
+    Append waste events of a cart, in the caller's transaction. Does not commit.
+
+    A plain insert that touches no shared row, so concurrent cart changes do
+    not queue behind each other; the rollups are updated by the waste
+    aggregator.
+
+    - **session**: Async database session.
+    - **cart**: Cart the items belong to; its operation date is the day.
+    - **metric**: `dispensed`, `returned` or `expired`.
+    - **items**: `(medication_id, amount)` pairs.
+    """
+    events = [
+        {
+            "day": cart.operationDate, "medicationId": medication_id, "operation": cart.operation,
+            "room": cart.roomNumber, "metric": metric, "amount": amount,
+        }
+        for medication_id, amount in items
+    ]
+    if events:
+        await session.exec(insert(WasteEvent).values(events))
+
+
+async def aggregate_waste_events(session: AsyncSession, limit: int = WASTE_AGGREGATE_BATCH) -> int:
+    """
+    Fold the oldest waste events into the daily rollups and delete them, in one transaction.
+
+    Events are claimed with `FOR UPDATE SKIP LOCKED`, so aggregators of
+    several processes take disjoint events. The rollup rows are upserted in
+    key order, so two aggregators touching the same rows never deadlock.
+
+    - **session**: Async database session.
+    - **limit**: Maximum number of events folded.
+
+    Returns the number of events folded.
+    """
+    result = await session.exec(
+        select(WasteEvent).order_by(WasteEvent.id).limit(limit).with_for_update(skip_locked=True)
+    )
+    events = result.all()
+    if not events:
+        return 0
+    totals: dict[tuple[str, date, str], dict[str, float]] = defaultdict(lambda: {m: 0.0 for m in METRICS})
+    for event in events:
+        for dimension, key in _dimension_keys(event).items():
+            totals[(dimension, event.day, key)][event.metric] += event.amount
+
+    statement = _insert(session)(WasteRollup).values([
+        {"dimension": dimension, "day": day, "key": key, **amounts}
+        for (dimension, day, key), amounts in sorted(totals.items())
+    ])
+    statement = statement.on_conflict_do_update(
+        index_elements=["dimension", "day", "key"],
+        set_={m: getattr(WasteRollup, m) + getattr(statement.excluded, m) for m in METRICS},
+    )
+    await session.exec(statement)
+    await session.exec(delete(WasteEvent).where(WasteEvent.id.in_([event.id for event in events])))
+    await session.commit()
+    return len(events)
+
+
+async def get_waste_report(
+    session: AsyncSession, dimension: WasteDimension, start: date, end: date
+) -> List[WasteReport]:
+    """
+    Sum the rollups of a date range per key of one dimension.
+
+    - **session**: Async database session.
+    - **dimension**: `medication`, `operation` or `room`.
+    - **start**: First operation date (inclusive).
+    - **end**: Last operation date (inclusive).
+
+    Returns a list of `WasteReport` entries, most expired first. The waste rate
+    is the expired share of the amount that stayed in the carts.
+    """
+    result = await session.exec(
+        select(WasteRollup.key, *(func.sum(getattr(WasteRollup, m)) for m in METRICS))
+        .where(WasteRollup.dimension == dimension.value, WasteRollup.day >= start, WasteRollup.day <= end)
+        .group_by(WasteRollup.key)
+    )
+    reports = [
+        WasteReport(
+            key=key,
+            dispensed=dispensed,
+            returned=returned,
+            expired=expired,
+            waste_rate=round(expired / (dispensed - returned), 4) if dispensed > returned else 0.0,
+        )
+        for key, dispensed, returned, expired in result.all()
+    ]
+    return sorted(reports, key=lambda report: report.expired, reverse=True)
+
+
+async def get_daily_waste(
+    session: AsyncSession, dimension: WasteDimension, start: date, end: date, key: Optional[str] = None
+) -> List[WasteDailyReport]:
+    """
+    Sum the rollups of a date range per day.
+
+    - **session**: Async database session.
+    - **dimension**: Dimension to read; every dimension holds the same daily totals.
+    - **start**: First operation date (inclusive).
+    - **end**: Last operation date (inclusive).
+    - **key**: Only this medication, operation type or room.
+
+    Returns a list of `WasteDailyReport` entries ordered by day.
+    """
+    statement = (
+        select(WasteRollup.day, *(func.sum(getattr(WasteRollup, m)) for m in METRICS))
+        .where(WasteRollup.dimension == dimension.value, WasteRollup.day >= start, WasteRollup.day <= end)
+        .group_by(WasteRollup.day)
+        .order_by(WasteRollup.day)
+    )
+    if key is not None:
+        statement = statement.where(WasteRollup.key == key)
+    result = await session.exec(statement)
+    return [
+        WasteDailyReport(day=day, dispensed=dispensed, returned=returned, expired=expired)
+        for day, dispensed, returned, expired in result.all()
+    ]
+
+
+async def backfill_waste_rollups(session: AsyncSession, start: Optional[date] = None, end: Optional[date] = None) -> int:
+    """
+    Recompute the dispensed and expired rollups from the existing cart items.
+
+    One `INSERT ... SELECT ... ON CONFLICT` per dimension. Removed items are
+    not in the database anymore: the dispensed total is the amount still in
+    carts plus the returned amount already recorded, which keeps the
+    incrementally maintained days unchanged. Carts closed before `closed_at`
+    was recorded count no expired items.
+
+    - **session**: Async database session.
+    - **start**: First operation date to recompute, all history if omitted.
+    - **end**: Last operation date to recompute.
+
+    Returns the number of rollup rows written.
+    """
+    # Pending events would be counted again on top of the recomputed totals
+    while await aggregate_waste_events(session):
+        pass
+    expired = case(
+        (
+            and_(
+                Cart.closed_at != None,  # noqa: E711
+                or_(
+                    and_(CartItem.stable_until != None, CartItem.stable_until <= Cart.closed_at),  # noqa: E711
+                    and_(CartItem.expiration_date != None, CartItem.expiration_date < func.date(Cart.closed_at)),  # noqa: E711
+                ),
+            ),
+            CartItem.amount,
+        ),
+        else_=0.0,
+    )
+    # SQLite needs a WHERE clause to parse INSERT ... SELECT ... ON CONFLICT
+    in_range = [true()]
+    if start is not None:
+        in_range.append(Cart.operationDate >= start)
+    if end is not None:
+        in_range.append(Cart.operationDate <= end)
+
+    written = 0
+    for dimension, column in (
+        (WasteDimension.medication, CartItem.medication_id),
+        (WasteDimension.operation, Cart.operation),
+        (WasteDimension.room, Cart.roomNumber),
+    ):
+        source = (
+            select(
+                literal(dimension.value),
+                Cart.operationDate,
+                column,
+                func.sum(CartItem.amount),
+                literal(0.0),
+                func.sum(expired),
+            )
+            .select_from(CartItem)
+            .join(Cart, Cart.id == CartItem.cart_id)
+            .where(*in_range)
+            .group_by(Cart.operationDate, column)
+        )
+        statement = _insert(session)(WasteRollup).from_select(
+            ["dimension", "day", "key", "dispensed", "returned", "expired"], source
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=["dimension", "day", "key"],
+            set_={
+                "dispensed": statement.excluded.dispensed + WasteRollup.returned,
+                "expired": statement.excluded.expired,
+            },
+        )
+        result = await session.exec(statement)
+        written += result.rowcount
+    await session.commit()
+    return written
+
+
+class WasteAggregator:
+    """Background task folding the waste events into the rollups every `WASTE_AGGREGATE_SECONDS`."""
+
+    def __init__(self, interval: float = WASTE_AGGREGATE_SECONDS):
+        """
+        Create the aggregator.
+
+        - **interval**: Seconds between two runs.
+        """
+        self.interval = interval
+        self._session_maker = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self, session_maker) -> None:
+        """
+        Start aggregating in the background, if not already running.
+
+        - **session_maker**: Factory of async database sessions.
+        """
+        self._session_maker = session_maker
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop aggregating; pending events stay in the database."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def aggregate(self) -> int:
+        """Fold all pending events once and return their number."""
+        folded = 0
+        while True:
+            async with self._session_maker() as session:
+                count = await aggregate_waste_events(session)
+            folded += count
+            if count < WASTE_AGGREGATE_BATCH:
+                return folded
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.aggregate()
+            except Exception as e:
+                logger.warning(f"Waste aggregation failed: {e}")
+
+
+# Global instance, started by the application lifespan
+waste_aggregator = WasteAggregator()
@@ -1,14 +1,20 @@
-from datetime import date, timedelta
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
 from typing import List
 
 from fastapi import HTTPException
+from sqlalchemy import delete
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from Application.backend.models.cart import Cart
+from Application.backend.models.cart import Cart, CartStatus
 from Application.backend.models.cart_item import AddToCartRequest, CartItem
-from Application.backend.models.inventory import Inventory
 from Application.backend.models.medication import Medication
+from Application.backend.models.reservation import StockReservation
+from Application.backend.services.analytics_service import record_waste
+from Application.backend.services.change_feed import change_feed, row_change, row_fields
+from Application.backend.services.reservation_service import adjust_stock, available_to_promise, hold, lock_inventory
+from Application.backend.services.stability_scheduler import stability_deadline, stability_scheduler
 
 
 async def get_all_cart_items(session: AsyncSession) -> List[CartItem]:
@@ -42,6 +48,30 @@ async def get_expiring_items(session: AsyncSession, days: int = 7) -> List[CartI
     return result.all()
 
 
+async def get_unstable_items(session: AsyncSession, minutes: int = 60, include_expired: bool = False) -> List[CartItem]:
+    """
+    Retrieve prepared cart items whose chemical stability ends within a given number of minutes.
+
+    - **session**: Async database session.
+    - **minutes**: Window from now in minutes (default: 60).
+    - **include_expired**: Also return items whose stability already ended.
+
+    Returns a list of `CartItem` objects ordered by `stable_until`, served by its index.
+    """
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    statement = select(CartItem).where(CartItem.stable_until <= now + timedelta(minutes=minutes))
+    if not include_expired:
+        statement = statement.where(CartItem.stable_until > now)
+    result = await session.exec(statement.order_by(CartItem.stable_until))
+    return result.all()
+
+
+def _set_stability(cart_item: CartItem, medication: Medication) -> None:
+    """Stamp a time-sensitive item as prepared now and compute the end of its chemical stability."""
+    cart_item.prepared_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    cart_item.stable_until = stability_deadline(cart_item.prepared_at, medication.chemicalStabilityHours)
+
+
 async def get_cart_contents(session: AsyncSession, cart_id: int) -> List[CartItem]:
     """
     Retrieve all items in a specific cart.
@@ -64,14 +94,16 @@ async def add_medication_to_cart(
     - **session**: Async database session.
     - **request**: `AddToCartRequest` containing cart_id, inventory_id, medication_id, amount, and time_sensitive flag.
 
-    Checks for existence of cart, medication, and inventory, validates inventory amount,
-    decrements inventory, creates a CartItem, and commits changes.
+    Checks for existence of cart, medication, and inventory, validates the amount against
+    the available-to-promise stock, holds the stock for a `Prepared` cart or decrements
+    inventory otherwise, creates a CartItem, and commits changes. The inventory item is
+    locked while doing so, so concurrent requests for the same batch wait for each other.
 
     Returns the newly created `CartItem`.
 
     Raises:
         HTTPException 404 if cart, medication, or inventory is not found.
-        HTTPException 400 if requested amount exceeds inventory.
+        HTTPException 400 if requested amount exceeds the available inventory.
     """
     cart = await session.get(Cart, request.cart_id)
     if not cart:
@@ -81,18 +113,23 @@ async def add_medication_to_cart(
     if not medication:
         raise HTTPException(status_code=404, detail="Medication not found")
 
-    inventory = await session.get(Inventory, request.inventory_id)
+    inventory = (await lock_inventory(session, [request.inventory_id])).get(request.inventory_id)
     if not inventory:
         raise HTTPException(status_code=404, detail="Inventory item not found")
 
-    if inventory.amount < request.amount:
+    available = (await available_to_promise(session, [inventory]))[inventory.id]
+    if available < request.amount:
         raise HTTPException(
             status_code=400,
-            detail=f"Not enough inventory for {medication.name}. Available: {inventory.amount} {inventory.unit}",
+            detail=f"Not enough inventory for {medication.name}. Available: {available} {inventory.unit}",
         )
 
-    inventory.amount -= request.amount
-    session.add(inventory)
+    # Prepared carts only hold the stock, it is decremented when the cart goes in use
+    reserve = cart.status == CartStatus.prepared
+    if not reserve:
+        remaining = await adjust_stock(session, inventory.id, -request.amount)
+        if remaining is None:
+            raise HTTPException(status_code=400, detail=f"Not enough inventory for {medication.name}")
 
     cart_item = CartItem(
         cart_id=request.cart_id,
@@ -102,12 +139,24 @@ async def add_medication_to_cart(
         unit=inventory.unit,
         time_sensitive=request.time_sensitive,
         expiration_date=inventory.expirationDate,
+        reserved=reserve,
     )
+    if request.time_sensitive:
+        _set_stability(cart_item, medication)
 
     session.add(cart_item)
+    if reserve:
+        await session.flush()
+        session.add(hold(cart_item))
+    await record_waste(session, cart, "dispensed", [(request.medication_id, request.amount)])
     await session.commit()
     await session.refresh(cart_item)
+    if cart_item.stable_until is not None:
+        stability_scheduler.schedule(cart_item.id, cart_item.stable_until)
 
+    changes = [] if reserve else [row_change("inventory", "update", inventory.id, {"amount": remaining})]
+    changes.append(row_change("cart_items", "create", cart_item.id, row_fields(cart_item)))
+    change_feed.emit(changes, cart_id=cart.id, room=cart.roomNumber)
     return cart_item
 
 
@@ -122,8 +171,8 @@ async def add_medications_to_cart_bulk(
 
     Validates all requests first, then performs bulk operations:
     - Checks existence of carts, medications, and inventory items
-    - Validates inventory amounts
-    - Decrements inventory amounts
+    - Validates amounts against the available-to-promise stock, with the inventory items locked
+    - Holds the stock for `Prepared` carts, decrements inventory amounts otherwise
     - Creates CartItem objects
     - Commits all changes
 
@@ -162,24 +211,24 @@ async def add_medications_to_cart_bulk(
             raise HTTPException(status_code=404, detail=f"Medication {med_id} not found")
         medications[med_id] = medication
 
-    # Check all inventory items exist and have sufficient amounts
-    inventories = {}
+    # Check all inventory items exist, locked so concurrent requests for the same batches wait
+    inventories = await lock_inventory(session, inventory_ids)
     for inv_id in inventory_ids:
-        inventory = await session.get(Inventory, inv_id)
-        if not inventory:
+        if inv_id not in inventories:
             raise HTTPException(status_code=404, detail=f"Inventory item {inv_id} not found")
-        inventories[inv_id] = inventory
 
-    # Validate inventory amounts for each request and filter out insufficient ones
+    # Validate amounts for each request against the stock left to promise and filter out insufficient ones
+    available = await available_to_promise(session, list(inventories.values()))
     valid_requests = []
     for request in requests:
         inventory = inventories[request.inventory_id]
-        if inventory.amount >= request.amount:
+        if available[inventory.id] >= request.amount:
+            available[inventory.id] -= request.amount
             valid_requests.append(request)
         else:
             # Log warning but don't fail - allow partial fulfillment
             medication = medications[request.medication_id]
-            print(f"WARNING: Skipping {medication.name} - insufficient inventory. Available: {inventory.amount} {inventory.unit}, Requested: {request.amount}")
+            print(f"WARNING: Skipping {medication.name} - insufficient inventory. Available: {available[inventory.id]} {inventory.unit}, Requested: {request.amount}")
 
     if not valid_requests:
         raise HTTPException(
@@ -189,13 +238,15 @@ async def add_medications_to_cart_bulk(
 
     # All validations passed, perform bulk operations
     cart_items = []
+    taken = defaultdict(float)
 
     for request in valid_requests:
         inventory = inventories[request.inventory_id]
+        # Prepared carts only hold the stock, it is decremented when the cart goes in use
+        reserve = carts[request.cart_id].status == CartStatus.prepared
 
-        # Decrement inventory
-        inventory.amount -= request.amount
-        session.add(inventory)
+        if not reserve:
+            taken[inventory.id] += request.amount
 
         # Create cart item
         cart_item = CartItem(
@@ -206,24 +257,57 @@ async def add_medications_to_cart_bulk(
             unit=inventory.unit,
             time_sensitive=request.time_sensitive,
             expiration_date=inventory.expirationDate,
+            reserved=reserve,
         )
+        if request.time_sensitive:
+            _set_stability(cart_item, medications[request.medication_id])
 
         session.add(cart_item)
         cart_items.append(cart_item)
 
+    # Decrement inventory, one update per item
+    decremented = {}
+    for inventory_id, amount in taken.items():
+        decremented[inventory_id] = await adjust_stock(session, inventory_id, -amount)
+        if decremented[inventory_id] is None:
+            raise HTTPException(status_code=400, detail=f"Not enough inventory in item {inventory_id}")
+
+    # Hold the stock of items in prepared carts, which needs their IDs
+    await session.flush()
+    for cart_item in cart_items:
+        if cart_item.reserved:
+            session.add(hold(cart_item))
+    for cart_id, cart in carts.items():
+        await record_waste(session, cart, "dispensed", [
+            (request.medication_id, request.amount) for request in valid_requests if request.cart_id == cart_id
+        ])
+
     # Commit all changes
     await session.commit()
 
     # Refresh all cart items to get their IDs
     for cart_item in cart_items:
         await session.refresh(cart_item)
+        if cart_item.stable_until is not None:
+            stability_scheduler.schedule(cart_item.id, cart_item.stable_until)
+
+    # Push all changes of this request as one frame per cart
+    changes_by_cart = {}
+    for cart_item in cart_items:
+        inventory = inventories[cart_item.inventory_id]
+        changes = changes_by_cart.setdefault(cart_item.cart_id, [])
+        if inventory.id in decremented:
+            changes.append(row_change("inventory", "update", inventory.id, {"amount": decremented[inventory.id]}))
+        changes.append(row_change("cart_items", "create", cart_item.id, row_fields(cart_item)))
+    for cart_id, changes in changes_by_cart.items():
+        change_feed.emit(changes, cart_id=cart_id, room=carts[cart_id].roomNumber)
 
     return cart_items
 
 
 async def remove_cart_item(session: AsyncSession, id: int) -> None:
     """
-    Remove a cart item and return its quantity to inventory.
+    Remove a cart item and return its quantity to inventory, or release its hold.
 
     - **session**: Async database session.
     - **id**: ID of the cart item to remove.
@@ -237,10 +321,20 @@ async def remove_cart_item(session: AsyncSession, id: int) -> None:
     if not cart_item:
         raise HTTPException(status_code=404, detail="Cart item not found")
 
-    inventory = await session.get(Inventory, cart_item.inventory_id)
-    if inventory:
-        inventory.amount += cart_item.amount
-        session.add(inventory)
-
+    changes = []
+    if cart_item.reserved:
+        # Stock was only held, releasing the hold makes it available again
+        await session.exec(delete(StockReservation).where(StockReservation.cart_item_id == cart_item.id))
+    else:
+        amount = await adjust_stock(session, cart_item.inventory_id, cart_item.amount)
+        if amount is not None:
+            changes.append(row_change("inventory", "update", cart_item.inventory_id, {"amount": amount}))
+
+    cart = await session.get(Cart, cart_item.cart_id)
+    if cart:
+        await record_waste(session, cart, "returned", [(cart_item.medication_id, cart_item.amount)])
     await session.delete(cart_item)
-    await session.commit()
\ No newline at end of file
+    await session.commit()
+    stability_scheduler.cancel(cart_item.id)
+    changes.append(row_change("cart_items", "delete", cart_item.id))
+    change_feed.emit(changes, cart_id=cart_item.cart_id, room=cart.roomNumber if cart else None)
\ No newline at end of file
@@ -1,11 +1,21 @@
+from datetime import datetime, timezone
 from typing import List, Optional
 
 from fastapi import HTTPException
+from sqlalchemy import update
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from Application.backend.models.cart import Cart, CartCreate, CartStatus
-from Application.backend.models.inventory import Inventory
+from Application.backend.core.concurrency import precondition_failed
+from Application.backend.models.cart import Cart, CartAvailability, CartCreate, CartStatus
+from Application.backend.services.analytics_service import is_expired, record_waste
+from Application.backend.services.change_feed import change_feed, row_change, row_fields
+from Application.backend.services.reservation_service import (
+    adjust_stock,
+    convert_cart_reservations,
+    release_cart_reservations,
+)
+from Application.backend.services.stability_scheduler import stability_scheduler
 
 
 async def get_all_carts(session: AsyncSession) -> List[Cart]:
@@ -33,6 +43,27 @@ async def get_cart_by_id(session: AsyncSession, cart_id: str) -> Optional[Cart]:
     return result.one_or_none()
 
 
+async def get_available_cart(session: AsyncSession) -> CartAvailability:
+    """
+    Find a cart in `Prepared` state that can be handed out.
+
+    - **session**: Async database session.
+
+    Uses the `(status, operationDate)` index and fetches at most one row,
+    preferring the cart with the earliest operation date.
+
+    Returns a `CartAvailability` with the cart ID if one is available.
+    """
+    result = await session.exec(
+        select(Cart.id)
+        .where(Cart.status == CartStatus.prepared)
+        .order_by(Cart.operationDate, Cart.id)
+        .limit(1)
+    )
+    cart_id = result.first()
+    return CartAvailability(available=cart_id is not None, cart_id=cart_id)
+
+
 async def add_cart(session: AsyncSession, cart_data: CartCreate) -> Cart:
     """
     Add a new cart to the database.
@@ -46,34 +77,80 @@ async def add_cart(session: AsyncSession, cart_data: CartCreate) -> Cart:
     session.add(cart_item)
     await session.commit()
     await session.refresh(cart_item)
+    change_feed.emit(
+        [row_change("carts", "create", cart_item.id, row_fields(cart_item))],
+        cart_id=cart_item.id,
+        room=cart_item.roomNumber,
+    )
     return cart_item
 
 
 async def update_cart_status(
-    session: AsyncSession, cart_id: str, new_status: CartStatus
+    session: AsyncSession, cart_id: str, new_status: CartStatus, if_match: Optional[list[int]] = None
 ) -> Cart:
     """
     Update the status of a cart.
 
+    A single guarded `UPDATE ... RETURNING` sets the status and bumps the
+    version, so no read is needed unless the update matches no row. Moving to
+    `In-Use` turns the cart's stock holds into inventory decrements, closing it
+    releases them.
+
     - **session**: Async database session.
     - **cart_id**: ID of the cart to update.
     - **new_status**: New `CartStatus` value (prepared, in_use, closed).
+    - **if_match**: Versions the cart must still have (from `If-Match`), `None` to update unconditionally.
 
     Returns the updated `Cart` object.
 
     Raises:
         HTTPException 404 if the cart does not exist.
+        HTTPException 412 if the cart's version is not one of `if_match`.
+        HTTPException 409 if moving to `In-Use` and expired holds are no longer covered by the stock.
     """
-    cart_item = await get_cart_by_id(session, cart_id)
-    if not cart_item:
-        raise HTTPException(status_code=404, detail=f"Cart '{cart_id}' not found")
-    cart_item.status = new_status
-    session.add(cart_item)
+    statement = update(Cart).where(Cart.id == cart_id)
+    if if_match is not None:
+        statement = statement.where(Cart.version.in_(if_match))
+    statement = statement.values(status=new_status, version=Cart.version + 1).returning(Cart)
+    cart_item = (await session.exec(statement)).scalars().one_or_none()
+    if cart_item is None:
+        current = await get_cart_by_id(session, cart_id)
+        if not current:
+            raise HTTPException(status_code=404, detail=f"Cart '{cart_id}' not found")
+        raise precondition_failed(f"Cart '{cart_id}'", current.version)
+
+    changes = [row_change("carts", "update", cart_item.id, {"status": cart_item.status.value, "version": cart_item.version})]
+    if new_status == CartStatus.in_use:
+        changes.extend(await convert_cart_reservations(session, cart_item.id))
+    elif new_status == CartStatus.closed:
+        await release_cart_reservations(session, cart_item.id)
+        await _record_expired(session, cart_item)
     await session.commit()
-    await session.refresh(cart_item)
+    change_feed.emit(
+        changes,
+        cart_id=cart_item.id,
+        room=cart_item.roomNumber,
+    )
     return cart_item
 
 
+async def _record_expired(session: AsyncSession, cart: Cart) -> None:
+    """Stamp the first close of a cart and add its expired items to the waste rollups. Does not commit."""
+    from Application.backend.models.cart_item import CartItem
+
+    closed_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    # Guarded, so closing a cart again does not count its items twice
+    first_close = (await session.exec(
+        update(Cart).where(Cart.id == cart.id, Cart.closed_at == None).values(closed_at=closed_at)  # noqa: E711
+    )).rowcount
+    if not first_close:
+        return
+    result = await session.exec(select(CartItem).where(CartItem.cart_id == cart.id))
+    await record_waste(session, cart, "expired", [
+        (item.medication_id, item.amount) for item in result.all() if is_expired(item, closed_at)
+    ])
+
+
 async def remove_cart(session: AsyncSession, cart_id: int) -> None:
     """
     Remove a cart and return all associated items to inventory.
@@ -81,8 +158,8 @@ async def remove_cart(session: AsyncSession, cart_id: int) -> None:
     - **session**: Async database session.
     - **cart_id**: ID of the cart to delete.
 
-    Adjusts inventory amounts for all `CartItem`s in the cart and deletes them,
-    then deletes the cart itself.
+    Releases the stock holds of the cart, adjusts inventory amounts for all
+    other `CartItem`s in the cart and deletes them, then deletes the cart itself.
 
     Raises:
         HTTPException 404 if the cart does not exist.
@@ -96,12 +173,23 @@ async def remove_cart(session: AsyncSession, cart_id: int) -> None:
     result = await session.exec(select(CartItem).where(CartItem.cart_id == cart_id))
     cart_items = result.all()
 
+    changes = []
+    await release_cart_reservations(session, cart_id)
+    await record_waste(session, cart, "returned", [(item.medication_id, item.amount) for item in cart_items])
     for item in cart_items:
-        inventory = await session.get(Inventory, item.inventory_id)
-        if inventory:
-            inventory.amount += item.amount
-            session.add(inventory)
+        # Reserved items only held stock, nothing to return
+        amount = None if item.reserved else await adjust_stock(session, item.inventory_id, item.amount)
+        if amount is not None:
+            changes.append(row_change("inventory", "update", item.inventory_id, {"amount": amount}))
         await session.delete(item)
+        changes.append(row_change("cart_items", "delete", item.id))
 
+    # Without relationships the unit of work does not order these deletes,
+    # make sure the items are gone before the cart they reference
+    await session.flush()
     await session.delete(cart)
-    await session.commit()
\ No newline at end of file
+    await session.commit()
+    for item in cart_items:
+        stability_scheduler.cancel(item.id)
+    changes.append(row_change("carts", "delete", cart_id))
+    change_feed.emit(changes, cart_id=cart_id, room=cart.roomNumber)
\ No newline at end of file
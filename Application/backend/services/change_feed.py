@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import os
+from typing import Callable, List, Optional
+
+from sqlmodel import SQLModel
+
+from Application.backend.socket_manager import manager
+
+logger = logging.getLogger(__name__)
+
+CHANGE_EVENT = "data_change"
+CHANGE_COALESCE_SECONDS = float(os.getenv("CHANGE_COALESCE_MS", "20")) / 1000
+
+
+def row_change(entity: str, op: str, row_id, fields: Optional[dict] = None) -> dict:
+    """
+    Describe a single row-level change.
+
+    - **entity**: Table name of the changed row (`inventory`, `carts`, `cart_items`, `orders`, `medications`).
+    - **op**: `create`, `update` or `delete`.
+    - **row_id**: Primary key of the row.
+    - **fields**: Changed fields and their new values (all fields on create).
+
+    Returns the change as a JSON-serializable dict.
+    """
+    return {"entity": entity, "op": op, "id": row_id, "fields": fields or {}}
+
+
+def row_fields(row: SQLModel) -> dict:
+    """
+    Return all fields of a row as JSON-compatible values.
+
+    - **row**: The SQLModel row.
+    """
+    return row.model_dump(mode="json")
+
+
+def _merge(previous: dict, change: dict) -> dict:
+    """Fold a later change of the same row into an earlier one."""
+    if change["op"] == "delete":
+        return change
+    if previous["op"] == "delete":
+        return change
+    # create+update stays a create, update+update stays an update
+    return {**previous, "fields": {**previous["fields"], **change["fields"]}}
+
+
+def _describe(changes: List[dict], limit: int = 5) -> str:
+    """Summarize changes for log views, e.g. `inventory 3 updated, cart_items 17 created`."""
+    parts = [f"{change['entity']} {change['id']} {change['op']}d" for change in changes[:limit]]
+    if len(changes) > limit:
+        parts.append(f"and {len(changes) - limit} more")
+    return ", ".join(parts)
+
+
+class ChangeFeed:
+    """
+    Coalesces row-level changes and pushes them over the notification socket.
+
+    Changes emitted within a short window are merged per row and sent as a
+    single `data_change` frame per (cart_id, room), so a bulk operation
+    results in one frame instead of one per row.
+    """
+
+    def __init__(self, window: float = CHANGE_COALESCE_SECONDS):
+        """
+        Create the feed.
+
+        - **window**: Seconds to wait for further changes before flushing.
+        """
+        self.window = window
+        self._pending: dict[tuple, dict[tuple, dict]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+        self._listeners: list[Callable[[List[dict]], None]] = []
+
+    def add_listener(self, listener: Callable[[List[dict]], None]) -> None:
+        """
+        Call `listener` with the changes of every `emit` of this process, e.g. to invalidate caches.
+
+        - **listener**: Synchronous callable receiving the list of changes.
+        """
+        self._listeners.append(listener)
+
+    def emit(self, changes: List[dict], cart_id: Optional[int] = None, room: Optional[str] = None) -> None:
+        """
+        Queue committed changes for the next frame.
+
+        Must be called after the transaction has been committed. Outside an
+        event loop there are no sockets to notify and the changes are dropped.
+
+        - **changes**: Changes built with `row_change`.
+        - **cart_id**: Cart the changes belong to, used for subscription routing.
+        - **room**: Room of that cart, used for subscription routing.
+        """
+        for listener in self._listeners:
+            listener(changes)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        rows = self._pending.setdefault((cart_id, room), {})
+        for change in changes:
+            key = (change["entity"], change["id"])
+            rows[key] = _merge(rows[key], change) if key in rows else change
+
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+
+    def _flush(self) -> None:
+        """Broadcast one frame per routing group with all pending changes."""
+        pending, self._pending = self._pending, {}
+        self._flush_handle = None
+        for (cart_id, room), rows in pending.items():
+            changes = list(rows.values())
+            payload = {"event_type": CHANGE_EVENT, "message": _describe(changes), "cart_id": cart_id, "changes": changes}
+            task = asyncio.create_task(
+                manager.broadcast(payload, cart_id=cart_id, room=room, event_type=CHANGE_EVENT)
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._done)
+
+    def _done(self, task: asyncio.Task) -> None:
+        """Forget a finished broadcast task and log its failure, if any."""
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.warning(f"Failed to publish change events: {task.exception()}")
+
+
+# Global instance used by the service layer
+change_feed = ChangeFeed()
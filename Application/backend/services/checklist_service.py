@@ -6,10 +6,16 @@ from sqlalchemy import func
 from pathlib import Path
 import aiofiles
 import json
+import os
 
 from Application.backend.models.inventory import Inventory
 from Application.backend.models.medication import Medication
 from Application.backend.models.checklist import ChecklistItem, ChecklistItemResponse
+from Application.backend.services.medication_index import medication_index
+from Application.backend.services.reservation_service import available_to_promise
+
+# Minimum similarity for a checklist name to be resolved to a medication by the fuzzy index
+CHECKLIST_MATCH_THRESHOLD = float(os.getenv("CHECKLIST_MATCH_THRESHOLD", "0.5"))
 
 BASE_PATH = Path("core/data/medication_lists")
 BASE_PATH.mkdir(parents=True, exist_ok=True)
@@ -22,8 +28,11 @@ async def process_checklist(items: List[ChecklistItem], session: AsyncSession) -
     - **items**: List of `ChecklistItem` objects to evaluate.
     - **session**: Async database session.
 
+    Names without an exact (case-insensitive) match are looked up in the fuzzy
+    medication name index; `match_confidence` tells how close the match is.
+
     Returns a list of `ChecklistItemResponse` objects indicating whether each item
-    is available in inventory and the location of the medication.
+    is available in inventory (stock minus active holds) and the location of the medication.
     """
     response_list: List[ChecklistItemResponse] = []
 
@@ -34,6 +43,13 @@ async def process_checklist(items: List[ChecklistItem], session: AsyncSession) -
         medication_query = select(Medication).where(func.lower(Medication.name) == name.lower())
         result = await session.exec(medication_query)
         medication = result.first()
+        confidence = 1.0
+
+        if not medication:
+            match = medication_index.best_match(name, CHECKLIST_MATCH_THRESHOLD)
+            if match:
+                medication = await session.get(Medication, match.medicationId)
+                confidence = match.score
 
         if not medication:
             response_list.append(
@@ -57,13 +73,15 @@ async def process_checklist(items: List[ChecklistItem], session: AsyncSession) -
                     checked=False,
                     name=name,
                     medication_id=medication.medicationId,
+                    match_confidence=confidence,
                     location="Unknown",
                     amount=required_amount
                 )
             )
             continue
 
-        available = inventory_item.amount
+        # Stock held by prepared carts cannot be promised to this checklist
+        available = (await available_to_promise(session, [inventory_item]))[inventory_item.id]
 
         if available >= required_amount:
             response_list.append(
@@ -71,6 +89,7 @@ async def process_checklist(items: List[ChecklistItem], session: AsyncSession) -
                     checked=True,
                     name=name,
                     medication_id=medication.medicationId,
+                    match_confidence=confidence,
                     location=inventory_item.location,
                     amount=required_amount
                 )
@@ -82,6 +101,7 @@ async def process_checklist(items: List[ChecklistItem], session: AsyncSession) -
                     checked=False,
                     name=name,
                     medication_id=medication.medicationId,
+                    match_confidence=confidence,
                     location=inventory_item.location,
                     amount=deficit
                 )
@@ -0,0 +1,200 @@
+import asyncio
+import os
+import time
+from datetime import date, timedelta
+from typing import List, Optional
+
+from sqlalchemy import Date, Float, Integer, String, cast, func, literal, null, select, type_coerce, union_all
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from Application.backend.models.cart import Cart, CartStatus
+from Application.backend.models.dashboard import DashboardSummary, ExpiringBatch, LowStockItem, OpenOrder
+from Application.backend.models.inventory import Inventory
+from Application.backend.models.medication import Medication
+from Application.backend.models.order import Order
+from Application.backend.services.change_feed import change_feed
+
+# Seconds a summary is served from memory, writes of this process invalidate it earlier
+DASHBOARD_CACHE_SECONDS = float(os.getenv("DASHBOARD_CACHE_SECONDS", "5"))
+# Batches expiring within this many days are listed
+DASHBOARD_EXPIRY_DAYS = int(os.getenv("DASHBOARD_EXPIRY_DAYS", "30"))
+# Maximum entries per list, the counts cover all rows
+DASHBOARD_LIST_LIMIT = int(os.getenv("DASHBOARD_LIST_LIMIT", "50"))
+
+
+def _column(value, type_):
+    # Typed NULLs keep the UNION ALL valid on Postgres; SQLite would turn a cast date into a number
+    return cast(null(), type_) if value is None else type_coerce(value, type_)
+
+
+def _row(section: str, id=None, key=None, label=None, amount=None, threshold=None, day=None, flags=None):
+    """Project one section onto the common column layout of the summary query."""
+    return [
+        literal(section).label("section"),
+        _column(id, Integer).label("id"),
+        _column(key, String).label("key"),
+        _column(label, String).label("label"),
+        _column(amount, Float).label("amount"),
+        _column(threshold, Float).label("threshold"),
+        _column(day, Date).label("day"),
+        _column(flags, Integer).label("flags"),
+    ]
+
+
+def summary_statement(today: date, expiry_days: int = DASHBOARD_EXPIRY_DAYS, limit: int = DASHBOARD_LIST_LIMIT):
+    """
+    Build the single statement behind the dashboard summary.
+
+    Every section is a CTE; their rows are combined with `UNION ALL` into one
+    result with a `section` column, so the summary costs one round trip.
+    """
+    cutoff = today + timedelta(days=expiry_days)
+
+    # Like the low-stock index: total stock of a medication against the largest `min_stock` of its batches
+    total = func.sum(Inventory.amount)
+    min_stock = func.coalesce(func.max(Inventory.min_stock), 0)
+    low_stock_rows = (
+        select(
+            Inventory.medicationId,
+            func.count().label("batches"),
+            total.label("amount"),
+            min_stock.label("min_stock"),
+        )
+        .group_by(Inventory.medicationId)
+        .having(total < min_stock)
+    )
+    expiring_rows = select(Inventory.id, Inventory.medicationId, Inventory.batchNumber, Inventory.expirationDate, Inventory.amount).where(
+        Inventory.expirationDate <= cutoff, Inventory.amount > 0
+    )
+    open_order_rows = select(Order.id, Order.name, Order.date, Order.isRush, Order.isInternal).where(Order.date >= today)
+
+    cart_counts = select(Cart.status, func.count().label("n")).group_by(Cart.status).cte("cart_counts")
+    low_stock = low_stock_rows.cte("low_stock")
+    expiring = expiring_rows.cte("expiring")
+    open_orders = open_order_rows.cte("open_orders")
+    low_stock_list = (
+        select(low_stock, Medication.name)
+        .join(Medication, Medication.medicationId == low_stock.c.medicationId)
+        .order_by(low_stock.c.amount / func.nullif(low_stock.c.min_stock, 0))
+        .limit(limit)
+        .cte("low_stock_list")
+    )
+    expiring_list = select(expiring).order_by(expiring.c.expirationDate).limit(limit).cte("expiring_list")
+    open_order_list = select(open_orders).order_by(open_orders.c.date).limit(limit).cte("open_order_list")
+
+    return union_all(
+        select(*_row("carts", key=cast(cart_counts.c.status, String), amount=cart_counts.c.n)),
+        select(*_row("count", key=literal("low_stock"), amount=func.count())).select_from(low_stock),
+        select(*_row("count", key=literal("expiring"), amount=func.count())).select_from(expiring),
+        select(*_row("count", key=literal("open_orders"), amount=func.count())).select_from(open_orders),
+        select(*_row(
+            "low_stock", id=low_stock_list.c.batches, key=low_stock_list.c.medicationId, label=low_stock_list.c.name,
+            amount=low_stock_list.c.amount, threshold=low_stock_list.c.min_stock,
+        )),
+        select(*_row(
+            "expiring", id=expiring_list.c.id, key=expiring_list.c.medicationId, label=expiring_list.c.batchNumber,
+            amount=expiring_list.c.amount, day=expiring_list.c.expirationDate,
+        )),
+        select(*_row(
+            "open_order", id=open_order_list.c.id, label=open_order_list.c.name, day=open_order_list.c.date,
+            # Bit 1: rush, bit 2: internal
+            flags=cast(open_order_list.c.isRush, Integer) + 2 * cast(open_order_list.c.isInternal, Integer),
+        )),
+    )
+
+
+async def compute_dashboard_summary(session: AsyncSession, today: Optional[date] = None) -> DashboardSummary:
+    """
+    Compute the dashboard summary in one query.
+
+    - **session**: Async database session.
+    - **today**: Reference date for expiring batches and open orders (default: today).
+
+    Returns the `DashboardSummary`.
+    """
+    result = await session.exec(summary_statement(today or date.today()))
+    carts_by_status, counts = {}, {}
+    low_stock: List[LowStockItem] = []
+    expiring: List[ExpiringBatch] = []
+    open_orders: List[OpenOrder] = []
+    for row in result.all():
+        if row.section == "carts":
+            # The status column stores the enum member names
+            carts_by_status[CartStatus[row.key].value] = int(row.amount)
+        elif row.section == "count":
+            counts[row.key] = int(row.amount)
+        elif row.section == "low_stock":
+            # The id column carries the number of batches
+            low_stock.append(LowStockItem(
+                medicationId=row.key, batches=row.id, name=row.label, amount=row.amount, min_stock=row.threshold
+            ))
+        elif row.section == "expiring":
+            expiring.append(ExpiringBatch(
+                inventory_id=row.id, medicationId=row.key, batchNumber=row.label, expirationDate=row.day, amount=row.amount
+            ))
+        else:
+            open_orders.append(OpenOrder(
+                id=row.id, name=row.label, date=row.day, isRush=bool(row.flags & 1), isInternal=bool(row.flags & 2)
+            ))
+    # UNION ALL does not keep the order of its parts
+    low_stock.sort(key=lambda item: item.amount / item.min_stock if item.min_stock else 0)
+    expiring.sort(key=lambda batch: batch.expirationDate)
+    open_orders.sort(key=lambda order: order.date)
+    return DashboardSummary(
+        carts_by_status=carts_by_status,
+        low_stock_count=counts.get("low_stock", 0),
+        low_stock=low_stock,
+        expiring_count=counts.get("expiring", 0),
+        expiring_batches=expiring,
+        open_orders_count=counts.get("open_orders", 0),
+        open_orders=open_orders,
+    )
+
+
+class DashboardCache:
+    """
+    Keeps the last dashboard summary for `DASHBOARD_CACHE_SECONDS`.
+
+    Every change emitted on the change feed of this process drops it.
+    Concurrent requests on a miss share one computation, and a summary
+    computed while a write happened is not stored.
+    """
+
+    def __init__(self, ttl: float = DASHBOARD_CACHE_SECONDS):
+        """
+        Create the cache.
+
+        - **ttl**: Seconds a summary is served from memory.
+        """
+        self.ttl = ttl
+        self._summary: Optional[DashboardSummary] = None
+        self._expires = 0.0
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self, changes: Optional[list] = None) -> None:
+        """Drop the cached summary; usable as change feed listener."""
+        self._summary = None
+        self._generation += 1
+
+    async def get(self, session: AsyncSession) -> DashboardSummary:
+        """
+        Return the cached summary or compute it.
+
+        - **session**: Async database session used on a miss.
+        """
+        if self._summary is not None and time.monotonic() < self._expires:
+            return self._summary
+        async with self._lock:
+            if self._summary is not None and time.monotonic() < self._expires:
+                return self._summary
+            generation = self._generation
+            summary = await compute_dashboard_summary(session)
+            if generation == self._generation:
+                self._summary, self._expires = summary, time.monotonic() + self.ttl
+            return summary
+
+
+# Global instance, invalidated by every change of this process
+dashboard_cache = DashboardCache()
+change_feed.add_listener(dashboard_cache.invalidate)
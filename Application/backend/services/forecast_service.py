@@ -0,0 +1,199 @@
+import asyncio
+import math
+import os
+from datetime import date, timedelta
+from statistics import NormalDist
+from typing import List, Optional
+
+import numpy as np
+from sqlalchemy import bindparam, func, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from Application.backend.models.cart import Cart
+from Application.backend.models.cart_item import CartItem
+from Application.backend.models.forecast import MinStockRecommendation
+from Application.backend.models.inventory import Inventory
+from Application.backend.models.order import Order, OrderLine
+from Application.backend.services.change_feed import change_feed, row_change
+
+# Days of consumption and order history the forecast is based on
+FORECAST_HISTORY_DAYS = int(os.getenv("FORECAST_HISTORY_DAYS", "90"))
+# Days between placing an order and receiving the stock
+FORECAST_LEAD_TIME_DAYS = float(os.getenv("FORECAST_LEAD_TIME_DAYS", "2"))
+# Probability of not running out before the next delivery arrives
+FORECAST_SERVICE_LEVEL = float(os.getenv("FORECAST_SERVICE_LEVEL", "0.95"))
+# Days between two orders of medications ordered less than twice in the history
+FORECAST_DEFAULT_REVIEW_DAYS = float(os.getenv("FORECAST_DEFAULT_REVIEW_DAYS", "7"))
+
+
+def _index(keys: np.ndarray, lookup: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Positions of `keys` in the sorted unique array `lookup`, and whether each key was found."""
+    if not len(lookup):
+        return np.zeros(len(keys), dtype=int), np.zeros(len(keys), dtype=bool)
+    positions = np.searchsorted(lookup, keys).clip(max=len(lookup) - 1)
+    return positions, lookup[positions] == keys
+
+
+def _pair_keys(medication_ids, locations) -> np.ndarray:
+    return np.array([f"{medication_id}\x1f{location}" for medication_id, location in zip(medication_ids, locations)], dtype=object)
+
+
+def forecast_min_stock(
+    consumption: List[tuple],
+    order_dates: List[tuple],
+    inventory: List[tuple],
+    days: int,
+    lead_time_days: float,
+    service_level: float,
+) -> List[MinStockRecommendation]:
+    """
+    Derive reorder points from consumption and order history.
+
+    Mean and variability of the daily consumption of all (medication,
+    location) pairs are computed at once from per-pair sums of the amounts
+    and their squares, counting days without consumption as zero. The stock
+    has to cover the lead time plus the usual time until the next order of
+    the medication (review period), taken from the gaps between its order
+    dates:
+
+        reorder point = mean * (L + R) + z * std * sqrt(L + R)
+
+    - **consumption**: `(medication_id, location, amount)` rows, one per day with consumption.
+    - **order_dates**: Distinct `(medication_id, day)` rows of the orders.
+    - **inventory**: `(inventory_id, medication_id, location, min_stock)` rows to recommend for.
+    - **days**: Length of the history in days.
+    - **lead_time_days**: Days from order to delivery (L).
+    - **service_level**: Probability of not running out, gives the safety factor z.
+
+    Returns a `MinStockRecommendation` for every inventory row whose location consumed the medication.
+    """
+    if not consumption or not inventory:
+        return []
+    medication_ids, locations, amounts = zip(*consumption)
+    pairs, pair_rows = np.unique(_pair_keys(medication_ids, locations), return_inverse=True)
+    # Rows are unique per pair and day, days without consumption add nothing to both sums
+    amounts = np.array(amounts, dtype=float)
+    totals = np.bincount(pair_rows, weights=amounts, minlength=len(pairs))
+    squares = np.bincount(pair_rows, weights=amounts * amounts, minlength=len(pairs))
+    mean = totals / days
+    std = np.sqrt(np.clip((squares - days * mean * mean) / max(days - 1, 1), 0, None))
+
+    # Review period: mean gap between consecutive order dates per medication
+    medications = np.unique(np.array(medication_ids, dtype=object))
+    review = np.full(len(medications), FORECAST_DEFAULT_REVIEW_DAYS)
+    if order_dates:
+        ordered, ordered_days = zip(*sorted(order_dates))
+        rows, found = _index(np.array(ordered, dtype=object), medications)
+        ordinals = np.array([day.toordinal() for day in ordered_days])
+        consecutive = (rows[1:] == rows[:-1]) & found[1:] & found[:-1]
+        gaps = np.diff(ordinals)[consecutive]
+        gap_totals = np.bincount(rows[1:][consecutive], weights=gaps, minlength=len(medications))
+        gap_counts = np.bincount(rows[1:][consecutive], minlength=len(medications))
+        review = np.where(gap_counts > 0, gap_totals / np.maximum(gap_counts, 1), review)
+    pair_medications, _ = _index(np.array([key.split("\x1f", 1)[0] for key in pairs], dtype=object), medications)
+    cover = lead_time_days + review[pair_medications]
+
+    z = NormalDist().inv_cdf(service_level)
+    safety = z * std * np.sqrt(cover)
+    reorder_point = mean * cover + safety
+
+    inventory_ids, inventory_medications, inventory_locations, min_stocks = zip(*inventory)
+    rows, found = _index(_pair_keys(inventory_medications, inventory_locations), pairs)
+    return [
+        MinStockRecommendation(
+            inventory_id=inventory_ids[i],
+            medicationId=inventory_medications[i],
+            location=inventory_locations[i],
+            current_min_stock=min_stocks[i],
+            daily_mean=round(float(mean[row]), 3),
+            daily_std=round(float(std[row]), 3),
+            review_days=round(float(review[pair_medications[row]]), 1),
+            safety_stock=round(float(safety[row]), 2),
+            reorder_point=round(float(reorder_point[row]), 2),
+            recommended_min_stock=float(math.ceil(reorder_point[row])),
+        )
+        for i, row in enumerate(rows)
+        if found[i]
+    ]
+
+
+async def get_min_stock_recommendations(
+    session: AsyncSession,
+    history_days: int = FORECAST_HISTORY_DAYS,
+    lead_time_days: float = FORECAST_LEAD_TIME_DAYS,
+    service_level: float = FORECAST_SERVICE_LEVEL,
+    medication_id: Optional[str] = None,
+) -> List[MinStockRecommendation]:
+    """
+    Recommend a minimum stock for every inventory item from the consumption of the last `history_days`.
+
+    Consumption is the amount added to carts per operation date and location
+    of the batch it was taken from. The history is read with two aggregate
+    queries; the forecast runs in a worker thread.
+
+    - **session**: Async database session.
+    - **history_days**: Days of history, ending yesterday.
+    - **lead_time_days**: Days from order to delivery.
+    - **service_level**: Probability of not running out before a delivery (0-1, exclusive).
+    - **medication_id**: Only this medication.
+
+    Returns a list of `MinStockRecommendation` entries; items without consumption are left out.
+    """
+    start = date.today() - timedelta(days=history_days)
+    consumption_query = (
+        select(CartItem.medication_id, Inventory.location, func.sum(CartItem.amount))
+        .join(Cart, Cart.id == CartItem.cart_id)
+        .join(Inventory, Inventory.id == CartItem.inventory_id)
+        .where(Cart.operationDate >= start, Cart.operationDate < date.today())
+        .group_by(CartItem.medication_id, Inventory.location, Cart.operationDate)
+    )
+    orders_query = (
+        select(OrderLine.medicationId, Order.date)
+        .join(Order, Order.id == OrderLine.order_id)
+        .where(Order.date >= start, Order.date < date.today())
+        .distinct()
+    )
+    inventory_query = select(Inventory.id, Inventory.medicationId, Inventory.location, Inventory.min_stock)
+    if medication_id is not None:
+        consumption_query = consumption_query.where(CartItem.medication_id == medication_id)
+        orders_query = orders_query.where(OrderLine.medicationId == medication_id)
+        inventory_query = inventory_query.where(Inventory.medicationId == medication_id)
+
+    consumption = (await session.exec(consumption_query)).all()
+    order_dates = (await session.exec(orders_query)).all()
+    inventory = (await session.exec(inventory_query)).all()
+    return await asyncio.to_thread(
+        forecast_min_stock, consumption, order_dates, inventory, history_days, lead_time_days, service_level
+    )
+
+
+async def apply_min_stock_recommendations(
+    session: AsyncSession, recommendations: List[MinStockRecommendation], inventory_ids: Optional[List[int]] = None
+) -> int:
+    """
+    Set the recommended minimum stock on the inventory items in one batched update.
+
+    - **session**: Async database session.
+    - **recommendations**: Recommendations from `get_min_stock_recommendations`.
+    - **inventory_ids**: Only these inventory items; all recommendations if omitted.
+
+    Returns the number of updated inventory items.
+    """
+    selected = set(inventory_ids) if inventory_ids is not None else None
+    changed = [
+        r for r in recommendations
+        if r.recommended_min_stock != r.current_min_stock and (selected is None or r.inventory_id in selected)
+    ]
+    if not changed:
+        return 0
+    table = Inventory.__table__
+    await session.exec(
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .values(min_stock=bindparam("b_min_stock"), version=table.c.version + 1),
+        params=[{"b_id": r.inventory_id, "b_min_stock": r.recommended_min_stock} for r in changed],
+    )
+    await session.commit()
+    change_feed.emit([row_change("inventory", "update", r.inventory_id, {"min_stock": r.recommended_min_stock}) for r in changed])
+    return len(changed)
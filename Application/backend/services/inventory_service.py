@@ -1,10 +1,13 @@
 from typing import List, Optional
 from fastapi import HTTPException
+from sqlalchemy import func, update
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from Application.backend.models.inventory import Inventory, InventoryCreate
+from Application.backend.core.concurrency import precondition_failed
+from Application.backend.models.inventory import Inventory, InventoryCreate, StockLevel
 from Application.backend.models.medication import Medication
+from Application.backend.services.change_feed import change_feed, row_change, row_fields
 
 
 async def get_all_inventory(session: AsyncSession) -> List[Inventory]:
@@ -62,6 +65,7 @@ async def add_inventory(session: AsyncSession, inventory_data: InventoryCreate)
     session.add(item)
     await session.commit()
     await session.refresh(item)
+    change_feed.emit([row_change("inventory", "create", item.id, row_fields(item))])
     return item
 
 
@@ -78,27 +82,63 @@ async def get_inventory_by_medication(session: AsyncSession, medication_id: str)
     return result.all()
 
 
-async def update_inventory_amount(session: AsyncSession, inventory_id: str, new_amount: float) -> Inventory:
+async def get_stock_level(session: AsyncSession, medication_id: str) -> Optional[StockLevel]:
+    """
+    Sum the stock of a medication across all batches.
+
+    The minimum stock is the largest `min_stock` of the batches, as in the
+    low-stock index. Read from the database, so it includes the changes of
+    every process.
+
+    - **session**: Async database session.
+    - **medication_id**: Medication identifier.
+
+    Returns the `StockLevel`, or `None` if the medication has no inventory.
+    """
+    result = await session.exec(
+        select(func.count(), func.sum(Inventory.amount), func.max(Inventory.min_stock))
+        .where(Inventory.medicationId == medication_id)
+    )
+    batches, total, min_stock = result.one()
+    if not batches:
+        return None
+    min_stock = min_stock or 0
+    return StockLevel(medicationId=medication_id, total=total, min_stock=min_stock, low=total < min_stock)
+
+
+async def update_inventory_amount(
+    session: AsyncSession, inventory_id: str, new_amount: float, if_match: Optional[list[int]] = None
+) -> Inventory:
     """
     Update the available amount of an inventory item.
 
+    A single guarded `UPDATE ... RETURNING` sets the amount and bumps the
+    version, so no read is needed unless the update matches no row.
+
     - **session**: Async database session.
     - **inventory_id**: ID of the inventory item.
     - **new_amount**: New amount to set.
+    - **if_match**: Versions the item must still have (from `If-Match`), `None` to update unconditionally.
 
     Raises:
         HTTPException 404 if the inventory item does not exist.
+        HTTPException 412 if the item's version is not one of `if_match`.
 
     Returns the updated `Inventory` item.
     """
-    item = await get_inventory_by_id(session, inventory_id)
-    if not item:
-        raise HTTPException(status_code=404, detail=f"Inventory item '{inventory_id}' not found")
+    statement = update(Inventory).where(Inventory.id == inventory_id)
+    if if_match is not None:
+        statement = statement.where(Inventory.version.in_(if_match))
+    statement = statement.values(amount=new_amount, version=Inventory.version + 1).returning(Inventory)
+    item = (await session.exec(statement)).scalars().one_or_none()
+    if item is None:
+        current = await get_inventory_by_id(session, inventory_id)
+        if not current:
+            raise HTTPException(status_code=404, detail=f"Inventory item '{inventory_id}' not found")
+        raise precondition_failed(f"Inventory item '{inventory_id}'", current.version)
 
-    item.amount = new_amount
-    session.add(item)
     await session.commit()
-    await session.refresh(item)
+    change_feed.emit([row_change("inventory", "update", item.id, {"amount": item.amount, "version": item.version})])
     return item
 
 
@@ -118,6 +158,7 @@ async def delete_inventory(session: AsyncSession, inventory_id: str) -> None:
 
     await session.delete(item)
     await session.commit()
+    change_feed.emit([row_change("inventory", "delete", item.id)])
 
 
 async def delete_all_inventory(session: AsyncSession) -> int:
@@ -136,4 +177,5 @@ async def delete_all_inventory(session: AsyncSession) -> int:
         await session.delete(item)
 
     await session.commit()
+    change_feed.emit([row_change("inventory", "delete", item.id) for item in items])
     return count
\ No newline at end of file
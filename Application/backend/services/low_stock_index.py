@@ -0,0 +1,220 @@
+import asyncio
+import logging
+import os
+from typing import Dict, List, Optional
+
+from sqlmodel import select
+
+from Application.backend.models.inventory import Inventory, StockLevel
+from Application.backend.services.change_feed import change_feed
+from Application.backend.socket_manager import manager
+
+logger = logging.getLogger(__name__)
+
+LOW_STOCK_EVENT = "low_stock"
+# Seconds between two reloads picking up the inventory changes of other processes, 0 disables them
+LOW_STOCK_RELOAD_SECONDS = float(os.getenv("LOW_STOCK_RELOAD_SECONDS", "60"))
+
+
+class _Batch:
+    """Stock of one inventory item as known to the index."""
+
+    def __init__(self, inventory_id: int, medication_id: str, amount: float, min_stock: float):
+        self.id = inventory_id
+        self.medication_id = medication_id
+        self.amount = amount
+        self.min_stock = min_stock
+
+
+class LowStockIndex:
+    """
+    Keeps the set of medications whose total stock across all batches is below their minimum stock.
+
+    The index is loaded once from the database and then updated from the
+    inventory changes published on the change feed by the services of this
+    process, so reading it never scans the inventory. The minimum stock of a
+    medication is the largest `min_stock` of its batches. When a medication
+    falls below it or recovers, a `low_stock` event is broadcast.
+
+    Changes made by other processes are only seen by reloading the index,
+    which happens every `reload_interval` seconds. Their threshold crossings
+    are broadcast by the process that made them, not again on reload. The
+    stock level read by the reorder decision comes from the database, see
+    `inventory_service.get_stock_level`.
+    """
+
+    def __init__(self, reload_interval: float = LOW_STOCK_RELOAD_SECONDS):
+        """
+        Create an empty index.
+
+        - **reload_interval**: Seconds between two reloads, 0 to only load on demand.
+        """
+        self.reload_interval = reload_interval
+        self._batches: Dict[int, _Batch] = {}
+        self._by_medication: Dict[str, set[int]] = {}
+        self._totals: Dict[str, float] = {}
+        self._low: Dict[str, StockLevel] = {}
+        self._tasks: set[asyncio.Task] = set()
+        # Changes applied while a reload is reading, re-applied on top of it
+        self._during_load: Optional[List[List[dict]]] = None
+        self._reloader: Optional[asyncio.Task] = None
+        self.loaded = False
+
+    async def start(self, session_maker) -> None:
+        """
+        Load the index and reload it periodically.
+
+        - **session_maker**: Factory of async database sessions.
+        """
+        await self.load(session_maker)
+        if self._reloader is None and self.reload_interval > 0:
+            self._reloader = asyncio.create_task(self._reload(session_maker))
+
+    async def stop(self) -> None:
+        """Stop reloading."""
+        if self._reloader is not None:
+            self._reloader.cancel()
+            try:
+                await self._reloader
+            except asyncio.CancelledError:
+                pass
+            self._reloader = None
+
+    async def _reload(self, session_maker) -> None:
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                await self.load(session_maker)
+            except Exception as e:
+                logger.warning(f"Low-stock index reload failed: {e}")
+
+    async def load(self, session_maker) -> int:
+        """
+        Rebuild the index from the inventory table.
+
+        - **session_maker**: Factory of async database sessions.
+
+        Returns the number of medications below their minimum stock.
+        """
+        self._during_load = []
+        try:
+            async with session_maker() as session:
+                result = await session.exec(select(Inventory.id, Inventory.medicationId, Inventory.amount, Inventory.min_stock))
+                rows = result.all()
+            self._batches, self._by_medication, self._totals, self._low = {}, {}, {}, {}
+            for inventory_id, medication_id, amount, min_stock in rows:
+                self._add(inventory_id, medication_id, amount, min_stock)
+            # Changes committed after the read would be lost otherwise; they carry absolute values
+            for changes in self._during_load:
+                self.apply(changes)
+        finally:
+            self._during_load = None
+        for medication_id in self._by_medication:
+            self._refresh(medication_id)
+        self.loaded = True
+        logger.debug(f"Low-stock index loaded with {len(self._low)} of {len(self._by_medication)} medications below minimum")
+        return len(self._low)
+
+    def low_stock(self) -> List[StockLevel]:
+        """Return the medications below their minimum stock, lowest relative stock first."""
+        return sorted(self._low.values(), key=lambda level: level.total / level.min_stock if level.min_stock else 0)
+
+    def apply(self, changes: List[dict]) -> List[StockLevel]:
+        """
+        Apply committed inventory changes.
+
+        - **changes**: Changes built with `row_change`; other entities are ignored.
+
+        Returns the stock level of every medication that crossed its minimum stock.
+        """
+        touched = set()
+        for change in changes:
+            if change["entity"] != "inventory":
+                continue
+            batch = self._batches.get(change["id"])
+            fields = change.get("fields") or {}
+            if change["op"] == "create":
+                if batch is not None:
+                    # Already read by a reload
+                    self._remove(batch)
+                self._add(change["id"], fields["medicationId"], fields["amount"], fields["min_stock"])
+                touched.add(fields["medicationId"])
+            elif batch is None:
+                # Created by another process
+                continue
+            elif change["op"] == "delete":
+                self._remove(batch)
+                touched.add(batch.medication_id)
+            elif "amount" in fields or "min_stock" in fields:
+                self._totals[batch.medication_id] += fields.get("amount", batch.amount) - batch.amount
+                batch.amount = fields.get("amount", batch.amount)
+                batch.min_stock = fields.get("min_stock", batch.min_stock)
+                touched.add(batch.medication_id)
+        return [level for level in map(self._refresh, touched) if level is not None]
+
+    def _add(self, inventory_id: int, medication_id: str, amount: float, min_stock: Optional[float]) -> None:
+        self._batches[inventory_id] = _Batch(inventory_id, medication_id, amount, min_stock or 0)
+        self._by_medication.setdefault(medication_id, set()).add(inventory_id)
+        self._totals[medication_id] = self._totals.get(medication_id, 0) + amount
+
+    def _remove(self, batch: _Batch) -> None:
+        del self._batches[batch.id]
+        self._by_medication[batch.medication_id].discard(batch.id)
+        self._totals[batch.medication_id] -= batch.amount
+        if not self._by_medication[batch.medication_id]:
+            del self._by_medication[batch.medication_id], self._totals[batch.medication_id]
+
+    def _level(self, medication_id: str) -> StockLevel:
+        total = self._totals[medication_id]
+        min_stock = max(self._batches[inventory_id].min_stock for inventory_id in self._by_medication[medication_id])
+        return StockLevel(medicationId=medication_id, total=total, min_stock=min_stock, low=total < min_stock)
+
+    def _refresh(self, medication_id: str) -> Optional[StockLevel]:
+        """Update the membership of a medication; return its level if it changed."""
+        was_low = medication_id in self._low
+        if medication_id not in self._by_medication:
+            self._low.pop(medication_id, None)
+            return None
+        level = self._level(medication_id)
+        if level.low:
+            self._low[medication_id] = level
+        else:
+            self._low.pop(medication_id, None)
+        return level if level.low != was_low else None
+
+    def on_changes(self, changes: List[dict]) -> None:
+        """Change feed listener: apply the changes and broadcast threshold crossings."""
+        if self._during_load is not None:
+            self._during_load.append(changes)
+        if not self.loaded:
+            return
+        crossed = self.apply(changes)
+        if not crossed:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        for level in crossed:
+            task = asyncio.create_task(self._publish(level))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _publish(self, level: StockLevel) -> None:
+        state = "below" if level.low else "back above"
+        try:
+            await manager.broadcast(
+                {
+                    "event_type": LOW_STOCK_EVENT,
+                    "message": f"{level.medicationId} is {state} its minimum stock ({level.total:g} of {level.min_stock:g})",
+                    **level.model_dump(),
+                },
+                event_type=LOW_STOCK_EVENT,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to publish low-stock event for {level.medicationId}: {e}")
+
+
+# Global instance, started by the application lifespan and fed by the change feed
+low_stock_index = LowStockIndex()
+change_feed.add_listener(low_stock_index.on_changes)
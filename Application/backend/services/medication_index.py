@@ -0,0 +1,239 @@
+import asyncio
+import bisect
+import json
+import logging
+import os
+import unicodedata
+from collections import Counter, defaultdict
+from itertools import chain
+from typing import Dict, List, Optional
+
+from sqlmodel import select
+
+from Application.backend.models.medication import Medication, MedicationMatch
+from Application.backend.services.change_feed import change_feed
+
+logger = logging.getLogger(__name__)
+
+# Optional JSON file mapping medication IDs to further names (brand names, spellings)
+MEDICATION_ALIASES_FILE = os.getenv("MEDICATION_ALIASES_FILE")
+# Minimum similarity of a fuzzy match, between 0 and 1
+FUZZY_MATCH_THRESHOLD = float(os.getenv("FUZZY_MATCH_THRESHOLD", "0.3"))
+# Seconds between two reloads picking up the catalog changes of other processes, 0 disables them
+MEDICATION_INDEX_RELOAD_SECONDS = float(os.getenv("MEDICATION_INDEX_RELOAD_SECONDS", "60"))
+
+
+def normalize(name: str) -> str:
+    """Lowercase a name, drop accents and punctuation and collapse whitespace."""
+    decomposed = unicodedata.normalize("NFKD", name.lower())
+    return " ".join("".join(c if c.isalnum() else " " for c in decomposed if not unicodedata.combining(c)).split())
+
+
+def trigrams(normalized: str) -> set[str]:
+    """Trigrams of every word, padded like `pg_trgm`: two spaces in front, one behind."""
+    grams = set()
+    for word in normalized.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class MedicationNameIndex:
+    """
+    Trigram index over the medication names (and aliases) of the catalog.
+
+    Every name is split into trigrams; an inverted list per trigram points to
+    the names containing it, so a lookup only touches names sharing at least
+    one trigram with the query. Similarity is the share of common trigrams
+    (`pg_trgm` style), 1.0 for identical names. Prefix completion uses a
+    sorted list of the names.
+
+    The index is loaded at startup and extended by medications created
+    through the service layer of this process. Medications created, renamed
+    or deleted by other processes (including the seeding of the leader) are
+    picked up by reloading the index every `reload_interval` seconds.
+    """
+
+    def __init__(self, reload_interval: float = MEDICATION_INDEX_RELOAD_SECONDS):
+        """
+        Create an empty index.
+
+        - **reload_interval**: Seconds between two reloads, 0 to only load on demand.
+        """
+        self.reload_interval = reload_interval
+        self._names: List[tuple[str, str]] = []
+        self._sizes: List[int] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._sorted: List[tuple[str, int]] = []
+        self._canonical: Dict[str, str] = {}
+        # Changes applied while a reload is reading, re-applied on top of it
+        self._during_load: Optional[List[List[dict]]] = None
+        self._reloader: Optional[asyncio.Task] = None
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._canonical)
+
+    async def start(self, session_maker) -> None:
+        """
+        Load the index and reload it periodically.
+
+        - **session_maker**: Factory of async database sessions.
+        """
+        await self.load(session_maker)
+        if self._reloader is None and self.reload_interval > 0:
+            self._reloader = asyncio.create_task(self._reload(session_maker))
+
+    async def stop(self) -> None:
+        """Stop reloading."""
+        if self._reloader is not None:
+            self._reloader.cancel()
+            try:
+                await self._reloader
+            except asyncio.CancelledError:
+                pass
+            self._reloader = None
+
+    async def _reload(self, session_maker) -> None:
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                await self.load(session_maker)
+            except Exception as e:
+                logger.warning(f"Medication name index reload failed: {e}")
+
+    async def load(self, session_maker) -> int:
+        """
+        Rebuild the index from the medications table and the alias file.
+
+        - **session_maker**: Factory of async database sessions.
+
+        Returns the number of indexed medications.
+        """
+        self._during_load = []
+        try:
+            async with session_maker() as session:
+                rows = (await session.exec(select(Medication.medicationId, Medication.name))).all()
+            aliases: Dict[str, List[str]] = {}
+            if MEDICATION_ALIASES_FILE:
+                with open(MEDICATION_ALIASES_FILE, encoding="utf-8") as f:
+                    aliases = json.load(f)
+
+            self._names, self._sizes, self._postings, self._sorted, self._canonical = [], [], defaultdict(list), [], {}
+            for medication_id, name in rows:
+                self.add(medication_id, name, aliases.get(medication_id, ()))
+            # Medications created after the read would be missing otherwise
+            for changes in self._during_load:
+                self._apply(changes)
+        finally:
+            self._during_load = None
+        self.loaded = True
+        logger.debug(f"Medication name index loaded with {len(self._names)} names of {len(self)} medications")
+        return len(self)
+
+    def add(self, medication_id: str, name: str, aliases=()) -> None:
+        """
+        Index a medication under its name and aliases.
+
+        - **medication_id**: ID of the medication.
+        - **name**: Catalog name, returned with every match.
+        - **aliases**: Further names the medication is found by.
+
+        A medication that is already indexed is left as it is.
+        """
+        if medication_id in self._canonical:
+            return
+        self._canonical[medication_id] = name
+        for indexed in (name, *aliases):
+            normalized = normalize(indexed)
+            if not normalized:
+                continue
+            position = len(self._names)
+            grams = trigrams(normalized)
+            self._names.append((medication_id, indexed))
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings[gram].append(position)
+            bisect.insort(self._sorted, (normalized, position))
+
+    def search(self, query: str, limit: int = 10, threshold: float = FUZZY_MATCH_THRESHOLD) -> List[MedicationMatch]:
+        """
+        Rank the medications by the similarity of their best-matching name to `query`.
+
+        - **query**: Name as written, e.g. on a checklist.
+        - **limit**: Maximum number of matches.
+        - **threshold**: Minimum similarity.
+
+        Returns a list of `MedicationMatch` objects, most similar first.
+        """
+        grams = trigrams(normalize(query))
+        if not grams:
+            return []
+        shared = Counter(chain.from_iterable(self._postings.get(gram, ()) for gram in grams))
+        size, sizes = len(grams), self._sizes
+        best: Dict[str, tuple[float, str]] = {}
+        for position, count in shared.items():
+            score = count / (size + sizes[position] - count)
+            if score >= threshold:
+                medication_id, indexed = self._names[position]
+                if score > best.get(medication_id, (0.0, ""))[0]:
+                    best[medication_id] = (score, indexed)
+        ranked = sorted(best.items(), key=lambda entry: (-entry[1][0], entry[1][1]))[:limit]
+        return [self._match(medication_id, indexed, score) for medication_id, (score, indexed) in ranked]
+
+    def best_match(self, query: str, threshold: float = FUZZY_MATCH_THRESHOLD) -> Optional[MedicationMatch]:
+        """Return the most similar medication, or `None` if none reaches `threshold`."""
+        matches = self.search(query, limit=1, threshold=threshold)
+        return matches[0] if matches else None
+
+    def complete(self, prefix: str, limit: int = 10) -> List[MedicationMatch]:
+        """
+        Autocomplete a partially typed name.
+
+        Names starting with `prefix` come first (shortest first), the rest is
+        filled up with fuzzy matches, so misspelled input still finds results.
+
+        - **prefix**: Typed text.
+        - **limit**: Maximum number of suggestions.
+
+        Returns a list of `MedicationMatch` objects.
+        """
+        normalized = normalize(prefix)
+        if not normalized:
+            return []
+        suggestions: Dict[str, MedicationMatch] = {}
+        prefixed = []
+        for name, position in self._sorted[bisect.bisect_left(self._sorted, (normalized, -1)):]:
+            if not name.startswith(normalized):
+                break
+            prefixed.append((len(name), name, position))
+        for _, name, position in sorted(prefixed):
+            medication_id, indexed = self._names[position]
+            if medication_id not in suggestions:
+                suggestions[medication_id] = self._match(medication_id, indexed, len(normalized) / len(name))
+        if len(suggestions) < limit:
+            for match in self.search(prefix, limit=limit):
+                suggestions.setdefault(match.medicationId, match)
+        return list(suggestions.values())[:limit]
+
+    def _match(self, medication_id: str, indexed: str, score: float) -> MedicationMatch:
+        return MedicationMatch(
+            medicationId=medication_id, name=self._canonical[medication_id], matched_name=indexed, score=round(score, 3)
+        )
+
+    def on_changes(self, changes: List[dict]) -> None:
+        """Change feed listener: index created medications."""
+        if self._during_load is not None:
+            self._during_load.append(changes)
+        if self.loaded:
+            self._apply(changes)
+
+    def _apply(self, changes: List[dict]) -> None:
+        for change in changes:
+            if change["entity"] == "medications" and change["op"] == "create":
+                self.add(change["id"], change["fields"]["name"])
+
+
+# Global instance, started by the application lifespan and fed by the change feed
+medication_index = MedicationNameIndex()
+change_feed.add_listener(medication_index.on_changes)
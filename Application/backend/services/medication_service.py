@@ -3,6 +3,7 @@ from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from Application.backend.models.medication import Medication, MedicationCreate
+from Application.backend.services.change_feed import change_feed, row_change, row_fields
 
 
 async def get_all_medications(session: AsyncSession) -> List[Medication]:
@@ -30,4 +31,5 @@ async def create_medication(session: AsyncSession, medication_data: MedicationCr
     session.add(medication)
     await session.commit()
     await session.refresh(medication)
+    change_feed.emit([row_change("medications", "create", medication.medicationId, row_fields(medication))])
     return medication
\ No newline at end of file
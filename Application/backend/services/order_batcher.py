@@ -0,0 +1,231 @@
+import asyncio
+import logging
+import os
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from Application.backend.models.medication import Medication
+from Application.backend.models.order import Order, OrderCreate, ReorderLine, ReorderReceipt, ReorderRequest
+from Application.backend.services.change_feed import change_feed, row_change, row_fields
+from Application.backend.services.order_service import stage_order
+
+logger = logging.getLogger(__name__)
+
+# Seconds reorder requests are collected before their consolidated order is written
+ORDER_BATCH_WINDOW_SECONDS = float(os.getenv("ORDER_BATCH_WINDOW_SECONDS", "300"))
+
+
+def _now() -> datetime:
+    # Naive UTC, like the other datetime columns
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class OrderBatcher:
+    """
+    Merges reorder requests into one order per supplier.
+
+    Requests are stored in the `reorder_requests` table and collected per
+    supplier (`Medication.producer`) and internal flag for
+    `ORDER_BATCH_WINDOW_SECONDS`, starting with the oldest pending request,
+    then written as a single order with one line per medication and the
+    amounts summed. Rush requests are written at once.
+
+    Pending requests survive restarts, and every process checks for due
+    suppliers about ten times per window, so the requests of all processes
+    end up in the same order. A request ID is stored with its request and is
+    unique, so a retried request is counted once, before and after its order
+    was written.
+    """
+
+    def __init__(self, window: float = ORDER_BATCH_WINDOW_SECONDS):
+        """
+        Create the batcher.
+
+        - **window**: Seconds requests are collected before the order is written.
+        """
+        self.window = window
+        self._session_maker = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self, session_maker) -> None:
+        """
+        Start writing due orders in the background.
+
+        - **session_maker**: Factory of async database sessions used to write the orders.
+        """
+        self._session_maker = session_maker
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop writing orders; pending requests stay in the database."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def submit(self, session: AsyncSession, request: ReorderRequest) -> ReorderReceipt:
+        """
+        Store a reorder request, and write it at once if it is a rush request.
+
+        A request whose `request_id` was already submitted is not stored again;
+        the receipt of the earlier request is returned instead.
+
+        - **session**: Async database session.
+        - **request**: Medication, amount and flags of the reorder.
+
+        Raises:
+            HTTPException 404 if the medication does not exist.
+
+        Returns a `ReorderReceipt`; `order_id` is set once the request was written to an order.
+        """
+        if request.request_id is not None:
+            existing = await _by_request_id(session, request.request_id)
+            if existing is not None:
+                return await _receipt(session, existing)
+
+        producer = (
+            await session.exec(select(Medication.producer).where(Medication.medicationId == request.medicationId))
+        ).one_or_none()
+        if producer is None:
+            raise HTTPException(status_code=404, detail=f"Medication '{request.medicationId}' not found")
+
+        line = ReorderLine(
+            request_id=request.request_id,
+            medicationId=request.medicationId,
+            supplier=producer,
+            amount=request.amount,
+            isRush=request.isRush,
+            isInternal=request.isInternal,
+            created_at=_now(),
+        )
+        try:
+            if request.isRush:
+                await _write(session, producer, True, request.isInternal, [line])
+            else:
+                session.add(line)
+                await session.commit()
+        except IntegrityError:
+            # The same request arrived concurrently
+            await session.rollback()
+            existing = await _by_request_id(session, request.request_id)
+            if existing is None:
+                raise
+            line = existing
+        return await _receipt(session, line)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.window / 10)
+            try:
+                await self.flush_due()
+            except Exception as e:
+                logger.warning(f"Writing due orders failed, retrying: {e}")
+
+    async def flush_due(self) -> List[Order]:
+        """
+        Write the orders of all suppliers whose oldest pending request is older than the window.
+
+        Returns the written orders.
+        """
+        async with self._session_maker() as session:
+            result = await session.exec(
+                select(ReorderLine.supplier, ReorderLine.isInternal)
+                .where(ReorderLine.order_id == None)  # noqa: E711
+                .group_by(ReorderLine.supplier, ReorderLine.isInternal)
+                .having(func.min(ReorderLine.created_at) <= _now() - timedelta(seconds=self.window))
+            )
+            due = result.all()
+        orders = []
+        for key in due:
+            order = await self.flush(tuple(key))
+            if order is not None:
+                orders.append(order)
+        return orders
+
+    async def flush(self, key: tuple[str, bool]) -> Optional[Order]:
+        """
+        Write the pending requests of a supplier to an order now.
+
+        Pending requests are locked while they are written, so a concurrent
+        flush in another process skips them instead of ordering them twice.
+
+        - **key**: Supplier and internal flag of the pending requests.
+
+        Returns the written `Order`, or `None` if nothing was pending.
+        """
+        producer, is_internal = key
+        async with self._session_maker() as session:
+            result = await session.exec(
+                select(ReorderLine)
+                .where(
+                    ReorderLine.supplier == producer,
+                    ReorderLine.isInternal == is_internal,
+                    ReorderLine.order_id == None,  # noqa: E711
+                )
+                .with_for_update(skip_locked=True)
+            )
+            lines = result.all()
+            if not lines:
+                return None
+            order = await _write(session, producer, False, is_internal, lines)
+        logger.info(f"Ordered {len(order.medications)} medications from {producer} in order {order.id}")
+        return order
+
+
+async def _by_request_id(session: AsyncSession, request_id: str) -> Optional[ReorderLine]:
+    result = await session.exec(select(ReorderLine).where(ReorderLine.request_id == request_id))
+    return result.one_or_none()
+
+
+async def _receipt(session: AsyncSession, line: ReorderLine) -> ReorderReceipt:
+    """Describe a stored request: its order, or the number of medications pending for its supplier."""
+    if line.order_id is not None:
+        result = await session.exec(select(func.count(func.distinct(ReorderLine.medicationId))).where(ReorderLine.order_id == line.order_id))
+        return ReorderReceipt(supplier=line.supplier, queued=False, order_id=line.order_id, lines=result.one())
+    result = await session.exec(
+        select(func.count(func.distinct(ReorderLine.medicationId))).where(
+            ReorderLine.supplier == line.supplier,
+            ReorderLine.isInternal == line.isInternal,
+            ReorderLine.order_id == None,  # noqa: E711
+        )
+    )
+    return ReorderReceipt(supplier=line.supplier, queued=True, lines=result.one())
+
+
+async def _write(session: AsyncSession, producer: str, is_rush: bool, is_internal: bool, lines: List[ReorderLine]) -> Order:
+    """Write requests to one order and mark them ordered, in one transaction."""
+    amounts: Dict[str, float] = {}
+    for line in lines:
+        amounts[line.medicationId] = amounts.get(line.medicationId, 0) + line.amount
+    order = await stage_order(session, _order(producer, is_rush, is_internal, amounts))
+    for line in lines:
+        line.order_id = order.id
+        session.add(line)
+    await session.commit()
+    await session.refresh(order)
+    change_feed.emit([row_change("orders", "create", order.id, row_fields(order))])
+    return order
+
+
+def _order(producer: str, is_rush: bool, is_internal: bool, lines: Dict[str, float]) -> OrderCreate:
+    return OrderCreate(
+        name=f"Reorder {producer}",
+        date=date.today(),
+        medications=[{"medicationId": medication_id, "amount": amount} for medication_id, amount in lines.items()],
+        isInternal=is_internal,
+        isRush=is_rush,
+    )
+
+
+# Global instance, started by the application lifespan
+order_batcher = OrderBatcher()
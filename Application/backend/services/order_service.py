@@ -1,10 +1,28 @@
+from datetime import date
 from typing import List, Optional
 
 from fastapi import HTTPException
+from sqlalchemy import case, delete, func
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from Application.backend.models.order import Order, OrderCreate
+from Application.backend.models.order import DailyDemand, MedicationDemand, Order, OrderCreate, OrderLine
+from Application.backend.services.change_feed import change_feed, row_change, row_fields
+
+
+def order_lines(order: Order) -> List[OrderLine]:
+    """
+    Build the order lines of a flushed order from its `medications` JSON.
+
+    - **order**: Order with its ID assigned.
+
+    Returns one `OrderLine` per entry with a medication ID.
+    """
+    return [
+        OrderLine(order_id=order.id, medicationId=line["medicationId"], amount=float(line.get("amount") or 0))
+        for line in order.medications or []
+        if line.get("medicationId")
+    ]
 
 
 async def get_all_orders(session: AsyncSession) -> List[Order]:
@@ -32,25 +50,41 @@ async def get_order_by_id(session: AsyncSession, order_id: str) -> Optional[Orde
     return result.one_or_none()
 
 
-async def add_order(session: AsyncSession, order_data: OrderCreate) -> Order:
+async def stage_order(session: AsyncSession, order_data: OrderCreate) -> Order:
     """
-    Create a new order.
+    Add a new order and its order lines to the session and flush them. Does not commit.
 
     - **session**: Async database session.
     - **order_data**: Data required to create the order.
 
-    Returns the newly created `Order` object.
+    Returns the `Order` with its ID assigned.
     """
     order_item = Order(**order_data.model_dump())
     session.add(order_item)
+    await session.flush()
+    session.add_all(order_lines(order_item))
+    return order_item
+
+
+async def add_order(session: AsyncSession, order_data: OrderCreate) -> Order:
+    """
+    Create a new order together with its order lines.
+
+    - **session**: Async database session.
+    - **order_data**: Data required to create the order.
+
+    Returns the newly created `Order` object.
+    """
+    order_item = await stage_order(session, order_data)
     await session.commit()
     await session.refresh(order_item)
+    change_feed.emit([row_change("orders", "create", order_item.id, row_fields(order_item))])
     return order_item
 
 
 async def delete_order(session: AsyncSession, order_id: str) -> None:
     """
-    Delete an order by its ID.
+    Delete an order and its order lines by its ID.
 
     - **session**: Async database session.
     - **order_id**: ID of the order.
@@ -61,5 +95,62 @@ async def delete_order(session: AsyncSession, order_id: str) -> None:
     order_item = await get_order_by_id(session, order_id)
     if not order_item:
         raise HTTPException(status_code=404, detail=f"Order '{order_id}' not found")
+    await session.exec(delete(OrderLine).where(OrderLine.order_id == order_item.id))
     await session.delete(order_item)
-    await session.commit()
\ No newline at end of file
+    await session.commit()
+    change_feed.emit([row_change("orders", "delete", order_item.id)])
+
+
+async def get_demand(
+    session: AsyncSession, start: date, end: date, medication_id: Optional[str] = None
+) -> List[MedicationDemand]:
+    """
+    Sum the ordered amounts per medication over a date range.
+
+    - **session**: Async database session.
+    - **start**: First order date (inclusive).
+    - **end**: Last order date (inclusive).
+    - **medication_id**: Only this medication.
+
+    Returns a list of `MedicationDemand` entries, largest amount first.
+    """
+    statement = (
+        select(
+            OrderLine.medicationId,
+            func.sum(OrderLine.amount),
+            func.sum(case((Order.isRush == True, OrderLine.amount), else_=0.0)),  # noqa: E712
+            func.count(func.distinct(OrderLine.order_id)),
+        )
+        .join(Order, Order.id == OrderLine.order_id)
+        .where(Order.date >= start, Order.date <= end)
+        .group_by(OrderLine.medicationId)
+        .order_by(func.sum(OrderLine.amount).desc())
+    )
+    if medication_id is not None:
+        statement = statement.where(OrderLine.medicationId == medication_id)
+    result = await session.exec(statement)
+    return [
+        MedicationDemand(medicationId=medication, amount=amount, rush_amount=rush_amount, orders=orders)
+        for medication, amount, rush_amount, orders in result.all()
+    ]
+
+
+async def get_daily_demand(session: AsyncSession, medication_id: str, start: date, end: date) -> List[DailyDemand]:
+    """
+    Sum the ordered amounts of a medication per order date.
+
+    - **session**: Async database session.
+    - **medication_id**: Medication identifier.
+    - **start**: First order date (inclusive).
+    - **end**: Last order date (inclusive).
+
+    Returns a list of `DailyDemand` entries ordered by day; days without orders are missing.
+    """
+    result = await session.exec(
+        select(Order.date, func.sum(OrderLine.amount), func.count(func.distinct(OrderLine.order_id)))
+        .join(Order, Order.id == OrderLine.order_id)
+        .where(OrderLine.medicationId == medication_id, Order.date >= start, Order.date <= end)
+        .group_by(Order.date)
+        .order_by(Order.date)
+    )
+    return [DailyDemand(day=day, amount=amount, orders=orders) for day, amount, orders in result.all()]
@@ -0,0 +1,276 @@
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import delete, func, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from Application.backend.models.cart_item import CartItem
+from Application.backend.models.inventory import Inventory, InventoryAvailability
+from Application.backend.models.reservation import StockReservation
+from Application.backend.services.change_feed import row_change
+
+logger = logging.getLogger(__name__)
+
+# Minutes a prepared cart holds its stock before the stock can be promised to other carts
+RESERVATION_TTL_MINUTES = float(os.getenv("RESERVATION_TTL_MINUTES", "240"))
+# Seconds between two runs of the sweeper deleting expired holds
+RESERVATION_SWEEP_SECONDS = float(os.getenv("RESERVATION_SWEEP_SECONDS", "60"))
+
+
+def _now() -> datetime:
+    # Naive UTC, like the other datetime columns
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+async def held_amounts(
+    session: AsyncSession, inventory_ids: Iterable[int], exclude_cart_id: Optional[int] = None
+) -> Dict[int, float]:
+    """
+    Sum the active holds per inventory item.
+
+    - **session**: Async database session.
+    - **inventory_ids**: IDs of the inventory items.
+    - **exclude_cart_id**: Leave out the holds of this cart.
+
+    Returns the held amount per inventory ID; items without active holds are missing.
+    """
+    inventory_ids = list(inventory_ids)
+    if not inventory_ids:
+        return {}
+    statement = (
+        select(StockReservation.inventory_id, func.sum(StockReservation.amount))
+        .where(StockReservation.inventory_id.in_(inventory_ids), StockReservation.expires_at > _now())
+        .group_by(StockReservation.inventory_id)
+    )
+    if exclude_cart_id is not None:
+        statement = statement.where(StockReservation.cart_id != exclude_cart_id)
+    result = await session.exec(statement)
+    return {inventory_id: held for inventory_id, held in result.all()}
+
+
+async def available_to_promise(session: AsyncSession, items: List[Inventory]) -> Dict[int, float]:
+    """
+    Compute the amount of each inventory item that can still be promised: stock minus active holds.
+
+    - **session**: Async database session.
+    - **items**: Inventory items to compute the amount for.
+
+    Returns the available amount per inventory ID.
+    """
+    held = await held_amounts(session, (item.id for item in items))
+    return {item.id: item.amount - held.get(item.id, 0) for item in items}
+
+
+async def get_availability_by_medication(session: AsyncSession, medication_id: str) -> List[InventoryAvailability]:
+    """
+    Retrieve stock, active holds and available-to-promise amount of all batches of a medication.
+
+    - **session**: Async database session.
+    - **medication_id**: Medication identifier.
+
+    Returns a list of `InventoryAvailability` entries.
+    """
+    result = await session.exec(select(Inventory).where(Inventory.medicationId == medication_id))
+    items = result.all()
+    held = await held_amounts(session, (item.id for item in items))
+    return [
+        InventoryAvailability(
+            inventory_id=item.id,
+            batchNumber=item.batchNumber,
+            location=item.location,
+            expirationDate=item.expirationDate,
+            amount=item.amount,
+            held=held.get(item.id, 0),
+            available=item.amount - held.get(item.id, 0),
+        )
+        for item in items
+    ]
+
+
+async def lock_inventory(session: AsyncSession, inventory_ids: Iterable[int]) -> Dict[int, Inventory]:
+    """
+    Lock inventory items until the end of the transaction and re-read them.
+
+    Concurrent requests taking or holding stock of the same items wait for
+    each other instead of failing, and the stock and holds read after the
+    lock are current, so two requests cannot both pass the availability
+    check. Rows are locked in ID order, so requests locking several items
+    cannot deadlock. SQLite has no row locks; it serializes writers itself.
+
+    - **session**: Async database session.
+    - **inventory_ids**: IDs of the inventory items.
+
+    Returns the locked items per ID; missing items are left out.
+    """
+    result = await session.exec(
+        select(Inventory)
+        .where(Inventory.id.in_(sorted(set(inventory_ids))))
+        .order_by(Inventory.id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    return {item.id: item for item in result.all()}
+
+
+async def adjust_stock(session: AsyncSession, inventory_id: int, delta: float) -> Optional[float]:
+    """
+    Add to or take from the stock of an inventory item in one atomic `UPDATE`, bumping its version.
+
+    A decrement only applies while the stock covers it (`amount >= -delta`).
+    Does not commit.
+
+    - **session**: Async database session.
+    - **inventory_id**: ID of the inventory item.
+    - **delta**: Amount to add, negative to take.
+
+    Returns the new amount, or `None` if the item does not exist or does not cover the decrement.
+    """
+    statement = update(Inventory).where(Inventory.id == inventory_id)
+    if delta < 0:
+        statement = statement.where(Inventory.amount >= -delta)
+    statement = statement.values(amount=Inventory.amount + delta, version=Inventory.version + 1).returning(Inventory.amount)
+    return (await session.exec(statement)).scalar_one_or_none()
+
+
+def hold(cart_item: CartItem) -> StockReservation:
+    """
+    Create the hold for a flushed, reserved cart item of a `Prepared` cart.
+
+    - **cart_item**: Cart item with its ID assigned.
+
+    Returns the `StockReservation`, to be added to the session.
+    """
+    return StockReservation(
+        cart_id=cart_item.cart_id,
+        cart_item_id=cart_item.id,
+        inventory_id=cart_item.inventory_id,
+        amount=cart_item.amount,
+        expires_at=_now() + timedelta(minutes=RESERVATION_TTL_MINUTES),
+    )
+
+
+async def convert_cart_reservations(session: AsyncSession, cart_id: int) -> List[dict]:
+    """
+    Turn the reserved items of a cart into real stock decrements.
+
+    Where a hold already expired, other carts may have been promised its
+    stock in the meantime. The inventory items are therefore locked and the
+    reserved amounts re-checked against the stock minus the active holds of
+    other carts before decrementing them in one guarded statement. Does not
+    commit.
+
+    - **session**: Async database session.
+    - **cart_id**: ID of the cart moving to `In-Use`.
+
+    Returns the inventory row changes for the change feed.
+
+    Raises:
+        HTTPException 409 if the stock of an item no longer covers the cart's reserved amount.
+    """
+    reserved = (
+        select(CartItem.inventory_id, func.sum(CartItem.amount).label("amount"))
+        .where(CartItem.cart_id == cart_id, CartItem.reserved == True)  # noqa: E712
+        .group_by(CartItem.inventory_id)
+        .subquery()
+    )
+    amounts = dict((await session.exec(select(reserved.c.inventory_id, reserved.c.amount))).all())
+    items = await lock_inventory(session, amounts)
+    held = await held_amounts(session, items, exclude_cart_id=cart_id)
+    short = sorted(
+        inventory_id for inventory_id, item in items.items() if item.amount - held.get(inventory_id, 0) < amounts[inventory_id]
+    )
+    if short:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Not enough stock left for the reserved items of cart {cart_id} in inventory items {short}, "
+            "their holds expired and the stock was promised elsewhere",
+        )
+    result = await session.exec(
+        update(Inventory)
+        .where(Inventory.id == reserved.c.inventory_id, Inventory.amount >= reserved.c.amount)
+        .values(amount=Inventory.amount - reserved.c.amount, version=Inventory.version + 1)
+        .returning(Inventory.id, Inventory.amount)
+        .execution_options(synchronize_session="fetch")
+    )
+    changes = [row_change("inventory", "update", inventory_id, {"amount": amount}) for inventory_id, amount in result.all()]
+    if len(changes) != len(items):
+        raise HTTPException(status_code=409, detail=f"Not enough stock left for the reserved items of cart {cart_id}")
+    await session.exec(
+        update(CartItem).where(CartItem.cart_id == cart_id, CartItem.reserved == True).values(reserved=False)  # noqa: E712
+    )
+    await release_cart_reservations(session, cart_id)
+    return changes
+
+
+async def release_cart_reservations(session: AsyncSession, cart_id: int) -> None:
+    """
+    Delete all holds of a cart, e.g. when it is closed or deleted. Does not commit.
+
+    - **session**: Async database session.
+    - **cart_id**: ID of the cart.
+    """
+    await session.exec(delete(StockReservation).where(StockReservation.cart_id == cart_id))
+
+
+async def release_expired_reservations(session: AsyncSession) -> int:
+    """
+    Delete all expired holds in one statement.
+
+    - **session**: Async database session.
+
+    Returns the number of released holds.
+    """
+    result = await session.exec(delete(StockReservation).where(StockReservation.expires_at <= _now()))
+    await session.commit()
+    return result.rowcount
+
+
+class ReservationSweeper:
+    """Background task releasing expired holds every `RESERVATION_SWEEP_SECONDS`."""
+
+    def __init__(self, session_maker, interval: float = RESERVATION_SWEEP_SECONDS):
+        """
+        Create a sweeper.
+
+        - **session_maker**: Factory of async database sessions.
+        - **interval**: Seconds between two sweeps.
+        """
+        self.session_maker = session_maker
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start sweeping in the background, if not already running."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sweeping."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def sweep(self) -> int:
+        """Release expired holds once and return their number."""
+        async with self.session_maker() as session:
+            released = await release_expired_reservations(session)
+        if released:
+            logger.info(f"Released {released} expired stock reservations")
+        return released
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.warning(f"Reservation sweep failed: {e}")
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,173 @@
+import asyncio
+import heapq
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import update
+from sqlmodel import select
+
+from Application.backend.models.cart import Cart, CartStatus
+from Application.backend.models.cart_item import CartItem
+from Application.backend.socket_manager import manager
+
+logger = logging.getLogger(__name__)
+
+STABILITY_EVENT = "stability_warning"
+# Minutes before the end of chemical stability at which the warning is sent
+STABILITY_WARNING_MINUTES = float(os.getenv("STABILITY_WARNING_MINUTES", "30"))
+
+
+def _now() -> datetime:
+    # Naive UTC, like the other datetime columns
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def stability_deadline(prepared_at: datetime, stability_hours: float) -> datetime:
+    """Return the end of the chemical stability of an item prepared at `prepared_at`."""
+    return prepared_at + timedelta(hours=stability_hours)
+
+
+class DeadlineScheduler:
+    """
+    Sends a warning shortly before each prepared cart item stops being chemically stable.
+
+    Deadlines are kept in a min-heap, so the scheduler sleeps until the next
+    one instead of scanning the table periodically. The heap is rebuilt from
+    the database at startup and updated by the cart item service when items
+    are added or removed. Removed items are only dropped from the lookup and
+    skipped when they reach the top of the heap.
+
+    Every process runs its own scheduler; the warning of an item is claimed
+    with a guarded update of `stability_notified_at`, so it is sent once even
+    when several processes know the item, and not at all once it was deleted.
+    """
+
+    def __init__(self, lead: timedelta = timedelta(minutes=STABILITY_WARNING_MINUTES)):
+        """
+        Create the scheduler.
+
+        - **lead**: How long before the deadline the warning is sent.
+        """
+        self.lead = lead
+        self._heap: list[tuple[datetime, int]] = []
+        self._deadlines: dict[int, datetime] = {}
+        self._session_maker = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    async def start(self, session_maker) -> int:
+        """
+        Load the pending deadlines and start waiting for them.
+
+        - **session_maker**: Factory of async database sessions.
+
+        Returns the number of loaded deadlines.
+        """
+        self._session_maker = session_maker
+        self._wakeup = asyncio.Event()
+        async with session_maker() as session:
+            result = await session.exec(
+                select(CartItem.id, CartItem.stable_until).where(
+                    CartItem.stable_until > _now(), CartItem.stability_notified_at == None  # noqa: E711
+                )
+            )
+            for cart_item_id, stable_until in result.all():
+                self.schedule(cart_item_id, stable_until)
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Stability scheduler started with {len(self)} deadlines")
+        return len(self)
+
+    async def stop(self) -> None:
+        """Stop the scheduler and forget all deadlines."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._heap.clear()
+        self._deadlines.clear()
+
+    def schedule(self, cart_item_id: int, stable_until: datetime) -> None:
+        """
+        Add or move the deadline of a cart item.
+
+        - **cart_item_id**: ID of the cart item.
+        - **stable_until**: End of its chemical stability (naive UTC).
+        """
+        self._deadlines[cart_item_id] = stable_until
+        heapq.heappush(self._heap, (stable_until, cart_item_id))
+        if self._wakeup is not None and self._heap[0] == (stable_until, cart_item_id):
+            self._wakeup.set()
+
+    def cancel(self, cart_item_id: int) -> None:
+        """Forget the deadline of a removed cart item."""
+        self._deadlines.pop(cart_item_id, None)
+
+    def _next(self) -> Optional[tuple[datetime, int]]:
+        """Return the earliest live entry, dropping cancelled or moved ones."""
+        while self._heap:
+            stable_until, cart_item_id = self._heap[0]
+            if self._deadlines.get(cart_item_id) == stable_until:
+                return self._heap[0]
+            heapq.heappop(self._heap)
+        return None
+
+    async def _run(self) -> None:
+        while True:
+            entry = self._next()
+            wait = None if entry is None else (entry[0] - self.lead - _now()).total_seconds()
+            if wait is None or wait > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            heapq.heappop(self._heap)
+            del self._deadlines[entry[1]]
+            try:
+                await self._notify(entry[1], entry[0])
+            except Exception as e:
+                logger.warning(f"Stability warning for cart item {entry[1]} failed: {e}")
+
+    async def _notify(self, cart_item_id: int, stable_until: datetime) -> None:
+        """Claim the warning of a cart item and broadcast it, unless it was already sent or the item is gone."""
+        async with self._session_maker() as session:
+            result = await session.exec(
+                update(CartItem)
+                .where(CartItem.id == cart_item_id, CartItem.stability_notified_at == None)  # noqa: E711
+                .values(stability_notified_at=_now())
+                .returning(CartItem.cart_id, CartItem.medication_id)
+            )
+            claimed = result.first()
+            await session.commit()
+            if claimed is None:
+                return
+            cart = await session.get(Cart, claimed.cart_id)
+        if cart is None or cart.status == CartStatus.closed:
+            return
+        minutes = max(0, round((stable_until - _now()).total_seconds() / 60))
+        await manager.broadcast(
+            {
+                "event_type": STABILITY_EVENT,
+                "message": f"{claimed.medication_id} in cart {cart.id} is chemically stable for {minutes} more minutes",
+                "cart_id": cart.id,
+                "room": cart.roomNumber,
+                "cart_item_id": cart_item_id,
+                "stable_until": stable_until.isoformat(),
+            },
+            cart_id=cart.id,
+            room=cart.roomNumber,
+            event_type=STABILITY_EVENT,
+        )
+
+
+# Global instance, started by the application lifespan
+stability_scheduler = DeadlineScheduler()
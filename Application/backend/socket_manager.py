@@ -1,55 +1,505 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+from enum import Enum
+
 from fastapi import WebSocket
 
+from Application.backend.notification_backends import BroadcastBackend, InMemoryBackend
+
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(str, Enum):
+    """What to do when a client's outbound queue is full."""
+
+    drop_oldest = "drop_oldest"
+    disconnect = "disconnect"
+
+
+WS_QUEUE_SIZE = int(os.getenv("WS_QUEUE_SIZE", "256"))
+WS_OVERFLOW_POLICY = OverflowPolicy(os.getenv("WS_OVERFLOW_POLICY", OverflowPolicy.drop_oldest.value))
+WS_REPLAY_BUFFER = int(os.getenv("WS_REPLAY_BUFFER", "1000"))
+# Protocol-level pings, sent and answered by uvicorn and the browser (see main.py)
+WS_PING_INTERVAL = float(os.getenv("WS_PING_INTERVAL", "25"))
+WS_PING_TIMEOUT = float(os.getenv("WS_PING_TIMEOUT", "20"))
+# Seconds without any frame from a client before it is evicted, 0 disables the reaper
+WS_IDLE_TIMEOUT = float(os.getenv("WS_IDLE_TIMEOUT", "0"))
+# Seconds to wait for a skipped sequence number before clients are told to resync
+WS_GAP_TIMEOUT = float(os.getenv("WS_GAP_TIMEOUT", "2"))
+
+RESYNC_EVENT = "resync_required"
+
+# Message attributes a client can subscribe on
+ROUTING_KEYS = ("cart_id", "room", "event_type")
+
+
+class ClientConnection:
+    """Outbound state of a single WebSocket: a bounded send queue and its writer task."""
+
+    def __init__(self, websocket: WebSocket, queue_size: int):
+        """
+        Create the outbound queue for a connection.
+
+        Args:
+            websocket: The accepted WebSocket connection.
+            queue_size: Maximum number of messages waiting to be sent.
+        """
+        self.websocket = websocket
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self.writer: asyncio.Task | None = None
+        self.dropped = 0
+        self.connected_at = time.monotonic()
+        # Last time the client sent any frame
+        self.last_seen = self.connected_at
+        # routing key -> accepted values, None means "everything"
+        self.filters: dict[str, frozenset | None] = {key: None for key in ROUTING_KEYS}
+
+    def matches(self, routing: dict) -> bool:
+        """
+        Check whether a message with the given routing attributes is wanted.
+
+        Args:
+            routing: Mapping of routing key to the message's value.
+
+        Returns:
+            True if every filtered key contains the message's value.
+        """
+        for key, accepted in self.filters.items():
+            if accepted is not None and routing.get(key) not in accepted:
+                return False
+        return True
+
 
 class ConnectionManager:
     """Manages active WebSocket connections for broadcasting messages."""
 
-    def __init__(self):
-        """Initialize the connection manager with an empty list of active connections."""
-        self.active_connections: list[WebSocket] = []
+    def __init__(
+        self,
+        queue_size: int = WS_QUEUE_SIZE,
+        overflow_policy: OverflowPolicy = WS_OVERFLOW_POLICY,
+        replay_buffer: int = WS_REPLAY_BUFFER,
+        idle_timeout: float = WS_IDLE_TIMEOUT,
+        gap_timeout: float = WS_GAP_TIMEOUT,
+    ):
+        """
+        Initialize the connection manager with no active connections.
+
+        Args:
+            queue_size: Maximum number of pending messages per connection.
+            overflow_policy: Policy applied when a connection's queue is full.
+            replay_buffer: Number of recent events kept for replay on reconnect.
+            idle_timeout: Seconds a client may stay silent before it is evicted, 0 to never evict.
+            gap_timeout: Seconds to wait for a skipped sequence number to arrive late.
+        """
+        self.active_connections: dict[WebSocket, ClientConnection] = {}
+        # Routing table: per key, clients without a filter and clients per accepted value
+        self._wildcards: dict[str, set[ClientConnection]] = {key: set() for key in ROUTING_KEYS}
+        self._routes: dict[str, dict[object, set[ClientConnection]]] = {key: {} for key in ROUTING_KEYS}
+        self.queue_size = queue_size
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self.dropped_messages = 0
+        self.overflow_disconnects = 0
+        # Recent events as (seq, routing, frame) in arrival order; routing None reaches every client
+        self.history: deque[tuple[int, dict | None, str]] = deque(maxlen=replay_buffer)
+        self.last_seq = 0
+        # Skipped sequence numbers that may still arrive out of order
+        self.gap_timeout = gap_timeout
+        self._missing: set[int] = set()
+        self.lost_events = 0
+        self.backend: BroadcastBackend = InMemoryBackend(self.deliver)
+        self.idle_timeout = idle_timeout
+        self.idle_evictions = 0
+        self._reaper: asyncio.Task | None = None
 
-    async def connect(self, websocket: WebSocket) -> None:
+    async def start(self, backend: BroadcastBackend) -> None:
         """
-        Accept a WebSocket connection and add it to the active connections list.
+        Switch to a broadcast backend and start it, along with the idle reaper.
+
+        Args:
+            backend: Transport used to fan events out to all processes.
+        """
+        await backend.start(self.deliver)
+        self.backend = backend
+        # Sequence numbers of the previous backend are meaningless now
+        self.history.clear()
+        self.last_seq = 0
+        self._missing.clear()
+        if self._reaper is None and self.idle_timeout > 0:
+            self._reaper = asyncio.create_task(self._reap())
+
+    async def stop(self) -> None:
+        """Stop the idle reaper and the broadcast backend, falling back to in-memory delivery."""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        backend = self.backend
+        self.backend = InMemoryBackend(self.deliver)
+        await backend.stop()
+
+    def touch(self, websocket: WebSocket) -> None:
+        """
+        Record that a client is alive (it sent a frame).
+
+        Args:
+            websocket: The connection that sent something.
+        """
+        client = self.active_connections.get(websocket)
+        if client:
+            client.last_seen = time.monotonic()
+
+    async def _reap(self) -> None:
+        """
+        Evict silent clients periodically.
+
+        Dead and half-open sockets are detected by the protocol-level pings
+        of the server; this only applies to deployments whose clients send
+        frames regularly on their own.
+        """
+        while True:
+            await asyncio.sleep(self.idle_timeout / 2)
+            self.reap_idle()
+
+    def reap_idle(self, now: float | None = None) -> int:
+        """
+        Evict clients that have not sent a frame within the idle timeout.
+
+        Args:
+            now: Monotonic time to compare against (defaults to now).
+
+        Returns:
+            Number of evicted connections.
+        """
+        now = time.monotonic() if now is None else now
+        deadline = now - self.idle_timeout
+        idle = [client for client in self.active_connections.values() if client.last_seen < deadline]
+        for client in idle:
+            logger.info("Evicting idle WebSocket client")
+            self.disconnect(client.websocket)
+            asyncio.create_task(self._close(client.websocket, code=1001))
+        self.idle_evictions += len(idle)
+        return len(idle)
+
+    async def connect(self, websocket: WebSocket, since: int | None = None, **filters) -> None:
+        """
+        Accept a WebSocket connection and start its writer task.
 
         Args:
             websocket: The WebSocket connection to accept and store.
+            since: Last sequence number the client saw; missed events are replayed.
+            **filters: Optional initial subscription, see `subscribe`.
         """
         await websocket.accept()
-        self.active_connections.append(websocket)
+        client = ClientConnection(websocket, self.queue_size)
+        client.writer = asyncio.create_task(self._writer(client))
+        # No await between registering and replaying, so no live event can
+        # slip in between the replayed ones
+        self.active_connections[websocket] = client
+        self.subscribe(websocket, **filters)
+        if since is not None:
+            self._replay(client, since)
+
+    def _replay(self, client: ClientConnection, since: int) -> None:
+        """
+        Queue the buffered events after `since` that match the client's filters.
+
+        Events can arrive out of order, so the buffer is not assumed to be
+        dense: an event with a lower `seq` that arrived after `since` may
+        have been missed by the client. In that case, and when the missed
+        events are no longer (or were never) in the buffer or would not fit
+        in the queue, a `resync_required` event is sent instead.
+
+        Args:
+            client: The reconnecting connection.
+            since: Last sequence number the client received.
+        """
+        missed = None
+        oldest = self.history[0][0] if self.history else self.last_seq + 1
+        if since <= self.last_seq and oldest <= since + 1:
+            missed = []
+            after_since = False
+            for seq, routing, frame in self.history:
+                if seq == since:
+                    after_since = True
+                elif seq > since:
+                    if (routing is None or client.matches(routing)) and frame not in missed[-1:]:
+                        missed.append(frame)
+                elif after_since:
+                    # Arrived late, after the client's last event
+                    missed = None
+                    break
+        if missed is None or len(missed) >= self.queue_size:
+            self._enqueue(client, self._resync_frame("Missed events are no longer available, reload the current state"))
+            return
+        for frame in missed:
+            self._enqueue(client, frame)
+
+    def _resync_frame(self, message: str, seq: int | None = None) -> str:
+        """Serialize a `resync_required` event."""
+        return json.dumps({"event_type": RESYNC_EVENT, "message": message, "seq": self.last_seq if seq is None else seq})
+
+    def subscribe(
+        self,
+        websocket: WebSocket,
+        cart_ids: list[int] | None = None,
+        rooms: list[str] | None = None,
+        event_types: list[str] | None = None,
+    ) -> None:
+        """
+        Replace the subscription filters of a connection.
+
+        A filter left as None (or empty) accepts every value for that key.
+
+        Args:
+            websocket: The connection to update.
+            cart_ids: Cart IDs to receive messages for.
+            rooms: Room numbers to receive messages for.
+            event_types: Event types to receive.
+        """
+        client = self.active_connections.get(websocket)
+        if not client:
+            return
+        self._unroute(client)
+        client.filters = {
+            "cart_id": frozenset(cart_ids) if cart_ids else None,
+            "room": frozenset(rooms) if rooms else None,
+            "event_type": frozenset(event_types) if event_types else None,
+        }
+        for key, accepted in client.filters.items():
+            if accepted is None:
+                self._wildcards[key].add(client)
+            else:
+                for value in accepted:
+                    self._routes[key].setdefault(value, set()).add(client)
+
+    def _unroute(self, client: ClientConnection) -> None:
+        """Remove a connection from the routing table."""
+        for key, accepted in client.filters.items():
+            if accepted is None:
+                self._wildcards[key].discard(client)
+                continue
+            routes = self._routes[key]
+            for value in accepted:
+                subscribers = routes.get(value)
+                if subscribers is not None:
+                    subscribers.discard(client)
+                    if not subscribers:
+                        del routes[value]
 
     def disconnect(self, websocket: WebSocket) -> None:
         """
-        Remove a WebSocket connection from the active connections list.
+        Remove a WebSocket connection and stop its writer task.
 
         Args:
             websocket: The WebSocket connection to remove.
         """
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        client = self.active_connections.pop(websocket, None)
+        if not client:
+            return
+        self._unroute(client)
+        if client.writer and client.writer is not asyncio.current_task():
+            client.writer.cancel()
 
-    async def broadcast(self, message: str) -> None:
+    async def broadcast(
+        self,
+        payload: dict,
+        cart_id: int | None = None,
+        room: str | None = None,
+        event_type: str | None = None,
+    ) -> None:
         """
-        Send a message to all active WebSocket connections.
+        Publish a message to all WebSocket connections subscribed to it.
 
-        If sending to a connection fails, the connection is disconnected.
+        The message goes through the broadcast backend, so with a shared
+        backend the sockets of every process receive it. Clients receive the
+        payload as JSON with an added `seq` sequence number. Never waits on
+        the sockets themselves: each connection has its own writer task, so a
+        slow client cannot delay delivery to the others.
 
         Args:
-            message: The message string to broadcast to all connections.
+            payload: JSON-serializable message to broadcast.
+            cart_id: Cart the message refers to, if any.
+            room: Room the message refers to, if any.
+            event_type: Event type of the message.
         """
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception as e:
-                # If sending fails, mark connection for disconnection
-                disconnected.append(connection)
-                print(f"Error sending message to connection: {e}")
+        routing = {"cart_id": cart_id, "room": room, "event_type": event_type}
+        await self.backend.publish({"payload": payload, "routing": routing})
+
+    def deliver(self, event: dict) -> None:
+        """
+        Queue a published event for the matching sockets of this process.
+
+        The event is serialized once and kept in the replay buffer. When a
+        queue is full the configured overflow policy is applied.
+
+        Sequence numbers that are skipped are waited for `gap_timeout`
+        seconds, since the backend may deliver them out of order. If they do
+        not arrive, every client is sent a `resync_required` event. A
+        truncated event (too large for the backend) is replaced by a
+        `resync_required` event for its recipients.
+
+        Args:
+            event: Event with its `payload`, `routing` attributes and `seq`.
+        """
+        seq = event["seq"]
+        routing = event["routing"]
+        if event.get("truncated"):
+            frame = self._resync_frame("An event was too large to forward, reload the current state", seq)
+        else:
+            frame = json.dumps({**event["payload"], "seq": seq})
+        if seq in self._missing:
+            self._missing.discard(seq)
+        elif self.last_seq and seq > self.last_seq + 1:
+            self._skipped(range(self.last_seq + 1, seq))
+        self.history.append((seq, routing, frame))
+        self.last_seq = max(self.last_seq, seq)
+        for client in self._recipients(routing):
+            self._enqueue(client, frame)
+
+    def _skipped(self, gap: range) -> None:
+        """
+        Wait for skipped sequence numbers, or give up at once if there are too many to track.
+
+        Args:
+            gap: The sequence numbers that were skipped.
+        """
+        if len(gap) > (self.history.maxlen or 0):
+            logger.warning(f"Skipped {len(gap)} notification events, clients must resync")
+            # The buffer no longer reaches back before the gap, so replays resync too
+            self.history.clear()
+            self._lost(list(gap))
+            return
+        self._missing.update(gap)
+        asyncio.get_running_loop().call_later(self.gap_timeout, self._gap_expired, gap)
+
+    def _gap_expired(self, gap: range) -> None:
+        """Give up on the skipped sequence numbers that still did not arrive."""
+        lost = [seq for seq in gap if seq in self._missing]
+        if not lost:
+            return
+        self._missing.difference_update(lost)
+        logger.warning(f"Notification events {lost[0]}..{lost[-1]} never arrived, clients must resync")
+        frame = self._resync_frame("Events were lost, reload the current state", lost[-1])
+        # Replays across the gap must resync as well
+        for seq in lost:
+            self.history.append((seq, None, frame))
+        self._lost(lost, frame)
 
-        # Disconnect failed connections
-        for connection in disconnected:
-            self.disconnect(connection)
+    def _lost(self, lost: list[int], frame: str | None = None) -> None:
+        """Tell every client to resync because events were lost."""
+        self.lost_events += len(lost)
+        frame = frame or self._resync_frame("Events were lost, reload the current state")
+        for client in list(self.active_connections.values()):
+            self._enqueue(client, frame)
+
+    def _recipients(self, routing: dict) -> list[ClientConnection]:
+        """
+        Look up the connections that accept a message.
+
+        Only the candidates of the most selective routing key are scanned,
+        so the cost grows with the number of interested clients rather than
+        with the number of connections.
+
+        Args:
+            routing: Mapping of routing key to the message's value.
+
+        Returns:
+            List of matching connections.
+        """
+        candidates = None
+        smallest = None
+        for key in ROUTING_KEYS:
+            value = routing.get(key)
+            routed = self._routes[key].get(value, ()) if value is not None else ()
+            size = len(self._wildcards[key]) + len(routed)
+            if smallest is None or size < smallest:
+                smallest = size
+                candidates = (self._wildcards[key], routed)
+        return [client for group in candidates for client in group if client.matches(routing)]
+
+    def _enqueue(self, client: ClientConnection, message: str) -> None:
+        """
+        Put a message on a connection's queue, applying the overflow policy.
+
+        Args:
+            client: The target connection.
+            message: The message string to queue.
+        """
+        try:
+            client.queue.put_nowait(message)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        if self.overflow_policy is OverflowPolicy.drop_oldest:
+            client.queue.get_nowait()
+            client.queue.put_nowait(message)
+            client.dropped += 1
+            self.dropped_messages += 1
+            return
+
+        # Disconnect policy: the client cannot keep up, drop it entirely
+        self.overflow_disconnects += 1
+        self.dropped_messages += client.queue.qsize() + 1
+        logger.warning("Disconnecting slow WebSocket client (queue full)")
+        self.disconnect(client.websocket)
+        asyncio.create_task(self._close(client.websocket, code=1013))
+
+    async def _writer(self, client: ClientConnection) -> None:
+        """
+        Send queued messages to a single connection until it fails or is removed.
+
+        Args:
+            client: The connection to serve.
+        """
+        try:
+            while True:
+                message = await client.queue.get()
+                await client.websocket.send_text(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Error sending message to connection: {e}")
+            self.disconnect(client.websocket)
+
+    @staticmethod
+    async def _close(websocket: WebSocket, code: int) -> None:
+        """Close a WebSocket, ignoring errors from connections that are already gone."""
+        try:
+            await websocket.close(code=code)
+        except Exception:
+            pass
+
+    def metrics(self) -> dict:
+        """
+        Return connection, queue depth and drop gauges for all connections.
+
+        Returns:
+            dict with connection count and age, queue depths and drop/eviction counters.
+        """
+        depths = [client.queue.qsize() for client in self.active_connections.values()]
+        now = time.monotonic()
+        ages = [now - client.connected_at for client in self.active_connections.values()]
+        return {
+            "connections": len(depths),
+            "connection_age_max_s": round(max(ages, default=0.0), 1),
+            "connection_age_avg_s": round(sum(ages) / len(ages), 1) if ages else 0.0,
+            "idle_evictions": self.idle_evictions,
+            "queue_size": self.queue_size,
+            "overflow_policy": self.overflow_policy.value,
+            "queue_depth_total": sum(depths),
+            "queue_depth_max": max(depths, default=0),
+            "dropped_messages": self.dropped_messages,
+            "overflow_disconnects": self.overflow_disconnects,
+            "backend": type(self.backend).__name__,
+            "last_seq": self.last_seq,
+            "replay_buffered": len(self.history),
+            "lost_events": self.lost_events,
+        }
 
 
 # Global instance for use in FastAPI endpoints
-manager = ConnectionManager()
\ No newline at end of file
+manager = ConnectionManager()
@@ -1,4 +1,3 @@
-import datetime
 import json
 import logging
 import os
@@ -17,7 +16,9 @@ from camunda.external_task.external_task_worker import ExternalTaskWorker
 # Camunda Engine
 BASE_URL = "https://digibp.engine.martinlab.science/engine-rest"
 # 2.  Backend
-BACKEND_API_URL = "http://localhost:8000/api"
+BACKEND_API_URL = os.getenv("BACKEND_API_URL", "http://localhost:8000/api")
+# Attempts of 'update-stock' when the inventory item changes between read and update
+UPDATE_STOCK_ATTEMPTS = 3
 
 # POST to start the Process Process_1gnj26y
 # url https://digibp.engine.martinlab.science/engine-rest/process-definition/key/Process_1gnj26y/tenant-id/mi25gotthard/start
@@ -71,17 +72,23 @@ def handle_inventory_check(task: ExternalTask) -> TaskResult:
             item = data[0] if isinstance(data, list) and data else data
 
             amount = item.get("amount", 0)
-            min_stock = item.get("min_stock", 0)
+            # The decision compares the stock of all batches, the update goes to the first one
+            level = requests.get(f"{BACKEND_API_URL}/inventory/{medication_id}/stock-level")
+            level.raise_for_status()
+            total_stock = level.json()["total"]
+            min_stock = level.json()["min_stock"]
             # Send variables back to Camunda
             logging_to_frontend(
                 "Decision",
-                f"{medication_id} going to the AI ? {amount - amount_needed < min_stock}",
+                f"{medication_id} going to the AI ? {total_stock - amount_needed < min_stock}",
             )
             return task.complete(
                 {
                     "current_stock": amount,
+                    "total_stock": total_stock,
                     "min_stock": min_stock,
                     "inventory_id": item.get("id"),
+                    "inventory_version": item.get("version"),
                 }
             )
         else:
@@ -230,18 +237,40 @@ def handle_update_stock(task: ExternalTask) -> TaskResult:
             retry_timeout=1000,
         )
     
-    new_amount = current_stock - amount
-
-    logging.info(f"[Bridge] Updating Inventory ID {inventory_id} to {new_amount}")
-    logging_to_frontend(
-        "[Bridge]", f"Updating Inventory ID {inventory_id} to {new_amount}"
-    )
+    # The stock read in 'inventory-check' may be outdated by now: the update only applies to
+    # the version read there, on a conflict the new amount is recomputed from a fresh read
+    version = task.get_variable("inventory_version")
 
     try:
-        response = requests.patch(
-            f"{BACKEND_API_URL}/inventory/{inventory_id}",
-            json={"new_amount": new_amount},
-        )
+        for _ in range(UPDATE_STOCK_ATTEMPTS):
+            if version is None:
+                fresh = requests.get(f"{BACKEND_API_URL}/inventory/items/{inventory_id}")
+                if fresh.status_code != 200:
+                    return task.failure(
+                        error_message=f"Inventory read failed ({fresh.status_code})",
+                        error_details=fresh.text,
+                        max_retries=0,
+                        retry_timeout=1000,
+                    )
+                current_stock = fresh.json()["amount"]
+                version = fresh.json()["version"]
+
+            new_amount = current_stock - amount
+
+            logging.info(f"[Bridge] Updating Inventory ID {inventory_id} to {new_amount}")
+            logging_to_frontend(
+                "[Bridge]", f"Updating Inventory ID {inventory_id} to {new_amount}"
+            )
+
+            response = requests.patch(
+                f"{BACKEND_API_URL}/inventory/{inventory_id}",
+                json={"new_amount": new_amount},
+                headers={"If-Match": f'"{version}"'},
+            )
+            if response.status_code != 412:
+                break
+            logging.info(f"[Bridge] Inventory ID {inventory_id} changed concurrently, retrying")
+            version = None
 
         if response.status_code == 200:
             return task.complete()
@@ -265,47 +294,35 @@ def handle_update_stock(task: ExternalTask) -> TaskResult:
 def handle_create_order(task: ExternalTask) -> TaskResult:
     """
     Handles the 'create-order' topic from Camunda.
-    Creates an order in the backend using variables from the Camunda process.
+    Requests a reorder in the backend using variables from the Camunda process; the backend
+    merges it into the next order of the medication's supplier, rush requests are ordered at once.
     Args:
         task (ExternalTask): The Camunda external task containing variables.
     Returns:
         TaskResult: The result to send back to Camunda (complete or failure).
     """
-    order_name = "Camunda Order"
-    order_date = task.get_variable("order_date")
-
-    if not order_date:
-        order_date = datetime.datetime.now().strftime("%Y-%m-%d")
-
     med_id = task.get_variable("medication_id")
     amount = task.get_variable("amount")
     is_internal = bool(task.get_variable("is_internal"))
     is_rush = bool(task.get_variable("is_rush"))
 
-    if not order_date:
-        return task.failure(
-            error_message="order_date is required",
-            error_details="order_date parameter is missing",
-            max_retries=0,
-            retry_timeout=1000,
-        )
-
     payload = {
-        "name": order_name,
-        "date": order_date,
-        "medications": [{"medicationId": med_id, "amount": amount}],
+        "medicationId": med_id,
+        "amount": amount,
         "isInternal": is_internal,
         "isRush": is_rush,
+        # A redelivered task is not ordered twice
+        "request_id": task.get_task_id(),
     }
 
-    logging_to_frontend("Bridge", f"Creating order {order_name}")
+    logging_to_frontend("Bridge", f"Requesting reorder of {med_id}")
 
     try:
-        response = requests.post(f"{BACKEND_API_URL}/orders", json=payload)
+        response = requests.post(f"{BACKEND_API_URL}/orders/reorder", json=payload)
 
         if response.status_code == 200:
             body = response.json()
-            return task.complete({"order_id": body.get("id")})
+            return task.complete({"order_id": body.get("order_id"), "supplier": body.get("supplier")})
         else:
             return task.failure(
                 error_message=f"Order creation failed ({response.status_code})",
@@ -321,7 +338,6 @@ def handle_create_order(task: ExternalTask) -> TaskResult:
             max_retries=0,
             retry_timeout=1000,
         )
-    
 
 
 def handle_update_checklist(task: ExternalTask) -> TaskResult:
@@ -365,7 +381,9 @@ def handle_update_checklist(task: ExternalTask) -> TaskResult:
 def handle_check_carts(task: ExternalTask) -> TaskResult:
     """
     Handles the 'check-carts' topic from Camunda.
-    Fetches cart information from the webhook and determines availability.
+    Asks the backend for a single prepared cart and determines availability.
+    Only 'available' and 'cart_id' are stored in the process, so the process
+    variables do not grow with the cart table.
     Args:
         task (ExternalTask): The Camunda external task containing variables.
     Returns:
@@ -374,38 +392,19 @@ def handle_check_carts(task: ExternalTask) -> TaskResult:
     logging_to_frontend("Bridge", "Checking carts availability")
 
     try:
-        # Send GET request to the webhook (since POST is not registered)
-        webhook_url = "http://localhost:5678/webhook/8c450380-3c3a-4de5-a3e4-5d030687aa1f"
-        response = requests.get(webhook_url, timeout=30)  # Change to GET
+        response = requests.get(f"{BACKEND_API_URL}/carts/available", timeout=30)
 
         if response.status_code == 200:
-            carts = response.json()
-            
-            # Normalize to list if it's a single dict
-            if isinstance(carts, dict):
-                carts = [carts]
-            elif not isinstance(carts, list):
-                return task.failure(
-                    error_message="Invalid carts response format",
-                    error_details="Expected list or dict",
-                    max_retries=0,
-                    retry_timeout=1000,
-                )
-            
-            # Filter for carts with status "Prepared"
-            prepared_carts = [cart for cart in carts if cart.get("status") == "Prepared"]
-            available = len(prepared_carts) > 0
-            logging.info(f"[DEBUG] Carts: {carts}, Prepared Carts: {prepared_carts}, Available: {available}")
-            
-            result = {
-                "carts": carts,  # Return all carts for reference
-                "available": available,
-            }
-            
+            body = response.json()
+            available = bool(body.get("available"))
+            logging.info(f"[DEBUG] Cart availability: {body}")
+
+            result = {"available": available}
+
             # If available, include the cart_id of the first prepared cart
             if available:
-                result["cart_id"] = prepared_carts[0]["id"]
-            
+                result["cart_id"] = body["cart_id"]
+
             return task.complete(result)
         else:
             return task.failure(
@@ -695,6 +694,20 @@ def handle_update_cart_status(task: ExternalTask) -> TaskResult:
         )
 
 
+# Set to stop the worker loops after their current poll, see stop_camunda_workers
+_stop_workers = threading.Event()
+_worker_threads: dict[str, threading.Thread] = {}
+
+
+class StoppableExternalTaskWorker(ExternalTaskWorker):
+    """ExternalTaskWorker whose polling loop ends once `_stop_workers` is set."""
+
+    def subscribe(self, topic_names, action, process_variables=None, variables=None):
+        while not _stop_workers.is_set():
+            self._fetch_and_execute_safe(topic_names, action, process_variables, variables)
+        self._log_with_context("Stopping worker", topic=topic_names)
+
+
 def start_subscription(topic, handler, i):
     """
     Starts a Camunda ExternalTaskWorker subscription for a given topic in a separate thread.
@@ -703,7 +716,7 @@ def start_subscription(topic, handler, i):
         handler (function): The handler function for the topic.
         i (int): Worker index for unique worker ID.
     """
-    worker = ExternalTaskWorker(
+    worker = StoppableExternalTaskWorker(
         worker_id="python-worker-" + str(i), 
         base_url=BASE_URL,
         config={'tenantId': 'mi25gotthard'}  # Set tenant here
@@ -716,6 +729,8 @@ def start_camunda_workers():
     """
     Starts Camunda worker threads for all defined topics.
     Each topic is handled by a separate thread running its own ExternalTaskWorker.
+    Topics whose thread is still running (e.g. still finishing its last poll after
+    stop_camunda_workers) are not started twice.
     """
     topics = [
         ("ai-check", handle_ai_check),
@@ -728,16 +743,92 @@ def start_camunda_workers():
         ("update-cart-status", handle_update_cart_status),  # Add new topic
     ]
 
+    _stop_workers.clear()
     idx = 1
     for topic, handler in topics:
+        if topic in _worker_threads and _worker_threads[topic].is_alive():
+            idx = idx + 1
+            continue
         # daemon=True means these threads will die automatically when Uvicorn shuts down
+        # Named after the topic, so profiles and thread dumps show which worker is busy
         t = threading.Thread(
-            target=start_subscription, args=(topic, handler, idx), daemon=True
+            target=start_subscription, args=(topic, handler, idx), daemon=True, name=f"camunda-{topic}"
         )
         t.start()
+        _worker_threads[topic] = t
         idx = idx + 1
 
 
+def stop_camunda_workers():
+    """
+    Asks all Camunda worker threads to stop.
+    Each thread ends after its current long poll (at most `asyncResponseTimeout`)
+    and after finishing the tasks it already locked.
+    """
+    _stop_workers.set()
+
+
+# Releases expired stock holds while this process is leader
+_reservation_sweeper = None
+
+
+async def on_elected():
+    """Leader duties: seed the database, then start the reservation sweeper and the worker loops."""
+    global _reservation_sweeper
+    from Application.backend.core.database import async_session_maker, seed_db
+    from Application.backend.services.low_stock_index import low_stock_index
+    from Application.backend.services.medication_index import medication_index
+    from Application.backend.services.reservation_service import ReservationSweeper
+
+    await seed_db()
+    # Seeding bypasses the services, pick up the seeded catalog and stock
+    if low_stock_index.loaded:
+        await low_stock_index.load(async_session_maker)
+    if medication_index.loaded:
+        await medication_index.load(async_session_maker)
+    _reservation_sweeper = ReservationSweeper(async_session_maker)
+    _reservation_sweeper.start()
+    start_camunda_workers()
+
+
+async def on_demoted():
+    """Stop the worker loops and the reservation sweeper after losing leadership."""
+    global _reservation_sweeper
+    stop_camunda_workers()
+    if _reservation_sweeper is not None:
+        await _reservation_sweeper.stop()
+        _reservation_sweeper = None
+
+
+async def run_standalone():
+    """
+    Runs the Camunda bridge in its own process.
+
+    Applies pending migrations, then campaigns for leadership; only the leader
+    seeds the database and runs the worker loops, so several bridge processes
+    can run for failover. Runs until interrupted.
+    """
+    import asyncio
+
+    from Application.backend.core.database import DATABASE_DIRECT_URL, direct_engine, engine, run_migrations
+    from Application.backend.core.leader import LeaderElection
+
+    await run_migrations(direct_engine)
+    election = LeaderElection(DATABASE_DIRECT_URL, on_elected, on_demoted)
+    await election.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await election.stop()
+        await engine.dispose()
+        if direct_engine is not engine:
+            await direct_engine.dispose()
+
+
 if __name__ == "__main__":
+    import asyncio
 
-    start_camunda_workers()
\ No newline at end of file
+    try:
+        asyncio.run(run_standalone())
+    except KeyboardInterrupt:
+        pass
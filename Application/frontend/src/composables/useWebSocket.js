@@ -4,6 +4,8 @@ export function useWebSocket(onMessage) {
     const socket = ref(null)
     const isConnected = ref(false)
     let reconnectTimeout = null
+    // Sequence number of the last received event, used to replay missed events on reconnect
+    let lastSeq = null
 
     /**
      * Determine the WebSocket protocol based on the current location protocol
@@ -17,7 +19,8 @@ export function useWebSocket(onMessage) {
      */
     function connect() {
         const protocol = getWebSocketProtocol()
-        const wsUrl = `${protocol}//${window.location.host}/api/notifications/ws`
+        const since = lastSeq !== null ? `?since=${lastSeq}` : ''
+        const wsUrl = `${protocol}//${window.location.host}/api/notifications/ws${since}`
 
         console.log('Connecting to WebSocket:', wsUrl)
 
@@ -33,6 +36,10 @@ export function useWebSocket(onMessage) {
                 const data = JSON.parse(event.data)
                 console.log('Received WebSocket message:', data)
 
+                if (typeof data.seq === 'number') {
+                    lastSeq = data.seq
+                }
+
                 // Call the message handler callback if provided
                 if (onMessage) {
                     onMessage(data)